@@ -1,7 +1,8 @@
 import logging
 
-from app.core.config import Config
-from app.core.logger import setup_logger
+# 컨테이너에서는 ai_worker가 app 패키지로 복사되므로 상대 경로로 워커 자신의 설정/로거를 가져온다
+from .config import Config
+from .logger import setup_logger
 
 
 def get_config() -> Config:
@@ -16,3 +16,18 @@ class Config(BaseSettings):
 
     OPENAI_API_KEY: str = Field(default="", validation_alias=AliasChoices("OPENAI_API_KEY", "api_key"))
     OPENAI_MODEL: str = "gpt-4o-mini"
+
+    # 로컬 임베딩 서버 (sentence-transformers, CPU)
+    # 한국어를 포함한 다국어 문장 임베딩 모델. query/passage prefix가 필요 없는 모델을 기본값으로 사용한다.
+    EMBEDDING_MODEL_NAME: str = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+    EMBEDDING_DEVICE: str = "cpu"
+    # vector_documents.embedding이 vector(1536)이므로 모델 출력 뒤를 0으로 채워 맞춘다 (코사인 거리 불변)
+    EMBEDDING_OUTPUT_DIMENSIONS: int = 1536
+    # 동적 배칭: 대기 시간(ms) 안에 들어온 요청을 최대 배치 크기까지 한 번의 forward로 묶는다.
+    EMBEDDING_MAX_BATCH_SIZE: int = 64
+    EMBEDDING_MAX_WAIT_MS: float = 5.0
+    EMBEDDING_MAX_TEXTS_PER_REQUEST: int = 2048
+    EMBEDDING_HOST: str = "0.0.0.0"  # 컨테이너 내부 네트워크(ws)에서만 노출
+    EMBEDDING_PORT: int = 8100
+    # 지정하면 TCP 대신 Unix 소켓으로 서빙한다 (같은 호스트/공유 볼륨에서 사용하는 경우)
+    EMBEDDING_SOCKET_PATH: str = ""
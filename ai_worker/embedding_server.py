@@ -0,0 +1,156 @@
+"""로컬 임베딩 HTTP 서버.
+
+ai 의존성 그룹에 웹 프레임워크가 없으므로 asyncio 스트림 위에 최소한의 HTTP/1.1(keep-alive 지원)을 구현한다.
+TCP 또는 Unix 소켓으로 서빙한다.
+
+    GET  /health  -> {"status": "ok", "model": ..., "dimensions": ...}
+    POST /embed   {"texts": [...]} -> {"model": ..., "dimensions": ..., "embeddings": [[...], ...]}
+"""
+
+import asyncio
+import json
+import logging
+from http import HTTPStatus
+from typing import Any
+
+from pydantic import ValidationError
+
+from .schemas.embedding import EmbedRequest, EmbedResponse
+from .tasks.embedding import DynamicBatcher
+
+logger = logging.getLogger(__name__)
+
+MAX_BODY_BYTES = 32 * 1024 * 1024
+MAX_HEADER_LINES = 100
+
+
+class _RequestError(Exception):
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+async def _read_request(reader: asyncio.StreamReader) -> tuple[str, str, dict[str, str], bytes] | None:
+    """요청 1건을 읽는다. 연결이 닫혔으면 None을 반환한다."""
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    try:
+        method, path, _version = request_line.decode("latin-1").split()
+    except ValueError as e:
+        raise _RequestError(HTTPStatus.BAD_REQUEST, "malformed request line") from e
+
+    headers: dict[str, str] = {}
+    for _ in range(MAX_HEADER_LINES):
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    else:
+        raise _RequestError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "too many headers")
+
+    try:
+        length = int(headers.get("content-length") or 0)
+    except ValueError as e:
+        raise _RequestError(HTTPStatus.BAD_REQUEST, "invalid content-length") from e
+    if length > MAX_BODY_BYTES:
+        raise _RequestError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "body too large")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), path.split("?", 1)[0], headers, body
+
+
+def _response(status: HTTPStatus, payload: dict[str, Any], *, keep_alive: bool) -> bytes:
+    body = json.dumps(payload, separators=(",", ":")).encode()
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+class EmbeddingServer:
+    """DynamicBatcher를 HTTP로 노출하는 서버."""
+
+    def __init__(
+        self,
+        batcher: DynamicBatcher,
+        *,
+        model_name: str,
+        dimensions: int,
+        max_texts_per_request: int,
+    ) -> None:
+        self._batcher = batcher
+        self._model_name = model_name
+        self._dimensions = dimensions
+        self._max_texts = max_texts_per_request
+
+    async def serve(self, *, host: str, port: int, socket_path: str = "") -> None:
+        """
+        서버를 시작하고 취소될 때까지 요청을 처리한다.
+
+        Args:
+            host (str): TCP 바인드 주소.
+            port (int): TCP 포트.
+            socket_path (str): 지정하면 TCP 대신 이 경로의 Unix 소켓으로 서빙한다.
+        """
+        self._batcher.start()
+        if socket_path:
+            server = await asyncio.start_unix_server(self._handle, path=socket_path)
+            logger.info("embedding server listening on unix:%s", socket_path)
+        else:
+            server = await asyncio.start_server(self._handle, host=host, port=port)
+            logger.info("embedding server listening on %s:%d", host, port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self._batcher.stop()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                except _RequestError as e:
+                    writer.write(_response(e.status, {"detail": str(e)}, keep_alive=False))
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+
+                method, path, headers, body = request
+                status, payload = await self._route(method, path, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                writer.write(_response(status, payload, keep_alive=keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, method: str, path: str, body: bytes) -> tuple[HTTPStatus, dict[str, Any]]:
+        if path == "/health" and method == "GET":
+            return HTTPStatus.OK, {"status": "ok", "model": self._model_name, "dimensions": self._dimensions}
+        if path != "/embed":
+            return HTTPStatus.NOT_FOUND, {"detail": "not found"}
+        if method != "POST":
+            return HTTPStatus.METHOD_NOT_ALLOWED, {"detail": "method not allowed"}
+
+        try:
+            request = EmbedRequest.model_validate_json(body)
+        except ValidationError as e:
+            return HTTPStatus.UNPROCESSABLE_ENTITY, {"detail": e.errors(include_url=False, include_context=False)}
+        if len(request.texts) > self._max_texts:
+            return HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"detail": f"at most {self._max_texts} texts per request"}
+
+        try:
+            embeddings = await self._batcher.embed(request.texts)
+        except Exception:
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"detail": "embedding failed"}
+        response = EmbedResponse(model=self._model_name, dimensions=self._dimensions, embeddings=embeddings)
+        return HTTPStatus.OK, response.model_dump()
@@ -0,0 +1,40 @@
+"""AI 워커 실행 진입점: 로컬 임베딩 서버를 띄운다."""
+
+import asyncio
+
+from .core import config, default_logger
+from .embedding_server import EmbeddingServer
+from .tasks.embedding import DynamicBatcher, SentenceEmbedder
+
+
+async def main() -> None:
+    """
+    임베딩 모델을 로드한 뒤(로드가 끝나야 연결을 받는다) HTTP 서버를 실행한다.
+    """
+    default_logger.info("loading embedding model: %s", config.EMBEDDING_MODEL_NAME)
+    embedder = SentenceEmbedder(
+        config.EMBEDDING_MODEL_NAME,
+        device=config.EMBEDDING_DEVICE,
+        output_dimensions=config.EMBEDDING_OUTPUT_DIMENSIONS,
+        batch_size=config.EMBEDDING_MAX_BATCH_SIZE,
+    )
+    batcher = DynamicBatcher(
+        embedder.encode,
+        max_batch_size=config.EMBEDDING_MAX_BATCH_SIZE,
+        max_wait_ms=config.EMBEDDING_MAX_WAIT_MS,
+    )
+    server = EmbeddingServer(
+        batcher,
+        model_name=config.EMBEDDING_MODEL_NAME,
+        dimensions=embedder.dimensions,
+        max_texts_per_request=config.EMBEDDING_MAX_TEXTS_PER_REQUEST,
+    )
+    await server.serve(
+        host=config.EMBEDDING_HOST,
+        port=config.EMBEDDING_PORT,
+        socket_path=config.EMBEDDING_SOCKET_PATH,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,15 @@
+from pydantic import BaseModel, Field
+
+
+class EmbedRequest(BaseModel):
+    """임베딩 요청 본문."""
+
+    texts: list[str] = Field(min_length=1)
+
+
+class EmbedResponse(BaseModel):
+    """임베딩 응답 본문 (embeddings는 texts와 같은 순서)."""
+
+    model: str
+    dimensions: int
+    embeddings: list[list[float]]
@@ -0,0 +1,137 @@
+"""로컬 문장 임베딩 모델과 동적 배처."""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class SentenceEmbedder:
+    """
+    sentence-transformers 모델 래퍼.
+
+    L2 정규화된 벡터를 만들고, 모델 차원이 출력 차원보다 작으면 뒤를 0으로 채운다.
+    0 패딩은 내적/노름을 바꾸지 않으므로 pgvector 코사인 거리가 모델 원래 차원에서와 같다.
+    """
+
+    def __init__(self, model_name: str, *, device: str, output_dimensions: int, batch_size: int) -> None:
+        from sentence_transformers import SentenceTransformer
+
+        self.model_name = model_name
+        self._model = SentenceTransformer(model_name, device=device)
+        self._batch_size = batch_size
+        model_dimensions = self._model.get_sentence_embedding_dimension() or output_dimensions
+        if model_dimensions > output_dimensions:
+            raise ValueError(f"model dimension {model_dimensions} exceeds output dimension {output_dimensions}")
+        self._padding = output_dimensions - model_dimensions
+        self.dimensions = output_dimensions
+
+    def encode(self, texts: list[str]) -> list[list[float]]:
+        """
+        텍스트 목록을 임베딩한다 (블로킹, 실행기 스레드에서 호출).
+
+        Args:
+            texts (list[str]): 임베딩할 텍스트 목록.
+
+        Returns:
+            list[list[float]]: 입력 순서와 같은 output_dimensions차원 벡터 목록.
+        """
+        matrix = self._model.encode(
+            texts,
+            batch_size=self._batch_size,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        if self._padding:
+            matrix = np.pad(matrix, ((0, 0), (0, self._padding)))
+        return matrix.astype(np.float32).tolist()
+
+
+class DynamicBatcher:
+    """
+    동시 요청을 모아 한 번의 모델 forward로 처리하는 동적 배처.
+
+    첫 요청이 들어온 뒤 max_wait_ms 동안(또는 max_batch_size개가 찰 때까지) 다른 요청을 모으고,
+    모델 추론은 단일 실행기 스레드에서 돌려 이벤트 루프(HTTP 처리)를 막지 않는다.
+    """
+
+    def __init__(
+        self,
+        encode_fn: Callable[[list[str]], list[list[float]]],
+        *,
+        max_batch_size: int,
+        max_wait_ms: float,
+    ) -> None:
+        self._encode_fn = encode_fn
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000
+        self._queue: asyncio.Queue[tuple[list[str], asyncio.Future[list[list[float]]]]] = asyncio.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embedding")
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """
+        텍스트 목록을 대기열에 넣고 배치 처리 결과를 기다린다.
+
+        Args:
+            texts (list[str]): 임베딩할 텍스트 목록.
+
+        Returns:
+            list[list[float]]: 입력 순서와 같은 벡터 목록.
+        """
+        future: asyncio.Future[list[list[float]]] = asyncio.get_running_loop().create_future()
+        await self._queue.put((texts, future))
+        return await future
+
+    async def _collect(self) -> list[tuple[list[str], asyncio.Future[list[list[float]]]]]:
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        size = len(batch[0][0])
+        deadline = loop.time() + self._max_wait
+        while size < self._max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout)
+            except TimeoutError:
+                break
+            batch.append(item)
+            size += len(item[0])
+        return batch
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            texts = [text for item_texts, _ in batch for text in item_texts]
+            try:
+                vectors = await loop.run_in_executor(self._executor, self._encode_fn, texts)
+            except Exception as e:
+                logger.exception("embedding batch failed: size=%d", len(texts))
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            offset = 0
+            for item_texts, future in batch:
+                if not future.done():
+                    future.set_result(vectors[offset : offset + len(item_texts)])
+                offset += len(item_texts)
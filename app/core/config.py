@@ -16,6 +16,13 @@ class Env(StrEnum):
     PROD = "prod"
 
 
+class EmbeddingBackend(StrEnum):
+    """임베딩 생성 백엔드."""
+
+    OPENAI = "openai"
+    LOCAL = "local"  # ai_worker 로컬 임베딩 서버 (sentence-transformers, CPU)
+
+
 class Config(BaseSettings):
     """
     애플리케이션 설정 클래스 (pydantic-settings 기반).
@@ -54,5 +61,41 @@ class Config(BaseSettings):
 
     REDIS_URL: str = "redis://localhost:6379/0"
 
+    # 임베딩 백엔드. local로 바꾸면 모델이 달라지므로 scripts/sync_vector_documents.py로 전체 재임베딩이 필요하다
+    # (embedding_model_version이 달라져 자동으로 재임베딩 대상이 된다)
+    EMBEDDING_BACKEND: EmbeddingBackend = EmbeddingBackend.OPENAI
+    # ai_worker 임베딩 서버 주소. LOCAL_EMBEDDING_SOCKET을 지정하면 URL 대신 Unix 소켓으로 연결한다
+    LOCAL_EMBEDDING_URL: str = "http://ai-worker:8100"
+    LOCAL_EMBEDDING_SOCKET: str = ""
+    # ai_worker의 EMBEDDING_MODEL_NAME과 같아야 한다 (캐시 키/embedding_model_version으로 사용)
+    LOCAL_EMBEDDING_MODEL: str = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+    LOCAL_EMBEDDING_TIMEOUT: float = 30.0
+    # 임베딩 micro-batching: 윈도우(ms) 안에 들어온 encode() 요청을 한 번의 API 호출로 묶는다.
+    EMBEDDING_BATCH_WINDOW_MS: float = 5.0
+    EMBEDDING_MAX_BATCH_SIZE: int = 256
+    EMBEDDING_MAX_IN_FLIGHT: int = 4
+    # 임베딩 캐시: 프로세스 내 LRU 최대 항목 수 (0이면 LRU 미사용, Redis만 사용)
+    EMBEDDING_CACHE_MAX_ENTRIES: int = 4096
+    # 약물 벡터 인메모리 인덱스 디렉터리 (scripts/export_drug_vector_index.py 출력). 비어 있으면 pgvector만 사용
+    # 브루트포스 검색이라 질의당 약 28ms(50k x 1536 실측)다. DB 왕복/HNSW 부하를 줄이려는 경우에만 설정한다
+    DRUG_VECTOR_INDEX_DIR: str = ""
+    # OCR 약품명 매칭용 인메모리 이름 인덱스 (시작 시 drugs로 빌드, 마스터 데이터 변경 알림 시 재빌드)
+    DRUG_NAME_INDEX_ENABLED: bool = True
+    # KCD anchor 변환용 인메모리 코드 매핑 trie (시작 시 disease_code_mappings로 빌드, 변경 알림 시 재빌드)
+    DISEASE_CODE_INDEX_ENABLED: bool = True
+    # 사용자 확정 OCR 별칭을 매칭에 쓰기 위한 최소 적중 횟수 (1이면 한 사용자의 잘못된 수정이 모든 사용자에게 퍼진다)
+    DRUG_ALIAS_MIN_HITS: int = 3
+    # reference_type별 벡터 검색 방식: "none"(원본 vector HNSW) | "halfvec" | "binary"
+    # 양자화 모드는 양자화 인덱스로 후보를 뽑은 뒤 원본 벡터로 정확히 재정렬한다 (partial 표현식 인덱스 필요)
+    # drug는 halfvec/binary 인덱스만 유지한다 (migration 15). "none"으로 되돌리면 전역 HNSW 인덱스를 사용
+    VECTOR_QUANTIZATION: dict[str, str] = Field(default_factory=lambda: {"drug": "halfvec"})
+    # 재정렬 대상 후보 수 (top_k보다 작으면 top_k 사용). HNSW는 ef_search행까지만 돌려주므로
+    # 커넥션의 hnsw.ef_search는 max(VECTOR_HNSW_EF_SEARCH, 이 값)으로 설정된다
+    VECTOR_RERANK_CANDIDATES: int = 40
+    # HNSW 검색 후보 수 (pgvector 기본 40). scripts/benchmark_vector_search.py로 recall/지연시간을 보고 조정
+    VECTOR_HNSW_EF_SEARCH: int = 40
+    # 약품명 trigram `%` 연산자 임계값 (pg_trgm.similarity_threshold). 코드에서 쓰는 가장 낮은 임계값 이하로 둔다
+    DRUG_TRGM_INDEX_THRESHOLD: float = 0.2
+
     # ENABLE_LLM_REFINEMENT=False로 검증 그다음 LLM refinement 켜서 비교
     ENABLE_LLM_REFINEMENT: bool = False
@@ -3,6 +3,7 @@ from tortoise import Tortoise
 from tortoise.contrib.fastapi import register_tortoise
 
 from app.core import config
+from app.db.pgvector import register_vector_codec
 
 TORTOISE_APP_MODELS = [
     "aerich.models",
@@ -23,6 +24,19 @@ TORTOISE_APP_MODELS = [
 ]
 
 
+def hnsw_ef_search() -> int:
+    """
+    커넥션의 hnsw.ef_search 값을 반환한다.
+
+    HNSW 인덱스 스캔은 최대 ef_search행만 돌려주므로, 양자화 재정렬 후보(VECTOR_RERANK_CANDIDATES)보다
+    작으면 후보 수를 늘려도 효과가 없다. 두 설정 중 큰 값을 쓴다.
+
+    Returns:
+        int: hnsw.ef_search
+    """
+    return max(config.VECTOR_HNSW_EF_SEARCH, config.VECTOR_RERANK_CANDIDATES)
+
+
 TORTOISE_ORM = {
     "connections": {
         "default": {
@@ -35,6 +49,13 @@ TORTOISE_ORM = {
                 "database": config.DB_NAME,
                 # asyncpg는 connect_timeout 미지원 (MySQL/asyncmy 전용)
                 "maxsize": config.DB_CONNECTION_POOL_MAXSIZE,
+                # 커넥션마다 pgvector 바이너리 코덱 등록 (vector 값을 텍스트로 직렬화하지 않음)
+                "init": register_vector_codec,
+                # pg_trgm.similarity_threshold: GIN trigram 인덱스를 타는 `%` 연산자의 기준 (쿼리에서 더 높은 임계값으로 재필터)
+                "server_settings": {
+                    "hnsw.ef_search": str(hnsw_ef_search()),
+                    "pg_trgm.similarity_threshold": str(config.DRUG_TRGM_INDEX_THRESHOLD),
+                },
             },
         },
     },
@@ -0,0 +1,148 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_vector_documents_drug_halfvec_hnsw" ON "vector_documents" USING hnsw (("embedding"::halfvec(1536)) halfvec_cosine_ops) WITH (m = 16, ef_construction = 64) WHERE "reference_type" = 'drug';
+        CREATE INDEX IF NOT EXISTS "idx_vector_documents_drug_binary_hnsw" ON "vector_documents" USING hnsw ((binary_quantize("embedding")::bit(1536)) bit_hamming_ops) WITH (m = 16, ef_construction = 64) WHERE "reference_type" = 'drug';
+        DROP INDEX IF EXISTS "idx_vector_documents_drug_hnsw";"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_vector_documents_drug_hnsw" ON "vector_documents" USING hnsw ("embedding" vector_cosine_ops) WITH (m = 16, ef_construction = 64) WHERE "reference_type" = 'drug';
+        DROP INDEX IF EXISTS "idx_vector_documents_drug_binary_hnsw";
+        DROP INDEX IF EXISTS "idx_vector_documents_drug_halfvec_hnsw";"""
+
+
+MODELS_STATE = (
+    "eJztXWtz2za6/iscf2ky4yaiTEmUZ+fM2I7TZuPYndjZ3dmmQ4MgZPNYIrUklTZn2/9+8A"
+    "K8E5QIibrQRjvj2CRekHwIAs97xX+PZr5DpuGbMxK4+PHoVPvvkYdmhP5SOnOsHaH5PDsO"
+    "ByJkT1lTlLWxwyhAOKJHJ2gaEnrIISEO3Hnk+h496i2mUzjoY9rQ9R6yQwvP/c+CWJH/QK"
+    "JHEtATv/5GD7ueQ/4gYfLn/MmauGTqFG7VdeDa7LgVfZ+zYx+86D1rCFezLexPFzMvazz/"
+    "Hj36Xtra9SI4+kA8EqCIQPdRsIDbh7uLnzN5In6nWRN+izkZh0zQYhrlHrchBtj3AD96Ny"
+    "F7wAe4yo993RgZ5snQMGkTdifpkdFf/PGyZ+eCDIHru6O/2HkUId6CwZjh9o0EIdxSBbyL"
+    "RxSI0cuJlCCkN16GMAFsGYbJgQzEbOC0hOIM/WFNifcQwQDvDwZLMPvH2eeLn88+v6KtXs"
+    "PT+HQw8zF+HZ/q83MAbAYkfBoSIMbNuwmg3us1AJC2qgWQnSsCSK8YEf4NFkH8++3NtRjE"
+    "nEgJyC8efcBfHRdHx9rUDaPfDhPWJSjCU8NNz8LwP9M8eK8+nf2rjOvF1c05Q8EPo4eA9c"
+    "I6OKcYw5Q5ecp9/HDARvjpdxQ4VuWM3/fr2lZPzfqz8hHkoQeGFTwxPF+8iHwJ2YReWVzY"
+    "8aVLy4K2CButLEdfF7iHMP05RGP6czTuaV8XNkIm/XkyMrVXl5/fnWqsw9dvjkqvSE76q0"
+    "f/p41GBrQZGOx3/Jb+Y/boH84QDtnYNOH3E1OD8/0ePdTHcKg3xHDI1OF6g5FzDJciBpPp"
+    "9fKSIDI22GUtHBCHDniXPj1t7+gGTm+B6HALA4fds2PCoTHi14D+8AgN2BOrNXbnayyZIX"
+    "cqszikAu0sD1vHr7A4GE3WBqN+aTAqKwP7VwK+pL1aXFMI5xQIYnmLmc1n26ZQluU6Cqne"
+    "BFG9HlC9jKftBtGjg75XsXxHcRBjmZcp4UinDhK5M/IGfjlMRJcg+O7s7rKED71/p26kXd"
+    "LhxBD6QC+APEwqSGXSa423eHrbHJyjT2dXl6ca/Pzqvb/kf/F/y+ShyTAcNhiFw9pBOCyP"
+    "QTe0KBlyvwnmxnPfnxLk1azMebkSwDYV3Nb4S1edtsff+c3NVYEqn3+4K6H45dP5Jf3EGb"
+    "i0kRuR/NJdxNSZuQJ9eCWkidgOEZW1r+wF0nngT9wpsdwZVQysRSDFhITC+50U1lyDBo2W"
+    "9cGSZX1QXdanKIysqf8gGrDv4jVFDGxRctlyBL8cJL5L4Lz78Ony9u7s0y+FMQzrFJzps6"
+    "PfS0crU2/aifbPD3c/a/Cn9u+b68uyop22u/v3EdwTWkS+5fm/0ykh/9jJ4eRQ0fgREIDW"
+    "QgL7x/IXWZRs4UXug63RZ3BuvOn3eBx15M3GQ37pi13MnTVfbFFSvdi9vlh28xKWtJxdeB"
+    "E9WnQZ++Y6sRmrxCti+fcfP5MpisSG9Zyt7Iz290vc3WG+9L+SkZwczV5+nhVknW+Iyi+5"
+    "rjqMCH5Eke1HVkjCcHNQLnhvt7yzDsMSYrQpFre0iw4j8EjQlM4h+JHgJ/BlAG3bEJGfWZ"
+    "cXSY9X/kOH8ZlQArQIiBV6aB4++lELk+x73uVt3GOHwQkI9mcz4jmohZn2c6GzZ4OKZaOI"
+    "fl2tgnMOXT4fhCaEOMB0WsXofdxph2HihjSr1a+MsTzWb6e/NylnckETjl2c9SjeeOTOpz"
+    "+aYXlR6PFQzRgryOEiCOgzWPFat2SESWLD+32f67Y7AK0RgZAbCzWxCMXRsjwqIe+P3yRA"
+    "Qej35+EBAzg0MXKxB/mLNg5i2OAKEOjAYh6EEQcIT7Cmn+r0JHKge4Sx8Ua7ATVVq95LHM"
+    "xQH+uA6BGQG+AhSBjQFvd1Hj8BzfDANrYX4sAeXyrOISexOtjhILz1W452mKMw/N2nM/wj"
+    "Ch+lbP1lwW46m7cSXZhis749saYLZfrfg+l/o5i84mxVHQYJA6j42OtpwCHOU3XLPj0coN"
+    "/TuTs/AdOHo49EuCfy4uz24uzd5dFf7cYwFuyvNRyibKNdwSKqJuJGREI3YWnVB7AC2uYA"
+    "wwo8MdnyzJbLwQTW1hNnXLvOFy8sJhPtX6UBobiuEAradMDuocooGGX4yfcfphSnj+gJ+X"
+    "CrxkRnt0doa3tEsJbcAbCGEfSEGPnAY2xWOMbIwCpYck/0IffdSEQJpDLdJA2DZsEBS2ID"
+    "KowhxsSqpbSr8bTqyW1HcN0KGVPO+mfh0xU46/ev/e3g/bUwgVf46ypO+t4PiPvgfSTft8"
+    "xK92eO2oyX7iwP550bEhQSEXVNTi1lrA5v1JymjiHfxcYO0DGb/YH7CDJk9JOegAHGzDG5"
+    "jJiUbtonUNAn7NCX6JDUJAUEE0jn0KG/G/A7HicMkV8tZZ+U+2YmqAFcfsLSfQwHa68+Xr"
+    "x7rdjjftjjy0oV2Qq7Sb4LGRjzMp2Mzu034d/9ev7dr/BvpxiUVETyjvxR8y2XxDoC5jIO"
+    "ePmvuwL9q+SxphTw6ub6p6R5OblVKo81l4eyoHrM1PU2de7HS+NPSXeHOTsceOTdgbkOt8"
+    "ywLuhfnyiP4vdXR7byrZrwLjbNWjMuIeF0xEBe9BNTo+xEK/CVr4u+Pu7DMWcMKcSU7miU"
+    "mz/6QbmdPSYGo0m6gGOJPZHbv2ychz3smafapa6bvVfQdjhOGdt47KSeRLBTwgndZB2ajN"
+    "xxf6OBWKue1gdXpD6A1v0JtNZJTP9eJzd9qRuvBKcV59sL55MlKxsRld2jt2WeohjzxowZ"
+    "ZmMiT5pLYtsCtGPjMUZFdliWxNToLKS0snVVwPVW5bSmciqp9WAK6VRUkXpyWVBXVlPLor"
+    "IkZ9yDn9jIvKqcoFECB97XUWwzK9rhctdbYeXbtPOYI+bteHGhnBPoL/Esk5GREEyESY+H"
+    "l2XXZt7oJOKM0kaQGJqcrQKf1AfsUL+njH97IoL0UR/8QFCUYwkZzMl0c9HYbTG2estVfT"
+    "G2gwVyF2arQi6bvwiwFK3JJDpiCdzF2FTu9+fpfk+Wbqn1ryiknPB5JFvww+d8woeHYlNX"
+    "fHGMHJQ3PliIrcNwfDlppy2a8/TBiDm1TVPOYQ7XEHPzjToEPl5wQ8QBm5yXg8VYx9r7jz"
+    "zgFAg2htQQbI6AgBt6UhJTeGX7ZJSqCHBIkXHlie9odSc6aywm9MteBHLhsGW5TlLHrdjC"
+    "YFWY0WcOhOml9bpNWa4jiO5av8nDZBGpuAeBqAJZCDKZTFyMsMDKUY9uXkbBKoTV8UNK0W"
+    "RAzSQUpEJIMdX2oHiELmVGygspYJcC218H2L4CdiWwJ+sAe6KAXQmssQ6whgK23qQc0fNy"
+    "61ZORIEqHq2PyHsgUGdNargWpBS0Qmhn9MoWvaGAOK6kg0kgqkAWqwiOKx2NlJfZEqzbjU"
+    "Rqy16wVpy5CqreclD1Jzo+MUPugxehJwIlKwV2c1Gz42Vm9FkqQKcWkEirazaxq9t4MuDF"
+    "CCBAhJz0mMnaia3d4r6F9vT1Okr3oMJpdSUeqxJ3Nxg5zHpuG3zHqSSiJTaY921e+YAFuZ"
+    "jDSRomnYW6JFlxdp/wUOuziN61vYhIePrV0+h/8Q2B0/RUE94MHkPEDYqjaNizQWLdGy4f"
+    "Tv3IooOZTE9l7lV7xYK2DR6Ew7bd0qHjPon34ILr64b+Nq0SwS9s9ozXbyp3Du5eOojpn7"
+    "k9vUa89hQEn8M+XVrpLeG+wwKFevoxSx4cGcl+Xkz02vdI8ogRihZh3L/2pxY+uRCsSH+j"
+    "wxF9J05DH8WvR7lbBhHe8dFvynlx3K7zooRzNcagBsGi2PY3+dlOyR0RZoI9frIvV4ZnFK"
+    "U6QuCKVOOkia/npN7Vc1Lx9JSmIvGYq49rEYirsl573tEjnptlvoxUoqs+0LZr2KhIr2ca"
+    "6aV2RXkWL3ZpbrFcGJ9AUsXyVTCtAiod0Nfd3VKOS1F9giFzSKF9BaAFporyi6i3UVSMS4"
+    "1C/vCYZbv0x1zrFW1lXehYHOcn30tslKgWoRb0lRWMTKsyZrWckxRtqk73WOTgcZLcAx0b"
+    "Pe39x2KRyGZatFKW15ifjpcoy47PyhIsRNb8+rDtgtBaU/0e1MBWkCwhh2Zi6OoVhZJYJ3"
+    "Xo9pUFhgp9HnkoE6FOArmFykWACWXPcUkSKSgzsU6C2f6opHQsiKQNiUWpDe2IB2XHEdgR"
+    "iedIA5SXeebwKCPIs9CVDyfd7RnwJqoMSMKWSbxQzFRtY1XbeHe1jQXzXAvANU9GPZyomD"
+    "J0S3JRby/vtOsvV1dHlcmuDezibroLXDaF16DWJFCrFOSzfphWTaRRd77pYlgmmfktxq19"
+    "ot11DI1dmYIZNCvMwQl8zUzCVvryJELWeGiYjVidTYREtlze77JwNYlOYqswl3CGyIx3+m"
+    "F7AE74hn7M7jvWBXFwyrS7H9MuvLy1o1Iqwt3UQDuicTYKSiGTCcFSQfeZREcMejtPwHEd"
+    "YsnjWhJT4ArBVfEEKp5ga5SvrGAceDwBKBwXjygSkcf03FLSOGM5PkmzVVyxHl9FxPawqX"
+    "IEOW+y+/gVpDpZYHoLfuLcRgpS/s2SXEeW7LK3uJm7eJm/uFqnKDWFCEwIS/I5i2IdwXPX"
+    "FAg531xRzdB6XDMJBak4vVt5VJ+PR1UiXXeb7OxngqbRYx0/y51dytAeWTvF0RRHe9kcjf"
+    "kX6bOEstvnVQS7kkr17GnFC8BU8QrFK9rmFcAZbD/6REJWbFDALUotlvILzNtaM95YIplk"
+    "MAIXXW+U+vt4+QO2fR73+pX7rsknWacjYeGJkNChHJxq9/cw6d/fQ4dDqAHBakPf36MwdM"
+    "F4Gd3fx3UY4g5PRZdmPk1INrFPTOVt3A+B4m9UhjxlEl1Zk7a+fVo2DRRBvPRw8H1OoVhm"
+    "kAk3qmiqlni1xHdpiS+4cenYl3YyFoWUfzGPZAuuxZjZ3GYdHh6YTZ2LxaFySH7FEsr1DD"
+    "P3HlYzzPh512SYfFu+4YDlCOts8w99YJb4YXKJBkRTsj8erJZsC5i2T7cNxAPCth4kWEAl"
+    "X+mn16/5VoVM2nTYhtQm7RXwSjc1yWLo3kJrKB+GMNt3mm+bbfchKzqtyMYqojmmUajI1o"
+    "yo/pqP14Z7UBXD2o+Uk938d8u7/lbnuZy/7ehw+SvLfFyLYBUlFcE6MIIFmto6rzUvp4qa"
+    "7Tl+VCWRqSSy3SWRNcnnyVsy189dqdpQuwNrcflczGYocFvCI2b8t6zT7x2DZXc6U4LPSt"
+    "UpB2RjDcoqvNJGqlSm4EAqzdiI826E2k7WvViNWrcvrkIVFS/ThGJPJsYsBQgb2tmHTE/q"
+    "OQ67nJ4pXtnl2IaSTrkYdFopShns92Swz8aztLE5J6uMzcrY/KJ0IWVsVsbml2ls/gfBkR"
+    "+88/FiRjxhqGSpxVKq9I21tZy4sUQONNLTDaPxCIyq9BCEDgz6kHgMQQDxLtSc6JQv9FpA"
+    "lTbvFDjTj1pAJiQgdKyyEXqq/ZAkHjwsXIqA65EfjrUfUurFl9Efkh20Cx24zmm6NYXdn4"
+    "wFG3PD75TcuQ5IkplNHIc+0ammD06GYEXvwz0PHR4gkT7gq5s58c4+aBFd3n9MpX48+TGc"
+    "oek0vpfXipXthZUVB5CMUboq2RVqVjRL642yXPQlWS56Ncsl/1lJDMyy2EtauAtk1vciyQ"
+    "3fciJdGYe7VhHSubeKK19Ia4zqebFnhG2ep/Pl9RUsZGpfiWesWB1IoO4tRsLgCXZ8KYsN"
+    "aYvmxr0RK4luYlxglIlpDJMxq9F+go00MmE0MkVl29llxUa/tq8hjN9NeG9Mc+/v8/n39/"
+    "dsg7dSxfjX2p+0HfdjT62AYD9w4pZjdjPslrOyQTwg43VpG7bFfOojh4BVsa+P+9o88DEo"
+    "TN5DcsTxPZL8Hm84kvwZom9s57YJcqfEiXuG0mS045uLz8CwT3ps27oJxHAYHLfByGFQss"
+    "3hzAGHapzs8ff325trxq/ZDnWDSbpDnY8Diyp2p9o1vWoQ9w9snEcrMz1jwENFBrybRBJT"
+    "PYGB5PnxvnxLAOJxLdlbdpjd1RnjzBSbSsN99mCPPqjRtE78Cf1JTxcO5SbV8qnCIFFhK+"
+    "1bcDuxS9VR8sm2FrjS/hZudF2Yfv+/tUhFSVRFOew5yqE46Uh8GxXBHX4i5bI+B/qZpBCJ"
+    "K743wLam7PuhFjcoWyYaGSaW2CWq5UzQg+eHrlTpjYJQR4DctWqdYmRN3VAwpwPdWoFuKl"
+    "mC+ItHn/1XymKjYw2a/La1WeFvk4WHAWnNXrjTyPXCN3DB/9lghljyHgCS5e+hDHlp9oYO"
+    "Kl7QPJWVMh+VBdVAF9uQgsAPrNrEsSW1IcuCCmDxTALqodQEkgioeWP9eWPhgYHgwXOBWU"
+    "u/ArG0eh/rvw/wUIO/UGaGycuoyUU4ucQ2IpmxnRNpYUAfFMRbGbkTd0qsOaIEXmLoFoSe"
+    "kYtFRbgpR4za4PuFvNhKfoFKAFIJQIeQALRNT25SrJHgJ+BAsLHPkpKOuVbHjUo7xgLpFk"
+    "SNvL6C3bRHI8z/AGcgZkniaRJ5si22PUbMY2dCxjhyJqbQ3dta52I/L4o9kGmf6dYueMxz"
+    "P8wRyxIx8Vs45ujxft5Fty1zyv6phU/ufJ56XhmcbLXgDdLQRjRiKScYXJVOb8i915Cij3"
+    "BPP06jIrGp47j1NRVfx6HJ7NHMb5lYpmMXmfJWtu2tpA9Gppb/jQSBK5duX5XsiDq5g/Ld"
+    "snvvtrTvboOFqeXhuQQ6wb673XCNtzu62q7mkE3P0vpdQVK5xPfsEleK+rPQ55Si/kxfbE"
+    "VRj8hsPqVYyynrJSm1VbYycigjx5aNHKKvtgXkSvaJu1zPB/cBN8WyND0dsNEohXu15Sj/"
+    "ZiTMRwkWjW1ItQaczEjCD5XKbDj6gAWC99hpewLh9vYYm2kz/aQnTCPY7gXjDYWHPfOUJ9"
+    "cyW1TczImj3I+54WqU/ZVdCSxXPWhNhk6cscqC8HWT12bUipYx22An+mOjwRMMhg4P8WfW"
+    "LQAAcipUmZI9mo2krUXd1eO3kv7qhhadYNxvgrXp3PenBHk14zAvV8LTpoLbAjQdo23r7u"
+    "c3N1cFHeD8Q9nT/eXT+SUFmMFLG7l8haoSzdAPIssPhEXv6+uAFIR2Rzd7+/7AlTXimSmt"
+    "yhrxTF9sWn+vYV5ubqn2RWGaMqULxX7Zzqg8Wy1bCNr0xSIICF1b6Dy4COIRVVJQRM2WKi"
+    "dMx8VcwprkRdbzbTvDHksqZtqCM4C0WUgFjpOKhVcTJzK31DXoGrEeHxcs/OVjnPSsn+pa"
+    "ot6A0zot7851ACjlzlJqB0xHIL20vLvTc5jywFJq8ajf47m4m+oIB2C76rq6EL93639Dub"
+    "0Hy3JdUR52HfSpFvkXuchXF7ZV1uIbj9z59MeWbcXbnq+2Ew63MRGIl/ZbD83DR19Yi0/U"
+    "bDURSObBMBbZiAlkK3RiY7N7GOxpvckov2hXLtqYEGxwhdgGyetl0NW7UMc4jTjDpt6Ly+"
+    "yJg+0KfGCEtfxCAq1Y2RDOKrKax6w2B9uShuR2k+GV+oCigK1SVUZWHOJ5cghlAXoWHEJg"
+    "Adq//qJ87y/G997EJAV5wLMZ8RxmeNrQOvW50JmyTNXgIuCiVeTqaajglTXzkLNkAJ7vUG"
+    "B1CNvMvjNJajeXrlDj/16/O2CWAfKejrUQ0+/2WGNPaX0jART2TtzVZ2/Ps5LOOcc20EtG"
+    "bQ1gs4bD7FEnBMcbETbjhIUkByjkB7+qnIb2qzXnX710yaka8U5mNwyauK0H9V7rQXU3QX"
+    "8RYCk8M4lOQrgV1/8eSjcfVrT+NjSYSUDoo3lYsHtO/egsCHUE2G1XlGMLpIDuTn1UF0GR"
+    "SJQQnIDIQWK4LHPp5sv51aX2y+fLiw+3H+LqF6lGx04Ww1A+X55dVWN7QkqOcUQEi/iq6J"
+    "685HrxPQeFZ4vhPUDgJEhR0vyFRt3vPN9u31Nh+3SnoCTIIFkRVICyc/PAn82jdRCtSipI"
+    "2bl06wlr7dG6pAsFMgf5j7kbcI1wjR23y8Iq+1Zl3ypvx1Y2gozNas1JYk5iSzzxIO1nGW"
+    "Q2ivCjHGZ5kZfkIiqYG0rRC3II1ki/UE1F+SiVj3I/+cHl77AlBAUxXgf3ETfFs2aqKmB7"
+    "e3mnXX+5ujqqriwtIFr0VJ4nvXZ3iObXz/X96BNCHGjTqgf9fdxptwAuDDueHWnBPLAhNP"
+    "Apn7HepMMMDgmc3cUZ8G9zZbBB+gk3jTiw2BcjkQKTDw6It4EjA1MYHJD0LY5vXasjHsYa"
+    "b/VmY9PMolULoa1D/gdy0l3ubFbT0bYnJk/Lh0ZGrxDhkOXm22xH6ZGBVVDqvkIN6PXJNz"
+    "S14KoReZDyPYqlO2lw29L+0Ak+kT+3pBw/VckXqlllSEzRzHaQlFtXJKw8vHFe7XTGjeUy"
+    "X3xBSH3oeSyh+g48+EIy9EAgq4ZobojSlxf5T0QUZls7fVYFX+jsqdwEz9RNoAyOyuCoki"
+    "IOEt0dWitSW9dKg0XeKtbYZjHJC8kaLXgWLaQaMLuDLrY4JJdYbbuQ7S/OxC0l18bFOvJ9"
+    "873uwRxxAjmysAsES6s1bThjGNzM8ZYV62CH7PhQuUQgHg30dCML2xw4yqqxH6tGMgikUy"
+    "cqgl1Jtt129JDikc+UR5amT6kZRyj7krilIuTtEvKgwvpa9bseJqZNSbrwa1sdH6CUnM2V"
+    "nG0S+loPbU3xnTpv7ooKPLFLec00aGHVPFa/Lq5qkxH1XHkc8TWbl+Vb+wKx9zJf16+qBw"
+    "DpB23AZJ5IfWSyq7C2Y12Pa/kVrwwXpYf6OuX+xYtq16fXqSTVMIwsCZtvPkd047VSB/aj"
+    "DqAwpHPdWuy1JKroq6KvB/JOFX09OPqqqNY6AayK9LdD+ndJX//6f9m64PE="
+)
@@ -0,0 +1,149 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "vector_documents" ADD "content_hash" VARCHAR(64);
+        ALTER TABLE "vector_documents" ADD "embedding_model_version" VARCHAR(100);
+        UPDATE "vector_documents" SET "content_hash" = encode(sha256(convert_to("content", 'UTF8')), 'hex'), "embedding_model_version" = 'text-embedding-3-small';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "vector_documents" DROP COLUMN "embedding_model_version";
+        ALTER TABLE "vector_documents" DROP COLUMN "content_hash";"""
+
+
+MODELS_STATE = (
+    "eJztXWtz2za6/iscf2ky4yaiTEmUZ+fM2I7TZuPYndjZ3dmmQ4MgZPNYIrUklTZn2/9+8A"
+    "LgHZRIibrQRjvj2CRekHwIAs97xX+PZr5DpuGbMxK4+PHoVPvvkYdmhP5SOHOsHaH5PD0O"
+    "ByJkT1lTlLaxwyhAOKJHJ2gaEnrIISEO3Hnk+h496i2mUzjoY9rQ9R7SQwvP/c+CWJH/QK"
+    "JHEtATv/5GD7ueQ/4gYfzn/MmauGTq5G7VdeDa7LgVfZ+zYx+86D1rCFezLexPFzMvbTz/"
+    "Hj36XtLa9SI4+kA8EqCIQPdRsIDbh7sTzxk/Eb/TtAm/xYyMQyZoMY0yj1sTA+x7gB+9m5"
+    "A94ANc5ce+bowM82RomLQJu5PkyOgv/njps3NBhsD13dFf7DyKEG/BYExx+0aCEG6pBN7F"
+    "Iwrk6GVEChDSGy9CGAO2DMP4QApiOnBaQnGG/rCmxHuIYID3B4MlmP3j7PPFz2efX9FWr+"
+    "FpfDqY+Ri/Fqf6/BwAmwIJn0YDEEXzbgKo93o1AKStKgFk5/IA0itGhH+DeRD/fntzLQcx"
+    "I1IA8otHH/BXx8XRsTZ1w+i3w4R1CYrw1HDTszD8zzQL3qtPZ/8q4npxdXPOUPDD6CFgvb"
+    "AOzinGMGVOnjIfPxywEX76HQWOVTrj9/2qtuVTs/6seAR56IFhBU8MzycWkS8hm9BLiws7"
+    "vnRpWdAWYa2V5ejrAvcQpj+HaEx/jsY97evCRsikP09Gpvbq8vO7U411+PrNUeEVNZP+6t"
+    "H/aaORAW0GBvsdv6X/mD36hzOEQzY2Tfj9xNTgfL9HD/UxHOoNMRwydbjeYOQcw6WIwWR6"
+    "vawkiIwNdlkLB8ShA96lT0/bO7qBk1sgOtzCwGH37JhwaIz4NaA/PEID9sRqjd35GktmyJ"
+    "02WRwSgXaWh63jl1scjDprg1G9NBillYH92wC+uL1aXBMI5xQIYnmLmc1n27pQFuU6Cqle"
+    "B1G9GlC9iKftBtGjg76XsXxHcZBjmZUp4EinDhK5M/IGfjlMRJcg+O7s7rKAD71/p2qkXd"
+    "LhxBD6QC+APExKSKXSa403Mb1tDs7Rp7Ory1MNfn713l/yv/i/RfJQZxgOa4zCYeUgHBbH"
+    "oBtalAy53yRz47nvTwnyKlbmrFwBYJsKbmv8JatO2+Pv/ObmKkeVzz/cFVD88un8kn7iDF"
+    "zayI1IdunOY+rMXIk+vBLSWGyHiDa1r+wF0nngT9wpsdwZVQysRdCICUmF9zsprLkGDWot"
+    "64Mly/qgvKxPURhZU/9BNmDfiTVFDmxectlyBL8cJL5L4Lz78Ony9u7s0y+5MQzrFJzps6"
+    "PfC0dLU2/SifbPD3c/a/Cn9u+b68uiop20u/v3EdwTWkS+5fm/0ykh+9jx4fhQ3vgREIDW"
+    "QhL7x/IXmZds4UXug63RZ3BuvOl3MY468mbFkF/6YhdzZ80Xm5dUL3avL5bdfANLWsYuvI"
+    "geLbqMfXMdYcYq8Aoh//7jZzJFkdywnrGVndH+fhHdHeZL/yseyfHR9OVnWUHa+Yao/JLp"
+    "qsOI4EcU2X5khSQMNwflgvd2yzvrMCwhRpticUu76DACjwRN6RyCHwl+Al8G0LYNEfmZdX"
+    "kR93jlP3QYnwklQIuAWKGH5uGjH7Uwyb7nXd6KHjsMTkCwP5sRz0EtzLSfc509G1QsG0X0"
+    "62oVnHPo8vkgNCHEAabTKkbvRacdhokb0qxWvzLG8li/nf7eGjmTc5qwcHFWo3jjkTuf/q"
+    "iH5UWux0M1Y6wgh4sgoM9gibVuyQhriA3v932m2+4AtEYEQmYsVMQi5EfL8qiErD9+kwAF"
+    "qd+fhwcM4NDEyMQeZC9aO4hhgytAoAOLeZBGHCA8wZp+qtOTyIHuEcbGG+0G1FStfC8imK"
+    "E61gHRIyA3wEOQMKAt7us8fgKa4YFtbC/EgT1+oziHjMTqYIeD8NZvOdphjsLwd5/O8I8o"
+    "fGxk6y8KdtPZvJXowgSb9e2JFV0o0/8eTP8bxeTlZ6vyMIgZQMnHXk0DDnGeqlr26eEA/Z"
+    "7M3dkJmD4cfSTCPZEXZ7cXZ+8uj/5qN4YxZ3+t4BBFG+0KFlE2EdciEroJS6s+gBXQNgcY"
+    "VuCJyZZntlwOJrC2njjjynU+f2E5mWj/KjUIxXWJUNCmA3YPZUbBKMNPvv8wpTh9RE/Ih1"
+    "s1Jjq7PUJb2yOCtfgOgDWMoCfEyAceY7PEMUYGVsGSe6IPme+mQZRAItNN0jCoFxywJDag"
+    "xBgEJlYlpV2Np1VNbjuC61bImHLWPwufrsRZv3/tbwfvr4UJvMRfV3HS935A3AfvI/m+ZV"
+    "a6P3PUZrx0Z3k479yQoJDIqGt8ailjdXij+jR1DPkuNnaAjtnsD9xHkCGjn/QkDFAwx/gy"
+    "clK6aZ9AQZ+wQ1+iQxKTFBBMIJ1Dh/5uwO94HDNEfrWEfVLum5qgBnD5CUv3MRysvfp48e"
+    "61Yo/7YY8vK1VkK+wm/i6awJiV6WR0br8O/+5X8+9+iX87+aCkPJJ35I+Kb7kg1hEwl3HA"
+    "y3/d5ehfKY81oYBXN9c/xc2Lya2N8lgzeSgLqsdMXW9T575YGn+KuzvM2eHAI+8OzHW4ZY"
+    "Z1Qf/6RHkUv78qspVtVYd3sWnWmnGJBk5HDORFPzE1yk60HF/5uujr4z4cc8aQQkzpjka5"
+    "+aMfFNvZY2IwmqRLOJbcE7n9y4o87GHPPNUudd3svYK2w3HC2MZjJ/Ekgp0STugm69Bk5I"
+    "77Gw3EWvW0Prgi9QG07k+gtU4E/Xsd3/SlbrySnFacby+crylZ2Yio7B69LfMUxZg3Zsww"
+    "G5PmpLkgti1AOzYeBSpNh2VBTI3OXEorW1clXG9VTmsip5JaD6aQTkkVqSaXOXVlNbXMK0"
+    "vNjHvwExupV5UTNErgwPs6EjazvB0uc70VVr5NOxccMWvHE4VyTqC/2LNMRkZMMBEmPR5e"
+    "ll6beaPjiDNKG0FiaHK2CnxSH7BD/Z4y/u2JCNJHffADSVGOJWQwI9PNRWO3xdiqLVfVxd"
+    "gOFshdmK1yuWz+IsCNaE0q0RFL4C7GpnK/P0/3e7x0N1r/8kLKCZ9FsgU/fMYnfHgo1nXF"
+    "58fIQXnjg4XcOgzHl5N22qI+Tx+MmFPbNJs5zOEacm6+UYfAx3NuCBGwyXk5WIx1rL3/yA"
+    "NOgWBjSA3B5ggIuKHHJTGlV7ZPRomKAIcUGVee+I5Wd6KzxmJCv+xF0CwctijXSeq4FVsY"
+    "rAoz+syBNL20WrcpynUE0V3rN1mYLNIo7kEiqkCWgkwmExcjLLFyVKOblVGwSmF1/JBStC"
+    "agphIKUimkmGp7UDxCb2RGygopYJcC218H2L4CdiWwJ+sAe6KAXQmssQ6whgK22qQc0fPN"
+    "1q2MiAJVPlofkfdAoM5ao+Gak1LQSqGd0Stb9IYC4rgNHUwSUQWyXEVw3MbRSFmZLcG63U"
+    "iktuwFa8WZq6DqLQdVf6LjEzPkPngReiJQslJiN5c1O15mRp8lAnRqAYmkumYdu7qNJwNe"
+    "jAACRMhJj5msHWHtlvcttaev11GyBxVOqivxWBXR3WDkMOu5bfAdp+KIFmEw79u88gELcj"
+    "GHkyRMOg11ibPi7D7hodZnEb1rexGR8PSrp9H/xA2B0/RUk94MHkPEDRJRNOzZILHuDZcP"
+    "p35k0cFMpqdN7lV7xYK2DR6Ew7bd0qHjPhF7cMH1dUN/m1SJ4Bc2e8brN6U7B3cvHcT0z8"
+    "yeXiNeewqCz2GfLq3wlnDfYYFCPf2YJQ+OjHg/LyZ67XskfsQIRYtQ9K/9qYVPLgQr0t/o"
+    "cETfiVPTR/HrUeaWQYR3fPSbcl4ct+u8KOBcjjGoQDAvtv1NfrZTckeGmWSPn/TLbcIz8l"
+    "IdIXB5qnFSx9dzUu3qOSl5egpTkXzMVce1SMRVWa897+gh5uYmX0Yi0VUfaNs1bFSk1zON"
+    "9FK7ojyLF7s0t7hZGJ9EUsXylTAtA9o4oK+7u6UcF6L6JEPmkEL7ckBLTBXFF1FtoygZl2"
+    "qF/OExy3bpj7nWK9vKOtexPM6veS/CKFEuQi3pKy0YmVRlTGs5xynaVJ3uscjB4zi5Bzo2"
+    "etr7j/kikfW0aKUsrzE/HS9Rlh2flSVYyKz51WHbOaG1pvo9qIGtIFlADs3k0FUrCgWxTu"
+    "rQ7SsLDBX6PM2hjIU6CeQWKhcBJpQ9i5IkjaBMxToJZvujktKxIGpsSMxLbWhHPCg7jsSO"
+    "SDynMUBZmWcOjzKCPAtd+XDS3Z4Bb6LKQEPYUokXipmqbaxqG++utrFknmsBuPrJqIcTFV"
+    "OEbkku6u3lnXb95erqqDTZtYGd6Ka7wKVTeAVqdQK1CkE+64dpVUQadeebzodlkpnfYtza"
+    "J9pdx9DYlSmYQbPCHBzDV88kbCUvr0HIGg8NsxGrs4mQzJbL+10WrtagE2EV5hLOEJlipx"
+    "+2B+CEb+jH7L5jXRIHp0y7+zHtwstbOyqlJNxNDbQjGmetoBQymRDcKOg+leiIQW/nCTiu"
+    "Q6zmuBbEFLhScFU8gYon2BrlKyoYBx5PAArHxSOKZOQxObeUNM5Yjk/cbBVXrMZXEbE9bK"
+    "ocQc5b0338clKdLDC9BT9xZiOFRv7NglxHluyit7ieu3iZv7hcpygxhUhMCEvyOfNiHcFz"
+    "1xQIOd9cWc3QalxTCQWpPL1beVSfj0e1QbruNtnZzwRNo8cqfpY5u5ShPbJ2iqMpjvayOR"
+    "rzL9JnCZtun1cS7Eoq1bOnFS8AU8UrFK9om1cAZ7D96BMJWbFBCbcotFjKLzBva8144wbJ"
+    "JIMRuOh6o8Tfx8sfsO3zuNev2HdFPsk6HUkLT4SEDuXgVLu/h0n//h46HEINCFYb+v4eha"
+    "ELxsvo/l7UYRAdnsouzXyakGxin5jK27gfAsXfaBPylEp0ZU3a+vZp6TSQB/HSw8H3OYVi"
+    "mUEm3KiiqVri1RLfpSU+58alY7+xkzEvpPyLWSRbcC0KZnObdnh4YNZ1LuaHyiH5FQsoVz"
+    "PMzHtYzTDF867JMPm2fMMByxHW2eYf+sAs8MP4EjWIZsP+eLBavC1g0j7ZNhAPCNt6kGAJ"
+    "lXyln16/5lsVMmnTYRtSm7RXwCvZ1CSNoXsLraF8GMJs32m+bbbdh6zopCIbq4jmmEauIl"
+    "s9ovprNl4b7kFVDGs/Uq7p5r9b3vW3PM9l/G1Hh8tfWebjWgQrL6kI1oERLNDU1nmtWTlV"
+    "1GzP8aMqiUwlke0uiaxOPk/Wkrl+7krZhtodWPPL52I2Q4HbEh6C8d+yTr93DJbd6UwxPi"
+    "tVpwyQtTUoK/dKa6lSqYIDqTRjQ+TdSLWdtHu5GrVuX1yFyitepgnFnkyMWQoQNrSzD6me"
+    "1HMcdjk9VbzSy7ENJZ1iMeikUpQy2O/JYJ+O58bG5oysMjYrY/OL0oWUsVkZm1+msfkfBE"
+    "d+8M7HixnxpKGShRZLqdI31tZyROMGOdBITzaMxiMwqtJDEDow6EPiMQQBiF2oOdEpXui1"
+    "hCpt3ilwph+1gExIQOhYZSP0VPshTjx4WLgUAdcjPxxrPyTUiy+jP8Q7aOc6cJ3TZGsKuz"
+    "8ZSzbmht8puXMdkCQzmzgOfaJTTR+cDMGK3od7Hjo8QCJ5wFc3c+KdfdAiurz/mEj9ePJj"
+    "OEPTqbiX19AlHasRhDc+ovBRe5tewWKv0/pGAhipbOuP8djhJm6GHysfWkbROdHFziIiTf"
+    "yVuIJ4kPAR9QfD44pXkJQuhd9NvhWQ4o075435Id7EbF6W7Ap5zBvO9Vp5OPqSPBy9nIeT"
+    "/fAbDMyi2EuiFjm6zSeSMnJLtvxLRboyDnetxCQzfhlXvtRXmP2zYs8I26wmwQnAK1hqSz"
+    "tfZJbNJvNjUa4jGWD5yXFo1Jgbh0bl1AinKgZhnnY0QXZJF50EeSsrkLJYPCOLxYFEwN9i"
+    "JI1KYseXqochbVHfaj5iew2YGOdUtdjmjMmYbX5wgo0k5Gc0MmX7IbDLyq3pbV9DGhgfK5"
+    "RCf7y/zxa2uL9nOycWtmJ4rf1J2/EAkakVEOwHjmg5ZjfDbjmtx8UjnV4X9jdczKc+cgiY"
+    "6/v6uK/NAx+DJcJ7iI84vkfi38VOPvGfIfrGtkScIHdKHNEz1PyjHd9cfGaqX4/tBzmB4C"
+    "iD4zYYOQxKzBU6DtU43jzz77c310xxZVs/DibJ1o8+DqwA/X6qXdOrBqJ/UHN5GgDTHgc8"
+    "BmvAu4klMVXAGUieLza8XAIQDxhL37LDHBrOGKc+jkQa7rNnC612ncAu+pOezh3KTKrFU7"
+    "lBouLB2neNdGL7t6P4k20tIqz9vRHpujD9/n9rkYqCqAof2nP4UH7SafBtlAR3+IkU62Ud"
+    "6GeSQCTfSqEGthX7KXRFnamlzSxRZsp1gtCD54duo5o2OaGOALlri1CCkTV1Q8mcDnRrBb"
+    "qJZAHiLx599l8pi42ONWjy29Zmhb9NFh4GpDV74U4j1wvfwAX/Z4MZYsl7AEiWv4ci5IXZ"
+    "GzoohRdkqWwjq2dRUA10uekzCPzAqszIXFJ0tSioAJbPJKAeNppAYgE1b6w/byw8MBA8eC"
+    "4w68avQC6t3sf67wNCP8AR32SGycqoyUU6uQgbUZOxnRFpYUAfFMRbGbkTd0qsOYokLq7q"
+    "oZsTekaeQRU6qhwxq0NHhdV8jRebl1Qvdq8vtpS4ozLrVGbdIWTWbdOTG1dBJfgJOBDsmL"
+    "WkVmqm1XGtmqlCINnbq5bXV7JN/WiE+R88zlTLVmeI95u3x4h57EwoxYCciSl197bWudzP"
+    "i4QHMukz2TMJj3lSlTli6VcmfgvHHB2ug42C25Y5Zf/Uwid3Pk88rwxOtlrwBknMMBqx+F"
+    "wMrkqnN+Tea6h9gXBPP07CjbGpY9H6moqv49Bk9mjmt4wt08JFpryVbXsr6YORqeV/I0Hg"
+    "NqtjUZbsiDq5g7r4TTe1bmlD6xoLU8vDcwl0kg2tu+Eab3d0tV0mJZ2eG+t3OUnlEt+zS1"
+    "wp6s9Cn1OK+jN9sSVFPSKz+ZRi3UxZL0ipPeiVkUMZObZs5JB9tS0gV7BP3GV6PrgPuC6W"
+    "henpgI1GCdyrLUfZN9PAfBRjUduGVGnASY0k/FChfo2jD1ggeI+dticQbm+PsZk000960j"
+    "SC7V5Q7NQ97JmnPGud2aJEM0dEuR9zw9Uo/Su9EliuetCaDB2RCs6C8HWTFz3V8pYx22An"
+    "+mOjxhMMhg4P8WfWLQAAcipU/Z89mo0aW4u6q8dvJWfODS06wbjfJGvTue9PCfIqxmFWro"
+    "CnTQW3BWgyRtvW3c9vbq5yOsD5h6Kn+8un80sKMIOXNnL5ClUmmqEfRJYfSHeTqC6wkxPa"
+    "Hd3s7fsDV9aIZ6a0KmvEM32xSWHLmnm5maXal4VpNqkJKvfLdkbl2Wo9UNCmLxZBQOjaQu"
+    "fBRSBGVEFBkTVbqpwwHRdzCWuSFVnPt+0MewYvrsTINKTNQiqwSCqWXk2eyNxS16BrCD1e"
+    "VAL95aNIetZPdS1WbxDmWbIDnOgAsEcCS6kdMB2B9JJ9E5yew5QHllKLR/0ez8XdVEc4AN"
+    "tV19UF8d6t/w2bbepZlOuK8rDroE+1yL/IRb68sK2yFt945M6nP7ZsK972fLWdcLiNiYBY"
+    "2m89NA8ffWmRS1mz1UQgngdDIbIRE0hX6NjGZvcw2NN6k1F20S5dtDYh2OAKwgbJ62XQ1T"
+    "tXIDyJOMOm3hNlH+XBdjk+MMJadiGBVqxsCGcVaTFxVpuD7fVEMts08RKYQFHAVqlKjisO"
+    "8Tw5hLIAPQsOIbEA7V9/Ub73F+N7r2OSgjzg2Yx4DjM8bWid+pzrTFmmKnCRcNEyctU0VP"
+    "LK6nnIWTIAz3fIsTqEbWbfmcRF0QtXqPB/r98dMMsAeU/HWojpd3us5ap5xu7qs7fnaa30"
+    "jGObVRwHgmgAmzUcZo86IVjs8FmPE+aSHKCQH/yqchraLzKeffWNS05ViHcyu2FQx209qP"
+    "ZaD8rbdPqLADfCM5XoJITbKZe7+4rjhxWtvw0NZhIQ+mgelmxLVT06c0IdAXbbFeXYAimh"
+    "u1MfVUVQxBIFBCcgcpAYLstcuvlyfnWp/fL58uLD7QdR/SLR6NjJfBjK58uzq3JsT0jJMY"
+    "6IZBFfFd2TlVwvvueg8GwxvAcIXANSFDd/oVH3O8+32/dU2D7dWXvXgOexV0D7gM4DfzaP"
+    "1kG0LKkgZefUHhe7APmPuRtwjXCNreyLwir7VmXfKm/HVnZYFWa1+iQxI7ElnniQ9rMUMh"
+    "tF+LEZZlmRl+QiypkbCtELzRCskH6hmoryUSof5X7yg4vfYUsISmK8Du4jrotnxVSVw/b2"
+    "8k67/nJ1dVReWVpANO+pPI977e4Qza6f6/vRJ4Q40KZVD/p70Wm3AM4NO54dacE8sCE08C"
+    "mfsd4ahxkcEji7izPg3+bKYIPkE64bcWCxL6ZBCkw2OEBsA0cGpjQ4IO5bHt+6Vkc8jFVs"
+    "9WZj00yjVXOhrUP+B3KSXe5sVtPRticmT8uHRkYvF+GQ5ubbbKv2kYFVUOq+Qg3o9ck3NL"
+    "XgqhF5aOR7lEt30uC2pW3NY3wif241cvyUJV+oZpUiMUUz20GN3LoyYeXhFXm10xk3ljf5"
+    "4nNC6kPPYgnVd+DBFw1DDySyaohmhih9eZH/RGRhtpXTZ1nwhc6eyk3wTN0EyuCoDI4qKe"
+    "Ig0d2htSKxda00WGStYrVtFpOsUFOjBc+ihVQDZnfQ5RaH+BKrbRdN+xOZuIXkWlGsI9s3"
+    "3+sezBEnkCMLu0CwtFrThjOGwc0cb1mxDnbIFoeKJQLxaKAnG1nY5sBRVo39WDXiQdA4da"
+    "Ik2JVk221HDyke+Ux5ZGH6bDTjSGVfErdUhLxdQh6UWF+rftfDxLQuSZd+bavjA5SSs7mS"
+    "s01CX+mhrSi+U+XNXVGBR7iU10yDllbNY/XrRFWblKhnyuPIr1m/LN/aFxDey2xdv7IeAK"
+    "QftAGTeSL1kcmuwtqOdV3U8stfGS5KD/V1yv3zF9WuT68TSaphGGkSNt98jujGa6UO7Ecd"
+    "QGFI57q12GtBVNFXRV8P5J0q+npw9FVRrXUCWBXpb4f075K+/vX/0RX4KQ=="
+)
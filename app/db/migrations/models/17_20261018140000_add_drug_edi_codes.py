@@ -0,0 +1,164 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "drug_edi_codes" (
+    "edi_code" VARCHAR(32) NOT NULL PRIMARY KEY,
+    "drug_id" INT NOT NULL REFERENCES "drugs" ("id") ON DELETE CASCADE
+);
+COMMENT ON TABLE "drug_edi_codes" IS '약품 보험코드(EDI) 정규화 테이블 (ERD: drug_edi_codes).';
+        INSERT INTO "drug_edi_codes" ("edi_code", "drug_id")
+        SELECT DISTINCT ON (code) code, id
+        FROM (
+            SELECT btrim(unnest(string_to_array("edi_code", ','))) AS code, "id"
+            FROM "drugs"
+            WHERE "edi_code" IS NOT NULL
+        ) AS codes
+        WHERE code <> '' AND length(code) <= 32
+        ORDER BY code, id;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "drug_edi_codes";"""
+
+
+MODELS_STATE = (
+    "eJztXW1v2zi2/itCvkwCZFrLlm05uLhAkqY73aZJ0aR7FzsdOBRFJ7qxJa8kd6Z3Z/775S"
+    "Gpd8qWbPlFCWeANKF4SOkRRT7nhYf/OZp5NpkGb86J7+CnozPtP0cumhH6S+7KqXaE5vOk"
+    "HApCZE1ZVZTUsYLQRzikpRM0DQgtskmAfWceOp5LS93FdAqFHqYVHfcxKVq4zr8XZBx6jy"
+    "R8Ij698OtvtNhxbfIHCaI/58/jiUOmduZWHRv6ZuXj8MeclX1ww/esIvRmjbE3XczcpPL8"
+    "R/jkuXFtxw2h9JG4xEchgeZDfwG3D3cnnjN6In6nSRV+iykZm0zQYhqmHrciBthzAT96Nw"
+    "F7wEfo5eeubgwNszcwTFqF3UlcMvyLP17y7FyQIXBzf/QXu45CxGswGBPcvhM/gFsqgHf5"
+    "hHw5eimRHIT0xvMQRoAtwzAqSEBMBk5DKM7QH+MpcR9DGODdfn8JZv84/3L5y/mXY1rrBJ"
+    "7Go4OZj/EbcanLrwGwCZDwadQAUVRvJ4B6p1MBQFqrFEB2LQsg7TEk/BvMgvj3u9sbOYgp"
+    "kRyQX136gL/aDg5PtakThL8dJqxLUISnhpueBcG/p2nwjj+d/zOP6+X17QVDwQvCR5+1wh"
+    "q4oBjDlDl5Tn38UGAh/Pw78u1x4YrX9crqFi/NurN8CXLRI8MKnhieTywiXwM2oRcWF1a+"
+    "dGlZ0BpBpZXl6NsCdxCmPwdoRH8ORx3t28JCyKQ/e0NTO7768u5MYw2evDnKvaJ60t9c+j"
+    "+tNDSgTt9gv+O39B+zQ/+wB1BkYdOE33umBte7HVrUxVDUGWAoMnXorz+0T6ErYjCZTict"
+    "CSIjg3U7xj6x6YB36NPT+rZu4PgWiA630LfZPdsmFI0Q7wPaw0PUZ0+s1tidr7Fkhpxpnc"
+    "UhFmhmedg6fpnFwaiyNhjlS4NRWBnYvzXgi+qrxTWGcE6BIGN3MbP4bFsVyrxcSyHVqyCq"
+    "lwOq5/G0HD98stGPIpbvKA5yLNMyORzp1EFCZ0bewC+HiegSBN+d31/l8KH3b5eNtCs6nB"
+    "hCH2gHyMWkgFQivdZ4E9Pb5uAcfTq/vjrT4Oc39/0V/4v/mycPVYbhoMIoHJQOwkF+DDrB"
+    "mJIh57tkbrzwvClBbsnKnJbLAWxRwW2Nv3jVaXr8XdzeXmeo8sWH+xyKXz9dXNFPnIFLKz"
+    "khSS/dWUztmSPRh1dCGontENG69pW9QDr3vYkzJWNnRhWD8cKvxYSkwvudFNZcg/qVlvX+"
+    "kmW9X1zWpygIx1PvUTZg34k1RQ5sVnLZcgS/HCS+S+C8//Dp6u7+/NPnzBiGdQqudFnpj1"
+    "xpYeqNG9H+58P9Lxr8qf3r9uYqr2jH9e7/dQT3hBahN3a93+mUkH7sqDgqyho/fALQjpHE"
+    "/rH8RWYlG3iR+2Br9BnsW3f6Q4yjlrxZMeSXvtjF3F7zxWYl1Yvd64tlN1/DkpayCy/Cpz"
+    "Fdxr47tjBj5XiFkH//8QuZolBuWE/Zys5pe59Fc4f50v+KRnJUmrz8NCtIGt8Qlc+pplqM"
+    "CH5CoeWF44AEweagXPLW7nhjLYYlwGhTLO5oEy1G4ImgKZ1D8BPBz+DLANq2ISK/sCYvox"
+    "avvccW4zOhBGjhk3Hgonnw5IUNTLLveZN3osUWg+MT7M1mxLVRAzPtl0xjLwaVsYVC+nU1"
+    "Cs4FNPlyEJoQYgPTaRSj96LRFsPEDWnjRr8yxvJYu63+3mo5kzOasHBxlqN465J7j/6ohu"
+    "VlpsVDNWOsIIcL36fPMBZr3ZIRVhMb3u77VLPtAWiNCITUWCiJRciOluVRCWl//CYBClK/"
+    "Pw8P6EPRxEjFHqQ7rRzEsEEPEOjAYh6kEQcIT7Cmn+n0IrKheYSx8Ua7BTVVK96LCGYoj3"
+    "VAtATk+ngAEgbUxV2dx09ANdy3jO2FOLDHrxXnkJJYHexwEN76LUc7zFEQ/O7RGf4JBU+1"
+    "bP15wXY6m7cSXRhjs749saQJZfrfg+l/o5i87GxVHAYRAyj42MtpwCHOU2XLPi320e/x3J"
+    "2egOnD0Uci3BN5eX53ef7u6uivZmMYM/bXEg6Rt9GuYBFFE3ElIqGbsLTqfVgBLbOPYQWe"
+    "mGx5ZstlfwJra88ela7z2Y7lZKL5XioQipsCoaBV++weioyCUYa/ed7jlOL0ET0jD27VmO"
+    "js9gitbQ0J1qI7ANYwhJYQIx94hM0CxxgaWAVL7ok+pL6bGlECsUw7SUO/WnDAktiAAmMQ"
+    "mIxLKe1qPMfl5LYluG6FjCln/Yvw6Uqc9fvX/nbw/hqYwAv8dRUnfe/5xHl0P5IfW2al+z"
+    "NHbcZLd7YP550TEBQQGXWNLi1lrDavVJ2mjmC/i4VtoGMW+wN3EeyQ0XsdCQMUzDHqRk5K"
+    "N20TKOgztulLtElskgKCCaRzYNPfDfgdjyKGyHuL2SflvokJqg/dT9h2H8PG2vHHy3cnij"
+    "3uhz2+rq0iW2E30XdRB8a0TCujc7tV+He3nH93C/zbzgYlZZG8J3+UfMs5sZaAuYwDXv3z"
+    "PkP/CvtYYwp4fXvzt6h6fnNrrX2sqX0oC6rHTB13U+e+WBr/FjV3mLPDgUfeHZjrcMsM65"
+    "L+9YnyKH5/ZWQrXasK72LT7HjGJWo4HTGQF71napSdaBm+8m3R1UddKLNHsIWY0h2NcvMn"
+    "z8/Xs0bEYDRJl3AsuSdy+92KfdiDjnmmXem62TmGuoNRzNhGIzv2JIKdEi7oJmvQZOSO+x"
+    "sNxGp1tC64IvU+1O5OoLZOBP07iW76SjeOJZcV59sL56tLVjYiKrtHb8s8RTHmjRkzzMak"
+    "PmnOiW0L0JaNR4FK3WGZE1OjM7Olla2rEq63ak9rLKc2tR5MIp2CKlJOLjPqympqmVWW6h"
+    "n34Cc2Eq8qJ2iUwIH3dShsZlk7XKq/FVa+TRsXHDFtxxOJcnrQXuRZJkMjIpgIkw4PL0v6"
+    "Zt7oKOKM0kaQGJicrQKf1PusqNtRxr89EUH6qI+eL0nKsYQMpmTauWjsNhlbueWqPBnbwQ"
+    "K5C7NVZi+bt/BxLVqTSLTEEriLsanc7y/T/R4t3bXWv6yQcsKnkWzAD5/yCR8eilVd8dkx"
+    "clDeeH8htw5D+XLSTmtU5+n9IXNqm2Y9hzn0IefmGzUIfDzjhhABm5yXg8VYx9r7jzzgFA"
+    "g2hq0h2BwCATf0KCWmtGerN4xVBChSZFx54lua3YnOGosJ/bIXfr1w2LxcK6njVmxhsCrM"
+    "6DP70u2l5bpNXq4liO5av0nDNCa14h4kogpkKchkMnEwwhIrRzm6aRkFqxRW2wsoRasDai"
+    "KhIJVCiqm2B8kj9FpmpLSQAnYpsN11gO0qYFcC21sH2J4CdiWwxjrAGgrYcpNySK/XW7dS"
+    "IgpU+Wh9Qu4jgTxrtYZrRkpBK4V2Rnse0xvyie3UdDBJRBXIchXBdmpHI6VltgTrdiORmr"
+    "IXrBVnHqG3aZi5v3i8sp1L8R4Oz+qlIswPIsI8NUxKnAepUbTchzDODN36zgQ8YcHZdmYT"
+    "3PHVuw8ncUIIZEOkDpyItdwzkNxKBZ/DlvoF1wTzUryJCmNnQyqXRLrPOJ8E7kIoEt85GD"
+    "kuWHdxyqrRKM6bYVnMpcESWOD+xIhvbUjbuv7w8QpuuddlcUU9drWHowQc1ggLrwgpyZHF"
+    "K1sQo8RE3ExIvQ7xTXDwGESww1923xylu9AYzB1x558/apHzxR5ANhC+UdLqEuONFhBia7"
+    "ELpjNgt2fBe+paUTqvAp78KWzoIfbaQGA+Ir1OdHRaqpMNPTh7WQ33HCfe61ZYDHvd0rUQ"
+    "Li3377APp56nPpFQbvoYwyZ89KKZw8OvsoM+GRqH5J3/RKcBzBgKHdTomUCebMl6K6u2dN"
+    "2dxQJUnwGJOKV3lfWXLn19ngFJi6ZMOqPaYkGTty1dUNdrKD74EscpHXmArGiOrtJscbJS"
+    "CwLbNM+XCLos8PWCrTWDSbyCJfG1mckfujsP6V1bi5AEZ99cjf4nbggitc406c3gka3z3F"
+    "Hxs8Fu/jdcPph64Zh+F2R6VudetWO2U8zgkb/srE8dGu4ScfAn9K8b+ts4NRXv2OwYJ28K"
+    "dw4xZvRzoH+mDhId8sUcdrzB4aBa7i3hrs2ikzv6KctYMBT1hOiN55LoEUMULgLRvvanFj"
+    "w7sEOC/kaHI/pB7IrL6q9HqVsGEd7w0W8qYmKNxWDZiprDuRjYWIJgVmz7JwtuJ8+fDDPJ"
+    "wYLJl1uHzmWlWmI1yjG6KgEmvfL4kl4hvCQ3FcnHXHkwrURc5RLd8zFiYm6u82XEEm0NvK"
+    "oUd1UjcZ4KL3+h4eXqKLYX8WKXmpvrWSQkksoyUcC0AQtFe49oO81ZKiRD5pAsFhmgJaaK"
+    "/Isot1EUnDiVXAN4xLbYdkdc6wX1FSGTReVHG3QzDcsN/fVbEUaJ4skXkraSLNWJ6T4+QC"
+    "LKC0PVaW64Po12FEPDRkd7/zGbmXpD47RSltdTlm2P5UJayEIIyi3QGaG1pvo9qIGNIJlD"
+    "Ds3k0JUrCjmxVurQzSsLDBX6PPWhjIRaCeQW0iUCJpQ9izxotaBMxFoJZvOjktIxP6xtSM"
+    "xKbWhHPCg7jsSOSFy7NkBpmRcOjzKCvAhduWgE2dce+xfAm3Ye8NB+zNSBCupAhd0dqCCZ"
+    "55qIrqmcAeNwok/z0C1JgHF3da/dfL2+PipMdruLTDpg4EoCkxLUqkSH54J81g+HLok0as"
+    "83nd0LQmZeg/Hhn2hzLUNjV6ZgBs0Kc3AEXzWT8Dh+eTVC1nhomIVYJDJCMlsub3dZuFqN"
+    "RoRVmEvYA2SK4wXZwcMTLYpBxsORLomDU6bd/Zh24eWtHZVSEG6nBtoSjbNSUAqZTAiutd"
+    "MvkWiJQW/nu34dm4zr45oTU+BKwVXxBCqeYGuUL69gHHg8ASgcl08olJHH+NpS0jhjW6mi"
+    "aqu4Yjm+iojt/ihmqnwRN6x7eHBGqpWnWmzBT5w6vamWfzMn15IlO+8truYuXuYvLiZHjE"
+    "0hEhPCkiQSWbGW4LlrCoTs744sUXk5romEglSeU0Z5VF+OR7VGjpBtsrNfCJqGT2X8LHV1"
+    "KUN7YvUUR1Mc7XVzNOZfpM8SyJXU8rWvINiWrVQvnla8AkwVr1C8omleAZzB8sJPJGAZji"
+    "XcIldjKb/AvO54xivX2EzSH4KLrjOM/X08/QE7s5d7/fJtl+wnWachaeKJgNCh7J9pDw8w"
+    "6T88QIMDyAHBckQ9PKAgcMB4GT48iDwMosEzWdfMp2nyZFDK27gfAsXfaB3ylEi0ZU3a+p"
+    "mtyTSQBfHKxf6POYVimUEm2CiNulri1RLfpiU+48alY7+2kzErpPyLaSQbcC0KZnOXNHh4"
+    "YFZ1LmaHyiH5FXMolzPM1HtYzTDF867JMPlZwDxbKNZZek69b+b4YdRFBaJZsz0erBadRR"
+    "zXj88qzqQfzVPJY/3s5kSk2wQ5EzJw9gcmbXUW59zM5Gh7C7UhfRiivYBMB+ssI6iRysg2"
+    "4Hk610nH+Ws6XhvuQWUMaz5SrqY3cbaJF3GteS7lbzs6XP7Kdj6uRbCykopgHRjBAk1tnd"
+    "eallNJzfYcP6o2kalNZLvbRFZlP0/akrn+3pWiDbU9sGaXz8VshnynITwE479jjf5oGSy7"
+    "05kifFaqTikgK2tQ48wrraRKJQoObKUZGWLfjVTbSZqXq1HrtsVVqKziZZqQ7MlkJyZQfc"
+    "bQzj8kelLHtll3eqJ4Jd2xMyPsfDLoOFOUMtjvyWCfjOfaxuaUrDI2K2Pzq9KFlLFZGZtf"
+    "p7H5HwSHnv/Ow4sZcaWhkrkaS6nSd1Z3bIvKNfZAIz0+7wgPwahKiyB0oN8dJSdC6ToWRC"
+    "ff0YmEKm3eKHCmnzWfTIhP6FhlI/RM+ynaePC4cCgCjkt+OtV+iqkXX0Z/gg6MiZ5twLHP"
+    "4qMp2AFTxbO34HdK7hwbJMnMIrZNn+hM0/u9AVjR4dgrPLB5gET8gMe3c+Kef9BCurz/HE"
+    "v93Ps5mKHpVNzLCTRJx2oI4Y1PKHjS3iY9jNnrHH8nPoxUdvTHaGRzEzfDj6UPLaJo93Rx"
+    "sojYJn4sehAPEjyhbn9wWvIK4tSl8LvJzx9UvHHnvDE7xOuYzYuSbSGPWcO5Xmkfjr5kH4"
+    "5e3IeT/vBrDMy82GuiFhm6zSeSInJLzhlORNoyDnetxMQzfhFXvtSXmP3TYi8I27QmwQnA"
+    "MSy1hZMvUstmnfkxL9eSHWDZyXFgVJgbB0bp1AiXSgZhlnbUQXZJE60EeSsrkLJYvCCLxY"
+    "FEwN9hJI1KYuVL1cOA1qhuNR+yswZMjDOqWmRzxoQdPGz1sBGH/Ijjg/PnIbBu5db0pvuQ"
+    "BsZHCqXQHx8e0oktHh7YyYm5oxhOtD9pPR4gMh37BHu+LWqO2M2wW07ycfFIp5Pc+YaL+d"
+    "RDNjuEuKuPutrc9zBYItzHqMT2XBL9Lk7yif4M0Hd2JOIEOVNii5bZccVn2u3lF6b6ddh5"
+    "kBMIjjI4buwcagol5godh2oUHZ7597vbG6a49sTRztEde9gf++j3M+2G9uqL9kHN5dsAmP"
+    "bY5zFYfd5MJImpAs5Acj1x4OUSgHjAWPKWbebQsEc48XHE0nCfHUtotesEdtGf9HKmKDWp"
+    "5i9lBomKB2veNdKK49+Ook+2sYiw5s9GpOvC9Mf/rUUqcqIqfGjP4UPZSafGt1EQ3OEnks"
+    "+XdaCfSQyR/CiFCtiWnKfQFnWmkjazRJkp5glCj64XOLVy2mSEWgLkri1CMUbjqRNI5nSg"
+    "WyvQjSVzEH916bP/SllseKpBld+2Niv812ThYkBasxbONHTc4A10+N8bzBBL3gNAsvw95C"
+    "HPzd7QQCG8IE1la1k984JqoMtNn77v+ePSHZlLkq7mBRXA8pkE1MNaE0gkoOaN9eeNhQsG"
+    "gkfXAWZd+xXIpdX7WP99QOgHOOLrzDBpGTW5SCcXYSOqM7ZTIg0M6IOCeCsjd+JMyXiOQo"
+    "mLq3zoZoRekGdQhY4qR8zq0FFhNV/jxWYl1Yvd64stbNxRO+vUzrpD2Fm3TU9ulAWV4Gfg"
+    "QHBi1pJcqalap5VypgqB+GyvSl5fyTH1wyHmf/A4Uy2dnSE6b94aIeaxMyEVA7InptTd21"
+    "jjcj8vEh7IuM34zCQ84puqzCHbfmXit1Bm69APNnJuW+aU/VMLnp35PPa8MjjZasErxDHD"
+    "aMjiczG4Ku3OgHuvIfcFwh39NA43xqaORe0bKr6OQ5PZo5nfMrJMCxeZ8lY27a2kD0amY+"
+    "878X2nXh6LomRL1Mkd5MWve6h1QwdaV1iYGh6eS6CTHGjdDtd4s6Or6TQpyfRcW7/LSCqX"
+    "+J5d4kpRfxH6nFLUX+iLLSjqIZnNpxTresp6TkqdQa+MHMrIsWUjh+yrbQC5nH3iPtXywX"
+    "3AVbHMTU8HbDSK4V5tOUq/mRrmowiLyjakUgNOYiThRbn8NbbeZ4HgHXbZmkC4vTXCZlxN"
+    "73Wk2wi226E4qXvQMc/4rnVmixLVbBHlfsoNV8Pkr6QnsFx1oDYZ2GIrOAvC102e9FTLWs"
+    "Ysg13ojowKT9Af2DzEn1m3AADYU6Hy/+zRbFTbWtRePX4re+acYEwnGOe7ZG268LwpQW7J"
+    "OEzL5fC0qOC2AI3HaNO6+8Xt7XVGB7j4kPd0f/10cUUBZvDSSg5foYpEM/D8cOz50tMkyh"
+    "PsZIR2Rzc7+/7AlTXihSmtyhrxQl9snNiy4r7c1FLtycI06+QElftlW6PybDUfKGjTlwvf"
+    "J3RtofPgwhcjKqegyKotVU6Yjou5xHiSFlnPt20POgZPrsTINGybha3AYlOxtDf5RuaGmg"
+    "ZdQ+jxIhPo549i07N+pmuReoMw3yXbx7EOAGcksC21faYjkE58boLdsZnywLbU4mG3w/fi"
+    "bqojHIDtqu3qgnjv4/8N6h3qmZdri/Kw66BPtci/ykW+uLCtshbfuuTeoz+2bCve9ny1nX"
+    "C4jYmAWNrvXDQPnjxpkktZtdVEIJoHAyGyERNIVujIxmZ1MNjTOpNhetEudFqZEGzQg7BB"
+    "8nwZdPXOJAiPI86wqXdE2kd5sF2GDwyxll5IoBZLG8JZRZJMnOXmYGc9kdQxTTwFJlAUsF"
+    "WqlOOKQ7xMDqEsQC+CQ0gsQPvXX5Tv/dX43quYpGAf8GxGXJsZnja0Tn3JNKYsUyW4SLho"
+    "EblyGip5ZdU85GwzAN/vkGF1CFvMvjOJkqLneijxf6/fHDBLH7nPp1qA6Xd7qmWyeUbu6v"
+    "O3F0mu9JRjm2UcB4JoAJs1bGaP6hEsTvisxgkzmxwgkR/8qvY0NJ9kPP3qa6ecKhFv5e6G"
+    "fhW3db/ca90vHtPpLXxcC89EopUQbidd7u4zjh9WtP42NJiJT+ijuVhyLFX56MwItQTYbW"
+    "eUYwukhO5OPVQWQRFJ5BCcgMhBYrhs59Lt14vrK+3zl6vLD3cfRPaLWKNjF7NhKF+uzq+L"
+    "sT0BJcc4JJJFfFV0T1pyvfieg8KzwfAeIHA1SFFU/ZVG3e98v92+p8Lm6c7apwa8jLMCmg"
+    "d07nuzebgOokVJBSm7ps642AXIf8wdn2uEaxxlnxdWu2/V7lvl7djKCavCrFadJKYktsQT"
+    "D9J+lkBmoRA/1cMsLfKaXEQZc0MueqEegiXSr1RTUT5K5aPcz/7g/HfYEIKSGK+D+4ir4l"
+    "kyVWWwvbu6126+Xl8fFVeWBhDNeiovolbbO0TT6+f6fvQJITbUadSD/l402i6AM8OO744c"
+    "wzywITTwKZ+z1mqHGRwSOLuLM+Df5spgg/gTrhpxMGZfTI0tMOngAHEMHOmb0uCAqG15fO"
+    "taDfEwVnHUm4VNM4lWzYS2DvgfyI5PubNYTkfLmph8Wz5UMjqZCIdkb77FjmofGlgFpe4r"
+    "1ID2T76j6Rh6DcljLd+jXLqVBrctHWse4RN683Etx09R8pVqVgkSUzSzbFTLrSsTVh5esa"
+    "92OuPG8jpffEZIfehpLCH7Djz4ombogURWDdHUEKUvL/SeiSzMtnT6LAq+0tlTuQleqJtA"
+    "GRyVwVFtijhIdHdorYhtXSsNFmmrWGWbxSQtVNdowXfRwlYDZnfQ5RaHqIvVtou67YmduL"
+    "nNtSJZR7ptftY9mCN6sEcWToFg22pNC64YBjdzvGXJOliRJYryKQLxsK/HB1lYZt9WVo39"
+    "WDWiQVB760RBsC2bbbcdPaR45Avlkbnps9aMI5V9TdxSEfJmCblfYH2N+l0PE9OqJF36ta"
+    "2OD1BKzuZKzjYJfamHtiT5Tpk3d0UGHuFSXnMbtDRrHstfJ7LaJEQ9lR5H3mf1tHxrdyC8"
+    "l+m8fkU9AEg/aAMm80TqQ5P1wuqOdF3k8sv2DJ3Soq5OuX+2U+3m7CaWpBqGkWzC5ofPEd"
+    "04UerAftQBFAR0rluLveZEFX1V9PVA3qmirwdHXxXVWieAVZH+Zkj/LunrX/8PPii2rQ=="
+)
@@ -0,0 +1,159 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        CREATE INDEX IF NOT EXISTS "idx_disease_code_mappings_code_pattern" ON "disease_code_mappings" ("code" varchar_pattern_ops);
+        CREATE INDEX IF NOT EXISTS "idx_disease_code_mappings_name_trgm" ON "disease_code_mappings" USING gin ("name" gin_trgm_ops);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_disease_code_mappings_name_trgm";
+        DROP INDEX IF EXISTS "idx_disease_code_mappings_code_pattern";"""
+
+
+MODELS_STATE = (
+    "eJztXW1v2zi2/itCvkwCZFrLlm05uLhAkqY73aZJ0aR7F9sZuBRFJ7q1Ja8kd6Z3Z/775S"
+    "Gpd8qWbPlFDmeANJF4SOoRRT7nhYf/OZl5NpkGry6J7+DnkwvtPycumhH6S+7OuXaC5vPk"
+    "OlwIkTVlRVFSxgpCH+GQXp2gaUDoJZsE2HfmoeO59Kq7mE7hoodpQcd9Si4tXOffCzIOvS"
+    "cSPhOf3vjyG73suDb5gwTRn/Nv44lDpnamq44NbbPr4/DHnF1754ZvWUFozRpjb7qYuUnh"
+    "+Y/w2XPj0o4bwtUn4hIfhQSqD/0FdB96J54zeiLe06QI72JKxiYTtJiGqcetiAH2XMCP9i"
+    "ZgD/gErfzc1Y2hYfYGhkmLsJ7EV4Z/8cdLnp0LMgTuHk/+YvdRiHgJBmOC23fiB9ClAnjX"
+    "z8iXo5cSyUFIO56HMAJsGYbRhQTEZOA0hOIM/TGeEvcphAHe7feXYPaPy0/Xv1x+OqWlzu"
+    "BpPDqY+Ri/E7e6/B4AmwAJn0YNEEXxdgKodzoVAKSlSgFk97IA0hZDwr/BLIh/f7i/k4OY"
+    "EskB+dmlD/jFdnB4rk2dIPztMGFdgiI8NXR6FgT/nqbBO/1w+c88rte391cMBS8In3xWC6"
+    "vgimIMU+bkW+rjhwsWwt9+R749Ltzxul5Z2eKtWXeWv4Jc9MSwgieG5xOLyOeATeiFxYVd"
+    "X7q0LGiJoNLKcvLrAncQpj8HaER/Dkcd7deFhZBJf/aGpnZ68+nNhcYqPHt1kntF9aR/de"
+    "n/tNDQgDJ9g/2OX9N/zA79wx7AJQubJvzeMzW43+3QS10MlzoDDJdMHdrrD+1zaIoYTKbT"
+    "SUuCyMhgzY6xT2w64B369LS8rRs47gLRoQt9m/XZNuHSCPE2oD48RH32xGqN3fkaS2bImd"
+    "ZZHGKBZpaHreOXWRyMKmuDUb40GIWVgf1bA76ovFpcYwjnFAgydhczi8+2VaHMy7UUUr0K"
+    "ono5oHoeT8vxw2cb/Shi+YbiIMcyLZPDkU4dJHRm5BX8cpiILkHwzeXjTQ4f2n+7bKTd0O"
+    "HEEHpHG0AuJgWkEum1xpuY3jYH5+TD5e3NhQY/f3Xf3vC/+L958lBlGA4qjMJB6SAc5Meg"
+    "E4wpGXK+S+bGK8+bEuSWrMxpuRzAFhXc1viLV52mx9/V/f1thipfvXvMofj5w9UN/cQZuL"
+    "SQE5L00p3F1J45En14JaSR2A4RrWtf2Qukc9+bOFMydmZUMRgv/FpMSCq830lhzTWoX2lZ"
+    "7y9Z1vvFZX2KgnA89Z5kA/aNWFPkwGYlly1H8MtB4rsEzsd3H24eHi8/fMyMYVin4E6XXf"
+    "2Ru1qYeuNKtP959/iLBn9q/7q/u8kr2nG5x3+dQJ/QIvTGrvc7nRLSjx1dji5ljR8+AWjH"
+    "SGL/WP4is5INvMh9sDX6DPa9O/0hxlFL3qwY8ktf7GJur/lis5Lqxe71xbLO17CkpezCi/"
+    "B5TJex744tzFg5XiHk377/RKYolBvWU7ayS1rfR1HdYb70v6KRHF1NXn6aFSSVb4jKx1RV"
+    "LUYEP6PQ8sJxQIJgc1CueW0PvLIWwxJgtCkWD7SKFiPwTNCUziH4meBv4MsA2rYhIr+wKq"
+    "+jGm+9pxbjM6EEaOGTceCiefDshQ1Msm95lQ+ixhaD4xPszWbEtVEDM+2nTGVHg8rYQiH9"
+    "uhoF5wqqPB6EJoTYwHQaxeitqLTFMHFD2rjRr4yxPFZvq7+3Ws7kjCYsXJzlKN675NGjP6"
+    "pheZ2p8VDNGCvI4cL36TOMxVq3ZITVxIbX+zZVbXsAWiMCITUWSmIRsqNleVRC2h+/SYCC"
+    "1O/PwwP6cGlipGIP0o1WDmLYoAUIdGAxD9KIA4QnWNMvdHoT2VA9wth4pd2DmqoV+yKCGc"
+    "pjHRC9AnJ9PAAJA8rirs7jJ6AY7lvG9kIc2OPXinNISawOdjgIb/2Wox3mKAh+9+gM/4yC"
+    "51q2/rxgO53NW4kujLFZ355YUoUy/e/B9L9RTF52tioOg4gBFHzs5TTgEOepsmWfXvbR7/"
+    "HcnZ6A6cPRRyLcE3l9+XB9+ebm5K9mYxgz9tcSDpG30a5gEUUTcSUioZuwtOp9WAEts49h"
+    "BZ6YbHlmy2V/Amtrzx6VrvPZhuVkovlWKhCKuwKhoEX7rA9FRsEow98872lKcXqPviEPum"
+    "pMdNY9QktbQ4K1qAfAGoZQE2LkA4+wWeAYQwOrYMk90YfUd1MjSiCWaSdp6FcLDlgSG1Bg"
+    "DAKTcSmlXY3nuJzctgTXrZAx5aw/Cp+uxFm/f+1vB++vgQm8wF9XcdK3nk+cJ/c9+bFlVr"
+    "o/c9RmvHRn+3DeOAFBAZFR1+jWUsZq80LVaeoI9rtY2AY6ZrE/cBfBDhm915EwQMEco2bk"
+    "pHTTOoGCfsM2fYk2iU1SQDCBdA5s+rsBv+NRxBB5azH7pNw3MUH1ofkJ2+5j2Fg7fX/95k"
+    "yxx/2wx5e1VWQr7Cb6LurAmJZpZXRutwr/7pbz726Bf9vZoKQsko/kj5JvOSfWEjCXccCb"
+    "fz5m6F9hH2tMAW/v7/4WFc9vbq21jzW1D2VB9Zip427q3BdL49+i6g5zdjjwyLsDcx1umW"
+    "Fd078+UB7F+1dGttKlqvAuNs2OZ1yihtMRA3nRe6ZG2YmW4Su/Lrr6qAvX7BFsIaZ0R6Pc"
+    "/Nnz8+WsETEYTdIlHEvuidx+s2If9qBjXmg3um52TqHsYBQzttHIjj2JYKeEG7rJKjQZue"
+    "P+RgOxUh2tC65IvQ+luxMorRNB/86iTt/oxqnktuJ8e+F8dcnKRkRl9+htmacoxrwxY4bZ"
+    "mNQnzTmxbQHasvEoUKk7LHNianRmtrSydVXC9VbtaY3l1KbWg0mkU1BFysllRl1ZTS2zyl"
+    "I94x78xEbiVeUEjRI48L4Ohc0sa4dLtbfCyrdp5YIjpu14IlFOD+qLPMtkaEQEE2HS4eFl"
+    "SdvMGx1FnFHaCBIDk7NV4JN6n13qdpTxb09EkD7qk+dLknIsIYMpmXYuGrtNxlZuuSpPxn"
+    "awQO7CbJXZy+YtfFyL1iQSLbEE7mJsKvf7cbrfo6W71vqXFVJO+DSSDfjhUz7hw0Oxqis+"
+    "O0YOyhvvL+TWYbi+nLTTEtV5en/InNqmWc9hDm3IuflGFQIfz7ghRMAm5+VgMdax9vY9Dz"
+    "gFgo1hawg2h0DADT1KiSlt2eoNYxUBLikyrjzxLc3uRGeNxYR+2Qu/XjhsXq6V1HErtjBY"
+    "FWb0mX3p9tJy3SYv1xJEd63fpGEak1pxDxJRBbIUZDKZOBhhiZWjHN20jIJVCqvtBZSi1Q"
+    "E1kVCQSiHFVNuD5BF6LTNSWkgBuxTY7jrAdhWwK4HtrQNsTwG7ElhjHWANBWy5STmk9+ut"
+    "WykRBap8tD4j94lAnrVawzUjpaCVQjujLY9ph3xiOzUdTBJRBbJcRbCd2tFIaZktwbrdSK"
+    "Sm7AVrxZmjqRNtitogyNxfPF1CRYdp8aoUXR4NowaguLGdazEgWwqGCrXfdqh9/MWU+FDi"
+    "z2m5I2Wc+n5X+1Purz9paRcIHABmsoBxjA0WFWSn/B1R3RI/yroViXgmeSYMdvZYP0rGwW"
+    "KbTkVDA3CuWBbP/FVsNQrIj++cxSFSeNjXk3xcZocF1ussIH8wmvD0GdCAwdrvDyCTF7Gh"
+    "HUR6HebIsaMdllaXsLB92l19JILu04/MvTfZ5B3Z/mait3jXhFsIUcFnJ6TDcOGGMSBR2B"
+    "iCp7Q7w06+PvFcKUBTXS1xIH3hkz57qeCt+015lLbrUYrhrkppYgHlU0qSSUcfR40xmJHZ"
+    "XYSFvu+hqEKOjj7kSB3PcRQvtsC8GV+qF0eWSKggshjDIoD1I8hENYeHX+XwsWRoHFrsWK"
+    "Qjl6g/KRV6hQKU0dvrh5ThCduia2dSoZzevHl3FqcFpN8u5uciL48PS7pSIfJsS+2CgsVi"
+    "1V5FF+OQs6xSErcZZxXEXdiQwvPHROFrrLk4cfFoFGdPBF0sUt5wf2LEXRvSum7fvb+BLv"
+    "e6bHdJj93t4SgNozXCIjaOJBpMNoshK2zhjhBxMxurdaaAYb6PGf6y++Yo3YTGYO6Inn98"
+    "r0UhePYAckKmNCQtIMTW4kC8zoB1z4L31LWipM4FPPlT2NBCHLsH27O5xsgP0F6thlXVuv"
+    "ZiE929DpbRIHrdCgpEr1uqP8Ct5TqZWmfVOnvs6+wHOg1gZp6lgxp9I3BakmS9lRVbuu7O"
+    "YoGxwyTig52qrL906etzY1XGyCYWNHnd0gV1vYqECVLsvmSJ/fk2SVEdXaXZ4mSlFgRmXe"
+    "NLBF0W+HrB1prBJF7Bkl2WeXOhexnSXluLkAQXv7oa/U90CHSsC03aGTyydZ5BOH42yOn2"
+    "issHUy8c0++CTC/q9FU7ZflCuLXSfM14BlTcJZj9wR5AN/TXsVmWN2x2jLNXhZ6Ddkg/B/"
+    "qnG6/+iJs/u5D3hFaOtdxbwl2b7VHt6OfM3DoU5YToneeS6BFDFC4CUb/2pxZ8c2CfPP2N"
+    "Dkf0g9gVl9UvJ6kugwivmBs9lZWzQStnDueiSaIEwazY9s+X3062dxlmkuPlky+3Dp3LSr"
+    "UkdiDH6KqYhHvlFuFewSCcm4rqmsEk4upEiT0fJi3m5jpfRizRVldJJU9JjfTpyuJ/FIZh"
+    "ZfE/0he7NNamnkVCIqksEwVMG7BQtPeg7vOcpUIyZA7JYpEBWmKqyL+IchtFIYKtkmsAj1"
+    "iipe6Ia72gviJksr3ZUZqmTMVyQ3/9WuRxUZq0ruSsosR0Hx8jGGUHpeo0N1yfR3mlRJDT"
+    "2/fZ84k2NE4rZXk9Zdn2WEbceuEsWaG1pvo9qIENR7QwENBMDl25opATa6UO3byywFChz1"
+    "MfykiolUBuIWk+YELZs8iGXQvKRKyVYDY/Kikd88PahsSs1IZ2xIOy40jsiMS1awOUljly"
+    "eJQR5Ch05aIRZF+Z1o6AN+084KH9mKlj9dSxers7Vk8yzzURXVM5D+LhbL3LQ7ckDeLDza"
+    "N29/n29qQw2e0uMumAgSsJTEpQq7JHOBfks/5e0JJIo/Z809mMAGTmNbg59gOtrmVo7MoU"
+    "zKBZYQ6O4KtmEh7HL69GyBoPDbMQi0RGSGbL5fUuC1erUYmwCnMJe4BMccg81NWZaFEMMh"
+    "6OdEkcnDLt7se0Cy9v7aiUgnA7NdCWaJyVglLIZEJwrXwviURLDHq7TvMSODYZ18c1J6bA"
+    "lYKr4glUPMHWKF9ewTjweAJQOK6fUSgjj/G9paRxxrZSRcVWccVyfBUR2zkRm1Pli7ihdA"
+    "4sd8llpVp5tuEW/MSpM3xr+Tdzci1ZsvPe4mru4mX+4mKK/NgUIjEhLEklmBVrCZ67pkDI"
+    "/u7IjqsqxzWRUJDKM4sqj+rxeFQLTHc/7OwXgqbhcxk/S91dytCeWTnF0RRHe9kcjfkX6b"
+    "MEciW1fO0rCLZlK9XR04oXgKniFYpXNM0rgDNYXviBBOycGwm3yJVYyi8wLzue8cI1NpP0"
+    "h+Ci6wxjfx9PfwBHcAuvX77ukv0k61QkTTwREDqU/Qvt61eY9L9+hQoHkAOC5Yj6+hUFgQ"
+    "PGy/DrV5GHQVR4IWua+TRNngxKeRv3Q6D4G61DnhKJtqxJ2w7enyXTQBbEGxf7P+YUimUG"
+    "mWCjw7TUEq+W+DYt8Rk3Lh37tZ2MWSHlX0wj2YBrUTCbh6TCwwOzqnMxO1QOya+YQ7mcYa"
+    "bew2qGKZ53TYbJzhQQ2UKxztJz6n0zxw+jJioQzZr18WA1dmpDunx85kEm/WieSp7qF3dn"
+    "8akHWDdtfhgDrXUW59zM5Gh7DaUhfRiirbAjELDOMoIaqYxsA56nc510nF/S8drQB5UxrP"
+    "lIuZrexNkmXsS15rmUv+3kcPkr2/m4FsHKSiqCdWAECzS1dV5rWk4lNdtz/KjaRKY2ke1u"
+    "E1mV/TxpS+b6e1eKNtT2wJpdPhezGfKdhvAQjP+BVfqjZbDsTmeK8FmpOqWArKxBjTOvtJ"
+    "IqlSg4sJVmZIh9N1JtJ6lerkatWxdXobKKl2lCsieTnZhA9RlDu3yX6Ekd22bN6YnilTTH"
+    "zoyw88mg40xRymC/J4N9Mp5rG5tTssrYrIzNL0oXUsZmZWx+mcbmfxAcev4bDy9mxJWGSu"
+    "ZKLKVK31nZsS0K19gDjfT4vCM8BKMqvQShA/3uKDkRStexIDr5hs4kVGnzSoEz/az5ZEJ8"
+    "QscqG6EX2k/RxoOnhUMRcFzy07n2U0y9+DL6EzRgTPRsBY59ER9NwQ6YKp69xY7uNTXHBk"
+    "kys4ht0ye60PR+bwBW9C47UZif9Js84On9nLiX77SQLu8/x1I/934OZmg6FX05gyrpWA0h"
+    "vPEZBc/a66SFMXud4+/Eh5HKjv4YjWxu4mb4sfShRRTtnt6JzymGbeKnogXxIMEz6vYH5y"
+    "WvIE5dyo9bPlO8cS+8MTvE65jNi5JtIY9Zw7leaR+OvmQfjl7ch5P+8GsMzLzYS6IWGbrN"
+    "J5IicuVKTEqkLeNw10pMPOMXceVLfYnZPy12RNimNQlOAE5hqS2cfJFaNuvMj3m5luwAy0"
+    "6OA6PC3DgwSqdGuFUyCLO0ow6yS6poJchbWYGUxeKILBYHEgH/gJE0KoldX6oeBrREdav5"
+    "kJ01YGKcUdUimzMm7OBhq4eNOORHHB+cPw+BNSu3pjfdhjQwPlIohf749Ws6scXXr+zkxN"
+    "xRDGfan7QcDxCZjn2CPd8WJUesM6zLST4uHul0ljvfcDGfeshmhxB39VFXm/seBkuE+xRd"
+    "sT2XRL+Lk3yiPwP0nR2JOEHOlNiiZnZc8YV2f/2JqX4ddh7kBIKjDI4bO4eaQom5QsehGk"
+    "WHZ/794f6OKa49cbRz1GMP+2Mf/X6h3dFWfVE/qLl8GwDTHvs8BqvPq4kkMVXAGUiuJw68"
+    "XAIQDxhL3rLNHBr2CCc+jlga+tmxhFa7TmAX/UlvZy6lJtX8rcwgUfFgzbtGWnH820n0yT"
+    "YWEdb82Yh0XZj++L+1SEVOVIUP7Tl8KDvp1Pg2CoI7/ETy+bIO9DOJIZIfpVAB25LzFNqi"
+    "zlTSZpYoM8U8QejJ9QKnVk6bjFBLgNy1RSjGaDx1AsmcDnRrBbqxZA7izy599i+UxYbnGh"
+    "T5bWuzwn9NFi4GpDVr4UxDxw1eQYP/vcEMseQ9ACTL30Me8tzsDRUUwgvSVLaW1TMvqAa6"
+    "3PTp+54/Lt2RuSTpal5QASyfSUA9rDWBRAJq3lh/3li4YCB4ch1g1rVfgVxavY/13weEfo"
+    "Ajvs4Mk5ZRk4t0chE2ojpjOyXSwIA+KIi3MnInzpSM5yiUuLjKh25G6Ig8gyp0VDliVoeO"
+    "Cqv5Gi82K6le7F5fbGHjjtpZp3bWHcLOum16cqMsqAR/Aw4EJ2YtyZWaKnVeKWeqEIjP9q"
+    "rk9ZUcUz8cYv4HjzPV0tkZovPmrRFiHjsTUjEge2JK3b2NVS738yLhgYzrjM9MwiO+qcoc"
+    "su1XJn4N12wd2sFGzm3LnLJ/asE3Zz6PPa8MTrZa8AJxzDAasvhcDK5KuzPg3mvIfYFwRz"
+    "+Pw42xqWNR+o6Kr+PQZPZo5reMLNPCRaa8lU17K+mDkenY+05836mXx6Io2RJ1cgd58ese"
+    "at3QgdYVFqaGh+cS6CQHWrfDNd7s6Go6TUoyPdfW7zKSyiW+Z5e4UtSPQp9TivqRvtiCoh"
+    "6S2XxKsa6nrOek1Bn0ysihjBxbNnLIvtoGkMvZJx5TNR/cB1wVy9z0dMBGoxju1Zaj9Jup"
+    "YT6KsKhsQyo14CRGEn4pl7/G1vssELzDblsTCLe3RtiMi+m9jnQbwXYbFCd1DzrmBd+1zm"
+    "xRopgtotzPueFqmPyVtASWqw6UJgNbbAVnQfi6yZOealnLmGWwG92RUeEJ+gObh/gz6xYA"
+    "AHsqVP6fPZqNaluL2qvHb2XPnBOM6QTjfJesTVeeNyXILRmHabkcnhYV3Bag8RhtWne/ur"
+    "+/zegAV+/ynu7PH65uKMAMXlrI4StUkWgGnh+OPV96mkR5gp2M0O7oZmffH7iyRhyZ0qqs"
+    "EUf6YuPElhX35aaWak8WplknJ6jcL9salWer+UBBm75e+D6hawudBxe+GFE5BUVWbKlywn"
+    "RczCXGk7TIer5te9AxeHIlRqZh2yxsBRabiqWtyTcyN1Q16BpCjxeZQD++F5ue9Qtdi9Qb"
+    "hPku2T6OdQA4I4Ftqe0zHYF04nMT7I7NlAe2pRYPux2+F3dTHeEAbFdtVxfEex//b1DvUM"
+    "+8XFuUh10HfapF/kUu8sWFbZW1+N4ljx79sWVb8bbnq+2Ew21MBMTS/uCiefDsSZNcyoqt"
+    "JgLRPBgIkY2YQLJCRzY2q4PBntaZDNOLdqHRyoRggxaEDZLny6CrdyZBeBxxhk29I9I+yo"
+    "PtMnxgiLX0QgKlWNoQziqSZOIsNwc764mkjmniKTCBooCtUqUcVxziODmEsgAdBYeQWID2"
+    "r78o3/uL8b1XMUnBPuDZjLg2MzxtaJ36lKlMWaZKcJFw0SJy5TRU8sqqecjZZgC+3yHD6h"
+    "C2mH1nEiVFz7VQ4v9evzpglj5yv51rAabf7bmWyeYZuasvX18ludJTjm2WcRwIogFs1rCZ"
+    "PapHsDjhsxonzGxygER+8Kva09B8kvH0q6+dcqpEvJW7G/pV3Nb9cq91v3hMp7fwcS08E4"
+    "lWQriddLm7zzh+WNH629BgJj6hj+ZiybFU5aMzI9QSYLedUY4tkBK6O/VQWQRFJJFDcAIi"
+    "B4nhsp1L95+vbm+0j59urt89vBPZL2KNjt3MhqF8urm8Lcb2BJQc45BIFvFV0T1pyfXiew"
+    "4KzwbDe4DA1SBFUfEXGnW/8/12+54Km6c7a58acBxnBTQP6Nz3ZvNwHUSLkgpSdk+dcbEL"
+    "kP+YOz7XCNc4yj4vrHbfqt23ytuxlRNWhVmtOklMSWyJJx6k/SyBzEIhfq6HWVrkJbmIMu"
+    "aGXPRCPQRLpF+opqJ8lMpHuZ/9wfnvsCEEJTFeB/cRV8WzZKrKYPtw86jdfb69PSmuLA0g"
+    "mvVUXkW1tneIptfP9f3oE0JsKNOoB/2tqLRdAGeGHd8dOYZ5YENo4FO+ZLXVDjM4JHB2F2"
+    "fAv82VwQbxJ1w14mDMvpgaW2DSwQHiGDjSN6XBAVHd8vjWtSriYaziqDcLm2YSrZoJbR3w"
+    "P5Adn3JnsZyOljUx+bZ8KGR0MhEOyd58ix3VPjSwCkrdV6gBbZ98R9MxtBqSp1q+R7l0Kw"
+    "1uWzrWPMIn9ObjWo6fouQL1awSJKZoZtmolltXJqw8vGJf7XTGjeV1vviMkPrQ01hC9h14"
+    "8EXN0AOJrBqiqSFKX17ofSOyMNvS6bMo+EJnT+UmOFI3gTI4KoOj2hRxkOju0FoR27pWGi"
+    "zSVrHKNotJWqiu0YLvooWtBszuoMstDlETq20XdesTO3Fzm2tFso503fysezBH9GCPLJwC"
+    "wbbVmhbcMQxu5njNknWwS5a4lE8RiId9PT7IwjL7trJq7MeqEQ2C2lsnCoJt2Wy77eghxS"
+    "OPlEfmps9aM45U9iVxS0XImyXkfoH1Nep3PUxMq5J06de2Oj5AKTmbKznbJPSlHtqS5Dtl"
+    "3twVGXiES3nNbdDSrHksf53IapMQ9VR6HHmb1dPyrd2A8F6m8/oV9QAg/aANmMwTqQ9N1g"
+    "orO9J1kcsv2zI0Si91dcr9s41qdxd3sSTVMIxkEzY/fI7oxplSB/ajDqAgoHPdWuw1J6ro"
+    "q6KvB/JOFX09OPqqqNY6AayK9DdD+ndJX//6fxqSM/w="
+)
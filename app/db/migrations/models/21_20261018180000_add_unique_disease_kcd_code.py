@@ -0,0 +1,164 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        UPDATE "prescriptions" AS p SET "disease_id" = d."keep_id"
+        FROM (SELECT "id", MIN("id") OVER (PARTITION BY "kcd_code") AS "keep_id" FROM "diseases" WHERE "kcd_code" IS NOT NULL) AS d
+        WHERE p."disease_id" = d."id" AND d."id" <> d."keep_id";
+        UPDATE "disease_guidelines" AS g SET "disease_id" = d."keep_id"
+        FROM (SELECT "id", MIN("id") OVER (PARTITION BY "kcd_code") AS "keep_id" FROM "diseases" WHERE "kcd_code" IS NOT NULL) AS d
+        WHERE g."disease_id" = d."id" AND d."id" <> d."keep_id";
+        DELETE FROM "diseases" AS d USING "diseases" AS k
+        WHERE d."kcd_code" = k."kcd_code" AND d."id" > k."id";
+        CREATE UNIQUE INDEX IF NOT EXISTS "uid_diseases_kcd_cod_23710b" ON "diseases" ("kcd_code");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "uid_diseases_kcd_cod_23710b";"""
+
+
+MODELS_STATE = (
+    "eJztXW1v2zi2/itCvkwCZFrLlm05uLhAkqY73aZJ0aR7F9sZuBRFJ7q1Ja8kd6Z3Z/775S"
+    "Gpd8qWbPlFDmeANJF4SOoRRT7nhYf/OZl5NpkGry6J7+DnkwvtPycumhH6S+7OuXaC5vPk"
+    "OlwIkTVlRVFSxgpCH+GQXp2gaUDoJZsE2HfmoeO59Kq7mE7hoodpQcd9Si4tXOffCzIOvS"
+    "cSPhOf3vjyG73suDb5gwTRn/Nv44lDpnamq44NbbPr4/DHnF1754ZvWUFozRpjb7qYuUnh"
+    "+Y/w2XPj0o4bwtUn4hIfhQSqD/0FdB96J54zeiLe06QI72JKxiYTtJiGqcetiAH2XMCP9i"
+    "ZgD/gErfzc1Y2hYfYGhkmLsJ7EV4Z/8cdLnp0LMgTuHk/+YvdRiHgJBmOC23fiB9ClAnjX"
+    "z8iXo5cSyUFIO56HMAJsGYbRhQTEZOA0hOIM/TGeEvcphAHe7feXYPaPy0/Xv1x+OqWlzu"
+    "BpPDqY+Ri/E7e6/B4AmwAJn0YNEEXxdgKodzoVAKSlSgFk97IA0hZDwr/BLIh/f7i/k4OY"
+    "EskB+dmlD/jFdnB4rk2dIPztMGFdgiI8NXR6FgT/nqbBO/1w+c88rte391cMBS8In3xWC6"
+    "vgimIMU+bkW+rjhwsWwt9+R749Ltzxul5Z2eKtWXeWv4Jc9MSwgieG5xOLyOeATeiFxYVd"
+    "X7q0LGiJoNLKcvLrAncQpj8HaER/Dkcd7deFhZBJf/aGpnZ68+nNhcYqPHt1kntF9aR/de"
+    "n/tNDQgDJ9g/2OX9N/zA79wx7AJQubJvzeMzW43+3QS10MlzoDDJdMHdrrD+1zaIoYTKbT"
+    "SUuCyMhgzY6xT2w64B369LS8rRs47gLRoQt9m/XZNuHSCPE2oD48RH32xGqN3fkaS2bImd"
+    "ZZHGKBZpaHreOXWRyMKmuDUb40GIWVgf1bA76ovFpcYwjnFAgydhczi8+2VaHMy7UUUr0K"
+    "ono5oHoeT8vxw2cb/Shi+YbiIMcyLZPDkU4dJHRm5BX8cpiILkHwzeXjTQ4f2n+7bKTd0O"
+    "HEEHpHG0AuJgWkEum1xpuY3jYH5+TD5e3NhQY/f3Xf3vC/+L958lBlGA4qjMJB6SAc5Meg"
+    "E4wpGXK+S+bGK8+bEuSWrMxpuRzAFhXc1viLV52mx9/V/f1thipfvXvMofj5w9UN/cQZuL"
+    "SQE5L00p3F1J45En14JaSR2A4RrWtf2Qukc9+bOFMydmZUMRgv/FpMSCq830lhzTWoX2lZ"
+    "7y9Z1vvFZX2KgnA89Z5kA/aNWFPkwGYlly1H8MtB4rsEzsd3H24eHi8/fMyMYVin4E6XXf"
+    "2Ru1qYeuNKtP959/iLBn9q/7q/u8kr2nG5x3+dQJ/QIvTGrvc7nRLSjx1dji5ljR8+AWjH"
+    "SGL/WP4is5INvMh9sDX6DPa9O/0hxlFL3qwY8ktf7GJur/lis5Lqxe71xbLO17CkpezCi/"
+    "B5TJex744tzFg5XiHk377/RKYolBvWU7ayS1rfR1HdYb70v6KRHF1NXn6aFSSVb4jKx1RV"
+    "LUYEP6PQ8sJxQIJgc1CueW0PvLIWwxJgtCkWD7SKFiPwTNCUziH4meBv4MsA2rYhIr+wKq"
+    "+jGm+9pxbjM6EEaOGTceCiefDshQ1Msm95lQ+ixhaD4xPszWbEtVEDM+2nTGVHg8rYQiH9"
+    "uhoF5wqqPB6EJoTYwHQaxeitqLTFMHFD2rjRr4yxPFZvq7+3Ws7kjCYsXJzlKN675NGjP6"
+    "pheZ2p8VDNGCvI4cL36TOMxVq3ZITVxIbX+zZVbXsAWiMCITUWSmIRsqNleVRC2h+/SYCC"
+    "1O/PwwP6cGlipGIP0o1WDmLYoAUIdGAxD9KIA4QnWNMvdHoT2VA9wth4pd2DmqoV+yKCGc"
+    "pjHRC9AnJ9PAAJA8rirs7jJ6AY7lvG9kIc2OPXinNISawOdjgIb/2Wox3mKAh+9+gM/4yC"
+    "51q2/rxgO53NW4kujLFZ355YUoUy/e/B9L9RTF52tioOg4gBFHzs5TTgEOepsmWfXvbR7/"
+    "HcnZ6A6cPRRyLcE3l9+XB9+ebm5K9mYxgz9tcSDpG30a5gEUUTcSUioZuwtOp9WAEts49h"
+    "BZ6YbHlmy2V/Amtrzx6VrvPZhuVkovlWKhCKuwKhoEX7rA9FRsEow98872lKcXqPviEPum"
+    "pMdNY9QktbQ4K1qAfAGoZQE2LkA4+wWeAYQwOrYMk90YfUd1MjSiCWaSdp6FcLDlgSG1Bg"
+    "DAKTcSmlXY3nuJzctgTXrZAx5aw/Cp+uxFm/f+1vB++vgQm8wF9XcdK3nk+cJ/c9+bFlVr"
+    "o/c9RmvHRn+3DeOAFBAZFR1+jWUsZq80LVaeoI9rtY2AY6ZrE/cBfBDhm915EwQMEco2bk"
+    "pHTTOoGCfsM2fYk2iU1SQDCBdA5s+rsBv+NRxBB5azH7pNw3MUH1ofkJ2+5j2Fg7fX/95k"
+    "yxx/2wx5e1VWQr7Cb6LurAmJZpJDp3t1uWulXYd7ecfXcL7NvOhiRlcXwkf5R8yTmxlgQ6"
+    "L2OAN/98zJC/wi7WmADe3t/9LSqe39paaxdrahfKgmoxU8fd1LUvFsa/RdUd5txw4HF3B+"
+    "Y43DK/uqZ/faAsivevjGqlS1VhXWySHc+4RA2XIwbqovdMjXITLcNWfl109VEXrtkj2EBM"
+    "yY5Gmfmz5+fLWSNiMJKkSxiW3A+5/WbFLuxBx7zQbnTd7JxC2cEo5mujkR37EcFKCTd0k1"
+    "VoMmrHvY0GYqU6WhcckXofSncnUFongvydRZ2+0Y1TyW3F+PbC+OpSlY1oyu7R2zJPUXx5"
+    "Y74MszGpT5lzYtsCtGXjUaBSd1jmxNTozGxoZeuqhOut2tEay6ktrQeTRqegipSTy4y6sp"
+    "paZpWleqY9+ImNxKfKCRolcOB7HQqLWdYKl2pvhY1v08oFR0xb8USanB7UF/mVydCICCbC"
+    "pMODy5K2mS86ijejtBEkBiZnq8An9T671O0o09+eiCB91CfPl6TkWEIGUzLtXDR2m4qt3H"
+    "JVnortYIHchdkqs5PNW/i4Fq1JJFpiCdzF2FTO9+N0vkdLd631LyukXPBpJBvwwqc8woeH"
+    "YlVHfHaMHJQv3l/IrcNwfTlppyWq8/T+kLm0TbOeuxzakHPzjSoEPp5xQ4hwTc7LwWKsY+"
+    "3tex5uCgQbw8YQbA6BgBt6lBBT2rLVG8YqAlxSZFz54Vua24nOGosJ/bIXfr1g2LxcK6nj"
+    "VmxhsCrM6DP70s2l5bpNXq4liO5av0nDNCa14h4kogpkKchkMnEwwhIrRzm6aRkFqxRW2w"
+    "soRasDaiKhIJVCiqm2B6kj9FpmpLSQAnYpsN11gO0qYFcC21sH2J4CdiWwxjrAGgrYcpNy"
+    "SO/XW7dSIgpU+Wh9Ru4TgSxrtYZrRkpBK4V2Rlse0w75xHZqOpgkogpkuYpgO7WjkdIyW4"
+    "J1u5FITdkL1oozR1Mn2hK1QZC5v3i6hIoO0+JVKbo8GkYNQHFjO9diQLYUDBVqv+1Q+/iL"
+    "KfGhxJ/TckfKOPX9rvan3F9/0tIuEDj+y2QB4xgbLCrITvk7orolfpR1KxLxTPI8GOzksX"
+    "6UioPFNp2KhgbgXLEsnver2GoUkB/fOYtDpPCwryfZuMwOC6zXWUD+YDThyTOgAYO13x9A"
+    "Hi9iQzuI9DrMkWNH+yutLmFh+7S7+kgE3acfmXtvsqk7sv3NRG/xrgm3EKKCz05Ih+HCDW"
+    "NAorAxBE9pd4adfH3iuVKAprpa4kD6wid99lLBW/eb8iht16MUw12V0sQCyqeUpJKOPo4a"
+    "YzAjs7sIC33fQ1GFHB19yJE6nOMoXmyBeTO+VC+OLJFQQWQxhkUA60eQiWoOD7/K4WPJ0D"
+    "i02LFIRy5Rf1Iq9AoFKKO31w8pwxO2RdfOJEI5vXnz7ixOCki/XcxPRV4eH5Z0pULk2Zba"
+    "BQWLxaq9ii7GIWdZpSRuM84piLuwIYVnj4nC11hzcdri0SjOnQi6WKS84f7EiLs2pHXdvn"
+    "t/A13uddnukh6728NREkZrhEVsHEk0mGwOQ1bYwh0h4mY2VutMAcN8HzP8ZffNUboJjcHc"
+    "ET3/+F6LQvDsAWSETGlIWkCIrcWBeJ0B654F76lrRSmdC3jyp7ChhTh2D7Znc42RH5+9Wg"
+    "2rqnXtxSa6ex0so0H0uhUUiF63VH+AW8t1MrXOqnX22NfZD3QawMw8Swc1+kbgrCTJeisr"
+    "tnTdncUCY4dJxMc6VVl/6dLX58aqjJFNLGjyuqUL6noVCROk2H3J0vrzbZKiOrpKs8XJSi"
+    "0IzLrGlwi6LPD1gq01g0m8giW7LPPmQvcypL22FiEJLn51Nfqf6BDoWBeatDN4ZOs8f3D8"
+    "bJDR7RWXD6ZeOKbfBZle1OmrdsryhXBrpfma8QyouEsw+4M9gG7or2OzLG/Y7Bhnrwo9B+"
+    "2Qfg70Tzde/RE3f3Yh7wmtHGu5t4S7Ntuj2tHPmbl1KMoJ0TvPJdEjhihcBKJ+7U8t+ObA"
+    "Pnn6Gx2O6AexKy6rX05SXQYRXjE3eiorZ4NWzhzORZNECYJZse2fLr+dXO8yzCSHyydfbh"
+    "06l5VqSexAjtFVMQn3yi3CvYJBODcV1TWDScTVeRJ7PkpazM11voxYoq2ukkqekhrJ05XF"
+    "/ygMw8rif6QvdmmsTT2LhERSWSYKmDZgoWjvMd3nOUuFZMgcksUiA7TEVJF/EeU2ikIEWy"
+    "XXAB6xREvdEdd6QX1FyGR7s6M0TZmK5Yb++rXI46I0aV3JSUWJ6T4+RDDKDkrVaW64Po/y"
+    "Sokgp7fvs6cTbWicVsryesqy7bGMuPXCWbJCa031e1ADG45oYSCgmRy6ckUhJ9ZKHbp5ZY"
+    "GhQp+nPpSRUCuB3ELSfMCEsmeRDbsWlIlYK8FsflRSOuaHtQ2JWakN7YgHZceR2BGJa9cG"
+    "KC1z5PAoI8hR6MpFI8i+Mq0dAW/aecBD+zFTh+qpQ/V2d6ieZJ5rIrqmch7Ew9l6l4duSR"
+    "rEh5tH7e7z7e1JYbLbXWTSAQNXEpiUoFZlj3AuyGf9vaAlkUbt+aazGQHIzGtwc+wHWl3L"
+    "0NiVKZhBs8IcHMFXzSQ8jl9ejZA1HhpmIRaJjJDMlsvrXRauVqMSYRXmEvYAmeKIeairM9"
+    "GiGGQ8HOmSODhl2t2PaRde3tpRKQXhdmqgLdE4KwWlkMmE4Fr5XhKJlhj0dp3mJXBsMq6P"
+    "a05MgSsFV8UTqHiCrVG+vIJx4PEEoHBcP6NQRh7je0tJ44xtpYqKreKK5fgqIrZzIjanyh"
+    "dxQ+kcWO6Sy0q18mzDLfiJU2f41vJv5uRasmTnvcXV3MXL/MXFFPmxKURiQliSSjAr1hI8"
+    "d02BkP3dkR1XVY5rIqEglWcWVR7V4/GoFpjuftjZLwRNw+cyfpa6u5ShPbNyiqMpjvayOR"
+    "rzL9JnCeRKavnaVxBsy1aqo6cVLwBTxSsUr2iaVwBnsLzwAwnYOTcSbpErsZRfYF52POOF"
+    "a2wm6Q/BRdcZxv4+nv4AjuAWXr983SX7SdapSJp4IiB0KPsX2tevMOl//QoVDiAHBMsR9f"
+    "UrCgIHjJfh168iD4Oo8ELWNPNpmjwZlPI27odA8TdahzwlEm1Zk7YdvD9LpoEsiDcu9n/M"
+    "KRTLDDLBRodpqSVeLfFtWuIzblw69ms7GbNCyr+YRrIB16JgNg9JhYcHZlXnYnaoHJJfMY"
+    "dyOcNMvYfVDFM875oMk50pILKFYp2l59T7Zo4fRk1UIJo16+PBauzUhnT5+MyDTPrRPJU8"
+    "1S/uzuJTD7Bu2vwwBlrrLM65mcnR9hpKQ/owRFthRyBgnWUENVIZ2QY8T+c66Ti/pOO1oQ"
+    "8qY1jzkXI1vYmzTbyIa81zKX/byeHyV7bzcS2ClZVUBOvACBZoauu81rScSmq25/hRtYlM"
+    "bSLb3SayKvt50pbM9feuFG2o7YE1u3wuZjPkOw3hIRj/A6v0R8tg2Z3OFOGzUnVKAVlZgx"
+    "pnXmklVSpRcGArzcgQ+26k2k5SvVyNWrcurkJlFS/ThGRPJjsxgeozhnb5LtGTOrbNmtMT"
+    "xStpjp0ZYeeTQceZopTBfk8G+2Q81zY2p2SVsVkZm1+ULqSMzcrY/DKNzf8gOPT8Nx5ezI"
+    "grDZXMlVhKlb6zsmNbFK6xBxrp8XlHeAhGVXoJQgf63VFyIpSuY0F08g2dSajS5pUCZ/pZ"
+    "88mE+ISOVTZCL7Sfoo0HTwuHIuC45Kdz7aeYevFl9CdowJjo2Qoc+yI+moIdMFU8e4sd3W"
+    "tqjg2SZGYR26ZPdKHp/d4ArOhddqIwP+k3ecDT+zlxL99pIV3ef46lfu79HMzQdCr6cgZV"
+    "0rEaQnjjMwqetddJC2P2OsffiQ8jlR39MRrZ3MTN8GPpQ4so2j29E59TDNvET0UL4kGCZ9"
+    "TtD85LXkGcupQft3ymeONeeGN2iNcxmxcl20Ies4ZzvdI+HH3JPhy9uA8n/eHXGJh5sZdE"
+    "LTJ0m08kReTKlZiUSFvG4a6VmHjGL+LKl/oSs39a7IiwTWsSnACcwlJbOPkitWzWmR/zci"
+    "3ZAZadHAdGhblxYJROjXCrZBBmaUcdZJdU0UqQt7ICKYvFEVksDiQC/gEjaVQSu75UPQxo"
+    "iepW8yE7a8DEOKOqRTZnTNjBw1YPG3HIjzg+OH8eAmtWbk1vug1pYHykUAr98evXdGKLr1"
+    "/ZyYm5oxjOtD9pOR4gMh37BHu+LUqOWGdYl5N8XDzS6Sx3vuFiPvWQzQ4h7uqjrjb3PQyW"
+    "CPcpumJ7Lol+Fyf5RH8G6Ds7EnGCnCmxRc3suOIL7f76E1P9Ouw8yAkERxkcN3YONYUSc4"
+    "WOQzWKDs/8+8P9HVNce+Jo56jHHvbHPvr9QrujrfqiflBz+TYApj32eQxWn1cTSWKqgDOQ"
+    "XE8ceLkEIB4wlrxlmzk07BFOfByxNPSzYwmtdp3ALvqT3s5cSk2q+VuZQaLiwZp3jbTi+L"
+    "eT6JNtLCKs+bMR6bow/fF/a5GKnKgKH9pz+FB20qnxbRQEd/iJ5PNlHehnEkMkP0qhArYl"
+    "5ym0RZ2ppM0sUWaKeYLQk+sFTq2cNhmhlgC5a4tQjNF46gSSOR3o1gp0Y8kcxJ9d+uxfKI"
+    "sNzzUo8tvWZoX/mixcDEhr1sKZho4bvIIG/3uDGWLJewBIlr+HPOS52RsqKIQXpKlsLatn"
+    "XlANdLnp0/c9f1y6I3NJ0tW8oAJYPpOAelhrAokE1Lyx/ryxcMFA8OQ6wKxrvwK5tHof67"
+    "8PCP0AR3ydGSYtoyYX6eQibER1xnZKpIEBfVAQb2XkTpwpGc9RKHFxlQ/djNAReQZV6Khy"
+    "xKwOHRVW8zVebFZSvdi9vtjCxh21s07trDuEnXXb9ORGWVAJ/gYcCE7MWpIrNVXqvFLOVC"
+    "EQn+1VyesrOaZ+OMT8Dx5nqqWzM0TnzVsjxDx2JqRiQPbElLp7G6tc7udFwgMZ1xmfmYRH"
+    "fFOVOWTbr0z8Gq7ZOrSDjZzbljll/9SCb858HnteGZxsteAF4phhNGTxuRhclXZnwL3XkP"
+    "sC4Y5+HocbY1PHovQdFV/Hocns0cxvGVmmhYtMeSub9lbSByPTsfed+L5TL49FUbIl6uQO"
+    "8uLXPdS6oQOtKyxMDQ/PJdBJDrRuh2u82dHVdJqUZHqurd9lJJVLfM8ucaWoH4U+pxT1I3"
+    "2xBUU9JLP5lGJdT1nPSakz6JWRQxk5tmzkkH21DSCXs088pmo+uA+4Kpa56emAjUYx3Kst"
+    "R+k3U8N8FGFR2YZUasBJjCT8Ui5/ja33WSB4h922JhBub42wGRfTex3pNoLtNihO6h50zA"
+    "u+a53ZokQxW0S5n3PD1TD5K2kJLFcdKE0GttgKzoLwdZMnPdWyljHLYDe6I6PCE/QHNg/x"
+    "Z9YtAAD2VKj8P3s0G9W2FrVXj9/KnjknGNMJxvkuWZuuPG9KkFsyDtNyOTwtKrgtQOMx2r"
+    "TufnV/f5vRAa7e5T3dnz9c3VCAGby0kMNXqCLRDDw/HHu+9DSJ8gQ7GaHd0c3Ovj9wZY04"
+    "MqVVWSOO9MXGiS0r7stNLdWeLEyzTk5QuV+2NSrPVvOBgjZ9vfB9QtcWOg8ufDGicgqKrN"
+    "hS5YTpuJhLjCdpkfV82/agY/DkSoxMw7ZZ2AosNhVLW5NvZG6oatA1hB4vMoF+fC82PesX"
+    "uhapNwjzXbJ9HOsAcEYC21LbZzoC6cTnJtgdmykPbEstHnY7fC/upjrCAdiu2q4uiPc+/t"
+    "+g3qGeebm2KA+7DvpUi/yLXOSLC9sqa/G9Sx49+mPLtuJtz1fbCYfbmAiIpf3BRfPg2ZMm"
+    "uZQVW00EonkwECIbMYFkhY5sbFYHgz2tMxmmF+1Co5UJwQYtCBskz5dBV+9MgvA44gybek"
+    "ekfZQH22X4wBBr6YUESrG0IZxVJMnEWW4OdtYTSR3TxFNgAkUBW6VKOa44xHFyCGUBOgoO"
+    "IbEA7V9/Ub73F+N7r2KSgn3AsxlxbWZ42tA69SlTmbJMleAi4aJF5MppqOSVVfOQs80AfL"
+    "9DhtUhbDH7ziRKip5rocT/vX51wCx95H471wJMv9tzLZPNM3JXX76+SnKlpxzbLOM4EEQD"
+    "2KxhM3tUj2Bxwmc1TpjZ5ACJ/OBXtaeh+STj6VdfO+VUiXgrdzf0q7it++Ve637xmE5v4e"
+    "NaeCYSrYRwO+lyd59x/LCi9behwUx8Qh/NxZJjqcpHZ0aoJcBuO6McWyAldHfqobIIikgi"
+    "h+AERA4Sw2U7l+4/X93eaB8/3Vy/e3gnsl/EGh27mQ1D+XRzeVuM7QkoOcYhkSziq6J70p"
+    "LrxfccFJ4NhvcAgatBiqLiLzTqfuf77fY9FTZPd9Y+NeA4zgpoHtC5783m4TqIFiUVpOye"
+    "OuNiFyD/MXd8rhGucZR9XljtvlW7b5W3YysnrAqzWnWSmJLYEk88SPtZApmFQvxcD7O0yE"
+    "tyEWXMDbnohXoIlki/UE1F+SiVj3I/+4Pz32FDCEpivA7uI66KZ8lUlcH24eZRu/t8e3tS"
+    "XFkaQDTrqbyKam3vEE2vn+v70SeE2FCmUQ/6W1FpuwDODDu+O3IM88CG0MCnfMlqqx1mcE"
+    "jg7C7OgH+bK4MN4k+4asTBmH0xNbbApIMDxDFwpG9KgwOiuuXxrWtVxMNYxVFvFjbNJFo1"
+    "E9o64H8gOz7lzmI5HS1rYvJt+VDI6GQiHJK9+RY7qn1oYBWUuq9QA9o++Y6mY2g1JE+1fI"
+    "9y6VYa3LZ0rHmET+jNx7UcP0XJF6pZJUhM0cyyUS23rkxYeXjFvtrpjBvL63zxGSH1oaex"
+    "hOw78OCLmqEHElk1RFNDlL680PtGZGG2pdNnUfCFzp7KTXCkbgJlcFQGR7Up4iDR3aG1Ir"
+    "Z1rTRYpK1ilW0Wk7RQXaMF30ULWw2Y3UGXWxyiJlbbLurWJ3bi5jbXimQd6br5WfdgjujB"
+    "Hlk4BYJtqzUtuGMY3MzxmiXrYJcscSmfIhAP+3p8kIVl9m1l1diPVSMaBLW3ThQE27LZdt"
+    "vRQ4pHHimPzE2ftWYcqexL4paKkDdLyP0C62vU73qYmFYl6dKvbXV8gFJyNldytknoSz20"
+    "Jcl3yry5KzLwCJfymtugpVnzWP46kdUmIeqp9DjyNqun5Vu7AeG9TOf1K+oBQPpBGzCZJ1"
+    "IfmqwVVnak6yKXX7ZlaJRe6uqU+2cb1e4u7mJJqmEYySZsfvgc0Y0zpQ7sRx1AQUDnurXY"
+    "a05U0VdFXw/knSr6enD0VVGtdQJYFelvhvTvkr7+9f+sojNm"
+)
@@ -0,0 +1,72 @@
+"""pgvector 바이너리 asyncpg 코덱.
+
+vector 값을 "[0.1, 0.2, ...]" 텍스트로 만들고 파싱하는 대신 pgvector의 바이너리 wire 포맷으로 주고받는다.
+
+    uint16 dim | uint16 unused | float32 x dim  (모두 big-endian)
+
+asyncpg 커넥션 풀의 ``init`` 콜백으로 등록하면 커넥션마다 한 번 설정되며,
+이후 vector 파라미터에는 list[float](또는 시퀀스)를 그대로 넘기고 결과도 list[float]로 받는다.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import struct
+from collections.abc import Sequence
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_HEADER = struct.Struct(">HH")
+
+
+def encode_vector(value: Sequence[float] | str) -> bytes:
+    """vector 값을 pgvector 바이너리 포맷으로 인코딩한다.
+
+    Args:
+        value (Sequence[float] | str): 벡터 (텍스트 표현 "[...]"도 허용).
+
+    Returns:
+        bytes: 바이너리 포맷 바이트열.
+    """
+    if isinstance(value, str):
+        value = json.loads(value)
+    dim = len(value)
+    return _HEADER.pack(dim, 0) + struct.pack(f">{dim}f", *value)
+
+
+def decode_vector(data: bytes) -> list[float]:
+    """pgvector 바이너리 포맷을 list[float]로 디코딩한다.
+
+    Args:
+        data (bytes): 바이너리 포맷 바이트열.
+
+    Returns:
+        list[float]: 벡터.
+    """
+    dim, _unused = _HEADER.unpack_from(data)
+    return list(struct.unpack_from(f">{dim}f", data, _HEADER.size))
+
+
+async def register_vector_codec(conn: Any) -> None:
+    """asyncpg 커넥션에 vector 타입 바이너리 코덱을 등록한다.
+
+    vector 확장이 아직 설치되지 않은 DB(마이그레이션 전)에서는 경고만 남기고 건너뛴다.
+
+    Args:
+        conn (asyncpg.Connection): 풀이 새로 연 커넥션.
+    """
+    schema = await conn.fetchval(
+        "SELECT n.nspname FROM pg_type t JOIN pg_namespace n ON n.oid = t.typnamespace WHERE t.typname = 'vector'"
+    )
+    if schema is None:
+        logger.warning("pgvector extension not found, vector binary codec not registered")
+        return
+    await conn.set_type_codec(
+        "vector",
+        schema=schema,
+        encoder=encode_vector,
+        decoder=decode_vector,
+        format="binary",
+    )
@@ -11,6 +11,8 @@ class DrugEntry(BaseModel):
     dose_days: int | None = None  # 투약일수
     dose_amount: str | None = None  # 1회 투여량 (예: "1")
     dose_unit: str | None = None  # 단위 (정, ml 등)
+    drug_id: int | None = None  # 매칭된 약품 ID (서버가 분석/저장 시 기록, 수정 요청 값은 무시)
+    ocr_name: str | None = None  # OCR 원문 약품명 (분석 시 서버가 기록, 별칭 학습용)
 
 
 class ScanUploadResponse(BaseModel):
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import httpx
+
+from app.core import config
+
+
+class LocalEmbeddingError(Exception):
+    """ai_worker 임베딩 서버 호출 실패."""
+
+
+class LocalEmbeddingClient:
+    """
+    ai_worker 로컬 임베딩 서버 HTTP 클라이언트.
+
+    커넥션을 재사용하도록 AsyncClient를 한 번만 만들고, socket_path가 있으면 Unix 소켓으로 연결한다.
+    """
+
+    def __init__(self, *, base_url: str, socket_path: str = "", timeout: float = 30.0) -> None:
+        transport = httpx.AsyncHTTPTransport(uds=socket_path) if socket_path else None
+        self._client = httpx.AsyncClient(
+            base_url="http://ai-worker" if socket_path else base_url,
+            transport=transport,
+            timeout=timeout,
+        )
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """
+        텍스트 목록을 임베딩한다.
+
+        Args:
+            texts (list[str]): 임베딩할 텍스트 목록.
+
+        Returns:
+            list[list[float]]: 입력 순서와 같은 벡터 목록 (서버에서 1536차원으로 맞춰 반환).
+
+        Raises:
+            LocalEmbeddingError: 연결 실패, 타임아웃, 2xx 이외 응답 시.
+        """
+        try:
+            response = await self._client.post("/embed", json={"texts": texts})
+        except httpx.HTTPError as e:
+            raise LocalEmbeddingError(f"local embedding request failed: {e}") from e
+        if response.status_code != 200:
+            raise LocalEmbeddingError(f"local embedding server returned {response.status_code}: {response.text}")
+        embeddings = response.json()["embeddings"]
+        if len(embeddings) != len(texts):
+            raise LocalEmbeddingError(f"expected {len(texts)} embeddings, got {len(embeddings)}")
+        return embeddings
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+_client: LocalEmbeddingClient | None = None
+
+
+def get_local_embedding_client() -> LocalEmbeddingClient:
+    """
+    LocalEmbeddingClient 싱글턴 인스턴스 반환.
+
+    Returns:
+        LocalEmbeddingClient: 설정값으로 초기화된 클라이언트.
+    """
+    global _client
+    if _client is None:
+        _client = LocalEmbeddingClient(
+            base_url=config.LOCAL_EMBEDDING_URL,
+            socket_path=config.LOCAL_EMBEDDING_SOCKET,
+            timeout=config.LOCAL_EMBEDDING_TIMEOUT,
+        )
+    return _client
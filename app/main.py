@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
 from pathlib import Path
 
@@ -12,6 +13,16 @@ from app.core import config
 from app.db.databases import initialize_tortoise
 from app.middleware import AuditLogMiddleware
 from app.models.health import HealthChecklistTemplate
+from app.repositories.disease_code_index import load_disease_code_index, refresh_disease_code_index
+from app.repositories.drug_alias_repository import apply_drug_alias_changes, load_drug_aliases, refresh_drug_aliases
+from app.repositories.drug_name_index import load_drug_name_index, refresh_drug_name_index
+from app.repositories.drug_vector_index import (
+    apply_drug_vector_sync,
+    load_drug_vector_index,
+    refresh_drug_vector_index,
+)
+from app.repositories.guideline_bundle import load_guideline_bundle_version, refresh_guideline_bundle_version
+from app.utils.master_data import on_master_data_change, on_master_data_payload, start_master_data_listener
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +86,23 @@ def _build_cors_origins() -> list[str]:
     return list(dict.fromkeys(origins))
 
 
+async def _load_master_data(kind: str, loader: Callable[[], Awaitable[object]]) -> None:
+    """
+    인메모리 마스터 데이터(인덱스/별칭/캐시 버전)를 로드한다.
+
+    모두 선택적 가속 기능이므로, 테이블이 아직 없거나(마이그레이션 진행 중) DB 오류가 나도
+    경고만 남기고 앱을 시작한다 (각 조회는 DB 경로로 동작하고, 변경 알림 시 다시 로드를 시도한다).
+
+    Args:
+        kind (str): 로그에 남길 마스터 데이터 종류
+        loader (Callable[[], Awaitable[object]]): 로드 함수
+    """
+    try:
+        await loader()
+    except Exception:
+        logger.warning("Failed to load %s master data, continuing without it", kind, exc_info=True)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     _validate_config()
@@ -82,7 +110,24 @@ async def lifespan(app: FastAPI):
         await seed_health_templates()
     except Exception:
         logger.exception("Failed to seed health templates")
+    if config.DRUG_VECTOR_INDEX_DIR:
+        load_drug_vector_index(config.DRUG_VECTOR_INDEX_DIR)
+        on_master_data_change("drug_vector", refresh_drug_vector_index)
+        on_master_data_payload("drug_vector", apply_drug_vector_sync)
+    if config.DRUG_NAME_INDEX_ENABLED:
+        await _load_master_data("drug name index", load_drug_name_index)
+        on_master_data_change("drug", refresh_drug_name_index)
+    await _load_master_data("drug alias", load_drug_aliases)
+    on_master_data_change("drug_alias", refresh_drug_aliases)
+    on_master_data_payload("drug_alias", apply_drug_alias_changes)
+    if config.DISEASE_CODE_INDEX_ENABLED:
+        await _load_master_data("disease code index", load_disease_code_index)
+        on_master_data_change("disease_code", refresh_disease_code_index)
+    await _load_master_data("guideline bundle version", load_guideline_bundle_version)
+    on_master_data_change("disease_guideline", refresh_guideline_bundle_version)
+    master_data_listener = start_master_data_listener()
     yield
+    master_data_listener.cancel()
 
 
 app = FastAPI(
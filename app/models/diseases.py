@@ -19,7 +19,7 @@ class Disease(models.Model):
 
     id = fields.IntField(pk=True)
     name = fields.CharField(max_length=255)
-    kcd_code = fields.CharField(max_length=20, null=True)
+    kcd_code = fields.CharField(max_length=20, null=True, unique=True)
     description = fields.TextField(null=True)
 
     class Meta:
@@ -6,6 +6,7 @@
 """
 
 from tortoise import fields, models
+from tortoise.fields.relational import ForeignKeyRelation
 
 
 class Drug(models.Model):
@@ -33,3 +34,42 @@ class Drug(models.Model):
 
     class Meta:
         table = "drugs"
+
+
+class DrugEdiCode(models.Model):
+    """
+    약품 보험코드(EDI) 정규화 테이블 (ERD: drug_edi_codes).
+
+    drugs.edi_code는 여러 코드를 쉼표로 이어 붙인 문자열이라 LIKE 패턴으로만 찾을 수 있으므로
+    코드 1개당 1행으로 풀어 PK 조회한다. seed 스크립트가 drugs.edi_code로부터 동기화한다.
+    """
+
+    edi_code = fields.CharField(max_length=32, pk=True)
+    drug: ForeignKeyRelation[Drug] = fields.ForeignKeyField(
+        "models.Drug", related_name="edi_codes", on_delete=fields.CASCADE
+    )
+
+    class Meta:
+        table = "drug_edi_codes"
+
+
+class DrugAlias(models.Model):
+    """
+    OCR 약품명 별칭 (ERD: drug_aliases).
+
+    사용자가 확정한 (OCR 원문 약품명 → 약품) 대응을 적중 횟수와 함께 기록한다.
+    같은 별칭이 여러 약품에 대응되면 hit_count가 가장 큰 약품을 사용한다.
+    """
+
+    id = fields.IntField(pk=True)
+    alias = fields.CharField(max_length=500)  # normalize_drug_name(OCR 원문)
+    drug: ForeignKeyRelation[Drug] = fields.ForeignKeyField(
+        "models.Drug", related_name="aliases", on_delete=fields.CASCADE
+    )
+    hit_count = fields.IntField(default=1)
+    created_at = fields.DatetimeField(auto_now_add=True)
+    updated_at = fields.DatetimeField(auto_now=True)
+
+    class Meta:
+        table = "drug_aliases"
+        unique_together = (("alias", "drug"),)
@@ -2,19 +2,38 @@ from __future__ import annotations
 
 from tortoise.fields import TextField
 
+EMBEDDING_DIMENSIONS = 1536
+
+
+def _dialect_of(instance) -> str:
+    """모델 인스턴스(또는 클래스)가 연결된 DB 방언을 반환한다 (연결 전이면 빈 문자열)."""
+    try:
+        return instance._meta.db.capabilities.dialect
+    except Exception:
+        return ""
+
 
 class VectorField(TextField):
     """
     pgvector 확장의 vector 타입을 위한 커스텀 Tortoise ORM 필드.
 
-    CI 환경에서는 TEXT로 동작하며, raw SQL에서 ``::vector`` 캐스팅으로 벡터 연산 처리.
+    PostgreSQL에서는 네이티브 ``vector(1536)`` 컬럼으로 생성되어 HNSW 인덱스를 사용할 수 있고,
+    SQLite(로컬 테스트)에서는 TEXT로 동작한다.
+
+    PostgreSQL에서는 값을 list 그대로 넘기며, 직렬화는 커넥션에 등록된
+    바이너리 코덱(app.db.pgvector)이 담당한다.
     """
 
     SQL_TYPE = "TEXT"
 
-    def to_db_value(self, value: list[float] | None, instance) -> str | None:
+    class _db_postgres:  # noqa: N801 - Tortoise 방언별 override 규약
+        SQL_TYPE = f"vector({EMBEDDING_DIMENSIONS})"
+
+    def to_db_value(self, value: list[float] | None, instance) -> list[float] | str | None:
         if value is None:
             return None
+        if _dialect_of(instance) == "postgres":
+            return list(value)
         return "[" + ", ".join(str(v) for v in value) + "]"
 
     def to_python_value(self, value: str | list | None) -> list[float] | None:
@@ -27,7 +46,7 @@ class VectorField(TextField):
         return json.loads(value)
 
     def get_db_field_types(self) -> dict:
-        return {"": "TEXT"}
+        return {"": "TEXT", "postgres": self._db_postgres.SQL_TYPE}
 
 
 class EncryptedTextField(TextField):
@@ -4,7 +4,8 @@
 📚 학습 포인트:
 - RAG/검색용: 텍스트를 벡터로 변환해 유사도 검색
 - reference_type + reference_id: 어떤 엔티티의 내용인지 (다형성 참조)
-- MySQL에는 vector 타입이 없어 JSON으로 저장 (1536차원 = OpenAI embedding)
+- PostgreSQL에서는 pgvector ``vector(1536)`` 컬럼 + reference_type별 partial HNSW 인덱스 사용
+  (1536차원 = OpenAI embedding, SQLite 테스트 환경에서는 TEXT)
 """
 
 from __future__ import annotations
@@ -21,6 +22,7 @@ class VectorDocument(models.Model):
     - reference_type: 'disease_guideline', 'chatbot_summary' 등
     - reference_id: 해당 테이블의 id
     - embedding: 1536차원 벡터 (OpenAI text-embedding-3-small 등)
+    - content_hash / embedding_model_version: 증분 재임베딩 판별용 (content의 sha256, 임베딩 모델명)
     """
 
     id = fields.IntField(pk=True)
@@ -28,6 +30,8 @@ class VectorDocument(models.Model):
     reference_id = fields.IntField()
     content = fields.TextField()
     embedding = VectorField()
+    content_hash = fields.CharField(max_length=64, null=True)
+    embedding_model_version = fields.CharField(max_length=100, null=True)
     created_at = fields.DatetimeField(auto_now_add=True)
 
     class Meta:
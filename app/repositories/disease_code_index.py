@@ -0,0 +1,184 @@
+"""
+KCD 코드 매핑 인메모리 인덱스
+
+- disease_code_mappings(상세 코드 → anchor 코드)는 수천 건 규모의 정적 마스터 데이터인데,
+  anchor 변환은 정확 일치 후 코드를 한 글자씩 줄여 가며 조회하므로 진단 하나에 DB 왕복이 4~5번 생긴다.
+- 앱 시작 시 한 번 읽어 다음 구조를 만든다.
+    1) 코드 문자 단위 prefix trie: 입력 코드를 따라 내려가며 가장 긴 등록 prefix를 찾는다 (anchor 변환)
+    2) anchor 코드 → disease_id: anchor 가이드라인 조회 시 diseases 조회를 생략한다
+       (빌드 이후 생긴 질환은 첫 조회 때 DB에서 찾아 채운다)
+- 마스터 데이터 변경 알림(app.utils.master_data, kind="disease_code")을 받으면 새로 빌드해 통째로 교체한다.
+- 코드는 대문자로 정규화한다 (DB 조회 경로와 같다).
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from app.models.diseases import Disease, DiseaseCodeMapping
+from app.utils.master_data import coalesced
+
+logger = logging.getLogger(__name__)
+
+# prefix 폴백의 최소 길이 (E11처럼 3자리 분류 코드까지만 줄인다)
+MIN_PREFIX_LENGTH = 3
+
+
+@dataclass(frozen=True, slots=True)
+class DiseaseCodeEntry:
+    """매핑 1건 (DiseaseCodeMapping 대신 쓰는 경량 레코드)."""
+
+    code: str
+    name: str
+    mapped_code: str
+    mapped_name: str
+    is_anchor: bool
+
+
+class _TrieNode:
+    __slots__ = ("children", "entry")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.entry: DiseaseCodeEntry | None = None
+
+
+class DiseaseCodeIndex:
+    """상세 KCD 코드 → anchor 코드 변환 인덱스."""
+
+    def __init__(self, entries: Iterable[DiseaseCodeEntry], anchor_disease_ids: dict[str, int]) -> None:
+        self._root = _TrieNode()
+        self._size = 0
+        self._anchor_codes: set[str] = set()
+        for entry in entries:
+            self._insert(entry)
+            self._anchor_codes.add(entry.mapped_code.strip().upper())
+        self._anchor_disease_ids = anchor_disease_ids
+
+    @classmethod
+    def build(
+        cls,
+        mappings: Iterable[tuple[str, str, str, str, bool]],
+        diseases: Iterable[tuple[int, str | None]],
+    ) -> DiseaseCodeIndex:
+        """
+        매핑 행과 질환 행으로 인덱스를 만든다.
+
+        Args:
+            mappings (Iterable[tuple[str, str, str, str, bool]]):
+                disease_code_mappings의 (code, name, mapped_code, mapped_name, is_anchor)
+            diseases (Iterable[tuple[int, str | None]]):
+                diseases의 (id, kcd_code). anchor 코드에 해당하는 질환만 남긴다 (중복 코드는 id가 작은 쪽)
+
+        Returns:
+            DiseaseCodeIndex: 빌드된 인덱스
+        """
+        entries = [
+            DiseaseCodeEntry(
+                code=code.strip().upper(),
+                name=name,
+                mapped_code=mapped_code,
+                mapped_name=mapped_name,
+                is_anchor=is_anchor,
+            )
+            for code, name, mapped_code, mapped_name, is_anchor in mappings
+            if code and code.strip()
+        ]
+        anchors = {entry.mapped_code.strip().upper() for entry in entries}
+        anchor_disease_ids: dict[str, int] = {}
+        for disease_id, kcd_code in sorted(diseases, key=lambda row: row[0]):
+            key = (kcd_code or "").strip().upper()
+            if key in anchors:
+                anchor_disease_ids.setdefault(key, disease_id)
+        return cls(entries, anchor_disease_ids)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _insert(self, entry: DiseaseCodeEntry) -> None:
+        node = self._root
+        for ch in entry.code:
+            node = node.children.setdefault(ch, _TrieNode())
+        if node.entry is None:
+            self._size += 1
+        node.entry = entry
+
+    def get(self, code: str) -> DiseaseCodeEntry | None:
+        """상세 코드 정확 일치 항목을 반환한다."""
+        node = self._root
+        for ch in code.strip().upper():
+            child = node.children.get(ch)
+            if child is None:
+                return None
+            node = child
+        return node.entry
+
+    def resolve_anchor(self, code: str) -> DiseaseCodeEntry | None:
+        """
+        코드 자신 또는 MIN_PREFIX_LENGTH 이상인 가장 긴 prefix의 매핑 항목을 반환한다.
+
+        Args:
+            code (str): 상세 KCD 코드 (예: E1180)
+
+        Returns:
+            DiseaseCodeEntry | None: 매핑 항목 (없으면 None)
+        """
+        key = code.strip().upper()
+        best: DiseaseCodeEntry | None = None
+        node = self._root
+        for depth, ch in enumerate(key, start=1):
+            child = node.children.get(ch)
+            if child is None:
+                break
+            node = child
+            if node.entry is not None and (depth >= MIN_PREFIX_LENGTH or depth == len(key)):
+                best = node.entry
+        return best
+
+    def is_anchor_code(self, anchor_code: str) -> bool:
+        """매핑 대상(anchor) 코드인지 반환한다."""
+        return anchor_code.strip().upper() in self._anchor_codes
+
+    def anchor_disease_id(self, anchor_code: str) -> int | None:
+        """anchor 코드에 해당하는 diseases.id를 반환한다 (빌드 시점에 질환이 없었으면 None → 호출 측이 DB 조회)."""
+        return self._anchor_disease_ids.get(anchor_code.strip().upper())
+
+    def remember_anchor_disease_id(self, anchor_code: str, disease_id: int) -> None:
+        """빌드 이후 생긴 anchor 질환의 id를 기록한다 (anchor 코드가 아니면 무시)."""
+        key = anchor_code.strip().upper()
+        if key in self._anchor_codes:
+            self._anchor_disease_ids.setdefault(key, disease_id)
+
+
+_index: DiseaseCodeIndex | None = None
+
+
+async def load_disease_code_index() -> DiseaseCodeIndex | None:
+    """
+    disease_code_mappings/diseases로 인덱스를 빌드해 모듈 전역에 등록한다.
+
+    빌드에 실패하면 기존 인덱스를 유지한다 (처음이면 None → DB 조회 사용).
+
+    Returns:
+        DiseaseCodeIndex | None: 현재 등록된 인덱스
+    """
+    global _index
+    try:
+        mappings = await DiseaseCodeMapping.all().values_list("code", "name", "mapped_code", "mapped_name", "is_anchor")
+        diseases = await Disease.filter(kcd_code__isnull=False).values_list("id", "kcd_code")
+        _index = DiseaseCodeIndex.build(mappings, diseases)  # type: ignore[arg-type]
+        logger.info("disease code index built: %d mappings", len(_index))
+    except Exception:
+        logger.warning("disease code index build failed, keeping previous index", exc_info=True)
+    return _index
+
+
+# 변경 알림 핸들러 (빌드 중 추가 알림은 한 번으로 병합)
+refresh_disease_code_index = coalesced(load_disease_code_index)
+
+
+def get_disease_code_index() -> DiseaseCodeIndex | None:
+    """로드된 KCD 코드 인덱스를 반환한다 (미로드/빌드 실패 시 None)."""
+    return _index
@@ -6,7 +6,52 @@ Disease 마스터 데이터 및 DiseaseGuideline 조회를 담당한다.
 
 from __future__ import annotations
 
+import re
+from collections.abc import Sequence
+from typing import Any
+
+from tortoise import connections
+from tortoise.expressions import Q
+from tortoise.filters import escape_like
+
 from app.models.diseases import Disease, DiseaseCodeMapping, DiseaseGuideline
+from app.repositories.disease_code_index import get_disease_code_index
+from app.repositories.guideline_bundle import GuidelineBundle, get_cached_bundle, set_cached_bundle
+
+# 상병코드 자동완성 순위 검색 ($1 코드 검색어(대문자), $2 코드 prefix 패턴, $3 이름 prefix 패턴,
+# $4 이름 부분 일치 패턴, $5 이름 검색어, $6 limit)
+# 순위: 코드 정확 일치 → 코드 prefix → 이름 prefix → 이름 부분 일치 → 이름 trigram 유사도, 같은 순위는 유사도/코드순.
+# 코드 prefix는 idx_disease_code_mappings_code_pattern(varchar_pattern_ops),
+# 이름 ILIKE/%는 idx_disease_code_mappings_name_trgm(GIN trigram)으로 찾는다.
+_CODE_SEARCH_SQL = """
+    SELECT code, name
+    FROM (
+        SELECT
+            code,
+            name,
+            CASE
+                WHEN code = $1 THEN 0
+                WHEN code LIKE $2 THEN 1
+                WHEN name ILIKE $3 THEN 2
+                WHEN name ILIKE $4 THEN 3
+                ELSE 4
+            END AS search_rank,
+            similarity(name, $5) AS score
+        FROM disease_code_mappings
+        WHERE code LIKE $2 OR name ILIKE $4 OR name % $5
+    ) AS hits
+    ORDER BY search_rank, score DESC, code
+    LIMIT $6
+"""
+
+# 누락된 코드 질환을 한 문장으로 생성한다 ($1 이름 배열, $2 KCD 코드 배열).
+# 동시 저장으로 이미 생성된 코드는 no-op UPDATE로 기존 행을 RETURNING에 포함시킨다.
+_UPSERT_BY_CODE_SQL = """
+    INSERT INTO diseases (name, kcd_code)
+    SELECT * FROM unnest($1::text[], $2::text[])
+    ON CONFLICT (kcd_code) DO UPDATE SET kcd_code = EXCLUDED.kcd_code
+    RETURNING id, name, kcd_code, description
+"""
 
 
 class DiseaseRepository:
@@ -100,6 +145,64 @@ class DiseaseRepository:
         """
         return await self._model.get_or_none(kcd_code=kcd_code)
 
+    async def get_or_create_many(self, entries: Sequence[tuple[str | None, str]]) -> list[Disease]:
+        """
+        (KCD 코드, 질환명) 목록을 질환으로 일괄 변환한다. 없는 질환은 생성한다.
+
+        코드가 있으면 코드로, 없으면 이름으로 찾는다 (같은 이름이 여럿이면 id가 작은 쪽).
+        기존 질환은 IN 조회 1회로 찾고, 없는 코드 질환은 INSERT ... ON CONFLICT (kcd_code) 1문장으로 만들어
+        동시 저장에서도 같은 코드의 질환이 중복 생성되지 않는다.
+
+        Args:
+            entries (Sequence[tuple[str | None, str]]):
+                (대문자 KCD 코드 또는 None, 질환명) 목록
+
+        Returns:
+            list[Disease]:
+                entries와 같은 순서의 질환 목록
+        """
+        codes = list(dict.fromkeys(code for code, _ in entries if code))
+        names = list(dict.fromkeys(name for code, name in entries if not code))
+        if not codes and not names:
+            return []
+
+        conditions = ([Q(kcd_code__in=codes)] if codes else []) + ([Q(name__in=names)] if names else [])
+        by_code: dict[str, Disease] = {}
+        by_name: dict[str, Disease] = {}
+        for disease in await self._model.filter(Q(*conditions, join_type="OR")).order_by("id"):
+            if disease.kcd_code:
+                by_code.setdefault(disease.kcd_code, disease)
+            by_name.setdefault(disease.name, disease)
+
+        code_names: dict[str, str] = {}
+        for code, name in entries:
+            if code and code not in by_code:
+                code_names.setdefault(code, name)
+        if code_names:
+            for disease in await self._create_by_codes(list(code_names.items())):
+                by_code[disease.kcd_code or ""] = disease
+
+        missing_names = [name for name in names if name not in by_name]
+        if missing_names:
+            await self._model.bulk_create([self._model(name=name) for name in missing_names])
+            for disease in await self._model.filter(name__in=missing_names).order_by("id"):
+                by_name.setdefault(disease.name, disease)
+
+        return [by_code[code] if code else by_name[name] for code, name in entries]
+
+    async def _create_by_codes(self, rows: list[tuple[str, str]]) -> list[Disease]:
+        # rows: (KCD 코드, 질환명)
+        conn = connections.get(self._model._meta.default_connection or "default")
+        if conn.capabilities.dialect == "postgres":
+            returned = await conn.execute_query_dict(
+                _UPSERT_BY_CODE_SQL, [[name for _, name in rows], [code for code, _ in rows]]
+            )
+            return [self._model._init_from_db(**row) for row in returned]
+        await self._model.bulk_create(
+            [self._model(name=name, kcd_code=code) for code, name in rows], ignore_conflicts=True
+        )
+        return await self._model.filter(kcd_code__in=[code for code, _ in rows])
+
     async def get_by_name(self, name: str) -> Disease | None:
         """
         질환명 정확 일치로 조회한다.
@@ -132,14 +235,83 @@ class DiseaseRepository:
             return []
         return await self._model.filter(name__icontains=keyword.strip()).limit(limit)
 
+    async def search_code_mappings(self, keyword: str, *, limit: int = 10) -> list[dict[str, Any]]:
+        """
+        상병코드 또는 질병명으로 매핑 테이블을 순위 검색한다.
+
+        PostgreSQL에서는 코드 prefix와 이름 유사도 후보를 한 SQL에서 순위를 매겨 반환하고,
+        그 외 DB(테스트용 SQLite)에서는 코드 prefix/이름 부분 일치 후보를 같은 순위(trigram 유사도 제외)로 정렬한다.
+
+        Args:
+            keyword (str):
+                검색어
+            limit (int):
+                최대 조회 개수
+
+        Returns:
+            list[dict[str, Any]]:
+                {code, name} 목록
+        """
+        text = keyword.strip()
+        if not text:
+            return []
+        conn = connections.get(DiseaseCodeMapping._meta.default_connection or "default")
+        if conn.capabilities.dialect != "postgres":
+            rows = await DiseaseCodeMapping.filter(Q(code__istartswith=text.upper()) | Q(name__icontains=text)).values(
+                "code", "name"
+            )
+            rows.sort(key=lambda row: (self._code_search_rank(row, text), row["code"]))
+            return rows[:limit]
+
+        escaped = escape_like(text)
+        return await conn.execute_query_dict(
+            _CODE_SEARCH_SQL,
+            [text.upper(), f"{escape_like(text.upper())}%", f"{escaped}%", f"%{escaped}%", text, limit],
+        )
+
+    @staticmethod
+    def _code_search_rank(row: dict[str, Any], text: str) -> int:
+        """_CODE_SEARCH_SQL의 search_rank와 같은 순위 (코드 정확 일치 → 코드 prefix → 이름 prefix → 이름 부분 일치)."""
+        code, name = row["code"], (row["name"] or "").lower()
+        if code == text.upper():
+            return 0
+        if code.startswith(text.upper()):
+            return 1
+        if name.startswith(text.lower()):
+            return 2
+        return 3
+
     async def get_mapping_by_code(self, code: str) -> DiseaseCodeMapping | None:
         """상세 KCD 코드로 매핑 레코드를 조회한다."""
         return await DiseaseCodeMapping.get_or_none(code=code.strip().upper())
 
+    async def get_code_names(self, codes: Sequence[str]) -> dict[str, str]:
+        """
+        상세 KCD 코드들의 한글명을 반환한다. 인메모리 KCD 인덱스가 있으면 DB를 조회하지 않는다.
+
+        Args:
+            codes (Sequence[str]):
+                상세 KCD 코드 목록
+
+        Returns:
+            dict[str, str]:
+                대문자 코드 → 매핑 테이블의 한글명 (미등록 코드는 제외)
+        """
+        keys = list(dict.fromkeys(code.strip().upper() for code in codes if code.strip()))
+        if not keys:
+            return {}
+        index = get_disease_code_index()
+        if index is not None:
+            entries = ((key, index.get(key)) for key in keys)
+            return {key: entry.name for key, entry in entries if entry}
+        rows = await DiseaseCodeMapping.filter(code__in=keys).values_list("code", "name")
+        return dict(rows)  # type: ignore[arg-type]
+
     async def resolve_anchor_code(self, code: str) -> tuple[str, str] | None:
         """상세 KCD 코드를 anchor 코드로 변환한다.
 
-        DB 매핑 테이블을 먼저 조회하고, 없으면 prefix를 줄여가며 탐색한다.
+        매핑 테이블을 먼저 정확 일치로 찾고, 없으면 prefix를 줄여가며 탐색한다.
+        인메모리 KCD 인덱스가 있으면 trie 탐색 1회로 처리한다.
 
         Returns:
             (anchor_code, anchor_name) 또는 None
@@ -148,6 +320,11 @@ class DiseaseRepository:
         if not upper:
             return None
 
+        index = get_disease_code_index()
+        if index is not None:
+            entry = index.resolve_anchor(upper)
+            return (entry.mapped_code, entry.mapped_name) if entry else None
+
         # 1) DB exact match
         mapping = await DiseaseCodeMapping.get_or_none(code=upper)
         if mapping:
@@ -163,39 +340,110 @@ class DiseaseRepository:
         return None
 
     async def get_guidelines_by_anchor_code(self, anchor_code: str) -> list[DiseaseGuideline]:
-        """anchor 코드에 해당하는 Disease의 가이드라인을 조회한다."""
-        disease = await self._model.get_or_none(kcd_code=anchor_code.strip().upper())
-        if not disease:
+        """anchor 코드에 해당하는 Disease의 가이드라인을 조회한다.
+
+        인메모리 KCD 인덱스에 있는 anchor 질환은 diseases 조회 없이 disease_id를 얻는다.
+        """
+        disease_id = await self._anchor_disease_id(anchor_code.strip().upper())
+        if disease_id is None:
             return []
-        return await self._guideline_model.filter(disease_id=disease.id).order_by("category")
+        return await self._guideline_model.filter(disease_id=disease_id).order_by("category")
+
+    async def _anchor_disease_id(self, upper: str) -> int | None:
+        """anchor 코드의 diseases.id를 인메모리 인덱스 → DB 순으로 찾는다.
+
+        인덱스의 질환 맵은 빌드 시점 스냅샷이므로, 이후 스캔 저장/seed로 생긴 질환은 DB에서 찾아 인덱스에 채워 둔다.
+        """
+        index = get_disease_code_index()
+        disease_id = index.anchor_disease_id(upper) if index is not None else None
+        if disease_id is not None:
+            return disease_id
+        disease = await self._model.get_or_none(kcd_code=upper)
+        if disease is None:
+            return None
+        if index is not None:
+            index.remember_anchor_disease_id(upper, disease.id)
+        return disease.id
+
+    async def match_guideline_bundle(self, name: str, *, kcd_code: str | None = None) -> GuidelineBundle:
+        """
+        진단명에 매칭되는 질환과 가이드라인 묶음을 반환한다 (가이드라인 묶음 캐시 우선).
+
+        매칭 우선순위: kcd_code 일치(주어진 경우) → 이름 정확 일치 → 이름 부분 일치.
+
+        Args:
+            name (str):
+                정규화된 진단명
+            kcd_code (str | None):
+                진단명이 코드 형태일 때 먼저 조회할 KCD 코드
+
+        Returns:
+            GuidelineBundle:
+                매칭된 질환과 category순 가이드라인 (매칭 실패 시 빈 묶음)
+        """
+        text = name.strip()
+        if not text:
+            return GuidelineBundle()
+        key = f"{kcd_code or ''}|{text}"
+        cached = await get_cached_bundle("disease", key)
+        if cached is not None:
+            return cached
+
+        disease = await self.get_by_kcd_code(kcd_code) if kcd_code else None
+        if disease is None:
+            disease = await self.get_by_name(text)
+        if disease is None:
+            results = await self.list_by_name_contains(text, limit=1)
+            disease = results[0] if results else None
+        bundle = await GuidelineBundle.of(disease)
+        await set_cached_bundle("disease", key, bundle)
+        return bundle
+
+    async def get_anchor_bundle(self, anchor_code: str) -> GuidelineBundle:
+        """
+        anchor 코드의 질환과 가이드라인 묶음을 반환한다 (가이드라인 묶음 캐시 우선).
+
+        Args:
+            anchor_code (str):
+                resolve_anchor_code로 얻은 anchor 코드
+
+        Returns:
+            GuidelineBundle:
+                anchor 질환과 category순 가이드라인 (질환이 없으면 빈 묶음)
+        """
+        upper = anchor_code.strip().upper()
+        if not upper:
+            return GuidelineBundle()
+        cached = await get_cached_bundle("anchor", upper)
+        if cached is not None:
+            return cached
+
+        disease_id = await self._anchor_disease_id(upper)
+        disease = await self.get_by_id(disease_id) if disease_id is not None else None
+        bundle = await GuidelineBundle.of(disease)
+        await set_cached_bundle("anchor", upper, bundle)
+        return bundle
 
     async def resolve_disease_info(self, code_or_name: str) -> tuple[str | None, str | None, list[str]]:
         """질병코드 또는 질병명으로 (anchor_code, disease_name, guideline_texts)를 반환한다.
 
-        챗봇 프롬프트 구성용 헬퍼.
+        챗봇 프롬프트 구성용 헬퍼. 가이드라인 묶음 캐시가 있으면 DB를 조회하지 않는다.
         """
         text = code_or_name.strip()
         if not text:
             return None, None, []
 
         # 1) 코드 형태면 매핑 테이블 → anchor → guideline
-        import re
-
         if re.fullmatch(r"[A-Za-z]\d{2,5}", text):
             anchor = await self.resolve_anchor_code(text)
             if anchor:
                 anchor_code, anchor_name = anchor
-                guidelines = await self.get_guidelines_by_anchor_code(anchor_code)
-                return anchor_code, anchor_name, [gl.content for gl in guidelines]
+                bundle = await self.get_anchor_bundle(anchor_code)
+                return anchor_code, anchor_name, [gl.content for gl in bundle.guidelines]
 
         # 2) 이름 매칭
-        disease = await self.get_by_name(text)
-        if not disease:
-            results = await self.list_by_name_contains(text, limit=1)
-            disease = results[0] if results else None
-
-        if disease:
-            guidelines = await self.get_guidelines_by_disease(disease.id)
-            return disease.kcd_code, disease.name, [gl.content for gl in guidelines]
+        bundle = await self.match_guideline_bundle(text)
+        if bundle.disease_id is not None:
+            return bundle.kcd_code, bundle.disease_name, [gl.content for gl in bundle.guidelines]
 
         return None, None, []
@@ -0,0 +1,133 @@
+"""OCR 약품명 별칭 Repository.
+
+사용자가 스캔 결과를 확정할 때의 (OCR 원문 약품명 → 약품) 대응을 drug_aliases에 누적하고,
+매칭 시에는 인메모리 해시 맵(정규화 별칭 → drug_id)으로 조회한다.
+약국 프린터별로 같은 오인식이 반복되므로, DRUG_ALIAS_MIN_HITS번 확정된 별칭은 다음 스캔부터 퍼지 매칭 없이 바로 매칭된다.
+기록한 변경분은 마스터 데이터 알림 payload로 다른 워커에 보내 각자 맵에 반영한다 (테이블 전체 재로드 없음).
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from typing import Any
+
+from tortoise.exceptions import IntegrityError
+from tortoise.expressions import F
+
+from app.core import config
+from app.models.drugs import DrugAlias
+from app.repositories.drug_name_index import normalize_drug_name
+from app.utils.master_data import coalesced
+
+logger = logging.getLogger(__name__)
+
+ALIAS_MAX_LENGTH = 500
+
+# 정규화 별칭 → (drug_id, hit_count). 별칭마다 적중 횟수가 가장 큰 약품만 유지
+_aliases: dict[str, tuple[int, int]] | None = None
+
+
+def _remember(alias: str, drug_id: int, hit_count: int) -> None:
+    if _aliases is None:
+        return
+    best = _aliases.get(alias)
+    if best is None or hit_count > best[1] or best[0] == drug_id:
+        _aliases[alias] = (drug_id, hit_count)
+
+
+class DrugAliasRepository:
+    async def record(self, pairs: Iterable[tuple[str, int]]) -> list[tuple[str, int, int]]:
+        """
+        (OCR 원문 약품명, drug_id) 대응을 기록한다. 이미 있으면 hit_count를 1 늘린다.
+
+        정규화 후 약품명과 같아지는 별칭은 이름 매칭으로 충분하므로 호출 측에서 걸러서 넘긴다.
+
+        Args:
+            pairs (Iterable[tuple[str, int]]): (OCR 원문 약품명, drug_id) 목록
+
+        Returns:
+            list[tuple[str, int, int]]: 기록한 (정규화 별칭, drug_id, hit_count) 목록 (다른 워커에 보낼 변경분)
+        """
+        recorded: list[tuple[str, int, int]] = []
+        for raw_name, drug_id in dict.fromkeys(pairs):
+            alias = normalize_drug_name(raw_name)
+            if not alias or len(alias) > ALIAS_MAX_LENGTH:
+                continue
+            hit_count = await self._increment(alias, drug_id)
+            _remember(alias, drug_id, hit_count)
+            recorded.append((alias, drug_id, hit_count))
+        return recorded
+
+    @staticmethod
+    async def _increment(alias: str, drug_id: int) -> int:
+        qs = DrugAlias.filter(alias=alias, drug_id=drug_id)
+        if not await qs.update(hit_count=F("hit_count") + 1):
+            try:
+                await DrugAlias.create(alias=alias, drug_id=drug_id)
+                return 1
+            except IntegrityError:
+                # 동시에 같은 별칭이 생성된 경우
+                await qs.update(hit_count=F("hit_count") + 1)
+        row = await qs.first().values("hit_count")
+        return row["hit_count"] if row else 1
+
+    async def load_map(self) -> dict[str, tuple[int, int]]:
+        """
+        별칭별로 hit_count가 가장 큰 약품을 고른 맵을 만든다 (DRUG_ALIAS_MIN_HITS 미만은 제외).
+
+        Returns:
+            dict[str, tuple[int, int]]: 정규화 별칭 → (drug_id, hit_count)
+        """
+        rows = await DrugAlias.filter(hit_count__gte=config.DRUG_ALIAS_MIN_HITS).values_list(
+            "alias", "drug_id", "hit_count"
+        )
+        aliases: dict[str, tuple[int, int]] = {}
+        for alias, drug_id, hit_count in rows:
+            best = aliases.get(alias)
+            if best is None or (hit_count, -drug_id) > (best[1], -best[0]):
+                aliases[alias] = (drug_id, hit_count)
+        return aliases
+
+
+async def load_drug_aliases() -> None:
+    """drug_aliases로 인메모리 별칭 맵을 만든다. 실패하면 기존 맵을 유지한다."""
+    global _aliases
+    try:
+        _aliases = await DrugAliasRepository().load_map()
+        logger.info("drug alias map loaded: %d aliases", len(_aliases))
+    except Exception:
+        logger.warning("drug alias map load failed, keeping previous map", exc_info=True)
+
+
+# 변경 알림 핸들러 (로드 중 추가 알림은 한 번으로 병합)
+refresh_drug_aliases = coalesced(load_drug_aliases)
+
+
+async def apply_drug_alias_changes(payload: Any) -> None:
+    """
+    다른 워커가 보낸 별칭 변경분을 인메모리 맵에 반영한다 (변경분 알림 핸들러).
+
+    Args:
+        payload (Any): record()가 반환한 [정규화 별칭, drug_id, hit_count] 목록 (JSON 역직렬화 결과)
+    """
+    for alias, drug_id, hit_count in payload:
+        _remember(str(alias), int(drug_id), int(hit_count))
+
+
+def lookup_drug_alias(raw_name: str) -> int | None:
+    """
+    OCR 원문 약품명의 확정 별칭 drug_id를 반환한다 (맵 미로드 또는 미등록이면 None).
+
+    Args:
+        raw_name (str): OCR 원문 약품명
+
+    Returns:
+        int | None: drug_id
+    """
+    if not _aliases:
+        return None
+    best = _aliases.get(normalize_drug_name(raw_name))
+    if best is None or best[1] < config.DRUG_ALIAS_MIN_HITS:
+        return None
+    return best[0]
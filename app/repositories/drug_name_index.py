@@ -0,0 +1,294 @@
+"""
+약품명 인메모리 인덱스
+
+- OCR 약품명 매칭은 이름 포함/접두 검색을 길이를 줄여 가며 반복하므로
+  DB로 처리하면 약품 하나에 LIKE 쿼리가 수십 번 나간다.
+- drugs(id, name)는 마스터 데이터라 앱 시작 시 한 번 읽어 다음 구조를 만든다.
+    1) 정규화 이름 정렬 배열: bisect로 접두 범위를 찾는다 (정렬 배열 = 압축 prefix trie)
+    2) 문자 bigram 역색인: 부분 문자열 후보를 posting 교집합으로 좁히고, 이름 유사도도 계산한다
+    3) 항목별 기본명/제형/함량 메타데이터: 후보 점수 계산 시 정규식을 다시 실행하지 않는다
+- 마스터 데이터 변경 알림(app.utils.master_data)을 받으면 워커 스레드에서 새로 빌드해 통째로 교체한다.
+  OCR 매칭 중 새로 생긴 약품은 add()로 정렬 배열/posting에 한 건씩 끼워 넣는다 (전체 재빌드 없음).
+- 정규화: 소문자 + 공백 제거. 결과는 DB 검색(order_by("name"))과 같이 원래 이름순으로 반환한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import logging
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from app.models.drugs import Drug
+from app.utils.master_data import coalesced
+
+logger = logging.getLogger(__name__)
+
+MAX_CANDIDATES = 20
+MIN_PREFIX_LENGTH = 3
+# pg_trgm 폴백(similarity > 0.35)과 같은 기준. 한국어 약품명은 bigram으로 계산한다
+MIN_NAME_SIMILARITY = 0.35
+# 유사도 정밀 계산 전에 공유 bigram 수로 추리는 후보 수
+_SIMILARITY_SHORTLIST = 200
+
+_FORM_WORDS = "점안액|점안|정|캡슐|시럽|액|주사|산|현탁액|크림|겔|패취|연질캡슐"
+_FORM_STRIP_RE = re.compile(rf"[\d.]+\s*(%|mg|ml|g|mcg|밀리그램|그램)?|\(.*?\)|({_FORM_WORDS})")
+_FORM_RE = re.compile(r"(점안액|점안|캡슐|시럽|현탁액|크림|겔|패취|연질캡슐|정|액|주사|산)")
+_DOSAGE_RE = re.compile(r"([\d.]+(?:/[\d.]+)?)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_drug_name(name: str) -> str:
+    """검색 키로 쓰는 정규화 이름 (소문자, 공백 제거)."""
+    return _WHITESPACE_RE.sub("", name).lower()
+
+
+def extract_dosage_number(name: str) -> str | None:
+    """약품명에서 함량 숫자를 추출한다. 예: '노바스크정5mg' → '5', '2.5/1000' → '2.5/1000'"""
+    m = _DOSAGE_RE.search(name)
+    return m.group(1) if m else None
+
+
+def parse_drug_base_and_form(drug_name: str) -> tuple[str, str | None]:
+    """약품명에서 함량/괄호/제형을 제거한 기본명과 제형 키워드를 분리한다."""
+    base = _FORM_STRIP_RE.sub("", drug_name).strip()
+    form_match = _FORM_RE.search(drug_name)
+    return base, form_match.group(1) if form_match else None
+
+
+def _bigrams(text: str) -> set[str]:
+    return {text[i : i + 2] for i in range(len(text) - 1)}
+
+
+@dataclass(frozen=True, slots=True)
+class DrugNameEntry:
+    """인덱스 항목 1건 (Drug 대신 후보 비교에 쓰는 경량 레코드)."""
+
+    id: int
+    name: str
+    key: str  # normalize_drug_name(name)
+    similarity_key: str  # 괄호 앞 부분의 정규화 이름 (split_part(name, '(', 1))
+    form: str | None
+    dosage: str | None
+
+
+class DrugNameIndex:
+    """약품명 접두/부분 문자열/유사도 검색 인덱스."""
+
+    def __init__(self, entries: list[DrugNameEntry]) -> None:
+        # 항목 위치(int)는 추가 순서로 고정한다. posting과 후보 목록은 이 위치로 다루고, 결과는 이름순으로 정렬한다
+        self._entries = sorted(entries, key=lambda e: (e.name, e.id))
+        order = sorted(range(len(self._entries)), key=lambda i: self._entries[i].key)
+        self._sorted_keys = [self._entries[i].key for i in order]
+        self._sorted_positions = order
+        self._postings: dict[str, list[int]] = {}
+        for pos, entry in enumerate(self._entries):
+            for gram in _bigrams(entry.key):
+                self._postings.setdefault(gram, []).append(pos)
+
+    def _name_order(self, pos: int) -> tuple[str, int]:
+        entry = self._entries[pos]
+        return entry.name, entry.id
+
+    @classmethod
+    def build(cls, rows: Iterable[tuple[int, str]]) -> DrugNameIndex:
+        """
+        (drug id, 이름) 목록으로 인덱스를 만든다.
+
+        Args:
+            rows (Iterable[tuple[int, str]]): drugs의 (id, name)
+
+        Returns:
+            DrugNameIndex: 빌드된 인덱스
+        """
+        entries = []
+        for drug_id, name in rows:
+            entry = _make_entry(drug_id, name)
+            if entry is not None:
+                entries.append(entry)
+        return cls(entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, drug_id: int, name: str) -> None:
+        """
+        약품 1건을 추가한다 (OCR 매칭 중 새로 생성된 약품 등).
+
+        항목은 끝에 붙이고, 정렬 키 배열에는 bisect로 끼워 넣고, posting에는 위치를 덧붙인다.
+        """
+        entry = _make_entry(drug_id, name)
+        if entry is None:
+            return
+        pos = len(self._entries)
+        self._entries.append(entry)
+        at = bisect.bisect_right(self._sorted_keys, entry.key)
+        self._sorted_keys.insert(at, entry.key)
+        self._sorted_positions.insert(at, pos)
+        for gram in _bigrams(entry.key):
+            self._postings.setdefault(gram, []).append(pos)
+
+    def startswith(self, prefix: str, *, limit: int = MAX_CANDIDATES) -> list[DrugNameEntry]:
+        """정규화 이름이 prefix로 시작하는 항목을 이름순으로 최대 limit개 반환한다."""
+        key = normalize_drug_name(prefix)
+        if not key:
+            return []
+        lo = bisect.bisect_left(self._sorted_keys, key)
+        hi = bisect.bisect_left(self._sorted_keys, key + "\U0010ffff", lo)
+        positions = sorted(self._sorted_positions[lo:hi], key=self._name_order)[:limit]
+        return [self._entries[pos] for pos in positions]
+
+    def contains(self, text: str, *, limit: int = MAX_CANDIDATES) -> list[DrugNameEntry]:
+        """정규화 이름에 text가 포함된 항목을 이름순으로 최대 limit개 반환한다."""
+        key = normalize_drug_name(text)
+        if not key:
+            return []
+        if len(key) < 2:
+            return sorted((e for e in self._entries if key in e.key), key=lambda e: (e.name, e.id))[:limit]
+
+        postings: list[list[int]] = []
+        for gram in _bigrams(key):
+            posting = self._postings.get(gram)
+            if posting is None:
+                return []
+            postings.append(posting)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return []
+        results: list[DrugNameEntry] = []
+        for pos in sorted(candidates, key=self._name_order):
+            entry = self._entries[pos]
+            if key in entry.key:
+                results.append(entry)
+                if len(results) >= limit:
+                    break
+        return results
+
+    def similar(self, text: str, *, min_similarity: float = MIN_NAME_SIMILARITY) -> DrugNameEntry | None:
+        """
+        괄호 앞 이름 기준 bigram 유사도(공유 / 합집합)가 가장 높은 항목을 반환한다.
+
+        Args:
+            text (str): 약품명
+            min_similarity (float): 이 값을 넘는 항목만 반환한다.
+
+        Returns:
+            DrugNameEntry | None: 가장 유사한 항목 (없으면 None)
+        """
+        query = _bigrams(normalize_drug_name(text).split("(", 1)[0])
+        if not query:
+            return None
+        shared: dict[int, int] = {}
+        for gram in query:
+            for pos in self._postings.get(gram, ()):
+                shared[pos] = shared.get(pos, 0) + 1
+        shortlist = sorted(shared, key=lambda pos: (-shared[pos], self._name_order(pos)))[:_SIMILARITY_SHORTLIST]
+
+        best: tuple[float, int] | None = None
+        for pos in shortlist:
+            grams = _bigrams(self._entries[pos].similarity_key)
+            if not grams:
+                continue
+            overlap = len(query & grams)
+            score = overlap / (len(query) + len(grams) - overlap)
+            if score > min_similarity and (best is None or score > best[0]):
+                best = (score, pos)
+        return self._entries[best[1]] if best else None
+
+    def prefix_search(self, base: str, form_kw: str | None, original_name: str = "") -> DrugNameEntry | None:
+        """
+        기본명 접두를 한 글자씩 줄여 가며 후보를 찾고, 제형/나머지 이름/함량 일치로 점수를 매긴다.
+
+        각 길이에서 접두 검색 → (없으면) 부분 문자열 검색 순으로 후보를 찾는다.
+        점수가 있는 후보가 나오거나 전체 기본명에서 후보가 있으면 그 최고점 후보를 반환한다.
+
+        Args:
+            base (str): 제형/함량을 제거한 기본명
+            form_kw (str | None): 질의 약품명의 제형 키워드
+            original_name (str): 질의 원본 약품명 (함량 비교용)
+
+        Returns:
+            DrugNameEntry | None: 선택된 항목 (없으면 None)
+        """
+        query_dosage = extract_dosage_number(original_name) if original_name else None
+        for length in range(len(base), MIN_PREFIX_LENGTH - 1, -1):
+            prefix = base[:length]
+            rest = normalize_drug_name(base[length:])
+            candidates = self.startswith(prefix) or self.contains(prefix)
+            if not candidates:
+                continue
+            best_score, best = -1, candidates[0]
+            for c in candidates:
+                score = (2 if form_kw and c.form == form_kw else 0) + (3 if rest and rest in c.key else 0)
+                if query_dosage and c.dosage == query_dosage:
+                    score += 10
+                if score > best_score:
+                    best_score, best = score, c
+            if best_score > 0 or length == len(base):
+                return best
+        return None
+
+    def prefix_match(self, drug_name: str) -> DrugNameEntry | None:
+        """제형 접미사를 제거한 기본명으로 점진적 접두 검색만 한다 (기본명이 2자 미만이면 None)."""
+        base, form_kw = parse_drug_base_and_form(drug_name)
+        if len(base) < 2:
+            return None
+        return self.prefix_search(base, form_kw, drug_name)
+
+    def fuzzy_match(self, drug_name: str) -> DrugNameEntry | None:
+        """제형 접미사를 제거한 점진적 접두 검색 → bigram 유사도 순으로 매칭한다."""
+        if len(parse_drug_base_and_form(drug_name)[0]) < 2:
+            return None
+        return self.prefix_match(drug_name) or self.similar(drug_name)
+
+
+def _make_entry(drug_id: int, name: str | None) -> DrugNameEntry | None:
+    name = (name or "").strip()
+    if not name:
+        return None
+    _, form = parse_drug_base_and_form(name)
+    return DrugNameEntry(
+        id=drug_id,
+        name=name,
+        key=normalize_drug_name(name),
+        similarity_key=normalize_drug_name(name.split("(", 1)[0]),
+        form=form,
+        dosage=extract_dosage_number(name),
+    )
+
+
+_index: DrugNameIndex | None = None
+
+
+async def load_drug_name_index() -> DrugNameIndex | None:
+    """
+    drugs 테이블로 인덱스를 빌드해 모듈 전역에 등록한다.
+
+    정렬/posting 빌드는 CPU 작업이라 이벤트 루프를 막지 않도록 워커 스레드에서 실행한다.
+    빌드에 실패하면 기존 인덱스를 유지한다 (처음이면 None → DB 검색 사용).
+
+    Returns:
+        DrugNameIndex | None: 현재 등록된 인덱스
+    """
+    global _index
+    try:
+        rows = await Drug.all().values_list("id", "name")
+        _index = await asyncio.to_thread(DrugNameIndex.build, rows)  # type: ignore[arg-type]
+        logger.info("drug name index built: %d drugs", len(_index))
+    except Exception:
+        logger.warning("drug name index build failed, keeping previous index", exc_info=True)
+    return _index
+
+
+# 변경 알림 핸들러 (빌드 중 추가 알림은 한 번으로 병합)
+refresh_drug_name_index = coalesced(load_drug_name_index)
+
+
+def get_drug_name_index() -> DrugNameIndex | None:
+    """로드된 약품명 인덱스를 반환한다 (미로드/빌드 실패 시 None)."""
+    return _index
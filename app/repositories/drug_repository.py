@@ -6,14 +6,230 @@ Drug 마스터 데이터 검색을 담당한다.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, cast
+
 from tortoise import connections
+from tortoise.filters import escape_like
+from tortoise.transactions import in_transaction
+
+from app.models.drugs import Drug, DrugEdiCode
+from app.repositories.vector_document_repository import VectorSearchHit, knn_sql
+from app.utils.ranking import RRF_K, reciprocal_rank_fusion
+
+HYBRID_CANDIDATES = 30  # 신호별 후보 수
+HYBRID_TRGM_THRESHOLD = 0.2  # 후보 수집용 trigram 하한 (채택 여부는 호출 측 임계값으로 판단)
+
+EDI_CODE_MAX_LENGTH = 32
+
+
+def split_edi_codes(value: str | None) -> list[str]:
+    """
+    drugs.edi_code의 쉼표 구분 문자열을 코드 목록으로 나눈다 (공백 제거, 빈 값/중복 제외, 순서 유지).
+
+    Args:
+        value (str | None): 예: "648900030,648900031"
+
+    Returns:
+        list[str]: 코드 목록
+    """
+    codes = (code.strip() for code in (value or "").split(","))
+    return list(dict.fromkeys(code for code in codes if code and len(code) <= EDI_CODE_MAX_LENGTH))
+
 
-from app.models.drugs import Drug
+def _lexical_sql(keyword: str = "$1", threshold: str = "$2", limit: str = "$3") -> str:
+    """괄호 앞 약품명 기준 pg_trgm 후보 SQL을 만든다 (keyword/threshold/limit은 파라미터 또는 컬럼 참조).
+
+    `%`는 idx_drugs_name_base_trgm(GIN) 인덱스로 pg_trgm.similarity_threshold 이상 후보를 찾고,
+    similarity() > threshold로 호출 측 임계값을 다시 적용한다 (similarity_threshold보다 낮으면 그 값이 하한이 된다).
+    """
+    return f"""
+        SELECT id, similarity(split_part(name, '(', 1), {keyword}) AS lexical_score
+        FROM drugs
+        WHERE split_part(name, '(', 1) % {keyword} AND similarity(split_part(name, '(', 1), {keyword}) > {threshold}
+        ORDER BY lexical_score DESC, id
+        LIMIT {limit}
+    """  # noqa: S608
+
+
+_LEXICAL_SQL = _lexical_sql()
+
+
+def _hybrid_sql(keyword: str, query: str, threshold: str, candidates: str, rrf_k: str, limit: str) -> str:
+    """검색어 1개의 trigram 후보와 벡터 후보를 RRF로 결합하는 SQL을 만든다 (LATERAL 서브쿼리로도 쓴다)."""
+    return f"""
+        SELECT
+            drug_id, lexical_score, lexical_rank, vector_distance, vector_rank,
+            COALESCE(1.0 / ({rrf_k}::int + lexical_rank), 0) + COALESCE(1.0 / ({rrf_k}::int + vector_rank), 0) AS score
+        FROM (
+            SELECT id AS drug_id, lexical_score, ROW_NUMBER() OVER (ORDER BY lexical_score DESC, id) AS lexical_rank
+            FROM ({_lexical_sql(keyword, threshold, candidates)}) AS l
+        ) AS lexical
+        FULL OUTER JOIN (
+            SELECT drug_id, vector_distance, ROW_NUMBER() OVER (ORDER BY vector_distance, drug_id) AS vector_rank
+            FROM (
+                SELECT reference_id AS drug_id, MIN(distance) AS vector_distance
+                FROM ({knn_sql("drug", query=query, limit=candidates)}) AS v
+                GROUP BY reference_id
+            ) AS s
+        ) AS semantic USING (drug_id)
+        ORDER BY score DESC, drug_id
+        LIMIT {limit}
+    """  # noqa: S608
+
+
+# 검색어 변형 목록을 한 번에 평가하는 순위 검색 ($1 LIKE 이스케이프된 변형 배열, $2 limit, $3 유사도 검색어, $4 threshold)
+# 변형 k(1부터)의 접두 일치는 순위 2k, 부분 일치는 2k+1이며 가장 낮은 순위의 결과만 이름순으로 반환한다
+# (변형을 앞에서부터 istartswith → icontains로 차례로 조회해 처음 결과가 나온 단계와 같다).
+# 어느 변형도 일치하지 않을 때만 괄호 앞 약품명 trigram 유사도 결과를 반환한다.
+_RANKED_SEARCH_SQL = """
+    WITH ranked AS (
+        SELECT m.id, m.name, v.ord * 2 + m.tier AS search_rank
+        FROM unnest($1::text[]) WITH ORDINALITY AS v(pattern, ord)
+        CROSS JOIN LATERAL (
+            (
+                SELECT id, name, 0 AS tier
+                FROM drugs
+                WHERE UPPER(CAST(name AS VARCHAR)) LIKE UPPER(v.pattern || '%')
+                ORDER BY name, id
+                LIMIT $2
+            )
+            UNION ALL
+            (
+                SELECT id, name, 1 AS tier
+                FROM drugs
+                WHERE UPPER(CAST(name AS VARCHAR)) LIKE UPPER('%' || v.pattern || '%')
+                ORDER BY name, id
+                LIMIT $2
+            )
+        ) AS m
+    ),
+    best AS (
+        SELECT id, ROW_NUMBER() OVER (ORDER BY name, id) AS pos
+        FROM ranked
+        WHERE search_rank = (SELECT MIN(search_rank) FROM ranked)
+    ),
+    fuzzy AS (
+        SELECT id, ROW_NUMBER() OVER (ORDER BY similarity(split_part(name, '(', 1), $3) DESC, id) AS pos
+        FROM drugs
+        WHERE NOT EXISTS (SELECT 1 FROM ranked)
+            AND split_part(name, '(', 1) % $3
+            AND similarity(split_part(name, '(', 1), $3) > $4
+    )
+    SELECT id, pos FROM best
+    UNION ALL
+    SELECT id, pos FROM fuzzy
+    ORDER BY pos
+    LIMIT $2
+"""
+
+
+# 검색어마다 search_by_name(limit=1)과 같은 첫 결과를 한 번에 찾는다 ($1 LIKE 이스케이프된 검색어 배열)
+# 접두 일치(tier 0)가 있으면 그중 이름순 첫 약품, 없으면 부분 일치(tier 1) 중 이름순 첫 약품
+_FIRST_BY_NAMES_SQL = """
+    SELECT k.ord, m.id
+    FROM unnest($1::text[]) WITH ORDINALITY AS k(pattern, ord)
+    CROSS JOIN LATERAL (
+        (
+            SELECT id, 0 AS tier
+            FROM drugs
+            WHERE UPPER(CAST(name AS VARCHAR)) LIKE UPPER(k.pattern || '%')
+            ORDER BY name, id
+            LIMIT 1
+        )
+        UNION ALL
+        (
+            SELECT id, 1 AS tier
+            FROM drugs
+            WHERE UPPER(CAST(name AS VARCHAR)) LIKE UPPER('%' || k.pattern || '%')
+            ORDER BY name, id
+            LIMIT 1
+        )
+        ORDER BY tier
+        LIMIT 1
+    ) AS m
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class DrugSearchCandidate:
+    """
+    하이브리드 약품 검색 후보 1건.
+
+    score는 RRF 점수이며, 신호별 점수/순위는 해당 후보 목록에 없으면 None이다.
+    """
+
+    drug_id: int
+    score: float
+    lexical_score: float | None = None
+    lexical_rank: int | None = None
+    vector_distance: float | None = None
+    vector_rank: int | None = None
+
+
+def _row_to_candidate(row: dict[str, Any]) -> DrugSearchCandidate:
+    return DrugSearchCandidate(
+        drug_id=row["drug_id"],
+        score=float(row["score"]),
+        lexical_score=float(row["lexical_score"]) if row["lexical_score"] is not None else None,
+        lexical_rank=row["lexical_rank"],
+        vector_distance=float(row["vector_distance"]) if row["vector_distance"] is not None else None,
+        vector_rank=row["vector_rank"],
+    )
+
+
+def fuse_drug_candidates(
+    lexical_rows: Sequence[dict[str, Any]],
+    vector_hits: Sequence[VectorSearchHit],
+    *,
+    limit: int,
+    rrf_k: int = RRF_K,
+) -> list[DrugSearchCandidate]:
+    """
+    trigram 후보와 벡터 후보를 RRF로 결합한다 (search_hybrid SQL과 같은 점수 계산과 동점 처리).
+
+    Args:
+        lexical_rows (Sequence[dict[str, Any]]): lexical_score 내림차순 {id, lexical_score} 목록
+        vector_hits (Sequence[VectorSearchHit]): 거리 오름차순 drug 벡터 검색 결과
+        limit (int): 반환할 최대 후보 수
+        rrf_k (int): RRF 평활 상수
+
+    Returns:
+        list[DrugSearchCandidate]: RRF 점수 내림차순 후보 목록
+    """
+    lexical = {row["id"]: (rank, float(row["lexical_score"])) for rank, row in enumerate(lexical_rows, start=1)}
+    # SQL과 같이 약품별 최소 거리 → (거리, drug_id) 순으로 순위를 매긴다
+    distances: dict[int, float] = {}
+    for hit in vector_hits:
+        distances[hit.reference_id] = min(hit.distance, distances.get(hit.reference_id, hit.distance))
+    ordered = sorted(distances.items(), key=lambda pair: (pair[1], pair[0]))
+    vector = {drug_id: (rank, distance) for rank, (drug_id, distance) in enumerate(ordered, start=1)}
+
+    fused = reciprocal_rank_fusion(list(lexical), list(vector), k=rrf_k)
+    candidates: list[DrugSearchCandidate] = []
+    for drug_id, score in fused[:limit]:
+        lexical_rank, lexical_score = lexical.get(drug_id, (None, None))
+        vector_rank, vector_distance = vector.get(drug_id, (None, None))
+        candidates.append(
+            DrugSearchCandidate(
+                drug_id=drug_id,
+                score=score,
+                lexical_score=lexical_score,
+                lexical_rank=lexical_rank,
+                vector_distance=vector_distance,
+                vector_rank=vector_rank,
+            )
+        )
+    return candidates
 
 
 class DrugRepository:
     async def search_by_name(self, keyword: str, *, limit: int = 20) -> list[Drug]:
-        """약품명 키워드로 검색한다. istartswith 우선, icontains 폴백."""
+        """약품명 키워드로 검색한다. istartswith 우선, icontains 폴백.
+
+        두 조건 모두 UPPER(name) LIKE로 실행되어 idx_drugs_name_upper_trgm(GIN trigram) 인덱스를 사용한다.
+        """
         q = keyword.strip()
         if not q:
             return []
@@ -23,23 +239,258 @@ class DrugRepository:
             return results
         return await Drug.filter(name__icontains=q).order_by("name").limit(limit)
 
+    async def first_by_names(self, keywords: Sequence[str]) -> dict[str, Drug]:
+        """
+        검색어마다 search_by_name(keyword, limit=1)의 결과를 한 번에 조회한다.
+
+        PostgreSQL에서는 SQL 1회로 실행하고, 그 외 DB(테스트용 SQLite)에서는 검색어별로 조회한다.
+
+        Args:
+            keywords (Sequence[str]): 검색어 목록
+
+        Returns:
+            dict[str, Drug]: 앞뒤 공백을 제거한 검색어 → 첫 번째 약품 (결과 없는 검색어는 제외)
+        """
+        terms = list(dict.fromkeys(q for q in (k.strip() for k in keywords) if q))
+        if not terms:
+            return {}
+        conn = connections.get(Drug._meta.default_connection or "default")
+        if conn.capabilities.dialect != "postgres":
+            found: dict[str, Drug] = {}
+            for term in terms:
+                rows = await self.search_by_name(term, limit=1)
+                if rows:
+                    found[term] = rows[0]
+            return found
+
+        hits = await conn.execute_query_dict(_FIRST_BY_NAMES_SQL, [[escape_like(t) for t in terms]])
+        by_id = cast(dict[int, Drug], await Drug.in_bulk({h["id"] for h in hits}, "id"))
+        return {terms[h["ord"] - 1]: by_id[h["id"]] for h in hits if h["id"] in by_id}
+
+    async def search_ranked(
+        self,
+        variants: Sequence[str],
+        *,
+        similarity_keyword: str,
+        limit: int = 20,
+        threshold: float = 0.35,
+    ) -> list[Drug]:
+        """
+        검색어 변형 목록을 우선순위대로 평가해 처음 일치한 변형의 결과를 반환한다.
+
+        변형마다 istartswith → icontains 순으로 보고, 모두 없으면 similarity_keyword로 trigram 유사도 검색을 한다.
+        PostgreSQL에서는 이 과정을 SQL 1회로 실행하고, 그 외 DB(테스트용 SQLite)에서는 같은 순서로 차례로 조회한다.
+
+        Args:
+            variants (Sequence[str]): 우선순위 순 검색어 변형 (원문, 오인식 보정, 단위 정규화, 핵심명 접두 등)
+            similarity_keyword (str): 마지막 trigram 유사도 검색어
+            limit (int): 최대 결과 수
+            threshold (float): trigram 유사도 하한
+
+        Returns:
+            list[Drug]: 이름순(유사도 검색이면 유사도 내림차순) 약품 목록
+        """
+        patterns = list(dict.fromkeys(q for q in (v.strip() for v in variants) if q))
+        conn = connections.get(Drug._meta.default_connection or "default")
+        if conn.capabilities.dialect != "postgres":
+            for pattern in patterns:
+                rows = await self.search_by_name(pattern, limit=limit)
+                if rows:
+                    return rows
+            return await self.search_by_similarity(similarity_keyword, limit=limit, threshold=threshold)
+
+        hits = await conn.execute_query_dict(
+            _RANKED_SEARCH_SQL,
+            [[escape_like(p) for p in patterns], limit, similarity_keyword.strip(), threshold],
+        )
+        if not hits:
+            return []
+        by_id = cast(dict[int, Drug], await Drug.in_bulk([h["id"] for h in hits], "id"))
+        return [by_id[h["id"]] for h in hits if h["id"] in by_id]
+
     async def search_by_similarity(self, keyword: str, *, limit: int = 5, threshold: float = 0.35) -> list[Drug]:
-        """괄호 앞 약품명 기준 pg_trgm similarity 검색."""
+        """괄호 앞 약품명 기준 pg_trgm similarity 검색 (GIN trigram 인덱스 사용, 유사도 내림차순)."""
         q = keyword.strip()
         if not q:
             return []
         try:
             conn = connections.get("default")
-            rows = await conn.execute_query_dict(
-                "SELECT id FROM drugs "
-                "WHERE similarity(split_part(name, '(', 1), $1) > $2 "
-                "ORDER BY similarity(split_part(name, '(', 1), $1) DESC "
-                "LIMIT $3",
-                [q, threshold, limit],
-            )
+            rows = await conn.execute_query_dict(_LEXICAL_SQL, [q, threshold, limit])
             if not rows:
                 return []
-            ids = [r["id"] for r in rows]
-            return await Drug.filter(id__in=ids).all()
+            by_id = await Drug.in_bulk([r["id"] for r in rows], "id")
+            return [by_id[r["id"]] for r in rows if r["id"] in by_id]
         except Exception:
             return []
+
+    async def search_hybrid(
+        self,
+        keyword: str,
+        embedding: Sequence[float],
+        *,
+        limit: int = 10,
+        candidates: int = HYBRID_CANDIDATES,
+        trgm_threshold: float = HYBRID_TRGM_THRESHOLD,
+        rrf_k: int = RRF_K,
+        vector_hits: Sequence[VectorSearchHit] | None = None,
+    ) -> list[DrugSearchCandidate]:
+        """
+        trigram 유사도와 벡터 거리 후보를 한 SQL에서 구해 RRF로 결합한다 (search_hybrid_many의 검색어 1개 버전).
+
+        LIKE → prefix 반복 → pg_trgm → 벡터 검색으로 이어지던 순차 조회를 1회 왕복으로 대체한다.
+        OCR 오탈자는 trigram이, 표기가 다른 동일 약품은 벡터 신호가 보완한다.
+
+        Args:
+            keyword (str): 검색할 약품명
+            embedding (Sequence[float]): keyword의 임베딩 벡터
+            limit (int): 반환할 최대 후보 수
+            candidates (int): 신호별로 수집할 후보 수
+            trgm_threshold (float): trigram 후보 수집 하한
+            rrf_k (int): RRF 평활 상수
+            vector_hits (Sequence[VectorSearchHit] | None): 메모리 인덱스 등에서 이미 구한 벡터 후보.
+                주어지면 SQL은 trigram 후보만 조회하고 결합은 fuse_drug_candidates로 한다.
+
+        Returns:
+            list[DrugSearchCandidate]: RRF 점수 내림차순 후보 목록
+        """
+        results = await self.search_hybrid_many(
+            [keyword],
+            [embedding],
+            limit=limit,
+            candidates=candidates,
+            trgm_threshold=trgm_threshold,
+            rrf_k=rrf_k,
+            vector_hits=[vector_hits] if vector_hits is not None else None,
+        )
+        return results[0]
+
+    async def search_hybrid_many(
+        self,
+        keywords: Sequence[str],
+        embeddings: Sequence[Sequence[float]],
+        *,
+        limit: int = 10,
+        candidates: int = HYBRID_CANDIDATES,
+        trgm_threshold: float = HYBRID_TRGM_THRESHOLD,
+        rrf_k: int = RRF_K,
+        vector_hits: Sequence[Sequence[VectorSearchHit]] | None = None,
+    ) -> list[list[DrugSearchCandidate]]:
+        """
+        여러 약품명의 하이브리드 후보를 한 번의 쿼리로 구한다.
+
+        검색어와 질의 벡터를 VALUES 목록으로 넘기고 CROSS JOIN LATERAL로 검색어별 후보를 구하므로
+        (search_similar_many와 같은 방식), 각 LATERAL 서브쿼리는 trigram GIN 인덱스와 HNSW 인덱스를 그대로 쓴다.
+
+        Args:
+            keywords (Sequence[str]): 검색할 약품명 목록
+            embeddings (Sequence[Sequence[float]]): keywords와 같은 순서의 임베딩 벡터
+            limit (int): 검색어별 반환할 최대 후보 수
+            candidates (int): 신호별로 수집할 후보 수
+            trgm_threshold (float): trigram 후보 수집 하한
+            rrf_k (int): RRF 평활 상수
+            vector_hits (Sequence[Sequence[VectorSearchHit]] | None): 검색어별로 이미 구한 벡터 후보.
+                주어지면 SQL은 trigram 후보만 조회하고 결합은 fuse_drug_candidates로 한다.
+
+        Returns:
+            list[list[DrugSearchCandidate]]: keywords와 같은 순서의 후보 목록 (빈 검색어는 빈 목록)
+        """
+        terms = [k.strip() for k in keywords]
+        queried = [i for i, term in enumerate(terms) if term]
+        results: list[list[DrugSearchCandidate]] = [[] for _ in terms]
+        if not queried:
+            return results
+
+        conn = connections.get("default")
+        n = len(queried)
+        if vector_hits is not None:
+            values_sql = ", ".join(f"({i}, ${i + 1}::text)" for i in range(n))
+            sql = f"""
+            SELECT q.ord, l.*
+            FROM (VALUES {values_sql}) AS q(ord, keyword)
+            CROSS JOIN LATERAL ({_lexical_sql("q.keyword", f"${n + 1}", f"${n + 2}")}) AS l
+            ORDER BY q.ord, l.lexical_score DESC, l.id
+            """  # noqa: S608
+            params: list[Any] = [terms[i] for i in queried]
+            rows = await conn.execute_query_dict(sql, [*params, trgm_threshold, candidates])
+            lexical_rows: list[list[dict[str, Any]]] = [[] for _ in queried]
+            for row in rows:
+                lexical_rows[row["ord"]].append(row)
+            for ord_, i in enumerate(queried):
+                results[i] = fuse_drug_candidates(lexical_rows[ord_], vector_hits[i], limit=limit, rrf_k=rrf_k)
+            return results
+
+        values_sql = ", ".join(f"({i}, ${2 * i + 1}::text, ${2 * i + 2}::vector)" for i in range(n))
+        lateral_sql = _hybrid_sql(
+            "q.keyword",
+            "q.query",
+            threshold=f"${2 * n + 1}",
+            candidates=f"${2 * n + 2}",
+            rrf_k=f"${2 * n + 3}",
+            limit=f"${2 * n + 4}",
+        )
+        sql = f"""
+        SELECT q.ord, h.*
+        FROM (VALUES {values_sql}) AS q(ord, keyword, query)
+        CROSS JOIN LATERAL ({lateral_sql}) AS h
+        ORDER BY q.ord, h.score DESC, h.drug_id
+        """  # noqa: S608
+        params = [value for i in queried for value in (terms[i], list(embeddings[i]))]
+        rows = await conn.execute_query_dict(sql, [*params, trgm_threshold, candidates, rrf_k, limit])
+        for row in rows:
+            results[queried[row["ord"]]].append(_row_to_candidate(row))
+        return results
+
+    @staticmethod
+    def supports_hybrid_search() -> bool:
+        """하이브리드 검색(pg_trgm + pgvector)을 쓸 수 있는 DB인지 반환한다 (테스트용 SQLite는 False)."""
+        return connections.get(Drug._meta.default_connection or "default").capabilities.dialect == "postgres"
+
+    async def get_by_edi_code(self, edi_code: str) -> Drug | None:
+        """보험코드(EDI) 1개로 약품을 조회한다 (drug_edi_codes PK 조회)."""
+        return (await self.get_by_edi_codes([edi_code])).get(edi_code.strip())
+
+    async def get_by_edi_codes(self, edi_codes: Sequence[str]) -> dict[str, Drug]:
+        """
+        처방전의 보험코드(EDI)들을 쿼리 1번으로 약품에 대응시킨다.
+
+        Args:
+            edi_codes (Sequence[str]): 보험코드 목록 (앞뒤 공백 허용, 중복 허용)
+
+        Returns:
+            dict[str, Drug]: 코드 → 약품 (등록되지 않은 코드는 포함하지 않음)
+        """
+        codes = list(dict.fromkeys(code.strip() for code in edi_codes if code and code.strip()))
+        if not codes:
+            return {}
+        rows = await DrugEdiCode.filter(edi_code__in=codes).select_related("drug")
+        return {row.edi_code: row.drug for row in rows}
+
+    async def sync_edi_codes(self) -> tuple[int, int]:
+        """
+        drug_edi_codes를 drugs.edi_code와 일치시킨다 (추가/변경/삭제만 반영).
+
+        같은 코드가 여러 약품에 있으면 id가 가장 작은 약품에 대응시킨다.
+
+        Returns:
+            tuple[int, int]: (추가·변경 수, 삭제 수)
+        """
+        expected: dict[str, int] = {}
+        rows = await Drug.filter(edi_code__isnull=False).order_by("id").values_list("id", "edi_code")
+        for drug_id, value in rows:
+            for code in split_edi_codes(value):
+                expected.setdefault(code, drug_id)
+
+        current: dict[str, int] = dict(await DrugEdiCode.all().values_list("edi_code", "drug_id"))  # type: ignore[arg-type]
+        upserts = [code for code, drug_id in expected.items() if current.get(code) != drug_id]
+        removed = [code for code in current if code not in expected]
+
+        async with in_transaction():
+            stale = removed + [code for code in upserts if code in current]
+            if stale:
+                await DrugEdiCode.filter(edi_code__in=stale).delete()
+            if upserts:
+                await DrugEdiCode.bulk_create(
+                    [DrugEdiCode(edi_code=code, drug_id=expected[code]) for code in upserts],
+                    batch_size=1000,
+                )
+        return len(upserts), len(removed)
@@ -0,0 +1,263 @@
+"""
+약물 벡터 인메모리 인덱스
+
+- vector_documents(reference_type="drug")는 마스터 데이터라 거의 바뀌지 않으므로
+  scripts/export_drug_vector_index.py로 파일에 내보낸 뒤 앱 시작 시 memory-map으로 로드한다.
+- 행렬은 L2 정규화된 float32(N x 1536)로 저장되며, np.load(mmap_mode="r")로 열어
+  uvicorn 워커끼리 OS 페이지 캐시를 공유한다 (워커 수만큼 메모리를 복사하지 않음).
+  질의마다 변환 없이 memory-map 행렬에 바로 BLAS 행렬 곱을 하는 브루트포스라 시간은 행 수에 비례한다
+  (실측: 전체 약품 50k x 1536 기준 질의당 약 28ms. 서브 밀리초가 아니며, 이득은 DB 왕복/HNSW 부하 제거다).
+  (이전 export의 float16 파일도 읽을 수 있으며, 이 경우 청크 단위로 float32 변환 후 계산한다.)
+- 코사인 top-k는 행렬 곱 + argpartition으로 계산한다 (DB 왕복 없음).
+  여러 질의는 한 번의 행렬 곱으로 함께 계산하고, 계산은 워커 스레드에서 실행해 이벤트 루프를 막지 않는다.
+- 인터페이스는 VectorDocumentRepository.search_drug_context와 동일하다.
+- 마스터 데이터 변경 알림(app.utils.master_data, kind="drug_vector")을 받으면 파일을 다시 읽어 교체한다.
+    - export 스크립트의 알림(payload 없음): 새 파일로 교체
+    - VectorSyncService의 알림(payload={"synced_at": ...}): 다시 읽은 파일이 동기화 이전 export면
+      오래된 벡터/약품 id를 내보내지 않도록 인덱스를 내리고 pgvector 검색을 쓴다 (재export 알림 시 다시 로드)
+
+인덱스 디렉터리 구성:
+    vectors.npy   float32 (N, D), 행별 L2 정규화
+    ids.npy       int64 (N, 2), [vector_documents.id, reference_id]
+    meta.json     {"model", "dimensions", "count", "contents": [...], "exported_at"}
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from app.repositories.vector_document_repository import VectorSearchHit
+from app.utils.master_data import coalesced
+
+logger = logging.getLogger(__name__)
+
+VECTORS_FILE = "vectors.npy"
+IDS_FILE = "ids.npy"
+META_FILE = "meta.json"
+
+# float16 행렬일 때 한 번에 float32로 변환해 계산할 행 수 (1536차원 기준 청크당 약 24MB)
+_CHUNK_ROWS = 4096
+
+
+class DrugVectorIndex:
+    """
+    memory-map된 정규화 행렬에 대한 브루트포스 코사인 top-k 인덱스.
+    """
+
+    def __init__(self, vectors: np.ndarray, ids: np.ndarray, contents: list[str], exported_at: str = "") -> None:
+        if vectors.ndim != 2 or len(vectors) != len(ids) or len(ids) != len(contents):
+            raise ValueError("drug vector index files are inconsistent")
+        self._vectors = vectors
+        self._ids = ids
+        self._contents = contents
+        self.exported_at = exported_at
+
+    @classmethod
+    def load(cls, directory: str | Path) -> DrugVectorIndex:
+        """
+        export 스크립트가 만든 디렉터리에서 인덱스를 로드한다.
+
+        Args:
+            directory (str | Path):
+                vectors.npy / ids.npy / meta.json이 있는 디렉터리
+
+        Returns:
+            DrugVectorIndex:
+                로드된 인덱스 (행렬은 읽기 전용 memory-map)
+        """
+        path = Path(directory)
+        meta = json.loads((path / META_FILE).read_text(encoding="utf-8"))
+        vectors = np.load(path / VECTORS_FILE, mmap_mode="r")
+        ids = np.load(path / IDS_FILE)
+        return cls(vectors, ids, meta["contents"], meta.get("exported_at") or "")
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def dimensions(self) -> int:
+        return int(self._vectors.shape[1])
+
+    def search(self, embedding: Sequence[float], *, top_k: int = 5) -> list[tuple[int, float]]:
+        """
+        코사인 거리가 가장 가까운 행을 찾는다.
+
+        Args:
+            embedding (Sequence[float]):
+                검색 기준 임베딩 벡터
+            top_k (int):
+                반환할 최대 행 수
+
+        Returns:
+            list[tuple[int, float]]:
+                (행 번호, 코사인 거리) 목록, 거리 오름차순
+        """
+        return self.search_many([embedding], top_k=top_k)[0]
+
+    def search_many(self, embeddings: Sequence[Sequence[float]], *, top_k: int = 5) -> list[list[tuple[int, float]]]:
+        """
+        여러 질의 벡터의 top-k를 행렬을 한 번만 순회해 찾는다 (CPU 작업이므로 async 경로에서는 스레드로 실행한다).
+
+        Args:
+            embeddings (Sequence[Sequence[float]]):
+                검색 기준 임베딩 벡터 목록
+            top_k (int):
+                질의별 반환할 최대 행 수
+
+        Returns:
+            list[list[tuple[int, float]]]:
+                embeddings와 같은 순서의 (행 번호, 코사인 거리) 목록, 거리 오름차순 (영벡터 질의는 빈 목록)
+        """
+        n = len(self._ids)
+        results: list[list[tuple[int, float]]] = [[] for _ in embeddings]
+        if n == 0 or top_k <= 0 or not embeddings:
+            return results
+
+        queries = np.asarray(embeddings, dtype=np.float32).reshape(len(embeddings), -1)
+        norms = np.linalg.norm(queries, axis=1)
+        valid = np.flatnonzero(norms > 0.0)
+        if len(valid) == 0:
+            return results
+        queries = queries[valid] / norms[valid, None]
+
+        if self._vectors.dtype == np.float32:
+            scores = queries @ self._vectors.T
+        else:
+            scores = np.empty((len(valid), n), dtype=np.float32)
+            for start in range(0, n, _CHUNK_ROWS):
+                chunk = np.asarray(self._vectors[start : start + _CHUNK_ROWS], dtype=np.float32)
+                scores[:, start : start + len(chunk)] = queries @ chunk.T
+
+        k = min(top_k, n)
+        for row_scores, i in zip(scores, valid, strict=True):
+            top = np.argpartition(-row_scores, k - 1)[:k] if k < n else np.arange(n)
+            top = top[np.argsort(-row_scores[top], kind="stable")]
+            results[i] = [(int(row), float(1.0 - row_scores[row])) for row in top]
+        return results
+
+    async def search_drug_context(
+        self,
+        embedding: list[float],
+        *,
+        top_k: int = 5,
+        include_embedding: bool = False,
+    ) -> list[VectorSearchHit]:
+        """drug 벡터 문서를 인메모리로 검색한다 (VectorDocumentRepository.search_drug_context와 동일 인터페이스).
+
+        include_embedding=True면 정규화된 벡터를 float로 돌려준다.
+        """
+        hits = await self.search_drug_context_many([embedding], top_k=top_k, include_embedding=include_embedding)
+        return hits[0]
+
+    async def search_drug_context_many(
+        self,
+        embeddings: Sequence[Sequence[float]],
+        *,
+        top_k: int = 5,
+        include_embedding: bool = False,
+    ) -> list[list[VectorSearchHit]]:
+        """여러 질의 벡터를 한 번에 검색한다 (워커 스레드에서 행렬 1회 순회).
+
+        Returns:
+            list[list[VectorSearchHit]]: embeddings와 같은 순서의 질의별 결과 (거리 오름차순)
+        """
+        if not embeddings:
+            return []
+        rows_per_query = await asyncio.to_thread(self.search_many, embeddings, top_k=top_k)
+        return [[self._to_hit(row, distance, include_embedding) for row, distance in rows] for rows in rows_per_query]
+
+    def _to_hit(self, row: int, distance: float, include_embedding: bool) -> VectorSearchHit:
+        doc_id, reference_id = self._ids[row]
+        return VectorSearchHit(
+            id=int(doc_id),
+            reference_type="drug",
+            reference_id=int(reference_id),
+            content=self._contents[row],
+            distance=distance,
+            embedding=self._vectors[row].astype(float).tolist() if include_embedding else None,
+        )
+
+
+_index: DrugVectorIndex | None = None
+_directory: str | Path | None = None
+
+
+def load_drug_vector_index(directory: str | Path) -> DrugVectorIndex | None:
+    """
+    인덱스를 로드해 모듈 전역에 등록한다. 실패하면 경고만 남기고 DB 검색을 그대로 사용한다.
+
+    Args:
+        directory (str | Path):
+            인덱스 디렉터리
+
+    Returns:
+        DrugVectorIndex | None:
+            로드된 인덱스 (실패 시 None)
+    """
+    global _index, _directory
+    _directory = directory
+    try:
+        _index = DrugVectorIndex.load(directory)
+        logger.info("drug vector index loaded: %s (%d vectors)", directory, len(_index))
+    except Exception:
+        logger.warning("drug vector index unavailable, falling back to pgvector: %s", directory, exc_info=True)
+        _index = None
+    return _index
+
+
+async def reload_drug_vector_index() -> DrugVectorIndex | None:
+    """
+    마지막으로 로드한 디렉터리에서 인덱스를 워커 스레드로 다시 읽어 교체한다.
+
+    읽기에 실패하면 기존 인덱스를 유지한다 (디렉터리가 설정되지 않았으면 아무것도 하지 않는다).
+
+    Returns:
+        DrugVectorIndex | None: 현재 등록된 인덱스
+    """
+    global _index
+    if _directory is None:
+        return _index
+    try:
+        _index = await asyncio.to_thread(DrugVectorIndex.load, _directory)
+        logger.info("drug vector index reloaded: %s (%d vectors)", _directory, len(_index))
+    except Exception:
+        logger.warning("drug vector index reload failed, keeping previous index", exc_info=True)
+    return _index
+
+
+# 변경 알림 핸들러 (읽는 중 추가 알림은 한 번으로 병합)
+refresh_drug_vector_index = coalesced(reload_drug_vector_index)
+
+
+async def apply_drug_vector_sync(payload: Any) -> None:
+    """
+    vector_documents 동기화 알림을 반영한다 (payload: {"synced_at": ISO 시각}).
+
+    인덱스를 다시 읽고, 그 파일이 동기화 이전에 export된 것이면 인덱스를 내린다 (pgvector 검색 사용).
+
+    Args:
+        payload (Any): VectorSyncService가 보낸 변경분
+    """
+    global _index
+    index = await reload_drug_vector_index()
+    synced_at = payload.get("synced_at") if isinstance(payload, dict) else None
+    if index is None or not synced_at or index.exported_at >= synced_at:
+        return
+    logger.warning(
+        "drug vector index exported at %s is older than vector sync at %s, using pgvector until re-export",
+        index.exported_at or "unknown",
+        synced_at,
+    )
+    _index = None
+
+
+def get_drug_vector_index() -> DrugVectorIndex | None:
+    """로드된 약물 벡터 인덱스를 반환한다 (미설정/로드 실패 시 None)."""
+    return _index
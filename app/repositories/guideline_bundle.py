@@ -0,0 +1,134 @@
+"""
+질환 가이드라인 묶음(bundle) 캐시
+
+- 추천 생성과 챗봇 컨텍스트는 진단마다 질환 매칭(최대 3쿼리) → 가이드라인 조회를 반복한다.
+  질환/가이드라인은 seed로만 바뀌는 마스터 데이터이므로 매칭 결과(질환 + category순 가이드라인)를
+  (KCD 코드, 정규화 진단명) 또는 anchor 코드 단위로 Redis에 저장해 두고, 적중하면 DB를 조회하지 않는다.
+- 매칭 실패(빈 묶음)는 TTL_GUIDELINE_BUNDLE_MISS로 짧게만 저장한다. 스캔 저장 등으로 나중에 생긴 질환은
+  seed 알림 없이 만들어지므로, 긴 TTL로 두면 그동안 추천/챗봇에서 보이지 않는다.
+- 키에 버전을 넣어 무효화한다. seed_disease_guidelines.py가 버전을 올리고(INCR) 변경 알림(kind="disease_guideline")을
+  보내면 각 워커가 새 버전을 읽어 이후 조회는 새 키를 사용한다 (이전 버전 키는 TTL로 만료).
+- Redis를 쓸 수 없으면 캐시 없이 DB를 조회한다.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from app.models.diseases import Disease, DiseaseGuideline
+from app.utils.cache import TTL_GUIDELINE_BUNDLE, TTL_GUIDELINE_BUNDLE_MISS, cache_get, cache_set, get_redis
+from app.utils.master_data import coalesced, publish_master_data_change
+
+logger = logging.getLogger(__name__)
+
+GUIDELINE_BUNDLE_VERSION_KEY = "cache:guideline_bundle:version"
+
+_version = "0"
+
+
+@dataclass(frozen=True, slots=True)
+class GuidelineItem:
+    """가이드라인 1건 (DiseaseGuideline 대신 쓰는 경량 레코드)."""
+
+    id: int
+    category: str
+    content: str
+
+
+@dataclass(frozen=True, slots=True)
+class GuidelineBundle:
+    """매칭된 질환과 그 가이드라인 목록 (category 오름차순). 매칭 실패는 disease_id=None 묶음이다."""
+
+    disease_id: int | None = None
+    disease_name: str | None = None
+    kcd_code: str | None = None
+    guidelines: tuple[GuidelineItem, ...] = ()
+
+    @classmethod
+    async def of(cls, disease: Disease | None) -> GuidelineBundle:
+        """질환의 가이드라인을 조회해 묶음을 만든다 (질환이 없으면 빈 묶음)."""
+        if disease is None:
+            return cls()
+        rows = await DiseaseGuideline.filter(disease_id=disease.id).order_by("category")
+        return cls(
+            disease_id=disease.id,
+            disease_name=disease.name,
+            kcd_code=disease.kcd_code,
+            guidelines=tuple(GuidelineItem(id=g.id, category=g.category, content=g.content) for g in rows),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> GuidelineBundle:
+        return cls(
+            disease_id=data.get("disease_id"),
+            disease_name=data.get("disease_name"),
+            kcd_code=data.get("kcd_code"),
+            guidelines=tuple(GuidelineItem(**g) for g in data.get("guidelines") or ()),
+        )
+
+
+async def get_cached_bundle(namespace: str, key: str) -> GuidelineBundle | None:
+    """
+    현재 버전의 캐시된 묶음을 반환한다 (미적중/Redis 사용 불가 시 None).
+
+    Args:
+        namespace (str): 키 종류 ("disease": 진단명 매칭, "anchor": anchor 코드)
+        key (str): "disease"는 "<KCD 코드>|<정규화 진단명>", "anchor"는 대문자 anchor 코드
+
+    Returns:
+        GuidelineBundle | None: 캐시된 묶음
+    """
+    cached = await cache_get("guideline_bundle", _version, namespace, key)
+    if cached is None:
+        return None
+    try:
+        return GuidelineBundle.from_dict(cached)
+    except (TypeError, KeyError):
+        return None
+
+
+async def set_cached_bundle(namespace: str, key: str, bundle: GuidelineBundle) -> None:
+    """현재 버전 키로 묶음을 저장한다 (매칭 실패 묶음은 짧은 TTL)."""
+    ttl = TTL_GUIDELINE_BUNDLE if bundle.disease_id is not None else TTL_GUIDELINE_BUNDLE_MISS
+    await cache_set("guideline_bundle", _version, namespace, key, value=bundle.to_dict(), ttl=ttl)
+
+
+async def load_guideline_bundle_version() -> str:
+    """
+    Redis의 묶음 캐시 버전을 읽어 모듈 전역에 반영한다. 실패하면 기존 버전을 유지한다.
+
+    Returns:
+        str: 현재 버전
+    """
+    global _version
+    r = await get_redis()
+    if not r:
+        return _version
+    try:
+        _version = str(await r.get(GUIDELINE_BUNDLE_VERSION_KEY) or "0")
+    except Exception:
+        logger.warning("guideline bundle version load failed, keeping %s", _version, exc_info=True)
+    return _version
+
+
+# 변경 알림 핸들러 (읽는 중 추가 알림은 한 번으로 병합)
+refresh_guideline_bundle_version = coalesced(load_guideline_bundle_version)
+
+
+async def invalidate_guideline_bundles() -> None:
+    """묶음 캐시 버전을 올리고 모든 워커에 알린다 (seed 스크립트에서 호출)."""
+    global _version
+    r = await get_redis()
+    if not r:
+        return
+    try:
+        _version = str(await r.incr(GUIDELINE_BUNDLE_VERSION_KEY))
+    except Exception:
+        logger.warning("guideline bundle version bump failed", exc_info=True)
+        return
+    await publish_master_data_change("disease_guideline")
@@ -8,9 +8,164 @@
 
 from __future__ import annotations
 
+import json
+from dataclasses import dataclass
+from typing import Any
+
+from tortoise.transactions import in_transaction
+
+from app.core import config
+from app.models.fields import EMBEDDING_DIMENSIONS
 from app.models.vector_documents import VectorDocument
 
 
+@dataclass(frozen=True, slots=True)
+class VectorSearchHit:
+    """
+    유사도 검색 결과 1건.
+
+    embedding은 include_embedding=True로 요청한 경우에만 채워진다
+    (기본 검색은 1536차원 벡터를 전송·파싱하지 않는다).
+    """
+
+    id: int
+    reference_type: str
+    reference_id: int
+    content: str
+    distance: float
+    embedding: list[float] | None = None
+
+
+def _quote_literal(value: str) -> str:
+    """SQL 문자열 리터럴로 안전하게 인용한다 (작은따옴표 이스케이프)."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+_SYNC_FIELDS = ("content", "embedding", "content_hash", "embedding_model_version")
+
+_SYNC_STAGE_TABLE = "vector_documents_sync_stage"
+_SYNC_STAGE_COLUMNS = (
+    "doc_id",
+    "reference_type",
+    "reference_id",
+    "content",
+    "embedding",
+    "content_hash",
+    "embedding_model_version",
+)
+_SYNC_STAGE_DDL = f"""
+CREATE TEMP TABLE IF NOT EXISTS {_SYNC_STAGE_TABLE} (
+    doc_id BIGINT,
+    reference_type VARCHAR(100) NOT NULL,
+    reference_id BIGINT NOT NULL,
+    content TEXT NOT NULL,
+    embedding vector({EMBEDDING_DIMENSIONS}) NOT NULL,
+    content_hash VARCHAR(64),
+    embedding_model_version VARCHAR(100)
+) ON COMMIT DROP
+"""
+_SYNC_STAGE_UPDATE_SQL = f"""
+UPDATE vector_documents AS v
+SET content = s.content,
+    embedding = s.embedding,
+    content_hash = s.content_hash,
+    embedding_model_version = s.embedding_model_version
+FROM {_SYNC_STAGE_TABLE} AS s
+WHERE s.doc_id IS NOT NULL AND v.id = s.doc_id
+"""
+_SYNC_STAGE_INSERT_SQL = f"""
+INSERT INTO vector_documents
+    (reference_type, reference_id, content, embedding, content_hash, embedding_model_version, created_at)
+SELECT reference_type, reference_id, content, embedding, content_hash, embedding_model_version, CURRENT_TIMESTAMP
+FROM {_SYNC_STAGE_TABLE}
+WHERE doc_id IS NULL
+"""
+
+
+def _columns(include_embedding: bool) -> str:
+    columns = "id, reference_type, reference_id, content"
+    return f"{columns}, embedding" if include_embedding else columns
+
+
+# 양자화 모드별 1차 후보 정렬식 (마이그레이션의 partial 표현식 인덱스와 같은 형태여야 인덱스를 탄다)
+_QUANTIZED_ORDER_BY = {
+    "halfvec": f"embedding::halfvec({EMBEDDING_DIMENSIONS}) <=> ({{query}})::halfvec({EMBEDDING_DIMENSIONS})",
+    "binary": f"binary_quantize(embedding)::bit({EMBEDDING_DIMENSIONS}) <~> binary_quantize({{query}})",
+}
+
+
+def _quantization_mode(reference_type: str | None) -> str:
+    """reference_type에 설정된 검색 방식을 반환한다 (partial index가 있는 타입 필터 검색에만 적용)."""
+    if not reference_type:
+        return "none"
+    mode = config.VECTOR_QUANTIZATION.get(reference_type, "none")
+    return mode if mode in _QUANTIZED_ORDER_BY else "none"
+
+
+def knn_sql(
+    reference_type: str | None,
+    include_embedding: bool = False,
+    *,
+    query: str = "$1::vector",
+    limit: str = "$2",
+) -> str:
+    """query 벡터 기준 최근접 limit건을 거리(distance)와 함께 조회하는 SQL을 만든다.
+
+    ORDER BY 절이 "컬럼 <=> 파라미터" 형태여야 HNSW 인덱스를 탄다.
+    reference_type은 partial index 조건과 매칭되도록 리터럴로 인라인한다.
+    (prepared statement의 generic plan에서는 $n 파라미터가 partial index 조건과 매칭되지 않음)
+
+    reference_type이 halfvec/binary 모드로 설정되어 있으면 양자화 인덱스로
+    VECTOR_RERANK_CANDIDATES개 후보를 먼저 뽑고, 원본 vector 코사인 거리로 재정렬한다.
+    """
+    where_sql = f"WHERE reference_type = {_quote_literal(reference_type)}" if reference_type else ""
+    columns = _columns(include_embedding)
+    mode = _quantization_mode(reference_type)
+    if mode == "none":
+        return f"""
+            SELECT {columns}, embedding <=> {query} AS distance
+            FROM vector_documents
+            {where_sql}
+            ORDER BY embedding <=> {query}
+            LIMIT {limit}
+        """  # noqa: S608
+
+    coarse_order_by = _QUANTIZED_ORDER_BY[mode].format(query=query)
+    candidates = int(config.VECTOR_RERANK_CANDIDATES)
+    return f"""
+        SELECT {columns}, embedding <=> {query} AS distance
+        FROM (
+            SELECT id, reference_type, reference_id, content, embedding
+            FROM vector_documents
+            {where_sql}
+            ORDER BY {coarse_order_by}
+            LIMIT GREATEST({limit}, {candidates})
+        ) AS candidates
+        ORDER BY distance
+        LIMIT {limit}
+    """  # noqa: S608
+
+
+def _parse_embedding(value: Any) -> list[float] | None:
+    # 바이너리 코덱이 등록된 커넥션은 list를, 그 외(코덱 미등록)는 텍스트 표현을 돌려준다.
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return json.loads(value)
+    return list(value)
+
+
+def _row_to_hit(row: dict[str, Any]) -> VectorSearchHit:
+    return VectorSearchHit(
+        id=row["id"],
+        reference_type=row["reference_type"],
+        reference_id=row["reference_id"],
+        content=row["content"],
+        distance=float(row["distance"]),
+        embedding=_parse_embedding(row.get("embedding")),
+    )
+
+
 class VectorDocumentRepository:
     """
     vector_documents 테이블 접근을 담당하는 Repository.
@@ -114,16 +269,111 @@ class VectorDocumentRepository:
             embedding=embedding,
         )
 
+    async def list_sync_state(self, reference_type: str) -> list[dict[str, Any]]:
+        """
+        증분 동기화 판별에 필요한 컬럼만 조회한다 (content/embedding은 읽지 않는다).
+
+        Args:
+            reference_type (str):
+                참조 타입
+
+        Returns:
+            list[dict[str, Any]]:
+                id, reference_id, content_hash, embedding_model_version 목록 (id 오름차순)
+        """
+        return (
+            await self._model.filter(reference_type=reference_type)
+            .order_by("id")
+            .values("id", "reference_id", "content_hash", "embedding_model_version")
+        )
+
+    async def save_synced(
+        self,
+        *,
+        created: list[VectorDocument],
+        updated: list[VectorDocument],
+    ) -> None:
+        """
+        재임베딩 결과를 한 트랜잭션으로 일괄 저장한다.
+
+        배치 단위로 커밋되므로 중간에 중단되어도 저장된 배치는 다음 실행에서 unchanged로 판별된다.
+        PostgreSQL에서는 COPY로 임시 테이블에 적재한 뒤 UPDATE ... FROM / INSERT ... SELECT 두 문장으로 반영한다
+        (행마다 INSERT/CASE 식을 만드는 ORM bulk 경로보다 전송량과 파싱 비용이 작다).
+
+        Args:
+            created (list[VectorDocument]):
+                새로 생성할 문서 (미저장 인스턴스)
+            updated (list[VectorDocument]):
+                content/embedding/content_hash/embedding_model_version을 갱신할 기존 문서 (id 포함)
+        """
+        if not created and not updated:
+            return
+        async with in_transaction() as conn:
+            if conn.capabilities.dialect == "postgres":
+                await self._copy_synced(conn, created=created, updated=updated)
+                return
+            if created:
+                await self._model.bulk_create(created)
+            if updated:
+                await self._model.bulk_update(updated, fields=list(_SYNC_FIELDS))
+
+    @staticmethod
+    async def _copy_synced(
+        conn: Any,
+        *,
+        created: list[VectorDocument],
+        updated: list[VectorDocument],
+    ) -> None:
+        # doc_id가 NULL인 행은 INSERT, 아니면 해당 id를 UPDATE
+        records = [
+            (
+                doc_id,
+                doc.reference_type,
+                doc.reference_id,
+                doc.content,
+                list(doc.embedding),
+                doc.content_hash,
+                doc.embedding_model_version,
+            )
+            for doc_id, doc in [*((doc.id, doc) for doc in updated), *((None, doc) for doc in created)]
+        ]
+        async with conn.acquire_connection() as raw:
+            await raw.execute(_SYNC_STAGE_DDL)
+            await raw.copy_records_to_table(_SYNC_STAGE_TABLE, records=records, columns=list(_SYNC_STAGE_COLUMNS))
+            if updated:
+                await raw.execute(_SYNC_STAGE_UPDATE_SQL)
+            if created:
+                await raw.execute(_SYNC_STAGE_INSERT_SQL)
+
+    async def delete_by_ids(self, doc_ids: list[int]) -> int:
+        """
+        문서 ID 목록에 해당하는 벡터 문서를 삭제한다.
+
+        Args:
+            doc_ids (list[int]):
+                벡터 문서 ID 목록
+
+        Returns:
+            int:
+                삭제된 행 수
+        """
+        if not doc_ids:
+            return 0
+        return await self._model.filter(id__in=doc_ids).delete()
+
     async def search_similar(
         self,
         embedding: list[float],
         *,
         reference_type: str | None = None,
         top_k: int = 5,
-    ) -> list[VectorDocument]:
+        include_embedding: bool = False,
+    ) -> list[VectorSearchHit]:
         """
         pgvector 코사인 거리 연산으로 유사 문서를 검색한다.
 
+        네이티브 vector 컬럼을 그대로 비교하므로 HNSW 인덱스(reference_type별 partial 포함)를 사용한다.
+
         Args:
             embedding (list[float]):
                 검색 기준 임베딩 벡터
@@ -131,73 +381,102 @@ class VectorDocumentRepository:
                 특정 reference_type으로 필터링할지 여부
             top_k (int):
                 반환할 최대 문서 수
+            include_embedding (bool):
+                결과에 문서 임베딩을 포함할지 여부 (기본 False)
 
         Returns:
-            list[VectorDocument]:
-                유사한 벡터 문서 목록
+            list[VectorSearchHit]:
+                거리 오름차순 검색 결과 목록
         """
-        from tortoise import connections
+        sql = knn_sql(reference_type, include_embedding)
+        return await self._fetch_hits(sql, [list(embedding), top_k])
 
-        conn = connections.get("default")
-        vector_str = "[" + ",".join(str(v) for v in embedding) + "]"
+    async def search_similar_many(
+        self,
+        embeddings: list[list[float]],
+        *,
+        reference_type: str | None = None,
+        top_k: int = 5,
+        include_embedding: bool = False,
+    ) -> list[list[VectorSearchHit]]:
+        """
+        여러 질의 벡터의 유사 문서를 한 번의 쿼리로 검색한다.
 
-        if reference_type:
-            sql = """
-            SELECT id, reference_type, reference_id, content, embedding, created_at,
-                   embedding::vector <=> $1::vector AS distance
-            FROM vector_documents
-            WHERE reference_type = $2
-            ORDER BY distance
-            LIMIT $3
-            """  # noqa: S608
-            params = [vector_str, reference_type, top_k]
-        else:
-            sql = """
-            SELECT id, reference_type, reference_id, content, embedding, created_at,
-                   embedding::vector <=> $1::vector AS distance
-            FROM vector_documents
-            ORDER BY distance
-            LIMIT $2
-            """  # noqa: S608
-            params = [vector_str, top_k]
+        질의 벡터를 VALUES 목록으로 넘기고 CROSS JOIN LATERAL로 질의별 top_k를 구하므로,
+        각 LATERAL 서브쿼리는 search_similar와 같은 HNSW 인덱스 스캔을 사용한다.
+
+        Args:
+            embeddings (list[list[float]]):
+                검색 기준 임베딩 벡터 목록
+            reference_type (str | None):
+                특정 reference_type으로 필터링할지 여부
+            top_k (int):
+                질의별 반환할 최대 문서 수
+            include_embedding (bool):
+                결과에 문서 임베딩을 포함할지 여부 (기본 False)
+
+        Returns:
+            list[list[VectorSearchHit]]:
+                embeddings와 같은 순서의 질의별 검색 결과 (거리 오름차순)
+        """
+        if not embeddings:
+            return []
 
+        from tortoise import connections
+
+        values_sql = ", ".join(f"({i}, ${i + 1}::vector)" for i in range(len(embeddings)))
+        lateral_sql = knn_sql(reference_type, include_embedding, query="q.query", limit=f"${len(embeddings) + 1}")
+        sql = f"""
+        SELECT q.ord, hit.*
+        FROM (VALUES {values_sql}) AS q(ord, query)
+        CROSS JOIN LATERAL ({lateral_sql}) AS hit
+        ORDER BY q.ord, hit.distance
+        """  # noqa: S608
+        params: list[Any] = [list(e) for e in embeddings]
+        params.append(top_k)
+
+        conn = connections.get("default")
         rows = await conn.execute_query_dict(sql, params)
 
-        docs: list[VectorDocument] = []
+        results: list[list[VectorSearchHit]] = [[] for _ in embeddings]
         for row in rows:
-            doc = VectorDocument(
-                id=row["id"],
-                reference_type=row["reference_type"],
-                reference_id=row["reference_id"],
-                content=row["content"],
-                embedding=row["embedding"],
-                created_at=row["created_at"],
-            )
-            doc._distance = float(row["distance"])  # type: ignore[attr-defined]
-            docs.append(doc)
-
-        return docs
+            results[row["ord"]].append(_row_to_hit(row))
+        return results
 
     async def search_drug_context(
         self,
         embedding: list[float],
         *,
         top_k: int = 5,
-    ) -> list[VectorDocument]:
-        """drug 관련 벡터 문서만 검색한다. 결과가 없으면 전체에서 fallback."""
-        docs = await self.search_similar(embedding, reference_type="drug", top_k=top_k)
-        if not docs:
-            docs = await self.search_similar(embedding, top_k=top_k)
-        return docs
+        include_embedding: bool = False,
+    ) -> list[VectorSearchHit]:
+        """drug 관련 벡터 문서만 검색한다. 결과가 없으면 전체에서 fallback (단일 쿼리)."""
+        columns = _columns(include_embedding)
+        # preferred가 비어 있을 때만 전체 검색 분기가 실행된다 (NOT EXISTS는 InitPlan으로 1회 평가).
+        sql = f"""
+        WITH preferred AS ({knn_sql("drug", include_embedding)})
+        SELECT {columns}, distance FROM preferred
+        UNION ALL
+        SELECT {columns}, distance FROM ({knn_sql(None, include_embedding)}) AS fallback
+        WHERE NOT EXISTS (SELECT 1 FROM preferred)
+        ORDER BY distance
+        """  # noqa: S608
+        return await self._fetch_hits(sql, [list(embedding), top_k])
 
     async def search_disease_context(
         self,
         embedding: list[float],
         *,
         top_k: int = 5,
-    ) -> list[VectorDocument]:
+        include_embedding: bool = False,
+    ) -> list[VectorSearchHit]:
         """disease_guideline 관련 벡터 문서만 검색한다."""
-        return await self.search_similar(embedding, reference_type="disease_guideline", top_k=top_k)
+        return await self.search_similar(
+            embedding,
+            reference_type="disease_guideline",
+            top_k=top_k,
+            include_embedding=include_embedding,
+        )
 
     async def search_with_type_priority(
         self,
@@ -206,22 +485,37 @@ class VectorDocumentRepository:
         preferred_type: str,
         top_k: int = 5,
         fallback_threshold: float = 0.5,
-    ) -> list[VectorDocument]:
-        """preferred_type을 우선 검색하고, 유사도가 낮으면 전체에서 보충한다."""
-        docs = await self.search_similar(embedding, reference_type=preferred_type, top_k=top_k)
-
-        # 유사도가 threshold 이상인 문서만 유지
-        good_docs = [d for d in docs if hasattr(d, "_distance") and d._distance < fallback_threshold]
+        include_embedding: bool = False,
+    ) -> list[VectorSearchHit]:
+        """preferred_type을 우선 검색하고, 유사도가 낮으면 전체에서 보충한다 (단일 쿼리).
 
-        if len(good_docs) < top_k:
-            all_docs = await self.search_similar(embedding, top_k=top_k)
-            seen_ids = {d.id for d in good_docs}
-            for d in all_docs:
-                if d.id not in seen_ids and len(good_docs) < top_k:
-                    good_docs.append(d)
-                    seen_ids.add(d.id)
+        preferred_type 상위 top_k 중 거리 < fallback_threshold인 문서를 먼저 두고,
+        모자란 만큼 전체 상위 top_k에서 아직 포함되지 않은 문서를 거리순으로 채운다.
+        """
+        columns = _columns(include_embedding)
+        sql = f"""
+        WITH good AS (
+            SELECT * FROM ({knn_sql(preferred_type, include_embedding)}) AS preferred
+            WHERE distance < $3
+        )
+        SELECT {columns}, distance FROM (
+            SELECT {columns}, distance, 0 AS tier FROM good
+            UNION ALL
+            SELECT {columns}, distance, 1 AS tier FROM ({knn_sql(None, include_embedding)}) AS fill
+            WHERE NOT EXISTS (SELECT 1 FROM good WHERE good.id = fill.id)
+        ) AS ranked
+        ORDER BY tier, distance
+        LIMIT $2
+        """  # noqa: S608
+        return await self._fetch_hits(sql, [list(embedding), top_k, fallback_threshold])
+
+    async def _fetch_hits(self, sql: str, params: list) -> list[VectorSearchHit]:
+        """유사도 검색 SQL을 실행하고 VectorSearchHit 목록으로 변환한다."""
+        from tortoise import connections
 
-        return good_docs
+        conn = connections.get("default")
+        rows = await conn.execute_query_dict(sql, params)
+        return [_row_to_hit(row) for row in rows]
 
     async def delete_by_reference(self, reference_type: str, reference_id: int) -> int:
         """
@@ -73,9 +73,9 @@ class ChatHealthService(BaseService):
         if not question:
             return ""
         try:
-            q_vector = encode(question)
+            q_vector = await encode(question)
             rag_docs = await self.vector_repo.search_disease_context(q_vector, top_k=3)
-            rag_items = [d.content for d in rag_docs if d.content and getattr(d, "_distance", 1.0) < 0.5]
+            rag_items = [d.content for d in rag_docs if d.content and d.distance < 0.5]
             return "\n".join(f"  - {item}" for item in rag_items) if rag_items else ""
         except Exception:
             return ""
@@ -0,0 +1,38 @@
+"""질병 서비스.
+
+상병코드 자동완성 검색을 담당한다.
+"""
+
+from __future__ import annotations
+
+from fastapi import HTTPException
+
+from app.repositories.disease_repository import DiseaseRepository
+from app.utils.cache import TTL_DISEASE_SEARCH, cache_get, cache_set
+
+
+class DiseaseService:
+    def __init__(self):
+        self.disease_repo = DiseaseRepository()
+
+    async def search(self, keyword: str, *, limit: int = 10) -> list[dict]:
+        """
+        상병코드 또는 질병명으로 검색하여 응답 딕셔너리 목록을 반환한다.
+
+        스캔 결과 편집 화면이 입력할 때마다 호출하므로 (대문자 검색어, limit) 단위로 결과를 캐시한다.
+        코드는 대문자, 이름은 대소문자 구분 없이 비교하므로 대문자 검색어가 같으면 결과도 같다.
+        """
+        key = keyword.strip().upper()
+        if not key:
+            return []
+        cached = await cache_get("disease_search", key, limit)
+        if cached is not None:
+            return cached
+
+        try:
+            rows = await self.disease_repo.search_code_mappings(keyword, limit=limit)
+        except Exception:
+            raise HTTPException(status_code=500, detail="질병 검색 중 오류가 발생했습니다.") from None
+        result = [{"code": r["code"], "name": r["name"], "display": f"{r['code']} {r['name']}"} for r in rows]
+        await cache_set("disease_search", key, limit, value=result, ttl=TTL_DISEASE_SEARCH)
+        return result
@@ -15,38 +15,31 @@ class DrugService:
     def __init__(self):
         self.drug_repo = DrugRepository()
 
-    async def _try_corrected_search(self, keyword: str, limit: int) -> list:
-        corrected = self._correct_ocr_typo(keyword)
-        if corrected != keyword:
-            rows = await self.drug_repo.search_by_name(corrected, limit=limit)
-            if rows:
-                return rows
+    def _search_variants(self, keyword: str) -> list[str]:
+        """
+        검색어 변형을 우선순위 순으로 만든다.
+
+        원문 → OCR 오인식 보정 → 단위 정규화 → 정규화 후 오인식 보정 → 핵심 브랜드명 접두(긴 것부터 2글자까지).
+
+        Args:
+            keyword (str): 검색어
+
+        Returns:
+            list[str]: 중복을 제거한 변형 목록
+        """
+        variants = [keyword, self._correct_ocr_typo(keyword)]
         normalized = self._normalize_unit(keyword)
         if normalized != keyword:
-            rows = await self.drug_repo.search_by_name(normalized, limit=limit)
-            if rows:
-                return rows
-            corrected_norm = self._correct_ocr_typo(normalized)
-            if corrected_norm != normalized:
-                rows = await self.drug_repo.search_by_name(corrected_norm, limit=limit)
-                if rows:
-                    return rows
-        return []
-
-    async def _search_with_fallbacks(self, keyword: str, limit: int) -> list:
-        rows = await self.drug_repo.search_by_name(keyword, limit=limit)
-        if rows:
-            return rows
-        rows = await self._try_corrected_search(keyword, limit)
-        if rows:
-            return rows
+            variants += [normalized, self._correct_ocr_typo(normalized)]
         core = self._extract_core_name(keyword)
         if core:
-            for length in range(len(core), 1, -1):
-                rows = await self.drug_repo.search_by_name(core[:length], limit=limit)
-                if rows:
-                    return rows
-        return await self.drug_repo.search_by_similarity(keyword, limit=limit)
+            variants += [core[:length] for length in range(len(core), 1, -1)]
+        return list(dict.fromkeys(variants))
+
+    async def _search_with_fallbacks(self, keyword: str, limit: int) -> list:
+        return await self.drug_repo.search_ranked(
+            self._search_variants(keyword), similarity_keyword=keyword, limit=limit
+        )
 
     async def search(self, keyword: str, *, limit: int = 20) -> list[dict]:
         """약품명 키워드로 검색하여 응답 딕셔너리 목록을 반환한다."""
@@ -1,40 +1,198 @@
 """텍스트 임베딩 서비스.
 
-OpenAI text-embedding-3-small 모델로 1536차원 벡터를 생성한다.
-생성된 벡터는 pgvector 유사도 검색에 사용된다.
+OpenAI text-embedding-3-small 모델(기본) 또는 ai_worker 로컬 임베딩 서버(EMBEDDING_BACKEND=local)로
+1536차원 벡터를 생성한다. 생성된 벡터는 pgvector 유사도 검색에 사용된다.
+
+이벤트 루프를 막지 않도록 AsyncOpenAI 싱글턴을 사용하며,
+짧은 윈도우(수 ms) 안에 동시에 들어온 encode() 호출은 하나의 embeddings.create 배치로 묶어
+요청한 곳으로 결과를 나눠준다. 동시에 진행되는 API 요청 수는 세마포어로 제한한다.
+
+encode()/encode_batch()는 먼저 임베딩 캐시(app.utils.embedding_cache)를 조회하고,
+미적중분만 API로 요청한 뒤 결과를 캐시에 채운다.
 """
 
 from __future__ import annotations
 
-from openai import OpenAI
+import asyncio
+import logging
+
+from app.core import config
+from app.core.config import EmbeddingBackend
+from app.integrations.local_embedding.client import get_local_embedding_client
+from app.integrations.openai.client import get_openai_client
+from app.utils.embedding_cache import get_embedding_cache
 
-from app.core.config import Config
+logger = logging.getLogger(__name__)
 
-_client = OpenAI(api_key=Config().OPENAI_API_KEY)
 _MODEL = "text-embedding-3-small"
+_MAX_INPUTS_PER_REQUEST = 2048  # OpenAI embeddings API 1회 입력 개수 한도
+
+
+class EmbeddingBatcher:
+    """동시 encode() 요청을 모아 한 번의 embeddings.create 호출로 처리하는 micro-batcher."""
+
+    def __init__(
+        self,
+        *,
+        model: str = _MODEL,
+        backend: EmbeddingBackend = EmbeddingBackend.OPENAI,
+        window_ms: float = 5.0,
+        max_batch_size: int = 256,
+        max_in_flight: int = 4,
+    ) -> None:
+        self._model = model
+        self._backend = backend
+        self._window = window_ms / 1000
+        self._max_batch_size = min(max_batch_size, _MAX_INPUTS_PER_REQUEST)
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._pending: list[tuple[str, asyncio.Future[list[float]]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def model(self) -> str:
+        return self._model
+
+    async def encode(self, text: str) -> list[float]:
+        """텍스트 1건을 대기열에 넣고, 배치 처리된 임베딩 결과를 기다린다.
+
+        Args:
+            text (str): 임베딩할 텍스트.
+
+        Returns:
+            list[float]: 1536차원 부동소수점 벡터.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[list[float]] = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._window, self._flush)
+
+        return await future
+
+    async def encode_many(self, texts: list[str]) -> list[list[float]]:
+        """이미 모여 있는 텍스트 목록을 윈도우 대기 없이 바로 요청한다.
+
+        API 입력 개수 한도를 넘으면 나눠서 요청하며, 각 요청은 동시 요청 제한을 공유한다.
+
+        Args:
+            texts (list[str]): 임베딩할 텍스트 목록.
+
+        Returns:
+            list[list[float]]: 입력 순서와 동일한 벡터 목록.
+        """
+        if not texts:
+            return []
+        chunks = [texts[i : i + _MAX_INPUTS_PER_REQUEST] for i in range(0, len(texts), _MAX_INPUTS_PER_REQUEST)]
+        results = await asyncio.gather(*(self._request(chunk) for chunk in chunks))
+        return [vector for chunk_vectors in results for vector in chunk_vectors]
+
+    def _flush(self) -> None:
+        """대기 중인 요청을 하나의 배치로 떼어내 백그라운드에서 전송한다."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
 
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
 
-def encode(text: str) -> list[float]:
+        task = asyncio.get_running_loop().create_task(self._dispatch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: list[tuple[str, asyncio.Future[list[float]]]]) -> None:
+        # 같은 텍스트가 여러 번 들어오면 한 번만 요청한다.
+        texts = list(dict.fromkeys(text for text, _ in batch))
+        try:
+            vectors = await self._request(texts)
+        except Exception as e:
+            logger.warning("embedding batch failed: size=%d error=%s", len(texts), e)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        by_text = dict(zip(texts, vectors, strict=True))
+        for text, future in batch:
+            if not future.done():
+                future.set_result(by_text[text])
+
+    async def _request(self, texts: list[str]) -> list[list[float]]:
+        async with self._semaphore:
+            if self._backend == EmbeddingBackend.LOCAL:
+                return await get_local_embedding_client().embed(texts)
+            response = await get_openai_client().embeddings.create(input=texts, model=self._model)
+        return [item.embedding for item in sorted(response.data, key=lambda x: x.index)]
+
+
+_batcher: EmbeddingBatcher | None = None
+
+
+def get_embedding_batcher() -> EmbeddingBatcher:
+    """
+    EmbeddingBatcher 싱글턴 인스턴스 반환.
+
+    Returns:
+        EmbeddingBatcher: 설정값으로 초기화된 배처.
+    """
+    global _batcher
+    if _batcher is None:
+        backend = config.EMBEDDING_BACKEND
+        _batcher = EmbeddingBatcher(
+            model=config.LOCAL_EMBEDDING_MODEL if backend == EmbeddingBackend.LOCAL else _MODEL,
+            backend=backend,
+            window_ms=config.EMBEDDING_BATCH_WINDOW_MS,
+            max_batch_size=config.EMBEDDING_MAX_BATCH_SIZE,
+            max_in_flight=config.EMBEDDING_MAX_IN_FLIGHT,
+        )
+    return _batcher
+
+
+async def encode(text: str) -> list[float]:
     """텍스트를 1536차원 임베딩 벡터로 변환한다.
 
+    캐시에 있으면 API를 호출하지 않으며, 없으면 동시에 들어온 다른 encode() 호출과
+    함께 하나의 API 요청으로 묶일 수 있다.
+
     Args:
         text (str): 임베딩할 텍스트.
 
     Returns:
         list[float]: 1536차원 부동소수점 벡터.
     """
-    response = _client.embeddings.create(input=text, model=_MODEL)
-    return response.data[0].embedding
+    batcher = get_embedding_batcher()
+    cache = get_embedding_cache()
+    cached = await cache.get(batcher.model, text)
+    if cached is not None:
+        return cached
 
+    # 캐시 적중 시와 같은 정밀도(float16 반올림)로 반환한다
+    return await cache.set(batcher.model, text, await batcher.encode(text))
 
-def encode_batch(texts: list[str]) -> list[list[float]]:
-    """텍스트 목록을 한 번의 API 호출로 일괄 임베딩한다.
+
+async def encode_batch(texts: list[str], *, use_cache: bool = True) -> list[list[float]]:
+    """텍스트 목록을 일괄 임베딩한다 (입력 개수 한도 초과 시 나눠서 요청).
 
     Args:
         texts (list[str]): 임베딩할 텍스트 목록.
+        use_cache (bool): False면 캐시를 거치지 않는다 (대량 시딩 시 LRU/Redis 오염 방지).
 
     Returns:
         list[list[float]]: 각 텍스트에 대한 1536차원 벡터 목록.
     """
-    response = _client.embeddings.create(input=texts, model=_MODEL)
-    return [item.embedding for item in sorted(response.data, key=lambda x: x.index)]
+    batcher = get_embedding_batcher()
+    if not use_cache:
+        return await batcher.encode_many(texts)
+
+    cache = get_embedding_cache()
+    results = await cache.get_many(batcher.model, texts)
+    missing = list(dict.fromkeys(text for text, vector in zip(texts, results, strict=True) if vector is None))
+    if missing:
+        vectors = await cache.set_many(batcher.model, missing, await batcher.encode_many(missing))
+        by_text = dict(zip(missing, vectors, strict=True))
+        results = [vector if vector is not None else by_text[text] for text, vector in zip(texts, results, strict=True)]
+    return [vector for vector in results if vector is not None]
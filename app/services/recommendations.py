@@ -12,15 +12,16 @@ from app.dtos.recommendations import RecommendationType, RecommendationUpdateReq
 from app.integrations.openai.client import chat_completion
 from app.repositories.disease_repository import DiseaseRepository
 from app.repositories.drug_repository import DrugRepository
+from app.repositories.guideline_bundle import GuidelineBundle
 from app.repositories.recommendation_repository import RecommendationRepository
 from app.repositories.scan_repository import ScanRepository
 from app.repositories.vector_document_repository import VectorDocumentRepository
-from app.services.embedding import encode
+from app.services.embedding import encode_batch
 from app.services.recommendation_refiner import (
     RecommendationCandidate,
     finalize_recommendations,
 )
-from app.utils.cache import TTL_DRUG_SEARCH, TTL_RECOMMENDATION, cache_get, cache_set
+from app.utils.cache import TTL_DRUG_SEARCH, TTL_RECOMMENDATION, cache_get, cache_get_many, cache_set, cache_set_many
 
 logger = logging.getLogger(__name__)
 
@@ -162,6 +163,13 @@ class RecommendationService:
         value = re.sub(r"\s+", " ", value).strip()
         return value or None
 
+    def _normalized_diagnoses(self, diagnosis_list: list[str]) -> list[str]:
+        """diagnosis_list를 정리하여 비어 있지 않은 진단만 순서대로 반환한다."""
+        normalized = (
+            self._normalize_diagnosis_text(entry) if isinstance(entry, str) else None for entry in diagnosis_list
+        )
+        return [diagnosis for diagnosis in normalized if diagnosis]
+
     def _build_vector_query(
         self,
         *,
@@ -218,9 +226,9 @@ class RecommendationService:
 
         return None, text
 
-    async def _match_disease(self, diagnosis: str | None) -> Any | None:
+    async def _match_disease(self, diagnosis: str | None) -> GuidelineBundle:
         """
-        diagnosis 문자열을 Disease에 매칭한다.
+        diagnosis 문자열을 Disease에 매칭해 가이드라인 묶음을 반환한다 (묶음 캐시 적중 시 DB 조회 없음).
 
         우선순위:
         1. icd/kcd code 형태면 코드 매칭
@@ -229,22 +237,9 @@ class RecommendationService:
         """
         value = self._normalize_diagnosis_text(diagnosis)
         if not value:
-            return None
-
-        if self._looks_like_disease_code(value):
-            disease = await self.disease_repo.get_by_kcd_code(value.upper())
-            if disease:
-                return disease
-
-        disease = await self.disease_repo.get_by_name(value)
-        if disease:
-            return disease
-
-        diseases = await self.disease_repo.list_by_name_contains(value, limit=1)
-        if diseases:
-            return diseases[0]
-
-        return None
+            return GuidelineBundle()
+        kcd_code = value.upper() if self._looks_like_disease_code(value) else None
+        return await self.disease_repo.match_guideline_bundle(value, kcd_code=kcd_code)
 
     def _create_recommendation_candidate(
         self,
@@ -352,23 +347,21 @@ class RecommendationService:
             return candidates
 
         # 1) 기존 직접 매칭
-        disease = await self._match_disease(normalized)
-        if disease:
-            guidelines = await self.disease_repo.get_guidelines_by_disease(disease.id)
-            if guidelines:
-                for gl in guidelines:
-                    candidates.append(
-                        self._create_recommendation_candidate(
-                            recommendation_type=getattr(gl, "category", "general_care"),
-                            source="direct_guideline",
-                            content=getattr(gl, "content", ""),
-                            score=0.95,
-                            disease_id=disease.id,
-                            guideline_id=getattr(gl, "id", None),
-                            metadata={"matched_from": normalized},
-                        )
+        bundle = await self._match_disease(normalized)
+        if bundle.guidelines:
+            for gl in bundle.guidelines:
+                candidates.append(
+                    self._create_recommendation_candidate(
+                        recommendation_type=gl.category,
+                        source="direct_guideline",
+                        content=gl.content,
+                        score=0.95,
+                        disease_id=bundle.disease_id,
+                        guideline_id=gl.id,
+                        metadata={"matched_from": normalized},
                     )
-                return candidates
+                )
+            return candidates
 
         # 2) 질병코드 매핑 테이블 fallback
         code, _name = self._parse_diagnosis_entry(diagnosis)
@@ -376,15 +369,15 @@ class RecommendationService:
             anchor = await self.disease_repo.resolve_anchor_code(code)
             if anchor:
                 anchor_code, anchor_name = anchor
-                guidelines = await self.disease_repo.get_guidelines_by_anchor_code(anchor_code)
-                for gl in guidelines:
+                anchor_bundle = await self.disease_repo.get_anchor_bundle(anchor_code)
+                for gl in anchor_bundle.guidelines:
                     candidates.append(
                         self._create_recommendation_candidate(
-                            recommendation_type=getattr(gl, "category", "general_care"),
+                            recommendation_type=gl.category,
                             source="direct_guideline",
-                            content=getattr(gl, "content", ""),
+                            content=gl.content,
                             score=0.93,
-                            guideline_id=getattr(gl, "id", None),
+                            guideline_id=gl.id,
                             metadata={
                                 "matched_from": normalized,
                                 "original_code": code,
@@ -399,37 +392,43 @@ class RecommendationService:
     async def _search_vector_guidelines(
         self,
         *,
-        diagnosis: str | None,
+        diagnoses: list[str],
         drugs: list[str],
         clinical_note: str | None = None,
         top_k: int = 3,
     ) -> list[RecommendationCandidate]:
         """
-        vector_documents에서 유사 guideline을 검색해 후보로 변환한다.
+        vector_documents에서 진단별 유사 guideline을 검색해 후보로 변환한다.
+
+        진단별 질의를 한 번에 임베딩하고 search_similar_many로 한 번에 검색한다.
+        진단이 없으면 clinical_note/약물만으로 질의 1건을 만든다.
 
         Notes:
             현재는 반환 type을 followup으로 두고 있으나,
             추후 vector 문서 메타데이터(category 등)가 정리되면 타입도 함께 반영 가능하다.
         """
-        normalized_diagnosis = self._normalize_diagnosis_text(diagnosis)
-        matched_disease = await self._match_disease(normalized_diagnosis)
-        disease_name = getattr(matched_disease, "name", None) if matched_disease else None
+        queries: dict[str, str | None] = {}
+        targets: list[str | None] = list(diagnoses) or [None]
+        for diagnosis in targets:
+            normalized_diagnosis = self._normalize_diagnosis_text(diagnosis)
+            disease_name = (await self._match_disease(normalized_diagnosis)).disease_name
 
-        query = self._build_vector_query(
-            diagnosis=normalized_diagnosis,
-            disease_name=disease_name,
-            drugs=drugs,
-            clinical_note=clinical_note,
-        )
+            query = self._build_vector_query(
+                diagnosis=normalized_diagnosis,
+                disease_name=disease_name,
+                drugs=drugs,
+                clinical_note=clinical_note,
+            )
+            if query and query not in queries:
+                queries[query] = normalized_diagnosis or clinical_note
 
-        if not query:
+        if not queries:
             return []
 
-        similar_docs: list[Any] = []
         try:
-            vector = encode(query)
-            similar_docs = await self.vector_doc_repo.search_similar(
-                vector,
+            vectors = await encode_batch(list(queries))
+            similar_lists = await self.vector_doc_repo.search_similar_many(
+                vectors,
                 reference_type="disease_guideline",
                 top_k=top_k,
             )
@@ -438,64 +437,69 @@ class RecommendationService:
             return []
 
         candidates: list[RecommendationCandidate] = []
+        seen_refs: set[tuple[str, int]] = set()
 
-        for doc in similar_docs:
-            content = getattr(doc, "content", None)
-            if not isinstance(content, str) or not content.strip():
-                continue
+        for matched_from, similar_docs in zip(queries.values(), similar_lists, strict=True):
+            for doc in similar_docs:
+                content = doc.content
+                if not isinstance(content, str) or not content.strip():
+                    continue
+                if (doc.reference_type, doc.reference_id) in seen_refs:
+                    continue
+                seen_refs.add((doc.reference_type, doc.reference_id))
 
-            candidates.append(
-                self._create_recommendation_candidate(
-                    recommendation_type="followup",
-                    source="vector_fallback",
-                    content=content,
-                    score=0.9,
-                    metadata={
-                        "matched_from": normalized_diagnosis or clinical_note,
-                        "reference_type": getattr(doc, "reference_type", None),
-                        "reference_id": getattr(doc, "reference_id", None),
-                    },
+                candidates.append(
+                    self._create_recommendation_candidate(
+                        recommendation_type="followup",
+                        source="vector_fallback",
+                        content=content,
+                        score=0.9,
+                        metadata={
+                            "matched_from": matched_from,
+                            "reference_type": doc.reference_type,
+                            "reference_id": doc.reference_id,
+                        },
+                    )
                 )
-            )
 
         return candidates
 
     async def _fetch_drug_details(self, drug_names: list[str]) -> list[dict[str, Any]]:
-        """약물명 목록으로 DB에서 상세정보를 조회한다."""
-        details: list[dict[str, Any]] = []
-        for name in drug_names[:10]:
-            name = name.strip()
-            if not name:
-                continue
-
-            cached = await cache_get("drug_detail", name)
-            if cached is not None:
-                details.append(cached)
-                continue
-
-            rows = await self.drug_repo.search_by_name(name, limit=1)
-            if not rows:
-                import re as _re
-
-                corrected = _re.sub(r"점(\d|$)", r"정\1", name)
-                if corrected != name:
-                    rows = await self.drug_repo.search_by_name(corrected, limit=1)
-            if rows:
-                d = rows[0]
-                detail = {
-                    "name": d.name,
-                    "efficacy": d.efficacy,
-                    "dosage": d.dosage,
-                    "caution": " ".join(filter(None, [d.caution_1, d.caution_2]))[:300]
-                    if (d.caution_1 or d.caution_2)
-                    else None,
-                    "main_ingredient": d.main_ingredient,
-                }
-            else:
-                detail = {"name": name}
-            await cache_set("drug_detail", name, value=detail, ttl=TTL_DRUG_SEARCH)
-            details.append(detail)
-        return details
+        """
+        약물명 목록으로 DB에서 상세정보를 조회한다.
+
+        Redis MGET 1회로 캐시를 확인하고, 미적중 약물명은 '점→정' 보정명까지 SQL 1회로 찾은 뒤
+        파이프라인 1회로 캐시에 저장한다.
+        """
+        names = [name.strip() for name in drug_names[:10]]
+        names = [name for name in names if name]
+        unique = list(dict.fromkeys(names))
+        cached = await cache_get_many("drug_detail", [(name,) for name in unique])
+        found: dict[str, dict[str, Any]] = {
+            name: value for name, value in zip(unique, cached, strict=True) if value is not None
+        }
+
+        misses = [name for name in unique if name not in found]
+        if misses:
+            corrected = {name: re.sub(r"점(\d|$)", r"정\1", name) for name in misses}
+            drugs = await self.drug_repo.first_by_names([*misses, *corrected.values()])
+            for name in misses:
+                d = drugs.get(name) or drugs.get(corrected[name])
+                if d:
+                    found[name] = {
+                        "name": d.name,
+                        "efficacy": d.efficacy,
+                        "dosage": d.dosage,
+                        "caution": " ".join(filter(None, [d.caution_1, d.caution_2]))[:300]
+                        if (d.caution_1 or d.caution_2)
+                        else None,
+                        "main_ingredient": d.main_ingredient,
+                    }
+                else:
+                    found[name] = {"name": name}
+            await cache_set_many("drug_detail", [((name,), found[name]) for name in misses], ttl=TTL_DRUG_SEARCH)
+
+        return [found[name] for name in names]
 
     async def _generate_ai_recommendations(
         self,
@@ -624,11 +628,11 @@ frequency 종류: daily, weekly, 3_per_week, every_other_day, monthly, as_needed
         if guideline_candidates:
             return guideline_candidates
 
-        # 5) 가이드라인도 없으면 vector fallback
-        first_diag = self._normalize_diagnosis_text(diagnosis_list[0] if diagnosis_list else None)
-        if first_diag:
+        # 5) 가이드라인도 없으면 vector fallback (진단 전체를 한 번에 검색)
+        diagnoses = self._normalized_diagnoses(diagnosis_list)
+        if diagnoses:
             vector_candidates = await self._search_vector_guidelines(
-                diagnosis=first_diag,
+                diagnoses=diagnoses,
                 drugs=drugs,
                 top_k=3,
             )
@@ -682,13 +686,13 @@ frequency 종류: daily, weekly, 3_per_week, every_other_day, monthly, as_needed
         if guideline_candidates:
             return guideline_candidates
 
-        first_diag = self._normalize_diagnosis_text(diagnosis_list[0] if diagnosis_list else None)
+        diagnoses = self._normalized_diagnoses(diagnosis_list)
         normalized_clinical_note = (
             clinical_note.strip() if isinstance(clinical_note, str) and clinical_note.strip() else None
         )
-        if first_diag or normalized_clinical_note:
+        if diagnoses or normalized_clinical_note:
             vector_candidates = await self._search_vector_guidelines(
-                diagnosis=first_diag,
+                diagnoses=diagnoses,
                 drugs=[],
                 clinical_note=normalized_clinical_note,
                 top_k=3,
@@ -10,7 +10,7 @@ from __future__ import annotations
 import logging
 import re
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, TypeVar, cast
 
 from fastapi import HTTPException, UploadFile
 from starlette import status
@@ -30,20 +30,37 @@ from app.integrations.ocr.exceptions import (
 from app.integrations.ocr.naver_ocr_client import NaverOCRClient
 from app.integrations.ocr.openai_client import ai_postprocess
 from app.integrations.ocr.parser import parse_ocr_result
-from app.models.diseases import Disease, DiseaseCodeMapping
+from app.models.diseases import Disease
 from app.models.drugs import Drug
 from app.models.prescriptions import Prescription
+from app.repositories.disease_repository import DiseaseRepository
+from app.repositories.drug_alias_repository import DrugAliasRepository, lookup_drug_alias
+from app.repositories.drug_name_index import (
+    DrugNameEntry,
+    DrugNameIndex,
+    extract_dosage_number,
+    get_drug_name_index,
+    normalize_drug_name,
+    parse_drug_base_and_form,
+)
+from app.repositories.drug_repository import HYBRID_CANDIDATES, DrugRepository
+from app.repositories.drug_vector_index import get_drug_vector_index
 from app.repositories.scan_repository import ScanRepository
-from app.repositories.vector_document_repository import VectorDocumentRepository
-from app.services.embedding import encode
+from app.services.embedding import encode_batch
 from app.services.health import HealthService
 from app.services.medication import MedicationService
 from app.services.recommendations import RecommendationService
 from app.utils.datetime import DateTimeError, parse_date_yyyy_mm_dd
 from app.utils.files import save_user_upload_file
+from app.utils.master_data import publish_master_data_change
 
 logger = logging.getLogger(__name__)
 
+_DRUG_TRGM_MIN_SIMILARITY = 0.35
+_DRUG_VECTOR_MAX_DISTANCE = 0.35
+
+_DrugCandidate = TypeVar("_DrugCandidate", Drug, DrugNameEntry)
+
 
 class ScanAnalysisService:
     """스캔 업로드/분석/수정/저장을 담당하는 서비스."""
@@ -54,7 +71,9 @@ class ScanAnalysisService:
         self.health_service = HealthService()
         self.ocr_client = NaverOCRClient()
         self.recommendation_service = RecommendationService()
-        self.vector_repo = VectorDocumentRepository()
+        self.drug_repo = DrugRepository()
+        self.drug_alias_repo = DrugAliasRepository()
+        self.disease_repo = DiseaseRepository()
 
     def _normalize_document_type(self, document_type: str | None) -> str:
         """입력값을 prescription 또는 medical_record로 정규화한다."""
@@ -199,18 +218,23 @@ class ScanAnalysisService:
     async def _correct_drug_names(self, drugs: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """AI 결과의 약품명을 DB 매칭으로 보정한다 (done 상태 저장 전).
 
-        EDI코드 우선 → 이름 매칭 순으로 시도한다.
+        스캔의 약품 전체를 _resolve_drugs로 한꺼번에 매칭하고, 매칭된 약품은 이름을 DB 이름으로 바꾸고
+        drug_id를 기록해 둔다 (저장 시 다시 매칭하지 않음). 매칭 실패 약품은 그대로 두며 새로 만들지 않는다.
+        OCR 원문 약품명은 ocr_name에 남겨 저장 시 별칭 학습에 쓴다.
         """
-        for drug_entry in drugs:
-            name = (drug_entry.get("name") or "").strip()
-            if not name:
-                continue
-            try:
-                drug_obj = await self._match_drug(drug_entry, name)
+        entries = self._collect_drug_entries(drugs)
+        for drug_entry, name in entries:
+            drug_entry.setdefault("ocr_name", name)
+        try:
+            resolved = await self._resolve_drugs(entries)
+        except Exception:
+            logger.warning("drug name correction failed (ignored)", exc_info=True)
+            return drugs
+        for (drug_entry, _name), drug_obj in zip(entries, resolved, strict=True):
+            if drug_obj is not None:
+                drug_entry["drug_id"] = drug_obj.id
                 if drug_obj.name:
                     drug_entry["name"] = drug_obj.name
-            except Exception:
-                pass
         return drugs
 
     async def prepare_analysis(self, user: Any, scan_id: int) -> dict[str, Any]:
@@ -343,9 +367,31 @@ class ScanAnalysisService:
         if data.clinical_note is not None:
             update_fields["clinical_note"] = data.clinical_note
         if data.drugs is not None:
-            update_fields["drugs"] = [d.model_dump(exclude_none=True) for d in data.drugs]
+            # drug_id는 서버가 매칭 결과로만 채운다 (클라이언트 값은 버리고 _carry_over_drug_ids로 복원)
+            update_fields["drugs"] = [d.model_dump(exclude_none=True, exclude={"drug_id"}) for d in data.drugs]
         return update_fields
 
+    @staticmethod
+    def _carry_over_drug_ids(previous: list[Any], edited: list[dict[str, Any]]) -> None:
+        """수정 요청 항목에 서버가 기록한 값(drug_id, ocr_name)을 이어 붙인다.
+
+        - drug_id: 수정 전과 이름이 같은 약품만 유지한다 (이름이 바뀐 약품은 저장 시 다시 매칭).
+        - ocr_name: 수정 전 스캔에 있던 OCR 원문만 허용한다 (없으면 같은 이름 항목의 값을 유지).
+        """
+        prev_entries = [d for d in previous if isinstance(d, dict)]
+        known_ids = {(d.get("name") or "").strip(): d["drug_id"] for d in prev_entries if d.get("drug_id") is not None}
+        known_ocr = {(d.get("name") or "").strip(): d["ocr_name"] for d in prev_entries if d.get("ocr_name")}
+        allowed_ocr = set(known_ocr.values())
+        for drug_entry in edited:
+            name = (drug_entry.get("name") or "").strip()
+            drug_id = known_ids.get(name)
+            if drug_id is not None:
+                drug_entry["drug_id"] = drug_id
+            if drug_entry.get("ocr_name") not in allowed_ocr:
+                drug_entry.pop("ocr_name", None)
+                if name in known_ocr:
+                    drug_entry["ocr_name"] = known_ocr[name]
+
     async def update_result(
         self,
         user: Any,
@@ -359,6 +405,8 @@ class ScanAnalysisService:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="scan not found.")
 
             update_fields = self._build_update_fields(data)
+            if "drugs" in update_fields:
+                self._carry_over_drug_ids(cur.get("drugs") or [], update_fields["drugs"])
             if update_fields:
                 update_fields["status"] = "updated"
                 await self.scan_repo.update(user.id, scan_id, **update_fields)
@@ -375,43 +423,40 @@ class ScanAnalysisService:
             logger.exception("update_result failed")
             raise HTTPException(status_code=500, detail="서버 내부 오류가 발생했습니다.") from e
 
-    async def _resolve_disease(self, diag: str) -> Disease | None:
-        """진단 문자열에서 Disease 객체를 조회하거나 생성한다."""
-        diag_name = diag.strip()
-        if not diag_name:
-            return None
-        m = re.match(r"^([A-Za-z]\d{2,5})\s+(.*)", diag_name)
+    @staticmethod
+    def _parse_diagnosis(diag: str) -> tuple[str | None, str | None]:
+        """진단 문자열을 (대문자 KCD 코드, 질환명)으로 분리한다. 코드만 있으면 질환명은 None."""
+        m = re.match(r"^([A-Za-z]\d{2,5})\s+(.*)", diag)
         if m:
-            kcd_code = m.group(1).upper()
-            name = m.group(2).strip()
-        else:
-            kcd_code = diag_name.upper() if re.match(r"^[A-Za-z]\d{2,5}$", diag_name) else None
-            if kcd_code:
-                mapping = await DiseaseCodeMapping.get_or_none(code=kcd_code)
-                name = mapping.name if mapping else kcd_code
-            else:
-                name = diag_name
-        if kcd_code:
-            disease_obj = await Disease.get_or_none(kcd_code=kcd_code)
-        else:
-            disease_obj = await Disease.get_or_none(name=name)
-        return disease_obj or await Disease.create(name=name, kcd_code=kcd_code)
-
-    async def _match_by_edi(self, edi_code: str) -> Drug | None:
-        """EDI 코드로 약품을 매칭한다."""
-        for flt in (
-            {"edi_code__contains": f",{edi_code},"},
-            {"edi_code__startswith": f"{edi_code},"},
-            {"edi_code__endswith": f",{edi_code}"},
-            {"edi_code": edi_code},
-        ):
-            drug_obj = await Drug.filter(**flt).first()
-            if drug_obj:
-                return drug_obj
-        return None
+            return m.group(1).upper(), m.group(2).strip()
+        if re.match(r"^[A-Za-z]\d{2,5}$", diag):
+            return diag.upper(), None
+        return None, diag
+
+    async def _resolve_diseases(self, diagnosis_list: list[str]) -> list[Disease | None]:
+        """진단 문자열 목록을 Disease 목록으로 일괄 조회/생성한다 (빈 진단은 None).
+
+        코드만 있는 진단은 매핑 테이블의 한글명을 이름으로 쓰며, 조회/생성은 DiseaseRepository에서 한 번에 처리한다.
+        """
+        parsed = [self._parse_diagnosis(diag.strip()) if diag.strip() else None for diag in diagnosis_list]
+        code_only = [p[0] for p in parsed if p and p[0] and p[1] is None]
+        code_names = await self.disease_repo.get_code_names(code_only) if code_only else {}
+
+        entries: list[tuple[str | None, str]] = []
+        for p in parsed:
+            if p is None:
+                continue
+            code, name = p
+            entries.append((code, name if name is not None else code_names.get(code or "", code or "")))
+        diseases = iter(await self.disease_repo.get_or_create_many(entries))
+        return [next(diseases) if p is not None else None for p in parsed]
 
     async def _match_by_name(self, drug_name: str) -> Drug | None:
-        """이름 기반으로 약품을 매칭한다 (정확 → 기본명 → 퍼지)."""
+        """이름 포함 검색으로 약품을 매칭한다 (정확 → 기본명). 퍼지 매칭은 _search_drugs_hybrid가 담당한다."""
+        index = get_drug_name_index()
+        if index is not None:
+            return await self._load_entry(self._pick_from_name_index(index, drug_name))
+
         candidates = await Drug.filter(name__icontains=drug_name).order_by("name").limit(20)
         if candidates:
             return candidates[0] if len(candidates) == 1 else self._pick_best_candidate(drug_name, candidates)
@@ -421,41 +466,185 @@ class ScanAnalysisService:
             candidates = await Drug.filter(name__icontains=base).order_by("name").limit(20)
             if candidates:
                 return candidates[0] if len(candidates) == 1 else self._pick_best_candidate(drug_name, candidates)
+        return None
+
+    @classmethod
+    def _pick_from_name_index(cls, index: DrugNameIndex, drug_name: str) -> DrugNameEntry | None:
+        """이름 인덱스에서 _match_by_name과 같은 규칙(정확 → 기본명 포함)으로 후보를 고른다."""
+        candidates = index.contains(drug_name)
+        if not candidates:
+            base, _ = cls._parse_drug_base_and_form(drug_name)
+            if base and base != drug_name:
+                candidates = index.contains(base)
+        return cls._pick_best_candidate(drug_name, candidates) if candidates else None
+
+    async def _match_by_names(self, drug_names: list[str]) -> list[Drug | None]:
+        """여러 약품명을 이름 포함 검색으로 매칭한다. 이름 인덱스가 있으면 인메모리 선택 후 PK 조회 1번."""
+        index = get_drug_name_index()
+        if index is None:
+            return [await self._match_by_name(name) for name in drug_names]
+        return await self._load_entries([self._pick_from_name_index(index, name) for name in drug_names])
+
+    @staticmethod
+    async def _load_entry(entry: DrugNameEntry | None) -> Drug | None:
+        """이름 인덱스 항목의 Drug를 PK로 조회한다 (인덱스 빌드 이후 삭제된 약품이면 None)."""
+        return await Drug.get_or_none(id=entry.id) if entry is not None else None
 
-        return await self._fuzzy_match_drug_by_name(drug_name)
+    @staticmethod
+    async def _load_entries(entries: list[DrugNameEntry | None]) -> list[Drug | None]:
+        """이름 인덱스 항목들의 Drug를 PK 조회 1번으로 가져온다 (entries와 같은 순서, 없으면 None)."""
+        by_id = cast(dict[int, Drug], await Drug.in_bulk([entry.id for entry in entries if entry is not None], "id"))
+        return [by_id.get(entry.id) if entry is not None else None for entry in entries]
+
+    async def _resolve_drugs(self, entries: list[tuple[dict[str, Any], str]]) -> list[Drug | None]:
+        """스캔의 약품 전체를 한꺼번에 매칭한다 (새 약품은 만들지 않음, 실패 시 None).
+
+        단계마다 아직 매칭되지 않은 약품만 모아 일괄 처리한다.
+            1) drug_entry에 기록된 drug_id (분석 단계 매칭 결과) → PK 조회 1번
+            2) EDI 코드 → drug_edi_codes 조회 1번
+            3) 사용자 확정 OCR 별칭 → 인메모리 해시 맵 + PK 조회 1번 (이름이 OCR 원문 그대로인 항목만)
+            4) 이름 포함 검색 → 이름 인덱스 + PK 조회 1번 (인덱스 미로드 시 약품별 DB 검색)
+            5) 점진적 접두 검색 → 이름 인덱스 + PK 조회 1번, 이후 trigram/벡터 하이브리드 → 임베딩 1번 + 검색 쿼리 1번
+        같은 (EDI, 약품명) 항목은 한 번만 매칭한다.
+
+        Args:
+            entries (list[tuple[dict[str, Any], str]]): (drug_entry, 약품명) 목록.
+
+        Returns:
+            list[Drug | None]: entries와 같은 순서의 매칭 결과.
+        """
+        keys = [((drug_entry.get("edi_code") or "").strip(), drug_name) for drug_entry, drug_name in entries]
+        resolved: dict[tuple[str, str], Drug | None] = dict.fromkeys(keys)
 
-    async def _match_drug(self, drug_entry: dict[str, Any], drug_name: str) -> Drug:
-        """EDI코드 → 이름 매칭 → 벡터 유사도 → get_or_create 순으로 매칭."""
-        edi_code = (drug_entry.get("edi_code") or "").strip()
-        if edi_code:
-            drug_obj = await self._match_by_edi(edi_code)
-            if drug_obj:
-                return drug_obj
+        await self._resolve_by_ids(
+            resolved,
+            {key: drug_entry.get("drug_id") for (drug_entry, _), key in zip(entries, keys, strict=True)},
+        )
 
-        drug_obj = await self._match_by_name(drug_name)
-        if drug_obj:
-            return drug_obj
+        pending = [key for key, drug_obj in resolved.items() if drug_obj is None and key[0]]
+        if pending:
+            by_edi = await self.drug_repo.get_by_edi_codes([edi_code for edi_code, _ in pending])
+            for key in pending:
+                resolved[key] = by_edi.get(key[0])
+
+        # 사용자가 이름을 고친 항목은 OCR 원문 별칭 대신 고친 이름으로 매칭한다
+        unedited = {
+            key
+            for (drug_entry, _), key in zip(entries, keys, strict=True)
+            if not self._is_user_edited(drug_entry, key[1])
+        }
+        await self._resolve_by_ids(
+            resolved,
+            {
+                key: lookup_drug_alias(key[1])
+                for key, drug_obj in resolved.items()
+                if drug_obj is None and key in unedited
+            },
+        )
 
-        query_vector = encode(drug_name)
-        similar = await self.vector_repo.search_similar(query_vector, reference_type="drug", top_k=1)
-        _drug_similarity_threshold = 0.35
-        if similar and getattr(similar[0], "_distance", 1.0) <= _drug_similarity_threshold:
-            drug_obj = await Drug.get_or_none(id=similar[0].reference_id)
-            if drug_obj:
-                return drug_obj
+        pending = [key for key, drug_obj in resolved.items() if drug_obj is None]
+        if pending:
+            for key, drug_obj in zip(pending, await self._match_by_names([name for _, name in pending]), strict=True):
+                resolved[key] = drug_obj
 
-        drug_obj, _ = await Drug.get_or_create(name=drug_name)
-        return drug_obj
+        pending = [key for key, drug_obj in resolved.items() if drug_obj is None]
+        if pending:
+            found = await self._search_drugs_hybrid([name for _, name in pending])
+            for key, drug_obj in zip(pending, found, strict=True):
+                resolved[key] = drug_obj
+
+        return [resolved[key] for key in keys]
+
+    @staticmethod
+    async def _resolve_by_ids(resolved: dict[Any, Drug | None], drug_ids: dict[Any, Any]) -> None:
+        """키별 drug_id(정수가 아니면 무시)를 PK 조회 1번으로 Drug로 바꿔 resolved에 채운다."""
+        drug_ids = {key: drug_id for key, drug_id in drug_ids.items() if isinstance(drug_id, int)}
+        if not drug_ids:
+            return
+        by_id = await Drug.in_bulk(set(drug_ids.values()), "id")
+        for key, drug_id in drug_ids.items():
+            resolved[key] = by_id.get(drug_id)
+
+    async def _match_drugs(self, entries: list[tuple[dict[str, Any], str]]) -> list[Drug]:
+        """여러 약품을 한꺼번에 매칭하고, 매칭되지 않은 약품은 새로 만든다.
+
+        매칭 결과의 drug_id를 drug_entry에 기록한다.
+
+        Args:
+            entries (list[tuple[dict[str, Any], str]]): (drug_entry, 약품명) 목록.
+
+        Returns:
+            list[Drug]: entries와 같은 순서의 매칭된(또는 새로 생성된) Drug 목록.
+        """
+        resolved = await self._resolve_drugs(entries)
+
+        result: list[Drug] = []
+        for (drug_entry, drug_name), drug_obj in zip(entries, resolved, strict=True):
+            if drug_obj is None:
+                drug_obj, created = await Drug.get_or_create(name=drug_name)
+                index = get_drug_name_index()
+                if created and index is not None:
+                    index.add(drug_obj.id, drug_obj.name)
+            drug_entry["drug_id"] = drug_obj.id
+            result.append(drug_obj)
+        return result
+
+    async def _search_drugs_hybrid(self, drug_names: list[str]) -> list[Drug | None]:
+        """약품명별 trigram + 벡터 RRF 후보 중 임계값을 넘는 약품을 고른다 (없으면 None).
+
+        이름 인덱스가 로드되어 있으면 기존 퍼지 매칭 순서(점진적 접두 → trigram → 벡터)대로
+        인덱스의 접두 검색(prefix_match)을 먼저 하고, 찾지 못한 약품명만 DB에서 검색한다.
+        나머지는 임베딩 1번 + 하이브리드 검색 쿼리 1번(search_hybrid_many)으로 처리한다.
+        trigram 유사도 또는 벡터 거리 중 하나라도 임계값을 만족한 후보만 채택하며,
+        채택 후보가 여럿이면 RRF 순서를 유지한 채 함량이 일치하는 약품을 우선한다.
+        DB가 하이브리드 검색을 지원하지 않으면(테스트용 SQLite) 기존 prefix/trigram 퍼지 매칭으로 대신한다.
+        """
+        if not self.drug_repo.supports_hybrid_search():
+            return [await self._fuzzy_match_drug_by_name(name) for name in drug_names]
+
+        results: list[Drug | None] = [None] * len(drug_names)
+        index = get_drug_name_index()
+        if index is not None:
+            results = await self._load_entries([index.prefix_match(name) for name in drug_names])
+        pending = [i for i, drug_obj in enumerate(results) if drug_obj is None]
+        if not pending:
+            return results
+        names = [drug_names[i] for i in pending]
+
+        query_vectors = await encode_batch(names)
+        drug_index = get_drug_vector_index()
+        vector_hits = (
+            await drug_index.search_drug_context_many(query_vectors, top_k=HYBRID_CANDIDATES)
+            if drug_index is not None
+            else None
+        )
+        candidate_lists = await self.drug_repo.search_hybrid_many(
+            names, query_vectors, limit=5, vector_hits=vector_hits
+        )
+        accepted_ids = [
+            [
+                c.drug_id
+                for c in candidates
+                if (c.lexical_score is not None and c.lexical_score >= _DRUG_TRGM_MIN_SIMILARITY)
+                or (c.vector_distance is not None and c.vector_distance <= _DRUG_VECTOR_MAX_DISTANCE)
+            ]
+            for candidates in candidate_lists
+        ]
+
+        by_id = cast(dict[int, Drug], await Drug.in_bulk([drug_id for ids in accepted_ids for drug_id in ids], "id"))
+        for i, name, ids in zip(pending, names, accepted_ids, strict=True):
+            drugs = [by_id[drug_id] for drug_id in ids if drug_id in by_id]
+            results[i] = self._pick_best_candidate(name, drugs) if drugs else None
+        return results
 
     @staticmethod
     def _extract_dosage_number(name: str) -> str | None:
         """약품명에서 함량 숫자를 추출한다. 예: '노바스크정5mg' → '5', '2.5/1000' → '2.5/1000'"""
-        m = re.search(r"([\d.]+(?:/[\d.]+)?)", name)
-        return m.group(1) if m else None
+        return extract_dosage_number(name)
 
     @staticmethod
-    def _pick_best_candidate(drug_name: str, candidates: list[Drug]) -> Drug:
-        """여러 DB 후보 중 약품명의 함량과 가장 일치하는 것을 선택한다."""
+    def _pick_best_candidate(drug_name: str, candidates: list[_DrugCandidate]) -> _DrugCandidate:
+        """여러 후보(Drug 또는 이름 인덱스 항목) 중 약품명의 함량과 가장 일치하는 것을 선택한다."""
         query_dosage = ScanAnalysisService._extract_dosage_number(drug_name)
         if not query_dosage:
             return candidates[0]
@@ -471,14 +660,7 @@ class ScanAnalysisService:
 
     @staticmethod
     def _parse_drug_base_and_form(drug_name: str) -> tuple[str, str | None]:
-        form_re = re.compile(
-            r"[\d.]+\s*(%|mg|ml|g|mcg|밀리그램|그램)?"
-            r"|\(.*?\)"
-            r"|(점안액|점안|정|캡슐|시럽|액|주사|산|현탁액|크림|겔|패취|연질캡슐)"
-        )
-        base = form_re.sub("", drug_name).strip()
-        form_match = re.search(r"(점안액|점안|캡슐|시럽|현탁액|크림|겔|패취|연질캡슐|정|액|주사|산)", drug_name)
-        return base, form_match.group(1) if form_match else None
+        return parse_drug_base_and_form(drug_name)
 
     @staticmethod
     async def _prefix_search_drug(base: str, form_kw: str | None, original_name: str = "") -> Drug | None:
@@ -506,32 +688,33 @@ class ScanAnalysisService:
 
     @staticmethod
     async def _trgm_drug_fallback(drug_name: str) -> Drug | None:
-        from tortoise import connections
-
-        try:
-            conn = connections.get("default")
-            rows = await conn.execute_query_dict(
-                "SELECT id, name, similarity(split_part(name, '(', 1), $1) AS sim "
-                "FROM drugs "
-                "WHERE similarity(split_part(name, '(', 1), $1) > 0.35 "
-                "ORDER BY sim DESC LIMIT 1",
-                [drug_name],
-            )
-            if rows:
-                return await Drug.get_or_none(id=rows[0]["id"])
-        except Exception:
-            pass
-        return None
+        drugs = await DrugRepository().search_by_similarity(drug_name, limit=1, threshold=_DRUG_TRGM_MIN_SIMILARITY)
+        return drugs[0] if drugs else None
 
     @staticmethod
     async def _fuzzy_match_drug_by_name(drug_name: str) -> Drug | None:
-        """약품명에서 제형 접미사를 제거하고 점진적 prefix + pg_trgm 유사도로 DB 매칭."""
+        """약품명에서 제형 접미사를 제거하고 점진적 prefix + 이름 유사도로 매칭 (이름 인덱스 미로드 시 DB)."""
+        index = get_drug_name_index()
+        if index is not None:
+            return await ScanAnalysisService._load_entry(index.fuzzy_match(drug_name))
         base, form_kw = ScanAnalysisService._parse_drug_base_and_form(drug_name)
         if len(base) < 2:
             return None
         result = await ScanAnalysisService._prefix_search_drug(base, form_kw, drug_name)
         return result or await ScanAnalysisService._trgm_drug_fallback(drug_name)
 
+    @staticmethod
+    def _collect_drug_entries(drugs_data: list[Any]) -> list[tuple[dict[str, Any], str]]:
+        """drugs_data에서 이름이 있는 약품만 (drug_entry, 약품명) 목록으로 추린다."""
+        entries: list[tuple[dict[str, Any], str]] = []
+        for drug_entry in drugs_data:
+            if isinstance(drug_entry, str):
+                drug_entry = {"name": drug_entry}
+            drug_name = (drug_entry.get("name") or "").strip()
+            if drug_name:
+                entries.append((drug_entry, drug_name))
+        return entries
+
     async def _create_prescriptions(
         self,
         user: Any,
@@ -545,9 +728,7 @@ class ScanAnalysisService:
         동일 사용자/동일 약물/동일 날짜/동일 질환 조합이 있으면 중복으로 간주하여 스킵한다.
         DB 매칭된 약품명으로 drug_entry를 보정하여 스캔 결과에도 반영한다.
         """
-        disease_objects: list[Disease | None] = []
-        for diag in diagnosis_list:
-            disease_objects.append(await self._resolve_disease(diag))
+        disease_objects = await self._resolve_diseases(diagnosis_list)
 
         if not disease_objects:
             disease_objects = [None]
@@ -558,13 +739,11 @@ class ScanAnalysisService:
 
         start = parse_date_yyyy_mm_dd(doc_date)
 
-        for drug_entry in drugs_data:
-            if isinstance(drug_entry, str):
-                drug_entry = {"name": drug_entry}
-            drug_name = (drug_entry.get("name") or "").strip()
-            if not drug_name:
-                continue
+        entries = self._collect_drug_entries(drugs_data)
+        # 약품 매칭을 한꺼번에 처리 (벡터 fallback은 임베딩·검색 각 1회)
+        drug_objects = await self._match_drugs(entries)
 
+        for (drug_entry, drug_name), drug_obj in zip(entries, drug_objects, strict=True):
             dose_count = drug_entry.get("dose_count") or 1
             dose_days = drug_entry.get("dose_days")
             dose_amount = drug_entry.get("dose_amount") or "1"
@@ -573,8 +752,6 @@ class ScanAnalysisService:
 
             end = start + timedelta(days=(dose_days - 1)) if dose_days and dose_days > 0 else start
 
-            drug_obj = await self._match_drug(drug_entry, drug_name)
-
             # DB 매칭 성공 시 약품명을 DB 이름으로 보정
             if drug_obj.name and drug_obj.name != drug_name:
                 drug_entry["name"] = drug_obj.name
@@ -639,6 +816,48 @@ class ScanAnalysisService:
         )
         return created, skipped, dupes, drugs_data
 
+    @staticmethod
+    def _is_user_edited(drug_entry: dict[str, Any], drug_name: str) -> bool:
+        """OCR 원문(ocr_name)이 있고 정규화 후 현재 약품명과 다르면 사용자가 이름을 고친 항목으로 본다."""
+        ocr_name = drug_entry.get("ocr_name")
+        return (
+            isinstance(ocr_name, str)
+            and bool(ocr_name)
+            and normalize_drug_name(ocr_name) != normalize_drug_name(drug_name)
+        )
+
+    @classmethod
+    def _user_corrected_drugs(cls, drugs: Any) -> list[dict[str, Any]]:
+        """저장 전 스캔 약품 중 사용자가 이름을 고친 항목(분석 단계 drug_id 없음)만 고른다 (별칭 학습 대상).
+
+        분석 단계에서 자동 매칭된 항목(drug_id 있음)은 사람이 확인한 대응이 아니므로 학습하지 않는다.
+        반환한 dict는 저장 중 drug_id가 채워지는 항목과 같은 객체다.
+        """
+        if not isinstance(drugs, list):
+            return []
+        return [
+            d
+            for d in drugs
+            if isinstance(d, dict)
+            and d.get("drug_id") is None
+            and cls._is_user_edited(d, (d.get("name") or "").strip())
+        ]
+
+    async def _learn_drug_aliases(self, drugs_data: list[dict[str, Any]]) -> None:
+        """사용자가 고친 약품 항목의 (OCR 원문 → 확정 drug_id)를 별칭으로 기록한다. 실패해도 저장에는 영향 없음.
+
+        기록한 변경분만 다른 워커에 보내 각자 인메모리 맵에 반영한다.
+        """
+        pairs = [(d["ocr_name"], d["drug_id"]) for d in drugs_data if isinstance(d.get("drug_id"), int)]
+        if not pairs:
+            return
+        try:
+            changes = await self.drug_alias_repo.record(pairs)
+            if changes:
+                await publish_master_data_change("drug_alias", payload=changes)
+        except Exception:
+            logger.warning("drug alias learning failed (ignored)", exc_info=True)
+
     async def save_result(self, user: Any, scan_id: int) -> dict[str, Any]:
         """스캔 결과를 실제 서비스 데이터로 저장한다."""
         try:
@@ -652,6 +871,8 @@ class ScanAnalysisService:
             created_prescriptions: list[int] = []
             skipped_count = 0
             skipped_duplicates: list[str] = []
+            corrected_drugs: list[dict] = []
+            user_corrected = self._user_corrected_drugs(cur.get("drugs")) if document_type == "prescription" else []
 
             async with in_transaction():
                 if document_type == "prescription":
@@ -666,13 +887,14 @@ class ScanAnalysisService:
                         skipped_duplicates,
                         corrected_drugs,
                     ) = await self._save_prescription_data(user, cur, doc_date)
-                    if corrected_drugs is not None:
-                        await self.scan_repo.update(user.id, scan_id, drugs=corrected_drugs)
+                    await self.scan_repo.update(user.id, scan_id, drugs=corrected_drugs)
                 elif doc_date:
                     await self.health_service.ensure_day_seed(user_id=user.id, date=doc_date)
 
                 await self.scan_repo.update(user.id, scan_id, status="saved")
 
+            await self._learn_drug_aliases(user_corrected)
+
             try:
                 await self.recommendation_service.get_for_scan(user_id=user.id, scan_id=scan_id)
             except Exception:
@@ -0,0 +1,405 @@
+"""벡터 문서 증분 동기화 서비스.
+
+원본 테이블(drugs, disease_guidelines)에서 임베딩 문서 텍스트를 만들고,
+vector_documents에 저장된 content_hash / embedding_model_version과 비교해
+추가·변경된 행만 다시 임베딩한다. 원본에서 사라진 행의 문서는 삭제한다.
+
+- 원본은 id 기준 keyset 페이지로 읽어 메모리 사용량을 제한한다.
+- 재임베딩은 토큰/개수 한도 안에서 배치로 요청하고, 배치마다 한 트랜잭션으로 저장한다.
+  배치는 최대 concurrency개까지 동시에 임베딩하고(저장은 순차), 일시적 오류는 지수 백오프(+jitter)로 재시도한다.
+- 중단 후 다시 실행하면 이미 저장된 배치는 해시가 일치하므로 건너뛴다.
+  on_checkpoint로 "이 id까지 완료" 워터마크를 받아 두면 start_after_id로 원본 읽기부터 건너뛸 수 있다.
+- drug 문서가 바뀌면 변경 알림(kind="drug_vector")을 보내 실행 중인 워커가 약물 벡터 인메모리 인덱스를 점검하게 한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import logging
+import random
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+import tiktoken
+from openai import APIConnectionError, InternalServerError, RateLimitError
+
+from app.integrations.local_embedding.client import LocalEmbeddingError
+from app.models.diseases import DiseaseGuideline
+from app.models.drugs import Drug
+from app.models.vector_documents import VectorDocument
+from app.repositories.vector_document_repository import VectorDocumentRepository
+from app.services.embedding import encode_batch, get_embedding_batcher
+from app.utils.master_data import publish_master_data_change
+
+logger = logging.getLogger(__name__)
+
+SOURCE_PAGE_SIZE = 2000
+MAX_TOKENS_PER_TEXT = 8000  # 8192 한도에서 decode 경계 오차 여유분 확보
+MAX_TOKENS_PER_REQUEST = 250_000  # OpenAI 한도 300,000에서 여유분 확보
+DEFAULT_CONCURRENCY = 4
+MAX_RETRIES = 5
+RETRY_BASE_DELAY = 2.0
+# 재시도할 일시적 오류 (429, 네트워크/타임아웃, 5xx)
+_RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, InternalServerError, LocalEmbeddingError)
+
+
+@functools.cache
+def _get_tokenizer() -> tiktoken.Encoding:
+    return tiktoken.get_encoding("cl100k_base")  # text-embedding-3-small 인코딩
+
+
+@dataclass(slots=True)
+class SyncStats:
+    """reference_type 1건의 동기화 결과."""
+
+    reference_type: str
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class _PendingDocument:
+    reference_id: int
+    content: str
+    content_hash: str
+    tokens: int
+    doc_id: int | None  # 갱신 대상 기존 문서 id (신규면 None)
+
+
+def content_hash(content: str) -> str:
+    """
+    문서 텍스트의 sha256 해시를 반환한다 (마이그레이션 backfill과 같은 방식).
+
+    Args:
+        content (str): 문서 텍스트
+
+    Returns:
+        str: 64자리 hex 문자열
+    """
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _truncate(text: str) -> tuple[str, int]:
+    """8000 토큰을 넘으면 잘라내고, (텍스트, 토큰 수 상한)을 반환한다.
+
+    토큰 수는 UTF-8 바이트 수를 넘지 않으므로, 바이트 수가 한도 이하인 대부분의 텍스트는
+    토큰화 없이 바이트 수를 배치 예산 계산용 상한으로 쓴다.
+    """
+    size = len(text.encode("utf-8"))
+    if size <= MAX_TOKENS_PER_TEXT:
+        return text, size
+    tokenizer = _get_tokenizer()
+    tokens = tokenizer.encode(text)
+    if len(tokens) <= MAX_TOKENS_PER_TEXT:
+        return text, len(tokens)
+    return tokenizer.decode(tokens[:MAX_TOKENS_PER_TEXT]), MAX_TOKENS_PER_TEXT
+
+
+def build_drug_document(drug: Drug) -> str:
+    """
+    약품 임베딩 문서 텍스트를 구성한다 (seed_drug_vectors.py와 같은 형식).
+
+    처방전 OCR 약품명 벡터 매칭에 쓰이므로 약품명만 임베딩한다.
+
+    Args:
+        drug (Drug): 약품
+
+    Returns:
+        str: 임베딩 대상 텍스트
+    """
+    return drug.name.strip()
+
+
+def build_guideline_document(guideline: DiseaseGuideline) -> str:
+    """
+    질병 가이드라인 임베딩 문서 텍스트를 구성한다 (seed_disease_guidelines.py와 같은 형식).
+
+    Args:
+        guideline (DiseaseGuideline): disease가 select_related된 가이드라인
+
+    Returns:
+        str: 임베딩 대상 텍스트
+    """
+    return (
+        f"질병명: {guideline.disease.name}\n"
+        f"질병코드(KCD): {guideline.disease.kcd_code or '없음'}\n"
+        f"카테고리: {guideline.category}\n"
+        f"내용: {guideline.content}"
+    )
+
+
+async def _iter_drug_documents(page_size: int, after_id: int = 0) -> AsyncIterator[list[tuple[int, str]]]:
+    last_id = after_id
+    while True:
+        page = await Drug.filter(id__gt=last_id).order_by("id").limit(page_size)
+        if not page:
+            return
+        yield [(drug.id, build_drug_document(drug)) for drug in page if drug.name.strip()]
+        last_id = page[-1].id
+
+
+async def _iter_guideline_documents(page_size: int, after_id: int = 0) -> AsyncIterator[list[tuple[int, str]]]:
+    last_id = after_id
+    while True:
+        page = await DiseaseGuideline.filter(id__gt=last_id).order_by("id").limit(page_size).select_related("disease")
+        if not page:
+            return
+        yield [(g.id, build_guideline_document(g)) for g in page if g.content.strip()]
+        last_id = page[-1].id
+
+
+SOURCES: dict[str, Callable[[int, int], AsyncIterator[list[tuple[int, str]]]]] = {
+    "drug": _iter_drug_documents,
+    "disease_guideline": _iter_guideline_documents,
+}
+
+
+async def _encode_with_retry(texts: list[str], encoder: Callable[[list[str]], Awaitable[list[list[float]]]]):
+    """일시적 오류 시 지수 백오프(+jitter)로 재시도한다. 동시 배치들이 같은 시점에 몰려 재시도하지 않도록 흩뜨린다."""
+    for attempt in range(MAX_RETRIES):
+        try:
+            return await encoder(texts)
+        except _RETRYABLE_ERRORS as e:
+            if attempt == MAX_RETRIES - 1:
+                raise
+            wait = RETRY_BASE_DELAY * 2**attempt * (0.5 + random.random())  # noqa: S311
+            logger.warning(
+                "임베딩 요청 실패(%s), %.1f초 후 재시도 (%d/%d)", type(e).__name__, wait, attempt + 1, MAX_RETRIES
+            )
+            await asyncio.sleep(wait)
+    raise AssertionError("unreachable")
+
+
+class _BatchPipeline:
+    """
+    배치 작업을 최대 concurrency개까지 동시에 실행한다.
+
+    submit은 실행 슬롯이 빌 때까지 기다리므로(backpressure) 원본을 앞서 과도하게 읽지 않는다.
+    배치는 제출 순서대로 완료 여부를 확인해, 앞선 배치가 모두 끝난 구간까지만 체크포인트를 전진시킨다.
+    """
+
+    def __init__(self, concurrency: int, on_checkpoint: Callable[[int], Awaitable[None]] | None) -> None:
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+        self._in_flight: deque[tuple[asyncio.Task[None], int]] = deque()
+        self._on_checkpoint = on_checkpoint
+
+    async def submit(self, coro: Coroutine[Any, Any, None], checkpoint: int) -> None:
+        try:
+            await self._semaphore.acquire()
+        except BaseException:
+            coro.close()
+            raise
+        task = asyncio.create_task(coro)
+        task.add_done_callback(lambda _: self._semaphore.release())
+        self._in_flight.append((task, checkpoint))
+        await self._advance()
+
+    async def drain(self) -> None:
+        await asyncio.gather(*(task for task, _ in self._in_flight))
+        await self._advance()
+
+    async def cancel(self) -> None:
+        for task, _ in self._in_flight:
+            task.cancel()
+        await asyncio.gather(*(task for task, _ in self._in_flight), return_exceptions=True)
+        self._in_flight.clear()
+
+    async def _advance(self) -> None:
+        while self._in_flight and self._in_flight[0][0].done():
+            task, checkpoint = self._in_flight.popleft()
+            task.result()  # 실패한 배치가 있으면 여기서 예외가 올라간다
+            if self._on_checkpoint is not None:
+                await self._on_checkpoint(checkpoint)
+
+
+class VectorSyncService:
+    """vector_documents를 원본 테이블과 증분 동기화한다."""
+
+    def __init__(
+        self,
+        *,
+        batch_size: int = 256,
+        page_size: int = SOURCE_PAGE_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ):
+        self.vector_repo = VectorDocumentRepository()
+        self.batch_size = batch_size
+        self.page_size = page_size
+        self.concurrency = concurrency
+
+    @property
+    def model_version(self) -> str:
+        return get_embedding_batcher().model
+
+    async def _encode(self, texts: list[str]) -> list[list[float]]:
+        return await encode_batch(texts, use_cache=False)
+
+    async def sync(
+        self,
+        reference_type: str,
+        *,
+        dry_run: bool = False,
+        start_after_id: int = 0,
+        on_checkpoint: Callable[[int], Awaitable[None]] | None = None,
+    ) -> SyncStats:
+        """
+        reference_type 하나를 동기화한다.
+
+        Args:
+            reference_type (str): SOURCES에 등록된 참조 타입
+            dry_run (bool): True면 변경 건수만 집계하고 임베딩/저장하지 않는다.
+            start_after_id (int): 이 id 이하의 원본은 이미 동기화된 것으로 보고 건너뛴다 (체크포인트 재개용).
+            on_checkpoint (Callable[[int], Awaitable[None]] | None): 원본 id 워터마크 콜백.
+                호출된 id 이하의 원본은 모두 저장이 끝난 상태다.
+
+        Returns:
+            SyncStats: 생성/갱신/유지/삭제 건수
+
+        Raises:
+            ValueError: 등록되지 않은 reference_type
+        """
+        if reference_type not in SOURCES:
+            raise ValueError(f"unsupported reference_type: {reference_type}")
+
+        stats = SyncStats(reference_type=reference_type)
+        model_version = self.model_version
+
+        # reference_id -> 기존 문서 상태. 같은 reference_id 문서가 여럿이면 첫 문서만 남기고 나머지는 삭제 대상
+        existing: dict[int, dict] = {}
+        stale_ids: list[int] = []
+        for row in await self.vector_repo.list_sync_state(reference_type):
+            if row["reference_id"] in existing:
+                stale_ids.append(row["id"])
+            else:
+                existing[row["reference_id"]] = row
+
+        pipeline = _BatchPipeline(self.concurrency, on_checkpoint)
+        save_lock = asyncio.Lock()
+        pending: list[_PendingDocument] = []
+        pending_tokens = 0
+        last_id = start_after_id
+        try:
+            async for page in SOURCES[reference_type](self.page_size, start_after_id):
+                for reference_id, raw_content in page:
+                    state = existing.pop(reference_id, None)
+                    document = self._diff(reference_id, raw_content, state, model_version)
+                    if document is not None:
+                        if pending and (
+                            len(pending) >= self.batch_size or pending_tokens + document.tokens > MAX_TOKENS_PER_REQUEST
+                        ):
+                            await pipeline.submit(
+                                self._flush(reference_type, pending, stats, save_lock, dry_run=dry_run), last_id
+                            )
+                            pending, pending_tokens = [], 0
+                        pending.append(document)
+                        pending_tokens += document.tokens
+                    else:
+                        stats.unchanged += 1
+                    last_id = reference_id
+            if pending:
+                await pipeline.submit(self._flush(reference_type, pending, stats, save_lock, dry_run=dry_run), last_id)
+            await pipeline.drain()
+        except BaseException:
+            await pipeline.cancel()
+            raise
+
+        # 원본에서 사라진 행의 문서 + 중복 문서 정리 (재개한 경우 건너뛴 구간은 판단하지 않는다)
+        stale_ids.extend(state["id"] for rid, state in existing.items() if rid > start_after_id)
+        stats.deleted = len(stale_ids) if dry_run else await self.vector_repo.delete_by_ids(stale_ids)
+
+        logger.info(
+            "vector sync %s: created=%d updated=%d unchanged=%d deleted=%d",
+            reference_type,
+            stats.created,
+            stats.updated,
+            stats.unchanged,
+            stats.deleted,
+        )
+        await self._notify_changed(stats, dry_run=dry_run)
+        return stats
+
+    @staticmethod
+    async def _notify_changed(stats: SyncStats, *, dry_run: bool) -> None:
+        """drug 문서가 바뀌었으면 실행 중인 API 워커에 알린다 (약물 벡터 인덱스 export 파일이 오래됐는지 점검)."""
+        if dry_run or stats.reference_type != "drug":
+            return
+        if stats.created or stats.updated or stats.deleted:
+            await publish_master_data_change("drug_vector", payload={"synced_at": datetime.now(UTC).isoformat()})
+
+    @staticmethod
+    def _diff(
+        reference_id: int,
+        raw_content: str,
+        state: dict | None,
+        model_version: str,
+    ) -> _PendingDocument | None:
+        """기존 문서와 비교해 재임베딩이 필요하면 _PendingDocument를, 아니면 None을 반환한다."""
+
+        def is_current(digest: str) -> bool:
+            return (
+                state is not None
+                and state["content_hash"] == digest
+                and state["embedding_model_version"] == model_version
+            )
+
+        # 대부분의 행은 변경이 없으므로 토큰화 전에 원문 해시로 먼저 비교한다
+        if is_current(content_hash(raw_content)):
+            return None
+        content, tokens = _truncate(raw_content)
+        digest = content_hash(content)
+        if content != raw_content and is_current(digest):
+            return None
+        return _PendingDocument(
+            reference_id=reference_id,
+            content=content,
+            content_hash=digest,
+            tokens=tokens,
+            doc_id=state["id"] if state else None,
+        )
+
+    async def _flush(
+        self,
+        reference_type: str,
+        pending: list[_PendingDocument],
+        stats: SyncStats,
+        save_lock: asyncio.Lock,
+        *,
+        dry_run: bool,
+    ) -> None:
+        created_count = sum(1 for doc in pending if doc.doc_id is None)
+        if dry_run:
+            stats.created += created_count
+            stats.updated += len(pending) - created_count
+            return
+
+        embeddings = await _encode_with_retry([doc.content for doc in pending], self._encode)
+        model_version = self.model_version
+        created: list[VectorDocument] = []
+        updated: list[VectorDocument] = []
+        for doc, embedding in zip(pending, embeddings, strict=True):
+            values = {
+                "reference_type": reference_type,
+                "reference_id": doc.reference_id,
+                "content": doc.content,
+                "embedding": embedding,
+                "content_hash": doc.content_hash,
+                "embedding_model_version": model_version,
+            }
+            if doc.doc_id is None:
+                created.append(VectorDocument(**values))
+            else:
+                updated.append(VectorDocument(id=doc.doc_id, **values))
+
+        # 임베딩 요청만 동시에 보내고 저장은 한 번에 하나씩 (트랜잭션이 커넥션/세이브포인트를 다투지 않도록)
+        async with save_lock:
+            await self.vector_repo.save_synced(created=created, updated=updated)
+        stats.created += len(created)
+        stats.updated += len(updated)
+        logger.info("vector sync %s: %d건 재임베딩 저장", reference_type, len(pending))
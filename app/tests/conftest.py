@@ -5,11 +5,12 @@ from typing import Any
 from unittest.mock import Mock, patch
 
 import pytest
-from tortoise import generate_config
+from tortoise import connections, generate_config
 from tortoise.contrib.test import finalizer, initializer
 
 from app.core import config
 from app.db.databases import TORTOISE_APP_MODELS
+from app.db.pgvector import register_vector_codec
 
 TEST_BASE_URL = "http://test"
 TEST_DB_LABEL = "models"
@@ -51,6 +52,9 @@ def get_test_db_config() -> dict[str, Any]:
         testing=True,
     )
     tortoise_config["timezone"] = TEST_DB_TZ
+    if db_url.startswith("postgres"):
+        # 운영 설정과 동일하게 pgvector 바이너리 코덱 등록
+        tortoise_config["connections"][TEST_DB_LABEL]["credentials"]["init"] = register_vector_codec
 
     return tortoise_config
 
@@ -65,10 +69,27 @@ def event_loop():
     loop.close()
 
 
+async def create_postgres_extensions() -> None:
+    """
+    테스트 DB에 trigram 검색용 pg_trgm 확장을 설치한다.
+
+    운영 DB는 aerich 마이그레이션(19, 20)이 설치하지만, 테스트 DB는 generate_schemas로만 만들어진다.
+    """
+    await connections.get(TEST_DB_LABEL).execute_script("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+
+
 @pytest.fixture(scope="session", autouse=True)
 def initialize_db(event_loop) -> Generator[None, None]:
     """TestCase를 위한 DB 초기화"""
     with patch("tortoise.contrib.test.getDBConfig", Mock(return_value=get_test_db_config())):
         initializer(modules=TORTOISE_APP_MODELS)
+        if get_test_db_url().startswith("postgres"):
+            event_loop.run_until_complete(create_postgres_extensions())
         yield
         finalizer()
+
+
+@pytest.fixture(autouse=True)
+def isolate_file_storage(tmp_path, monkeypatch) -> None:
+    """업로드 파일이 ./artifacts 대신 테스트별 임시 디렉토리에 저장되도록 FILE_STORAGE_DIR를 바꾼다."""
+    monkeypatch.setattr(config, "FILE_STORAGE_DIR", str(tmp_path))
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from tortoise.contrib.test import TestCase
+
+from app.models.diseases import Disease, DiseaseCodeMapping, DiseaseGuideline
+from app.repositories import disease_code_index
+from app.repositories.disease_code_index import DiseaseCodeIndex, load_disease_code_index
+from app.repositories.disease_repository import DiseaseRepository
+
+MAPPINGS = [
+    ("E1180", "합병증을 동반하지 않은 2형 당뇨병", "E14", "당뇨병", False),
+    ("E11", "2형 당뇨병", "E14", "당뇨병", False),
+    ("E14", "당뇨병", "E14", "당뇨병", True),
+    ("I10", "본태성 고혈압", "I10", "고혈압", True),
+    ("K2", "위염 분류", "K29", "위염", False),
+]
+
+
+class TestDiseaseCodeIndex:
+    """DiseaseCodeIndex 테스트."""
+
+    def test_exact_and_longest_prefix(self):
+        index = DiseaseCodeIndex.build(MAPPINGS, [])
+        assert index.resolve_anchor("e1180").code == "E1180"
+        assert index.resolve_anchor("E119").code == "E11"
+        assert index.resolve_anchor("I109").mapped_code == "I10"
+        assert index.resolve_anchor("J45") is None
+
+    def test_short_prefix_only_on_exact_match(self):
+        """3자리 미만 prefix로는 줄이지 않고, 정확히 일치할 때만 반환한다 (DB 조회 경로와 같다)."""
+        index = DiseaseCodeIndex.build(MAPPINGS, [])
+        assert index.resolve_anchor("K2").mapped_code == "K29"
+        assert index.resolve_anchor("K21") is None
+
+    def test_anchor_disease_ids_prefer_lowest_id(self):
+        index = DiseaseCodeIndex.build(MAPPINGS, [(9, "E14"), (3, "e14"), (5, "J45"), (7, None)])
+        assert index.anchor_disease_id("E14") == 3
+        assert index.anchor_disease_id("J45") is None
+        assert index.is_anchor_code("i10") and not index.is_anchor_code("E11")
+        assert index.get("E11").name == "2형 당뇨병"
+        assert len(index) == 5
+
+
+class TestDiseaseRepositoryWithIndex(TestCase):
+    """인메모리 KCD 인덱스를 사용하는 DiseaseRepository 테스트."""
+
+    async def test_resolves_without_mapping_queries(self):
+        """인덱스 로드 후에는 매핑/질환 테이블을 조회하지 않고 anchor 가이드라인을 찾는다."""
+        disease = await Disease.create(name="당뇨병", kcd_code="E14")
+        await DiseaseGuideline.create(disease=disease, category="lifestyle", content="식후 걷기")
+        await DiseaseCodeMapping.create(
+            code="E11", name="2형 당뇨병", mapped_code="E14", mapped_name="당뇨병", is_anchor=False
+        )
+        repo = DiseaseRepository()
+
+        with patch.object(disease_code_index, "_index", None):
+            await load_disease_code_index()
+            with (
+                patch.object(DiseaseCodeMapping, "get_or_none", side_effect=AssertionError),
+                patch.object(Disease, "get_or_none", side_effect=AssertionError),
+            ):
+                assert await repo.resolve_anchor_code("E119") == ("E14", "당뇨병")
+                assert await repo.get_code_names(["e11", "Z99"]) == {"E11": "2형 당뇨병"}
+                guidelines = await repo.get_guidelines_by_anchor_code("E14")
+
+        assert [g.content for g in guidelines] == ["식후 걷기"]
+
+    async def test_anchor_disease_created_after_build_falls_back_to_db(self):
+        """인덱스 빌드 이후 생긴 anchor 질환은 DB에서 찾고, 다음 조회부터는 인덱스로 찾는다."""
+        await DiseaseCodeMapping.create(code="I10", name="본태성 고혈압", mapped_code="I10", mapped_name="고혈압")
+        repo = DiseaseRepository()
+
+        with patch.object(disease_code_index, "_index", None):
+            await load_disease_code_index()
+            disease = await Disease.create(name="고혈압", kcd_code="I10")
+            await DiseaseGuideline.create(disease=disease, category="diet", content="저염식")
+
+            guidelines = await repo.get_guidelines_by_anchor_code("I10")
+            with patch.object(Disease, "get_or_none", side_effect=AssertionError):
+                again = await repo.get_guidelines_by_anchor_code("i10")
+
+        assert [g.content for g in guidelines] == [g.content for g in again] == ["저염식"]
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from tortoise.contrib.test import TestCase
+
+from app.models.diseases import Disease
+from app.repositories.disease_repository import DiseaseRepository
+
+
+class TestDiseaseGetOrCreateMany(TestCase):
+    """질환 일괄 조회/생성 테스트."""
+
+    async def test_reuses_existing_and_creates_missing_in_order(self):
+        """기존 질환은 코드/이름으로 재사용하고 없는 질환만 만들며, 입력 순서와 중복을 유지한다."""
+        hypertension = await Disease.create(name="고혈압", kcd_code="I10")
+        headache = await Disease.create(name="두통")
+
+        diseases = await DiseaseRepository().get_or_create_many(
+            [("I10", "본태성 고혈압"), ("E11", "2형 당뇨병"), (None, "두통"), (None, "비염"), ("E11", "당뇨")]
+        )
+
+        assert diseases[0].id == hypertension.id
+        assert diseases[2].id == headache.id
+        assert diseases[1].id == diseases[4].id
+        assert (diseases[1].name, diseases[1].kcd_code) == ("2형 당뇨병", "E11")
+        assert diseases[3].name == "비염" and diseases[3].kcd_code is None
+        assert await Disease.filter(kcd_code="E11").count() == 1
+        assert await Disease.all().count() == 4
+
+    async def test_postgres_upserts_missing_codes_in_one_statement(self):
+        """PostgreSQL에서는 없는 코드 질환을 INSERT ... ON CONFLICT (kcd_code) 한 문장으로 만든다."""
+        conn = MagicMock()
+        conn.capabilities.dialect = "postgres"
+        conn.execute_query_dict = AsyncMock(
+            return_value=[{"id": 41, "name": "2형 당뇨병", "kcd_code": "E11", "description": None}]
+        )
+
+        with patch("app.repositories.disease_repository.connections", MagicMock(get=MagicMock(return_value=conn))):
+            diseases = await DiseaseRepository().get_or_create_many([("E11", "2형 당뇨병")])
+
+        sql, params = conn.execute_query_dict.await_args.args
+        assert "ON CONFLICT (kcd_code)" in sql
+        assert params == [["2형 당뇨병"], ["E11"]]
+        assert [(d.id, d.kcd_code) for d in diseases] == [(41, "E11")]
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from tortoise.contrib.test import TestCase
+
+from app.models.drugs import Drug, DrugAlias
+from app.repositories import drug_alias_repository
+from app.repositories.drug_alias_repository import (
+    DrugAliasRepository,
+    apply_drug_alias_changes,
+    load_drug_aliases,
+    lookup_drug_alias,
+)
+
+
+class TestDrugAliasRepository(TestCase):
+    """OCR 약품명 별칭 기록/조회 테스트."""
+
+    async def test_record_increments_hit_count(self):
+        drug = await Drug.create(name="노바스크정5mg")
+        repo = DrugAliasRepository()
+
+        await repo.record([("노바스그정 5mg", drug.id)])
+        await repo.record([("노바스그정5MG", drug.id)])
+
+        alias = await DrugAlias.get(drug_id=drug.id)
+        assert (alias.alias, alias.hit_count) == ("노바스그정5mg", 2)
+
+    async def test_record_returns_changes_applied_by_other_workers(self):
+        drug = await Drug.create(name="노바스크정5mg")
+        with (
+            patch.object(drug_alias_repository, "_aliases", {}),
+            patch.object(drug_alias_repository.config, "DRUG_ALIAS_MIN_HITS", 1),
+        ):
+            changes = await DrugAliasRepository().record([("노바스그정 5mg", drug.id)])
+        assert changes == [("노바스그정5mg", drug.id, 1)]
+
+        # 다른 워커: JSON 역직렬화된 변경분만 반영 (테이블 재로드 없음)
+        with (
+            patch.object(drug_alias_repository, "_aliases", {}),
+            patch.object(drug_alias_repository.config, "DRUG_ALIAS_MIN_HITS", 1),
+            patch.object(DrugAliasRepository, "load_map", side_effect=AssertionError("full reload")),
+        ):
+            await apply_drug_alias_changes([list(change) for change in changes])
+            assert lookup_drug_alias("노바스그정5mg") == drug.id
+
+    async def test_map_prefers_most_confirmed_drug(self):
+        right = await Drug.create(name="노바스크정5mg")
+        wrong = await Drug.create(name="노바스크정10mg")
+        repo = DrugAliasRepository()
+        await repo.record([("노바스그정", wrong.id)])
+        await repo.record([("노바스그정", right.id)])
+        await repo.record([("노바스그정", right.id)])
+
+        with (
+            patch.object(drug_alias_repository, "_aliases", None),
+            patch.object(drug_alias_repository.config, "DRUG_ALIAS_MIN_HITS", 1),
+        ):
+            await load_drug_aliases()
+            assert lookup_drug_alias("노바스그 정") == right.id
+            assert lookup_drug_alias("처음보는약") is None
+
+    async def test_lookup_respects_min_hits(self):
+        drug = await Drug.create(name="게보린정")
+        with (
+            patch.object(drug_alias_repository, "_aliases", {}),
+            patch.object(drug_alias_repository.config, "DRUG_ALIAS_MIN_HITS", 2),
+        ):
+            await DrugAliasRepository().record([("게보린전", drug.id)])
+            assert lookup_drug_alias("게보린전") is None
+            await DrugAliasRepository().record([("게보린전", drug.id)])
+            assert lookup_drug_alias("게보린전") == drug.id
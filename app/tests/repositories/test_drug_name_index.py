@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from app.repositories.drug_name_index import DrugNameIndex, normalize_drug_name
+
+ROWS = [
+    (1, "타이레놀정500mg(아세트아미노펜)"),
+    (2, "타이레놀정160mg"),
+    (3, "노바스크정5mg(암로디핀베실산염)"),
+    (4, "노바스크정10mg"),
+    (5, "게보린정"),
+    (6, "Lipitor Tab 10mg"),
+]
+
+
+class TestDrugNameIndex:
+    """DrugNameIndex 테스트."""
+
+    def test_normalize_strips_whitespace_and_case(self):
+        assert normalize_drug_name(" Lipitor  Tab ") == "lipitortab"
+
+    def test_startswith_returns_name_order(self):
+        index = DrugNameIndex.build(ROWS)
+        assert [e.id for e in index.startswith("타이레놀")] == [2, 1]
+        assert index.startswith("없는약") == []
+
+    def test_contains_uses_bigram_postings(self):
+        index = DrugNameIndex.build(ROWS)
+        assert [e.id for e in index.contains("스크정")] == [4, 3]
+        assert [e.id for e in index.contains("lipitor tab")] == [6]
+        assert index.contains("스크정정") == []
+
+    def test_entry_metadata(self):
+        entry = DrugNameIndex.build(ROWS).contains("노바스크정5mg")[0]
+        assert (entry.form, entry.dosage) == ("정", "5")
+
+    def test_prefix_search_prefers_matching_dosage(self):
+        index = DrugNameIndex.build(ROWS)
+        assert index.fuzzy_match("노바스크정10mg").id == 4
+        assert index.fuzzy_match("노바스크OD정5mg").id == 3
+
+    def test_similarity_fallback(self):
+        index = DrugNameIndex.build(ROWS)
+        assert index.similar("게보린") is not None
+        assert index.similar("전혀다른이름") is None
+
+    def test_add_keeps_indexes_consistent(self):
+        index = DrugNameIndex.build(ROWS)
+        index.add(7, "타이레놀이알서방정")
+        assert [e.id for e in index.startswith("타이레놀")] == [7, 2, 1]
+        assert [e.id for e in index.contains("이알서방")] == [7]
+
+    def test_incremental_add_matches_full_build(self):
+        added = [(7, "타이레놀이알서방정"), (8, "노바스크정2.5mg"), (9, "게보린")]
+        incremental = DrugNameIndex.build(ROWS)
+        for drug_id, name in added:
+            incremental.add(drug_id, name)
+        rebuilt = DrugNameIndex.build([*ROWS, *added])
+
+        for query in ("타이레놀", "노바스크", "게보", "lipitor"):
+            assert incremental.startswith(query) == rebuilt.startswith(query)
+            assert incremental.contains(query) == rebuilt.contains(query)
+        for query in ("노바스크정2.5mg", "게보린정", "타이레놀이알"):
+            assert incremental.fuzzy_match(query) == rebuilt.fuzzy_match(query)
+            assert incremental.similar(query) == rebuilt.similar(query)
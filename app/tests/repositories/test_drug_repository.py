@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from tortoise.contrib.test import TestCase
+
+from app.models.drugs import Drug, DrugEdiCode
+from app.repositories.drug_repository import DrugRepository, fuse_drug_candidates, split_edi_codes
+from app.repositories.vector_document_repository import VectorSearchHit
+
+
+def _hit(reference_id: int, distance: float) -> VectorSearchHit:
+    return VectorSearchHit(
+        id=reference_id, reference_type="drug", reference_id=reference_id, content="", distance=distance
+    )
+
+
+class TestDrugHybridSearch:
+    """trigram + 벡터 하이브리드 검색 테스트 (pg_trgm/pgvector SQL은 모킹)."""
+
+    async def test_hybrid_runs_single_query(self):
+        """두 신호의 후보 수집과 RRF 결합을 한 번의 쿼리로 실행하고 신호별 점수를 돌려준다."""
+        conn = MagicMock()
+        conn.execute_query_dict = AsyncMock(
+            return_value=[
+                {
+                    "ord": 0,
+                    "drug_id": 7,
+                    "lexical_score": 0.5,
+                    "lexical_rank": 1,
+                    "vector_distance": 0.12,
+                    "vector_rank": 2,
+                    "score": 1 / 61 + 1 / 62,
+                },
+                {
+                    "ord": 0,
+                    "drug_id": 9,
+                    "lexical_score": None,
+                    "lexical_rank": None,
+                    "vector_distance": 0.1,
+                    "vector_rank": 1,
+                    "score": 1 / 61,
+                },
+            ]
+        )
+        with patch("tortoise.connections.get", return_value=conn):
+            candidates = await DrugRepository().search_hybrid(" 노바스크정 ", [0.1, 0.2], limit=5)
+
+        conn.execute_query_dict.assert_awaited_once()
+        sql, params = conn.execute_query_dict.await_args.args
+        assert "FULL OUTER JOIN" in sql
+        assert "reference_type = 'drug'" in sql
+        assert params == ["노바스크정", [0.1, 0.2], 0.2, 30, 60, 5]
+        assert [c.drug_id for c in candidates] == [7, 9]
+        assert candidates[0].lexical_score == 0.5
+        assert candidates[1].lexical_rank is None
+        assert candidates[1].vector_distance == 0.1
+
+    async def test_precomputed_vector_hits_fuse_in_python(self):
+        """메모리 인덱스 결과가 주어지면 trigram 후보만 조회해 같은 방식으로 결합한다."""
+        conn = MagicMock()
+        conn.execute_query_dict = AsyncMock(return_value=[{"ord": 0, "id": 3, "lexical_score": 0.4}])
+        with patch("tortoise.connections.get", return_value=conn):
+            candidates = await DrugRepository().search_hybrid(
+                "노바스크", [0.1], vector_hits=[_hit(5, 0.2), _hit(3, 0.3)]
+            )
+
+        sql, _params = conn.execute_query_dict.await_args.args
+        assert "vector_documents" not in sql
+        assert [c.drug_id for c in candidates] == [3, 5]
+        assert (candidates[0].lexical_rank, candidates[0].vector_rank) == (1, 2)
+
+    async def test_hybrid_many_runs_single_lateral_query(self):
+        """여러 약품명을 VALUES + LATERAL 쿼리 1번으로 검색하고 검색어 순서대로 나눠 돌려준다 (빈 검색어는 제외)."""
+        row = {"lexical_score": None, "lexical_rank": None, "vector_distance": 0.1, "vector_rank": 1, "score": 1 / 61}
+        conn = MagicMock()
+        conn.execute_query_dict = AsyncMock(
+            return_value=[
+                {"ord": 0, "drug_id": 4, **row},
+                {"ord": 1, "drug_id": 8, **row},
+                {"ord": 1, "drug_id": 2, **row},
+            ]
+        )
+        with patch("tortoise.connections.get", return_value=conn):
+            results = await DrugRepository().search_hybrid_many(
+                ["노바스크정", " ", "게보린"], [[0.1], [0.2], [0.3]], limit=5
+            )
+
+        conn.execute_query_dict.assert_awaited_once()
+        sql, params = conn.execute_query_dict.await_args.args
+        assert "CROSS JOIN LATERAL" in sql
+        assert "q.keyword" in sql and "q.query" in sql
+        assert params == ["노바스크정", [0.1], "게보린", [0.3], 0.2, 30, 60, 5]
+        assert [[c.drug_id for c in cands] for cands in results] == [[4], [], [8, 2]]
+
+    async def test_hybrid_many_fuses_precomputed_vector_hits_per_keyword(self):
+        conn = MagicMock()
+        conn.execute_query_dict = AsyncMock(
+            return_value=[{"ord": 0, "id": 3, "lexical_score": 0.4}, {"ord": 1, "id": 6, "lexical_score": 0.5}]
+        )
+        with patch("tortoise.connections.get", return_value=conn):
+            results = await DrugRepository().search_hybrid_many(
+                ["노바스크", "게보린"], [[0.1], [0.2]], vector_hits=[[_hit(5, 0.2)], []]
+            )
+
+        sql, params = conn.execute_query_dict.await_args.args
+        assert "vector_documents" not in sql
+        assert params == ["노바스크", "게보린", 0.2, 30]
+        assert [[c.drug_id for c in cands] for cands in results] == [[3, 5], [6]]
+
+    def test_fuse_keeps_best_vector_rank_per_drug(self):
+        candidates = fuse_drug_candidates([], [_hit(1, 0.1), _hit(1, 0.2), _hit(2, 0.3)], limit=5)
+        assert [(c.drug_id, c.vector_rank, c.vector_distance) for c in candidates] == [(1, 1, 0.1), (2, 2, 0.3)]
+
+    def test_fuse_breaks_ties_by_drug_id_like_sql(self):
+        """같은 거리/같은 RRF 점수는 SQL과 같이 drug_id 오름차순으로 정렬한다."""
+        lexical = [{"id": 9, "lexical_score": 0.5}, {"id": 4, "lexical_score": 0.4}]
+        candidates = fuse_drug_candidates(lexical, [_hit(8, 0.2), _hit(2, 0.2)], limit=5)
+        assert [(c.drug_id, c.vector_rank) for c in candidates] == [(2, 1), (9, None), (4, None), (8, 2)]
+
+
+class TestDrugEdiCodes(TestCase):
+    """drug_edi_codes 동기화/조회 테스트."""
+
+    def test_split_edi_codes(self):
+        assert split_edi_codes(" 648900030, 648900031,,648900030 ") == ["648900030", "648900031"]
+        assert split_edi_codes(None) == []
+
+    async def test_sync_and_batch_lookup(self):
+        """쉼표로 이어진 코드를 1코드 1행으로 풀고, 여러 코드를 한 번에 조회한다."""
+        first = await Drug.create(name="노바스크정5mg", edi_code="648900030,648900031")
+        second = await Drug.create(name="노바스크정10mg", edi_code="648900040,648900030")
+        repo = DrugRepository()
+
+        assert await repo.sync_edi_codes() == (3, 0)
+
+        found = await repo.get_by_edi_codes([" 648900031", "648900040", "000000000"])
+        assert {code: drug.id for code, drug in found.items()} == {"648900031": first.id, "648900040": second.id}
+        assert (await repo.get_by_edi_code("648900030")).id == first.id  # 중복 코드는 작은 id
+
+    async def test_sync_applies_only_changes(self):
+        drug = await Drug.create(name="게보린정", edi_code="111,222")
+        other = await Drug.create(name="판콜에이")
+        repo = DrugRepository()
+        await repo.sync_edi_codes()
+
+        drug.edi_code = "222"
+        await drug.save()
+        other.edi_code = "333"
+        await other.save()
+
+        assert await repo.sync_edi_codes() == (1, 1)
+        assert dict(await DrugEdiCode.all().order_by("edi_code").values_list("edi_code", "drug_id")) == {
+            "222": drug.id,
+            "333": other.id,
+        }
+
+
+class TestDrugSimilaritySearch(TestCase):
+    """trigram 유사도 검색 테스트 (pg_trgm SQL은 모킹)."""
+
+    async def test_uses_index_operator_and_keeps_similarity_order(self):
+        """`%` 연산자로 GIN 인덱스 후보를 찾고 임계값으로 재필터하며, 유사도 순서를 유지한다."""
+        low = await Drug.create(name="노바스크정10mg")
+        high = await Drug.create(name="노바스크정5mg")
+        conn = MagicMock()
+        conn.execute_query_dict = AsyncMock(return_value=[{"id": high.id}, {"id": low.id}])
+
+        with patch("app.repositories.drug_repository.connections", MagicMock(get=MagicMock(return_value=conn))):
+            drugs = await DrugRepository().search_by_similarity("노바스크정", limit=2, threshold=0.4)
+
+        sql, params = conn.execute_query_dict.await_args.args
+        assert "split_part(name, '(', 1) % $1" in sql
+        assert "similarity(split_part(name, '(', 1), $1) > $2" in sql
+        assert params == ["노바스크정", 0.4, 2]
+        assert [d.id for d in drugs] == [high.id, low.id]
+
+
+class TestDrugFirstByNames(TestCase):
+    """검색어별 첫 약품 일괄 조회 테스트."""
+
+    async def test_postgres_runs_single_query(self):
+        """PostgreSQL에서는 이스케이프한 검색어 배열로 1회 조회하고 ord로 검색어에 매핑한다."""
+        drug = await Drug.create(name="타이레놀정500mg")
+        conn = MagicMock()
+        conn.capabilities.dialect = "postgres"
+        conn.execute_query_dict = AsyncMock(return_value=[{"ord": 2, "id": drug.id}])
+
+        with patch("app.repositories.drug_repository.connections", MagicMock(get=MagicMock(return_value=conn))):
+            found = await DrugRepository().first_by_names(["없는약", " 타이레놀 ", "타이레놀", "10%"])
+
+        conn.execute_query_dict.assert_awaited_once()
+        assert conn.execute_query_dict.await_args.args[1] == [["없는약", "타이레놀", "10\\%"]]
+        assert {name: d.id for name, d in found.items()} == {"타이레놀": drug.id}
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pytest
+
+from app.repositories import drug_vector_index
+from app.repositories.drug_vector_index import (
+    IDS_FILE,
+    META_FILE,
+    VECTORS_FILE,
+    DrugVectorIndex,
+    apply_drug_vector_sync,
+    get_drug_vector_index,
+    load_drug_vector_index,
+    reload_drug_vector_index,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_loaded_index(monkeypatch):
+    """모듈 전역 인덱스를 테스트마다 비우고 끝나면 되돌린다 (다른 테스트의 DB 검색 경로에 새지 않도록)."""
+    monkeypatch.setattr(drug_vector_index, "_index", None)
+    monkeypatch.setattr(drug_vector_index, "_directory", None)
+
+
+@pytest.fixture(params=[np.float32, np.float16], ids=["float32", "float16-legacy"])
+def index_dir(tmp_path, request):
+    vectors = np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.6, 0.8, 0.0]], dtype=request.param)
+    np.save(tmp_path / VECTORS_FILE, vectors)
+    np.save(tmp_path / IDS_FILE, np.array([[10, 100], [11, 101], [12, 102]], dtype=np.int64))
+    (tmp_path / META_FILE).write_text(
+        json.dumps({"contents": ["타이레놀정", "게보린정", "판콜에이"]}), encoding="utf-8"
+    )
+    return tmp_path
+
+
+class TestDrugVectorIndex:
+    """DrugVectorIndex 테스트."""
+
+    def test_load_uses_memory_map(self, index_dir):
+        """행렬은 memory-map으로 로드된다."""
+        index = DrugVectorIndex.load(index_dir)
+        assert isinstance(index._vectors, np.memmap)
+        assert len(index) == 3
+        assert index.dimensions == 3
+
+    def test_search_orders_by_cosine_distance(self, index_dir):
+        """쿼리 벡터 크기와 무관하게 코사인 거리 오름차순으로 반환한다."""
+        index = DrugVectorIndex.load(index_dir)
+        result = index.search([0.0, 2.0, 0.0], top_k=2)
+        assert [row for row, _ in result] == [1, 2]
+        assert result[0][1] == pytest.approx(0.0, abs=1e-3)
+        assert result[1][1] == pytest.approx(0.2, abs=1e-3)
+
+    async def test_search_drug_context_matches_repository_interface(self, index_dir):
+        """VectorSearchHit(reference_id, content, distance)로 반환한다."""
+        index = DrugVectorIndex.load(index_dir)
+        docs = await index.search_drug_context([1.0, 0.1, 0.0], top_k=1)
+        assert len(docs) == 1
+        assert docs[0].id == 10
+        assert docs[0].reference_type == "drug"
+        assert docs[0].reference_id == 100
+        assert docs[0].content == "타이레놀정"
+        assert docs[0].distance < 0.01
+        assert docs[0].embedding is None
+
+    async def test_search_many_matches_single_queries(self, index_dir):
+        """여러 질의를 한 번에 검색해도 질의별 결과는 단건 검색과 같고, 영벡터 질의는 빈 목록이다."""
+        index = DrugVectorIndex.load(index_dir)
+        queries = [[0.0, 2.0, 0.0], [0.0, 0.0, 0.0], [1.0, 0.1, 0.0]]
+
+        many = await index.search_drug_context_many(queries, top_k=2)
+
+        assert [[hit.reference_id for hit in hits] for hits in many] == [[101, 102], [], [100, 102]]
+        for hits, query in zip(many, queries, strict=True):
+            single = await index.search_drug_context(query, top_k=2)
+            assert [hit.distance for hit in hits] == pytest.approx([hit.distance for hit in single], abs=1e-6)
+
+    def test_load_failure_returns_none(self, tmp_path):
+        """파일이 없으면 None을 반환해 pgvector 검색으로 대체된다."""
+        assert load_drug_vector_index(tmp_path / "missing") is None
+
+    async def test_reload_picks_up_new_export(self, index_dir):
+        """export 알림으로 다시 읽으면 새 파일의 약품 id로 교체된다."""
+        load_drug_vector_index(index_dir)
+        np.save(index_dir / IDS_FILE, np.array([[20, 200], [21, 201], [22, 202]], dtype=np.int64))
+
+        await reload_drug_vector_index()
+
+        hits = await get_drug_vector_index().search_drug_context([1.0, 0.0, 0.0], top_k=1)
+        assert hits[0].reference_id == 200
+
+    async def test_sync_after_export_unloads_stale_index(self, index_dir):
+        """vector sync 시각보다 오래된 export면 인덱스를 내리고, 재export 후 다시 로드한다."""
+        meta = json.loads((index_dir / META_FILE).read_text(encoding="utf-8"))
+        meta["exported_at"] = "2026-01-01T00:00:00+00:00"
+        (index_dir / META_FILE).write_text(json.dumps(meta), encoding="utf-8")
+        load_drug_vector_index(index_dir)
+
+        await apply_drug_vector_sync({"synced_at": "2025-12-31T00:00:00+00:00"})
+        assert get_drug_vector_index() is not None
+
+        await apply_drug_vector_sync({"synced_at": "2026-01-02T00:00:00+00:00"})
+        assert get_drug_vector_index() is None
+
+        meta["exported_at"] = "2026-01-03T00:00:00+00:00"
+        (index_dir / META_FILE).write_text(json.dumps(meta), encoding="utf-8")
+        await reload_drug_vector_index()
+        assert get_drug_vector_index().exported_at == "2026-01-03T00:00:00+00:00"
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+from tortoise.contrib.test import TestCase
+
+from app.models.diseases import Disease, DiseaseCodeMapping, DiseaseGuideline
+from app.repositories import guideline_bundle
+from app.repositories.disease_repository import DiseaseRepository
+from app.repositories.guideline_bundle import invalidate_guideline_bundles, load_guideline_bundle_version
+from app.services.recommendations import RecommendationService
+
+
+class _FakeRedis:
+    """get/set/incr/publish만 흉내 내는 Redis 대역."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+        self.ttls: dict[str, int | None] = {}
+        self.published: list[tuple[str, str]] = []
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+        self.ttls[key] = ex
+
+    async def incr(self, key):
+        self.store[key] = str(int(self.store.get(key, 0)) + 1)
+        return int(self.store[key])
+
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+
+
+def _patch_redis(redis: _FakeRedis):
+    get_redis = AsyncMock(return_value=redis)
+    return (
+        patch("app.utils.cache.get_redis", get_redis),
+        patch("app.repositories.guideline_bundle.get_redis", get_redis),
+        patch("app.utils.master_data.get_redis", get_redis),
+        patch.object(guideline_bundle, "_version", "0"),
+    )
+
+
+class TestGuidelineBundleCache(TestCase):
+    """가이드라인 묶음 캐시 테스트."""
+
+    async def test_warm_cache_skips_db(self):
+        """캐시가 채워지면 추천 후보와 챗봇 컨텍스트 모두 DB 조회 없이 같은 결과를 돌려준다."""
+        disease = await Disease.create(name="고혈압", kcd_code="I10")
+        await DiseaseGuideline.create(disease=disease, category="lifestyle", content="저염식")
+        await DiseaseGuideline.create(disease=disease, category="followup", content="혈압 측정")
+        await DiseaseCodeMapping.create(
+            code="I109", name="상세불명 고혈압", mapped_code="I10", mapped_name="고혈압", is_anchor=False
+        )
+        redis = _FakeRedis()
+        service = RecommendationService()
+        repo = DiseaseRepository()
+
+        p1, p2, p3, p4 = _patch_redis(redis)
+        with p1, p2, p3, p4:
+            cold = await service._build_guideline_recommendations(diagnosis="고혈압 의증")
+            cold_info = await repo.resolve_disease_info("고혈압")
+            with (
+                patch.object(Disease, "get_or_none", side_effect=AssertionError),
+                patch.object(Disease, "filter", side_effect=AssertionError),
+                patch.object(DiseaseGuideline, "filter", side_effect=AssertionError),
+            ):
+                warm = await service._build_guideline_recommendations(diagnosis="고혈압 의증")
+                warm_info = await repo.resolve_disease_info("고혈압")
+
+        assert [c.content for c in cold] == ["혈압 측정", "저염식"]
+        assert [(c.content, c.guideline_id, c.disease_id) for c in warm] == [
+            (c.content, c.guideline_id, c.disease_id) for c in cold
+        ]
+        assert warm_info == cold_info == ("I10", "고혈압", ["혈압 측정", "저염식"])
+
+    async def test_invalidate_bumps_version(self):
+        """seed 후 버전을 올리면 이전 묶음 대신 새로 조회하고, 다른 워커는 알림으로 새 버전을 읽는다."""
+        disease = await Disease.create(name="당뇨병", kcd_code="E14")
+        redis = _FakeRedis()
+        repo = DiseaseRepository()
+
+        p1, p2, p3, p4 = _patch_redis(redis)
+        with p1, p2, p3, p4:
+            assert (await repo.get_anchor_bundle("E14")).guidelines == ()
+            await DiseaseGuideline.create(disease=disease, category="lifestyle", content="식후 걷기")
+            assert (await repo.get_anchor_bundle("E14")).guidelines == ()
+
+            await invalidate_guideline_bundles()
+            bundle = await repo.get_anchor_bundle("E14")
+            guideline_bundle._version = "0"
+            assert await load_guideline_bundle_version() == "1"
+
+        assert [g.content for g in bundle.guidelines] == ["식후 걷기"]
+        assert redis.published == [("master_data:changed", "disease_guideline")]
+
+    async def test_miss_is_cached_briefly(self):
+        """매칭 실패 묶음은 짧은 TTL로만 저장하고, 매칭된 묶음은 긴 TTL로 저장한다."""
+        from app.utils.cache import TTL_GUIDELINE_BUNDLE, TTL_GUIDELINE_BUNDLE_MISS
+
+        redis = _FakeRedis()
+        repo = DiseaseRepository()
+
+        p1, p2, p3, p4 = _patch_redis(redis)
+        with p1, p2, p3, p4:
+            assert (await repo.match_guideline_bundle("처음보는병")).disease_id is None
+            miss_ttls = set(redis.ttls.values())
+            redis.ttls.clear()
+            await Disease.create(name="처음보는병")
+            redis.store.clear()  # 짧은 TTL 만료
+            assert (await repo.match_guideline_bundle("처음보는병")).disease_id is not None
+
+        assert miss_ttls == {TTL_GUIDELINE_BUNDLE_MISS}
+        assert set(redis.ttls.values()) == {TTL_GUIDELINE_BUNDLE}
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.core import config
+from app.db.databases import hnsw_ef_search
+from app.repositories.vector_document_repository import VectorDocumentRepository, knn_sql
+
+
+def _row(doc_id: int, reference_type: str, distance: float, embedding: str | None = None) -> dict:
+    row = {
+        "id": doc_id,
+        "reference_type": reference_type,
+        "reference_id": doc_id * 10,
+        "content": f"doc-{doc_id}",
+        "distance": distance,
+    }
+    if embedding is not None:
+        row["embedding"] = embedding
+    return row
+
+
+def _fake_conn(rows: list[dict]) -> MagicMock:
+    conn = MagicMock()
+    conn.execute_query_dict = AsyncMock(return_value=rows)
+    return conn
+
+
+class TestVectorDocumentRepositorySearch:
+    """유사도 검색이 단일 쿼리로 실행되는지 확인 (pgvector SQL은 모킹)."""
+
+    async def test_type_priority_runs_single_query(self):
+        """우선 타입 + 전체 보충을 한 번의 쿼리로 조회하고 순서를 유지한다."""
+        conn = _fake_conn([_row(1, "disease_guideline", 0.1), _row(2, "drug", 0.3)])
+        with patch("tortoise.connections.get", return_value=conn):
+            docs = await VectorDocumentRepository().search_with_type_priority(
+                [0.1, 0.2], preferred_type="disease_guideline", top_k=2, fallback_threshold=0.4
+            )
+
+        conn.execute_query_dict.assert_awaited_once()
+        sql, params = conn.execute_query_dict.await_args.args
+        assert "reference_type = 'disease_guideline'" in sql
+        assert "NOT EXISTS" in sql
+        assert params == [[0.1, 0.2], 2, 0.4]
+        assert [d.id for d in docs] == [1, 2]
+        assert docs[1].distance == 0.3
+        assert docs[1].embedding is None
+
+    async def test_drug_context_runs_single_query(self):
+        """drug 결과가 없을 때의 전체 fallback도 같은 쿼리 안에서 처리한다."""
+        conn = _fake_conn([_row(3, "disease_guideline", 0.2)])
+        with patch("tortoise.connections.get", return_value=conn):
+            docs = await VectorDocumentRepository().search_drug_context([0.5], top_k=1)
+
+        conn.execute_query_dict.assert_awaited_once()
+        sql, _params = conn.execute_query_dict.await_args.args
+        assert "reference_type = 'drug'" in sql
+        assert "NOT EXISTS (SELECT 1 FROM preferred)" in sql
+        assert [d.reference_id for d in docs] == [30]
+
+    async def test_embedding_is_selected_only_on_request(self):
+        """기본 검색은 embedding 컬럼을 조회하지 않고, 요청 시에만 포함한다."""
+        conn = _fake_conn([_row(1, "drug", 0.1)])
+        with patch("tortoise.connections.get", return_value=conn):
+            docs = await VectorDocumentRepository().search_similar([0.5], reference_type="drug", top_k=1)
+        sql, _params = conn.execute_query_dict.await_args.args
+        assert "content, embedding," not in sql
+        assert docs[0].embedding is None
+
+        conn = _fake_conn([_row(1, "drug", 0.1, embedding="[0.1,0.2]")])
+        with patch("tortoise.connections.get", return_value=conn):
+            docs = await VectorDocumentRepository().search_similar(
+                [0.5], reference_type="drug", top_k=1, include_embedding=True
+            )
+        sql, _params = conn.execute_query_dict.await_args.args
+        assert "content, embedding," in sql
+        assert docs[0].embedding == [0.1, 0.2]
+
+    async def test_search_similar_many_groups_by_query(self):
+        """여러 질의 벡터를 LATERAL 단일 쿼리로 검색하고 질의 순서대로 묶는다."""
+        rows = [
+            {**_row(1, "drug", 0.1), "ord": 0},
+            {**_row(2, "drug", 0.3), "ord": 0},
+            {**_row(3, "drug", 0.2), "ord": 2},
+        ]
+        conn = _fake_conn(rows)
+        with patch("tortoise.connections.get", return_value=conn):
+            results = await VectorDocumentRepository().search_similar_many(
+                [[0.1], [0.2], [0.3]], reference_type="drug", top_k=2
+            )
+
+        conn.execute_query_dict.assert_awaited_once()
+        sql, params = conn.execute_query_dict.await_args.args
+        assert "CROSS JOIN LATERAL" in sql
+        assert "LIMIT $4" in sql
+        assert params == [[0.1], [0.2], [0.3], 2]
+        assert [[h.id for h in hits] for hits in results] == [[1, 2], [], [3]]
+
+
+class TestQuantizedSearchSql:
+    """reference_type별 양자화 검색 SQL 생성 테스트."""
+
+    def test_halfvec_mode_reranks_candidates(self):
+        with patch.object(config, "VECTOR_QUANTIZATION", {"drug": "halfvec"}):
+            sql = knn_sql("drug")
+        assert "embedding::halfvec(1536) <=> ($1::vector)::halfvec(1536)" in sql
+        assert f"LIMIT GREATEST($2, {config.VECTOR_RERANK_CANDIDATES})" in sql
+        assert "ORDER BY distance" in sql
+
+    def test_ef_search_covers_rerank_candidates(self):
+        """HNSW는 ef_search행까지만 돌려주므로 ef_search는 재정렬 후보 수 이상으로 설정된다."""
+        with patch.object(config, "VECTOR_HNSW_EF_SEARCH", 40), patch.object(config, "VECTOR_RERANK_CANDIDATES", 100):
+            assert hnsw_ef_search() == 100
+        with patch.object(config, "VECTOR_HNSW_EF_SEARCH", 80), patch.object(config, "VECTOR_RERANK_CANDIDATES", 40):
+            assert hnsw_ef_search() == 80
+
+    def test_binary_mode_uses_hamming_distance(self):
+        with patch.object(config, "VECTOR_QUANTIZATION", {"drug": "binary"}):
+            sql = knn_sql("drug", query="q.query", limit="$3")
+        assert "binary_quantize(embedding)::bit(1536) <~> binary_quantize(q.query)" in sql
+        assert "embedding <=> q.query AS distance" in sql
+
+    def test_unfiltered_or_unknown_mode_uses_exact_index(self):
+        with patch.object(config, "VECTOR_QUANTIZATION", {"drug": "halfvec", "disease_guideline": "pq"}):
+            assert "halfvec" not in knn_sql(None)
+            assert "halfvec" not in knn_sql("disease_guideline")
+
+
+class TestSaveSyncedCopy:
+    """PostgreSQL에서 재임베딩 결과를 COPY 스테이징으로 저장하는지 확인 (asyncpg 커넥션은 모킹)."""
+
+    async def test_postgres_uses_copy_staging_table(self):
+        from contextlib import asynccontextmanager
+
+        from app.models.vector_documents import VectorDocument
+
+        raw = MagicMock()
+        raw.execute = AsyncMock()
+        raw.copy_records_to_table = AsyncMock()
+        conn = MagicMock()
+        conn.capabilities.dialect = "postgres"
+
+        @asynccontextmanager
+        async def acquire():
+            yield raw
+
+        @asynccontextmanager
+        async def fake_transaction():
+            yield conn
+
+        conn.acquire_connection = acquire
+        values = {"reference_type": "drug", "content_hash": "h", "embedding_model_version": "m"}
+        created = [VectorDocument(reference_id=1, content="a", embedding=[0.1], **values)]
+        updated = [VectorDocument(id=7, reference_id=2, content="b", embedding=[0.2], **values)]
+
+        with patch("app.repositories.vector_document_repository.in_transaction", fake_transaction):
+            await VectorDocumentRepository().save_synced(created=created, updated=updated)
+
+        table = raw.copy_records_to_table.await_args.args[0]
+        records = raw.copy_records_to_table.await_args.kwargs["records"]
+        assert records == [(7, "drug", 2, "b", [0.2], "h", "m"), (None, "drug", 1, "a", [0.1], "h", "m")]
+        statements = [call.args[0] for call in raw.execute.await_args_list]
+        assert f"CREATE TEMP TABLE IF NOT EXISTS {table}" in statements[0]
+        assert "ON COMMIT DROP" in statements[0]
+        assert "UPDATE vector_documents" in statements[1]
+        assert "INSERT INTO vector_documents" in statements[2]
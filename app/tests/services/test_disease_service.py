@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from tortoise.contrib.test import TestCase
+
+from app.models.diseases import DiseaseCodeMapping
+from app.services.diseases import DiseaseService
+
+
+async def _make_mapping(code: str, name: str) -> DiseaseCodeMapping:
+    return await DiseaseCodeMapping.create(code=code, name=name, mapped_code=code[:3], mapped_name=name)
+
+
+class TestDiseaseService(TestCase):
+    """상병코드 자동완성 검색 서비스 테스트."""
+
+    async def test_search_ranks_code_before_name(self):
+        """코드 prefix 일치가 이름 일치보다 먼저 오고, 각 결과에 display를 붙여 반환한다."""
+        await _make_mapping("I109", "기타 및 상세불명의 원발성 고혈압")
+        await _make_mapping("E119", "합병증을 동반하지 않은 2형 당뇨병")
+        await _make_mapping("B181", "만성 B형 바이러스간염")
+        await _make_mapping("Z225", "B형 간염 보균자")
+        service = DiseaseService()
+
+        by_name = await service.search("고혈압")
+        by_code = await service.search("e11")
+        both = await service.search("b")
+
+        assert by_name == [
+            {
+                "code": "I109",
+                "name": "기타 및 상세불명의 원발성 고혈압",
+                "display": "I109 기타 및 상세불명의 원발성 고혈압",
+            }
+        ]
+        assert [r["code"] for r in by_code] == ["E119"]
+        # 코드 prefix(B181)가 이름 prefix(Z225)보다 먼저 온다
+        assert [r["code"] for r in both] == ["B181", "Z225"]
+
+    async def test_postgres_runs_single_ranked_query(self):
+        """PostgreSQL에서는 코드/이름 패턴을 이스케이프해 순위 검색 SQL을 한 번만 실행한다."""
+        conn = MagicMock()
+        conn.capabilities.dialect = "postgres"
+        conn.execute_query_dict = AsyncMock(return_value=[{"code": "K29", "name": "위염_십이지장염"}])
+
+        with patch("app.repositories.disease_repository.connections", MagicMock(get=MagicMock(return_value=conn))):
+            result = await DiseaseService().search(" k2_ ", limit=5)
+
+        conn.execute_query_dict.assert_awaited_once()
+        sql, params = conn.execute_query_dict.await_args.args
+        assert "ORDER BY search_rank, score DESC, code" in sql
+        assert params == ["K2_", "K2\\_%", "k2\\_%", "%k2\\_%", "k2_", 5]
+        assert result == [{"code": "K29", "name": "위염_십이지장염", "display": "K29 위염_십이지장염"}]
+
+    async def test_cached_result_skips_query(self):
+        """같은 대문자 검색어/limit의 캐시가 있으면 DB를 조회하지 않는다."""
+        cached = [{"code": "I10", "name": "본태성 고혈압", "display": "I10 본태성 고혈압"}]
+        service = DiseaseService()
+
+        with (
+            patch("app.services.diseases.cache_get", AsyncMock(return_value=cached)) as cache_get,
+            patch.object(service.disease_repo, "search_code_mappings", new=AsyncMock()) as search,
+        ):
+            result = await service.search("i10")
+
+        cache_get.assert_awaited_once_with("disease_search", "I10", 10)
+        search.assert_not_awaited()
+        assert result == cached
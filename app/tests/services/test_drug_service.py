@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from tortoise.contrib.test import TestCase
+
+from app.models.drugs import Drug
+from app.services.drugs import DrugService
+
+
+class TestDrugService(TestCase):
+    """약품 검색 서비스 테스트."""
+
+    async def test_search_variants_order(self):
+        """원문 → 오인식 보정 → 단위 정규화 → 핵심명 접두 순으로 중복 없이 변형을 만든다."""
+        variants = DrugService()._search_variants("히알루점인액 5mg")
+        assert variants == [
+            "히알루점인액 5mg",
+            "히알루점안액 5mg",
+            "히알루점인액 5밀리그램",
+            "히알루점안액 5밀리그램",
+            "히알루점인",
+            "히알루점",
+            "히알루",
+            "히알",
+        ]
+
+    async def test_search_prefers_earlier_variant(self):
+        """원문이 일치하지 않으면 오인식 보정 결과를 이름순으로 반환한다."""
+        await Drug.create(name="히알루점안액0.1%")
+        await Drug.create(name="히알루론산정")
+
+        rows = await DrugService()._search_with_fallbacks("히알루점인액", 20)
+
+        assert [row.name for row in rows] == ["히알루점안액0.1%"]
+
+    async def test_search_falls_back_to_core_prefix(self):
+        """변형이 모두 없으면 핵심 브랜드명을 한 글자씩 줄인 접두로 찾는다."""
+        await Drug.create(name="노바스크정5mg")
+        await Drug.create(name="노바정")
+
+        rows = await DrugService()._search_with_fallbacks("노바스크캡슐", 20)
+
+        assert [row.name for row in rows] == ["노바스크정5mg"]
+
+    async def test_postgres_runs_single_ranked_query(self):
+        """PostgreSQL에서는 LIKE 이스케이프한 변형 배열로 순위 검색 SQL을 한 번만 실행한다."""
+        drug = await Drug.create(name="타이레놀정500mg")
+        conn = MagicMock()
+        conn.capabilities.dialect = "postgres"
+        conn.execute_query_dict = AsyncMock(return_value=[{"id": drug.id, "pos": 1}])
+
+        with patch("app.repositories.drug_repository.connections", MagicMock(get=MagicMock(return_value=conn))):
+            rows = await DrugService()._search_with_fallbacks("타이레놀_10%", 5)
+
+        conn.execute_query_dict.assert_awaited_once()
+        sql, params = conn.execute_query_dict.await_args.args
+        assert "WITH ORDINALITY" in sql
+        assert params[0][0] == "타이레놀\\_10\\%"
+        assert params[1:] == [5, "타이레놀_10%", 0.35]
+        assert [row.id for row in rows] == [drug.id]
@@ -0,0 +1,118 @@
+"""임베딩 micro-batcher 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from app.core.config import EmbeddingBackend
+from app.integrations.local_embedding.client import LocalEmbeddingClient, LocalEmbeddingError
+from app.services.embedding import EmbeddingBatcher
+
+
+def _fake_client(create: AsyncMock) -> MagicMock:
+    client = MagicMock()
+    client.embeddings.create = create
+    return client
+
+
+def _fake_response(texts: list[str]) -> SimpleNamespace:
+    # 인덱스 역순으로 돌려줘도 입력 순서대로 복원되는지 확인하기 위해 뒤집어서 반환
+    data = [SimpleNamespace(index=i, embedding=[float(len(t)), float(i)]) for i, t in enumerate(texts)]
+    return SimpleNamespace(data=list(reversed(data)))
+
+
+class TestEmbeddingBatcher:
+    async def test_concurrent_calls_are_coalesced(self):
+        """윈도우 안에 들어온 동시 요청은 한 번의 API 호출로 묶인다."""
+        create = AsyncMock(side_effect=lambda input, model: _fake_response(input))
+        batcher = EmbeddingBatcher(window_ms=5, max_batch_size=100, max_in_flight=2)
+
+        with patch("app.services.embedding.get_openai_client", return_value=_fake_client(create)):
+            results = await asyncio.gather(*(batcher.encode(t) for t in ["a", "bb", "ccc", "bb"]))
+
+        assert create.await_count == 1
+        assert create.await_args.kwargs["input"] == ["a", "bb", "ccc"]
+        assert [r[0] for r in results] == [1.0, 2.0, 3.0, 2.0]
+
+    async def test_flushes_immediately_when_batch_is_full(self):
+        """max_batch_size에 도달하면 윈도우를 기다리지 않고 바로 전송한다."""
+        create = AsyncMock(side_effect=lambda input, model: _fake_response(input))
+        batcher = EmbeddingBatcher(window_ms=10_000, max_batch_size=2, max_in_flight=2)
+
+        with patch("app.services.embedding.get_openai_client", return_value=_fake_client(create)):
+            results = await asyncio.wait_for(asyncio.gather(batcher.encode("x"), batcher.encode("yy")), timeout=1)
+
+        assert create.await_count == 1
+        assert [r[0] for r in results] == [1.0, 2.0]
+
+    async def test_error_is_propagated_to_every_caller(self):
+        """API 실패 시 배치에 포함된 모든 호출자에게 예외가 전달된다."""
+        create = AsyncMock(side_effect=RuntimeError("boom"))
+        batcher = EmbeddingBatcher(window_ms=1, max_batch_size=100, max_in_flight=1)
+
+        with patch("app.services.embedding.get_openai_client", return_value=_fake_client(create)):
+            results = await asyncio.gather(batcher.encode("a"), batcher.encode("b"), return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_encode_many_preserves_order(self):
+        create = AsyncMock(side_effect=lambda input, model: _fake_response(input))
+        batcher = EmbeddingBatcher(window_ms=1, max_batch_size=100, max_in_flight=1)
+
+        with patch("app.services.embedding.get_openai_client", return_value=_fake_client(create)):
+            vectors = await batcher.encode_many(["aaa", "b"])
+
+        assert vectors == [[3.0, 0.0], [1.0, 1.0]]
+
+    async def test_encode_many_empty(self):
+        batcher = EmbeddingBatcher()
+        assert await batcher.encode_many([]) == []
+
+
+class TestLocalEmbeddingBackend:
+    """ai_worker 로컬 임베딩 백엔드 테스트."""
+
+    async def test_local_backend_skips_openai(self):
+        """backend=local이면 같은 배칭 경로로 로컬 서버를 호출하고 OpenAI는 호출하지 않는다."""
+        local = MagicMock()
+        local.embed = AsyncMock(side_effect=lambda texts: [[float(len(t))] for t in texts])
+        batcher = EmbeddingBatcher(model="local-model", backend=EmbeddingBackend.LOCAL, window_ms=5)
+
+        with (
+            patch("app.services.embedding.get_local_embedding_client", return_value=local),
+            patch("app.services.embedding.get_openai_client") as openai_client,
+        ):
+            results = await asyncio.gather(batcher.encode("a"), batcher.encode("bb"))
+
+        local.embed.assert_awaited_once_with(["a", "bb"])
+        openai_client.assert_not_called()
+        assert results == [[1.0], [2.0]]
+
+    async def test_client_posts_texts_and_validates_response(self):
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"model": "m", "dimensions": 2, "embeddings": [[0.1, 0.0]]})
+
+        client = LocalEmbeddingClient(base_url="http://worker")
+        client._client = httpx.AsyncClient(base_url="http://worker", transport=httpx.MockTransport(handler))
+
+        assert await client.embed(["감기"]) == [[0.1, 0.0]]
+        assert requests[0].url.path == "/embed"
+        with pytest.raises(LocalEmbeddingError):
+            await client.embed(["감기", "두통"])
+
+    async def test_client_wraps_server_errors(self):
+        client = LocalEmbeddingClient(base_url="http://worker")
+        client._client = httpx.AsyncClient(
+            base_url="http://worker", transport=httpx.MockTransport(lambda request: httpx.Response(503))
+        )
+
+        with pytest.raises(LocalEmbeddingError):
+            await client.embed(["감기"])
@@ -1,12 +1,34 @@
 from __future__ import annotations
 
+from unittest.mock import AsyncMock, patch
+
 from tortoise.contrib.test import TestCase
 
+from app.models.drugs import Drug
 from app.models.recommendations import Recommendation, RecommendationBatch
 from app.models.users import User
 from app.services.recommendations import RecommendationService
 
 
+class _FakeRedis:
+    """mget/pipeline만 흉내 내는 Redis 대역."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+        self.mget_calls = 0
+
+    async def mget(self, keys):
+        self.mget_calls += 1
+        return [self.store.get(k) for k in keys]
+
+    def pipeline(self, transaction: bool = True):
+        store = self.store
+        pipe = AsyncMock()
+        pipe.set = lambda key, value, ex=None: store.__setitem__(key, value)
+        pipe.__aenter__.return_value = pipe
+        return pipe
+
+
 class TestRecommendationService(TestCase):
     async def test_list_by_user(self):
         """사용자의 추천 목록 조회"""
@@ -140,3 +162,36 @@ class TestRecommendationService(TestCase):
         with self.assertRaises(HTTPException) as ctx:
             await service.save_for_scan(user_id=1, scan_id=42)
         assert ctx.exception.status_code == 404
+
+
+class TestFetchDrugDetails(TestCase):
+    """처방약 상세정보 일괄 조회 테스트."""
+
+    async def test_batch_lookup_matches_per_name_semantics(self):
+        """접두 우선/부분 일치/'점→정' 보정/미매칭/중복 이름을 순서대로 기존과 같이 돌려준다."""
+        await Drug.create(name="타이레놀정500mg", efficacy="해열", caution_1="간 손상 주의")
+        await Drug.create(name="노바스크정5mg", efficacy="고혈압")
+        await Drug.create(name="한미아스피린장용정", efficacy="혈전 예방")
+        redis = _FakeRedis()
+
+        with patch("app.utils.cache.get_redis", AsyncMock(return_value=redis)):
+            details = await RecommendationService()._fetch_drug_details(
+                [" 타이레놀", "아스피린", "노바스크점5", "없는약", "", "타이레놀"]
+            )
+            service = RecommendationService()
+            with patch.object(service.drug_repo, "first_by_names", new=AsyncMock()) as first_by_names:
+                again = await service._fetch_drug_details(["타이레놀", "없는약"])
+
+        assert [d["name"] for d in details] == [
+            "타이레놀정500mg",
+            "한미아스피린장용정",
+            "노바스크정5mg",
+            "없는약",
+            "타이레놀정500mg",
+        ]
+        assert details[0]["caution"] == "간 손상 주의"
+        assert details[3] == {"name": "없는약"}
+        assert len(redis.store) == 4
+        assert again == [details[0], details[3]]
+        first_by_names.assert_not_awaited()
+        assert redis.mget_calls == 2
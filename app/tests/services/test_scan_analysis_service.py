@@ -185,8 +185,15 @@ class TestScanAnalysisService(TestCase):
         with (
             patch.object(service.med_service, "ensure_day_seed", new=AsyncMock(), create=True),
             patch.object(service.health_service, "ensure_day_seed", new=AsyncMock(), create=True),
-            patch("app.services.scan_analysis.encode", return_value=[0.1] * 1536),
-            patch.object(service.vector_repo, "search_similar", new=AsyncMock(return_value=[])),
+            patch(
+                "app.services.scan_analysis.encode_batch",
+                new=AsyncMock(side_effect=lambda names: [[0.1] * 1536 for _ in names]),
+            ),
+            patch.object(
+                service.drug_repo,
+                "search_hybrid_many",
+                new=AsyncMock(side_effect=lambda names, *_, **__: [[] for _ in names]),
+            ),
         ):
             result = await service.save_result(user, scan_id=scan["scan_id"])
         assert result["saved"] is True
@@ -208,8 +215,15 @@ class TestScanAnalysisService(TestCase):
         with (
             patch.object(service.med_service, "ensure_day_seed", new=AsyncMock(), create=True),
             patch.object(service.health_service, "ensure_day_seed", new=AsyncMock(), create=True),
-            patch("app.services.scan_analysis.encode", return_value=[0.1] * 1536),
-            patch.object(service.vector_repo, "search_similar", new=AsyncMock(return_value=[])),
+            patch(
+                "app.services.scan_analysis.encode_batch",
+                new=AsyncMock(side_effect=lambda names: [[0.1] * 1536 for _ in names]),
+            ),
+            patch.object(
+                service.drug_repo,
+                "search_hybrid_many",
+                new=AsyncMock(side_effect=lambda names, *_, **__: [[] for _ in names]),
+            ),
         ):
             first = await service.save_result(user, scan_id=scan["scan_id"])
             second = await service.save_result(user, scan_id=scan["scan_id"])
@@ -222,3 +236,239 @@ class TestScanAnalysisService(TestCase):
         assert len(second["created_prescriptions"]) == 0
         assert second["skipped_count"] == 2
         assert set(second["skipped_duplicates"]) == {"아스피린", "타이레놀"}
+
+    async def test_match_drugs_uses_hybrid_search_for_unmatched(self):
+        """이름 매칭 실패 약품은 임베딩 1회 후 하이브리드 후보 중 임계값을 넘는 약품으로 매칭된다."""
+        from app.models.drugs import Drug
+        from app.repositories.drug_repository import DrugSearchCandidate
+
+        known = await Drug.create(name="암로디핀베실산염정")
+        service = ScanAnalysisService()
+        candidates = {
+            "노바스크정": [DrugSearchCandidate(drug_id=known.id, score=0.016, vector_distance=0.2, vector_rank=1)],
+            "처음보는약": [DrugSearchCandidate(drug_id=known.id, score=0.016, lexical_score=0.21, lexical_rank=1)],
+        }
+        encode_batch = AsyncMock(side_effect=lambda names: [[0.1] * 1536 for _ in names])
+        search_hybrid_many = AsyncMock(side_effect=lambda names, vectors, **_: [candidates[name] for name in names])
+
+        with (
+            patch("app.services.scan_analysis.encode_batch", new=encode_batch),
+            patch.object(service.drug_repo, "supports_hybrid_search", return_value=True),
+            patch.object(service.drug_repo, "search_hybrid_many", new=search_hybrid_many),
+        ):
+            result = await service._match_drugs([({}, "노바스크정"), ({}, "처음보는약")])
+
+        encode_batch.assert_awaited_once_with(["노바스크정", "처음보는약"])
+        search_hybrid_many.assert_awaited_once()
+        assert search_hybrid_many.await_args.args[0] == ["노바스크정", "처음보는약"]
+        assert result[0].id == known.id
+        assert result[1].name == "처음보는약"
+
+    async def test_hybrid_search_error_is_not_retried_in_transaction(self):
+        """하이브리드 검색이 실패하면 (트랜잭션이 이미 중단되었으므로) 약품별 폴백 쿼리 없이 예외를 올린다."""
+        import pytest
+
+        service = ScanAnalysisService()
+        with (
+            patch("app.services.scan_analysis.encode_batch", new=AsyncMock(return_value=[[0.1]])),
+            patch.object(service.drug_repo, "supports_hybrid_search", return_value=True),
+            patch.object(service.drug_repo, "search_hybrid_many", new=AsyncMock(side_effect=RuntimeError("aborted"))),
+            patch.object(service, "_fuzzy_match_drug_by_name", new=AsyncMock()) as fuzzy,
+            pytest.raises(RuntimeError),
+        ):
+            await service._search_drugs_hybrid(["노바스크정"])
+        fuzzy.assert_not_awaited()
+
+    async def test_hybrid_search_uses_name_index_prefix_first(self):
+        """이름 인덱스가 있으면 PostgreSQL 경로에서도 접두 검색으로 찾은 약품은 임베딩/하이브리드 검색에서 뺀다."""
+        from app.models.drugs import Drug
+        from app.repositories.drug_name_index import DrugNameIndex
+
+        known = await Drug.create(name="노바스크정5mg")
+        index = DrugNameIndex.build([(known.id, known.name)])
+        service = ScanAnalysisService()
+        encode_batch = AsyncMock(side_effect=lambda names: [[0.1] * 1536 for _ in names])
+        search_hybrid_many = AsyncMock(side_effect=lambda names, vectors, **_: [[] for _ in names])
+
+        with (
+            patch("app.services.scan_analysis.get_drug_name_index", return_value=index),
+            patch("app.services.scan_analysis.encode_batch", new=encode_batch),
+            patch.object(service.drug_repo, "supports_hybrid_search", return_value=True),
+            patch.object(service.drug_repo, "search_hybrid_many", new=search_hybrid_many),
+        ):
+            result = await service._search_drugs_hybrid(["노바스크OD정5mg", "처음보는약"])
+
+        encode_batch.assert_awaited_once_with(["처음보는약"])
+        assert search_hybrid_many.await_args.args[0] == ["처음보는약"]
+        assert result[0].id == known.id
+        assert result[1] is None
+
+    async def test_match_by_name_uses_name_index(self):
+        """이름 인덱스가 로드되어 있으면 LIKE 검색 없이 인덱스에서 후보를 고르고 PK로만 조회한다."""
+        from app.models.drugs import Drug
+        from app.repositories.drug_name_index import DrugNameIndex
+
+        low = await Drug.create(name="노바스크정5mg")
+        high = await Drug.create(name="노바스크정10mg")
+        index = DrugNameIndex.build([(low.id, low.name), (high.id, high.name)])
+        service = ScanAnalysisService()
+
+        with (
+            patch("app.services.scan_analysis.get_drug_name_index", return_value=index),
+            patch.object(Drug, "filter", side_effect=AssertionError("LIKE query issued")),
+        ):
+            by_name = await service._match_by_name("노바스크정 10mg")
+            fuzzy = await service._fuzzy_match_drug_by_name("노바스크OD정5mg")
+
+        assert by_name.id == high.id
+        assert fuzzy.id == low.id
+
+    async def test_match_drugs_resolves_edi_codes_in_one_lookup(self):
+        """처방전의 EDI 코드는 drug_edi_codes로 한 번에 조회해 이름 매칭보다 먼저 적용한다."""
+        from app.models.drugs import Drug, DrugEdiCode
+
+        drug = await Drug.create(name="노바스크정5mg", edi_code="648900030")
+        await DrugEdiCode.create(edi_code="648900030", drug=drug)
+        service = ScanAnalysisService()
+        get_by_edi_codes = AsyncMock(wraps=service.drug_repo.get_by_edi_codes)
+
+        with patch.object(service.drug_repo, "get_by_edi_codes", new=get_by_edi_codes):
+            result = await service._match_drugs(
+                [({"edi_code": "648900030"}, "OCR오인식약품명"), ({"edi_code": " 648900030 "}, "노바스크")]
+            )
+
+        get_by_edi_codes.assert_awaited_once()
+        assert [d.id for d in result] == [drug.id, drug.id]
+
+    async def test_correct_drug_names_records_drug_id_reused_on_save(self):
+        """분석 단계 매칭 결과(drug_id)를 스캔에 기록하고, 저장 시에는 다시 매칭하지 않는다."""
+        from app.models.drugs import Drug
+
+        drug = await Drug.create(name="노바스크정5mg")
+        service = ScanAnalysisService()
+        drugs = [{"name": "노바스크정5mg"}, {"name": "노바스크정5mg"}]
+
+        corrected = await service._correct_drug_names(drugs)
+        assert [d["drug_id"] for d in corrected] == [drug.id, drug.id]
+
+        entries = service._collect_drug_entries(corrected)
+        with (
+            patch.object(service, "_match_by_names", new=AsyncMock(side_effect=AssertionError("re-matched"))),
+            patch.object(service, "_search_drugs_hybrid", new=AsyncMock(side_effect=AssertionError("re-matched"))),
+        ):
+            result = await service._match_drugs(entries)
+        assert [d.id for d in result] == [drug.id, drug.id]
+
+    async def test_update_result_keeps_drug_id_only_for_unchanged_names(self):
+        """결과 수정 시 이름이 그대로인 약품만 drug_id를 유지하고, 클라이언트가 보낸 drug_id는 무시한다."""
+        from app.dtos.scan import DrugEntry, ScanResultUpdateRequest
+
+        user = await _make_user("scan_drug_id@example.com")
+        service = ScanAnalysisService()
+        scan = await service.scan_repo.create(user_id=user.id, file_path="storage/1/test.jpg")
+        await service.scan_repo.update(
+            user.id,
+            scan["scan_id"],
+            status="done",
+            drugs=[{"name": "타이레놀정", "drug_id": 1}, {"name": "게보린정", "drug_id": 2}],
+        )
+
+        data = ScanResultUpdateRequest(
+            drugs=[DrugEntry(name="타이레놀정"), DrugEntry(name="게보린정 300mg", drug_id=2)]
+        )
+        updated = await service.update_result(user, scan["scan_id"], data)
+
+        assert updated["drugs"] == [{"name": "타이레놀정", "drug_id": 1}, {"name": "게보린정 300mg"}]
+
+    async def test_save_result_learns_alias_used_by_next_scan(self):
+        """사용자가 고친 약품의 (OCR 원문 → 확정 약품)을 별칭으로 기록하고, 다음 스캔은 퍼지 매칭 없이 별칭으로 매칭한다."""
+        from app.models.drugs import Drug
+        from app.repositories import drug_alias_repository
+
+        drug = await Drug.create(name="노바스크정5mg")
+        user = await _make_user("scan_alias@example.com")
+        service = ScanAnalysisService()
+        scan = await service.scan_repo.create(user_id=user.id, file_path="storage/1/test.jpg")
+        await service.scan_repo.update(
+            user.id,
+            scan["scan_id"],
+            status="updated",
+            document_date="2024-01-01",
+            drugs=[{"name": "노바스크정5mg", "ocr_name": "노바스그정5mg"}],
+        )
+
+        with (
+            patch.object(drug_alias_repository, "_aliases", {}),
+            patch.object(drug_alias_repository.config, "DRUG_ALIAS_MIN_HITS", 1),
+            patch.object(service.med_service, "ensure_day_seed", new=AsyncMock(), create=True),
+            patch.object(service.health_service, "ensure_day_seed", new=AsyncMock(), create=True),
+        ):
+            await service.save_result(user, scan_id=scan["scan_id"])
+            with (
+                patch.object(service, "_match_by_names", new=AsyncMock(side_effect=AssertionError("fuzzy"))),
+                patch.object(service, "_search_drugs_hybrid", new=AsyncMock(side_effect=AssertionError("fuzzy"))),
+            ):
+                resolved = await service._resolve_drugs([({}, "노바스그정5mg")])
+
+        assert resolved[0].id == drug.id
+
+    async def test_save_result_does_not_learn_auto_matched_drugs(self):
+        """분석 단계에서 자동 매칭된 약품(drug_id 있음)은 사용자가 확인한 대응이 아니므로 별칭으로 기록하지 않는다."""
+        from app.models.drugs import Drug, DrugAlias
+
+        drug = await Drug.create(name="노바스크정5mg")
+        user = await _make_user("scan_alias_auto@example.com")
+        service = ScanAnalysisService()
+        scan = await service.scan_repo.create(user_id=user.id, file_path="storage/1/test.jpg")
+        await service.scan_repo.update(
+            user.id,
+            scan["scan_id"],
+            status="done",
+            document_date="2024-01-01",
+            drugs=[{"name": "노바스크정5mg", "ocr_name": "노바스그정5mg", "drug_id": drug.id}],
+        )
+
+        with (
+            patch.object(service.med_service, "ensure_day_seed", new=AsyncMock(), create=True),
+            patch.object(service.health_service, "ensure_day_seed", new=AsyncMock(), create=True),
+        ):
+            await service.save_result(user, scan_id=scan["scan_id"])
+
+        assert await DrugAlias.all().count() == 0
+
+    async def test_resolve_drugs_ignores_alias_for_renamed_entry(self):
+        """사용자가 이름을 고친 항목은 OCR 원문의 별칭 대신 고친 이름으로 매칭한다."""
+        from app.models.drugs import Drug
+        from app.repositories import drug_alias_repository
+
+        wrong = await Drug.create(name="노바스크정10mg")
+        right = await Drug.create(name="노바스크정5mg")
+        service = ScanAnalysisService()
+
+        with (
+            patch.object(drug_alias_repository, "_aliases", {"노바스그정": (wrong.id, 5)}),
+            patch.object(service, "_match_by_names", new=AsyncMock(return_value=[right])) as match_by_names,
+        ):
+            resolved = await service._resolve_drugs([({"ocr_name": "노바스그정"}, "노바스크정5mg")])
+            unedited = await service._resolve_drugs([({"ocr_name": "노바스그정"}, "노바스그정")])
+
+        assert resolved[0].id == right.id
+        match_by_names.assert_awaited_once_with(["노바스크정5mg"])
+        assert unedited[0].id == wrong.id
+
+    async def test_resolve_diseases_in_batch(self):
+        """진단 목록을 한 번에 질환으로 변환하고, 코드만 있는 진단은 매핑 한글명으로 만든다."""
+        from app.models.diseases import Disease, DiseaseCodeMapping
+
+        await DiseaseCodeMapping.create(
+            code="J301", name="꽃가루에 의한 알레르기비염", mapped_code="J30", mapped_name="비염"
+        )
+        existing = await Disease.create(name="고혈압", kcd_code="I10")
+        service = ScanAnalysisService()
+
+        diseases = await service._resolve_diseases(["I10 고혈압", "", "j301", "두통", "I10"])
+
+        assert diseases[0].id == diseases[4].id == existing.id
+        assert diseases[1] is None
+        assert (diseases[2].kcd_code, diseases[2].name) == ("J301", "꽃가루에 의한 알레르기비염")
+        assert (diseases[3].kcd_code, diseases[3].name) == (None, "두통")
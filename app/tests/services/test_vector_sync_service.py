@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+from tortoise.contrib.test import TestCase
+
+from app.models.diseases import Disease, DiseaseGuideline
+from app.models.drugs import Drug
+from app.models.vector_documents import VectorDocument
+from app.services.vector_sync import VectorSyncService, content_hash
+
+
+def _fake_encode(texts: list[str], **_kwargs) -> list[list[float]]:
+    return [[float(len(text)), 0.0] for text in texts]
+
+
+class TestVectorSyncService(TestCase):
+    """vector_documents 증분 동기화 테스트."""
+
+    async def _sync(self, reference_type: str, **kwargs):
+        service = VectorSyncService(batch_size=2)
+        encode = AsyncMock(side_effect=_fake_encode)
+        with patch("app.services.vector_sync.encode_batch", new=encode):
+            stats = await service.sync(reference_type, **kwargs)
+        return stats, encode
+
+    async def test_first_sync_embeds_all_in_batches(self):
+        """처음 동기화하면 모든 원본을 batch_size 단위로 임베딩해 저장한다."""
+        for name in ("타이레놀정", "게보린정", "판콜에이"):
+            await Drug.create(name=name)
+
+        stats, encode = await self._sync("drug")
+
+        assert (stats.created, stats.updated, stats.unchanged, stats.deleted) == (3, 0, 0, 0)
+        assert encode.await_count == 2
+        doc = await VectorDocument.get(content="게보린정")
+        assert doc.content_hash == content_hash("게보린정")
+        assert doc.embedding_model_version == "text-embedding-3-small"
+
+    async def test_second_sync_only_reembeds_changed_rows(self):
+        """변경된 행만 다시 임베딩하고, 사라진 원본의 문서는 삭제한다."""
+        keep = await Drug.create(name="타이레놀정")
+        edit = await Drug.create(name="게보린정")
+        gone = await Drug.create(name="판콜에이")
+        await self._sync("drug")
+        edit_doc_id = (await VectorDocument.get(reference_id=edit.id)).id
+
+        edit.name = "게보린정 300mg"
+        await edit.save()
+        await gone.delete()
+        stats, encode = await self._sync("drug")
+
+        assert (stats.created, stats.updated, stats.unchanged, stats.deleted) == (0, 1, 1, 1)
+        encode.assert_awaited_once_with(["게보린정 300mg"], use_cache=False)
+        updated = await VectorDocument.get(id=edit_doc_id)
+        assert updated.content == "게보린정 300mg"
+        assert updated.content_hash == content_hash("게보린정 300mg")
+        assert await VectorDocument.filter(reference_id=keep.id).count() == 1
+
+    async def test_drug_changes_notify_vector_index(self):
+        """drug 문서가 바뀐 동기화만 약물 벡터 인덱스 점검 알림(synced_at)을 보낸다."""
+        await Drug.create(name="타이레놀정")
+
+        with patch("app.services.vector_sync.publish_master_data_change", new=AsyncMock()) as publish:
+            await self._sync("drug")
+            await self._sync("drug")
+            await self._sync("drug", dry_run=True)
+
+        publish.assert_awaited_once()
+        assert publish.await_args.args == ("drug_vector",)
+        assert "synced_at" in publish.await_args.kwargs["payload"]
+
+    async def test_model_version_change_triggers_reembed(self):
+        """embedding_model_version이 다르면 내용이 같아도 다시 임베딩한다."""
+        drug = await Drug.create(name="타이레놀정")
+        await VectorDocument.create(
+            reference_type="drug",
+            reference_id=drug.id,
+            content="타이레놀정",
+            embedding=[0.0, 0.0],
+            content_hash=content_hash("타이레놀정"),
+            embedding_model_version="text-embedding-ada-002",
+        )
+
+        stats, _ = await self._sync("drug")
+
+        assert stats.updated == 1
+        assert await VectorDocument.filter(reference_type="drug").count() == 1
+
+    async def test_dry_run_counts_without_writing(self):
+        """dry_run은 임베딩·저장 없이 건수만 집계한다."""
+        disease = await Disease.create(name="고혈압", kcd_code="I10")
+        await DiseaseGuideline.create(disease=disease, category="식이", content="저염식")
+
+        stats, encode = await self._sync("disease_guideline", dry_run=True)
+
+        assert stats.created == 1
+        encode.assert_not_awaited()
+        assert await VectorDocument.all().count() == 0
+
+    async def test_concurrent_sync_reports_checkpoints_in_order(self):
+        """동시에 처리해도 체크포인트는 앞선 배치가 모두 저장된 id까지만 단조 증가한다."""
+        drugs = [await Drug.create(name=f"약품{i}") for i in range(7)]
+        checkpoints: list[int] = []
+
+        async def on_checkpoint(after_id: int) -> None:
+            checkpoints.append(after_id)
+
+        service = VectorSyncService(batch_size=2, concurrency=3)
+        with patch("app.services.vector_sync.encode_batch", new=AsyncMock(side_effect=_fake_encode)):
+            stats = await service.sync("drug", on_checkpoint=on_checkpoint)
+
+        assert stats.created == 7
+        assert checkpoints == sorted(checkpoints)
+        assert checkpoints[-1] == drugs[-1].id
+        assert await VectorDocument.filter(reference_type="drug").count() == 7
+
+    async def test_resume_skips_rows_before_checkpoint(self):
+        """start_after_id 이하 원본은 읽지 않고, 그 구간의 문서도 삭제 대상으로 보지 않는다."""
+        first = await Drug.create(name="타이레놀정")
+        second = await Drug.create(name="게보린정")
+        await VectorDocument.create(
+            reference_type="drug",
+            reference_id=first.id,
+            content="타이레놀정",
+            embedding=[0.0, 0.0],
+            content_hash=content_hash("타이레놀정"),
+            embedding_model_version="text-embedding-3-small",
+        )
+        await first.delete()
+
+        stats, encode = await self._sync("drug", start_after_id=first.id)
+
+        assert (stats.created, stats.deleted) == (1, 0)
+        encode.assert_awaited_once_with(["게보린정"], use_cache=False)
+        assert await VectorDocument.filter(reference_id=second.id).exists()
+
+    async def test_transient_errors_are_retried(self):
+        """일시적 오류(로컬 임베딩 서버 장애 등)는 백오프 후 재시도한다."""
+        from app.integrations.local_embedding.client import LocalEmbeddingError
+
+        await Drug.create(name="타이레놀정")
+        encode = AsyncMock(side_effect=[LocalEmbeddingError("down"), [[1.0, 0.0]]])
+        with (
+            patch("app.services.vector_sync.encode_batch", new=encode),
+            patch("app.services.vector_sync.asyncio.sleep", new=AsyncMock()) as sleep,
+        ):
+            stats = await VectorSyncService().sync("drug")
+
+        assert stats.created == 1
+        assert encode.await_count == 2
+        sleep.assert_awaited_once()
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.utils.embedding_cache import EmbeddingCache, make_embedding_key, pack_vector, unpack_vector
+
+
+class _FakeRedis:
+    """mget/pipeline만 흉내 내는 바이너리 Redis 대역."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, bytes] = {}
+
+    async def mget(self, keys):
+        return [self.store.get(k) for k in keys]
+
+    def pipeline(self, transaction: bool = True):
+        store = self.store
+        pipe = MagicMock()
+        pipe.set = lambda key, value, ex=None: store.__setitem__(key, value)
+        pipe.execute = AsyncMock()
+        pipe.__aenter__ = AsyncMock(return_value=pipe)
+        pipe.__aexit__ = AsyncMock(return_value=False)
+        return pipe
+
+
+class TestEmbeddingCache:
+    """EmbeddingCache 테스트."""
+
+    def test_key_ignores_whitespace_and_width_differences(self):
+        """NFKC/공백 정규화 후 같은 텍스트는 같은 키를 가진다."""
+        assert make_embedding_key("m", " 타이레놀정  500mg ") == make_embedding_key("m", "타이레놀정 500ｍｇ")
+        assert make_embedding_key("m", "a") != make_embedding_key("other", "a")
+
+    def test_pack_roundtrip_uses_float16(self):
+        """float16 바이트열로 저장되고 복원된다."""
+        blob = pack_vector([0.5, -0.25, 1.0])
+        assert len(blob) == 6
+        assert unpack_vector(blob) == [0.5, -0.25, 1.0]
+
+    async def test_lru_hit_and_miss_counters(self):
+        """LRU 적중/미적중이 카운터에 반영된다."""
+        cache = EmbeddingCache(max_entries=10)
+        with patch("app.utils.embedding_cache.get_binary_redis", AsyncMock(return_value=None)):
+            assert await cache.get("m", "a") is None
+            await cache.set("m", "a", [0.5, 1.0])
+            assert await cache.get("m", "a") == [0.5, 1.0]
+
+        stats = cache.stats()
+        assert stats["lru_hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    async def test_lru_evicts_least_recently_used(self):
+        """최대 항목 수를 넘으면 가장 오래 쓰지 않은 항목부터 제거된다."""
+        cache = EmbeddingCache(max_entries=2)
+        with patch("app.utils.embedding_cache.get_binary_redis", AsyncMock(return_value=None)):
+            await cache.set("m", "a", [1.0])
+            await cache.set("m", "b", [2.0])
+            await cache.get("m", "a")
+            await cache.set("m", "c", [3.0])
+
+            assert await cache.get("m", "b") is None
+            assert await cache.get("m", "a") == [1.0]
+
+    async def test_redis_tier_backfills_lru(self):
+        """LRU에 없으면 Redis에서 읽고 LRU를 채운다."""
+        redis = _FakeRedis()
+        writer = EmbeddingCache(max_entries=10)
+        reader = EmbeddingCache(max_entries=10)
+        with patch("app.utils.embedding_cache.get_binary_redis", AsyncMock(return_value=redis)):
+            await writer.set_many("m", ["a", "b"], [[1.0], [2.0]])
+            assert await reader.get_many("m", ["a", "b", "c"]) == [[1.0], [2.0], None]
+            assert await reader.get("m", "a") == [1.0]
+
+        assert reader.stats()["redis_hits"] == 2
+        assert reader.stats()["lru_hits"] == 1
+        assert reader.stats()["misses"] == 1
+
+
+class TestEncodeWithCache:
+    """encode_batch()가 캐시 미적중분만 API로 요청하는지 확인."""
+
+    async def test_encode_batch_requests_only_misses(self):
+        from app.services import embedding
+
+        cache = EmbeddingCache(max_entries=10)
+        batcher = MagicMock(model="m")
+        batcher.encode_many = AsyncMock(side_effect=lambda texts: [[float(len(t))] for t in texts])
+
+        with (
+            patch("app.utils.embedding_cache.get_binary_redis", AsyncMock(return_value=None)),
+            patch.object(embedding, "get_embedding_cache", return_value=cache),
+            patch.object(embedding, "get_embedding_batcher", return_value=batcher),
+        ):
+            await cache.set("m", "aa", [9.0])
+            result = await embedding.encode_batch(["aa", "bbb", "bbb"])
+
+        assert result == [[9.0], [3.0], [3.0]]
+        batcher.encode_many.assert_awaited_once_with(["bbb"])
+
+    async def test_encode_batch_miss_matches_later_hit(self):
+        from app.services import embedding
+
+        cache = EmbeddingCache(max_entries=10)
+        batcher = MagicMock(model="m")
+        batcher.encode_many = AsyncMock(return_value=[[0.1, 0.2, 0.3]])
+
+        with (
+            patch("app.utils.embedding_cache.get_binary_redis", AsyncMock(return_value=None)),
+            patch.object(embedding, "get_embedding_cache", return_value=cache),
+            patch.object(embedding, "get_embedding_batcher", return_value=batcher),
+        ):
+            miss = await embedding.encode_batch(["aa"])
+            hit = await embedding.encode_batch(["aa"])
+
+        assert miss == hit
+        assert miss[0] != [0.1, 0.2, 0.3]
+        batcher.encode_many.assert_awaited_once()
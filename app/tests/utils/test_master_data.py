@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.utils import master_data
+
+
+class TestMasterDataChange:
+    """마스터 데이터 변경 알림 테스트."""
+
+    @pytest.fixture(autouse=True)
+    def _isolated_handlers(self):
+        with (
+            patch.object(master_data, "_handlers", master_data.defaultdict(list)),
+            patch.object(master_data, "_payload_handlers", master_data.defaultdict(list)),
+        ):
+            yield
+
+    async def test_dispatch_runs_handlers_for_kind_only(self):
+        drug_handler = AsyncMock()
+        disease_handler = AsyncMock()
+        master_data.on_master_data_change("drug", drug_handler)
+        master_data.on_master_data_change("drug", drug_handler)  # 중복 등록 무시
+        master_data.on_master_data_change("disease", disease_handler)
+
+        await master_data.dispatch_master_data_change("drug")
+
+        drug_handler.assert_awaited_once()
+        disease_handler.assert_not_awaited()
+
+    async def test_handler_error_does_not_stop_others(self):
+        failing = AsyncMock(side_effect=RuntimeError("boom"))
+        ok = AsyncMock()
+        master_data.on_master_data_change("drug", failing)
+        master_data.on_master_data_change("drug", ok)
+
+        await master_data.dispatch_master_data_change("drug")
+
+        ok.assert_awaited_once()
+
+    async def test_payload_goes_to_payload_handler_instead_of_reload(self):
+        reload = AsyncMock()
+        apply_changes = AsyncMock()
+        master_data.on_master_data_change("drug_alias", reload)
+        master_data.on_master_data_payload("drug_alias", apply_changes)
+
+        await master_data.dispatch_master_data_change(*master_data._parse_message('drug_alias:[["a", 1, 2]]'))
+        apply_changes.assert_awaited_once_with([["a", 1, 2]])
+        reload.assert_not_awaited()
+
+        await master_data.dispatch_master_data_change(*master_data._parse_message("drug_alias"))
+        reload.assert_awaited_once()
+
+    async def test_publish_serializes_payload(self):
+        redis = AsyncMock()
+        with patch.object(master_data, "get_redis", new=AsyncMock(return_value=redis)):
+            await master_data.publish_master_data_change("drug_alias", payload=[("노바스그정", 1, 2)])
+        redis.publish.assert_awaited_once_with(master_data.MASTER_DATA_CHANNEL, 'drug_alias:[["노바스그정", 1, 2]]')
+
+    async def test_publish_without_redis_is_noop(self):
+        with patch.object(master_data, "get_redis", new=AsyncMock(return_value=None)):
+            await master_data.publish_master_data_change("drug")
@@ -12,6 +12,7 @@ from app.integrations.ocr.parser import (
 )
 from app.utils.common import normalize_phone_number
 from app.utils.files import FileValidationError, sanitize_filename, validate_extension
+from app.utils.ranking import reciprocal_rank_fusion
 
 
 class TestNormalizePhoneNumber:
@@ -27,6 +28,24 @@ class TestNormalizePhoneNumber:
         assert normalize_phone_number("01012345678") == "01012345678"
 
 
+class TestReciprocalRankFusion:
+    """RRF 순위 결합 테스트."""
+
+    def test_items_in_both_rankings_rank_first(self):
+        fused = reciprocal_rank_fusion(["a", "b", "c"], ["c", "a"], k=60)
+        assert [item for item, _ in fused] == ["a", "c", "b"]
+        assert fused[0][1] == pytest.approx(1 / 61 + 1 / 62)
+
+    def test_ties_break_by_item(self):
+        """동점은 처음 나온 순서가 아니라 항목 오름차순 (SQL의 ORDER BY score DESC, drug_id와 같다)."""
+        fused = reciprocal_rank_fusion([7, 3], [3, 7], k=60)
+        assert [item for item, _ in fused] == [3, 7]
+
+    def test_duplicates_within_ranking_count_once(self):
+        fused = dict(reciprocal_rank_fusion(["a", "a", "b"], k=1))
+        assert fused == {"a": pytest.approx(1 / 2), "b": pytest.approx(1 / 4)}
+
+
 class TestSanitizeFilename:
     """파일명 정제 테스트."""
 
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import struct
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from app.db.pgvector import decode_vector, encode_vector, register_vector_codec
+from app.models.fields import VectorField
+
+
+class TestPgvectorCodec:
+    """pgvector 바이너리 코덱 테스트."""
+
+    def test_wire_format(self):
+        """uint16 dim + uint16 unused + big-endian float32 배열로 인코딩된다."""
+        data = encode_vector([1.0, -0.5])
+        assert data == struct.pack(">HHff", 2, 0, 1.0, -0.5)
+
+    def test_roundtrip_and_text_input(self):
+        """인코딩/디코딩 왕복 및 텍스트 표현 입력 허용."""
+        assert decode_vector(encode_vector([0.25, 0.5, 0.75])) == [0.25, 0.5, 0.75]
+        assert decode_vector(encode_vector("[0.25, 0.5]")) == [0.25, 0.5]
+
+    async def test_register_sets_binary_codec_in_extension_schema(self):
+        """vector 타입이 있는 스키마에 binary 포맷 코덱을 등록한다."""
+        conn = MagicMock()
+        conn.fetchval = AsyncMock(return_value="extensions")
+        conn.set_type_codec = AsyncMock()
+
+        await register_vector_codec(conn)
+
+        conn.set_type_codec.assert_awaited_once()
+        assert conn.set_type_codec.await_args.kwargs["schema"] == "extensions"
+        assert conn.set_type_codec.await_args.kwargs["format"] == "binary"
+
+    async def test_register_skips_when_extension_missing(self):
+        """vector 확장이 없으면 코덱 등록을 건너뛴다."""
+        conn = MagicMock()
+        conn.fetchval = AsyncMock(return_value=None)
+        conn.set_type_codec = AsyncMock()
+
+        await register_vector_codec(conn)
+
+        conn.set_type_codec.assert_not_awaited()
+
+
+class TestVectorFieldDbValue:
+    """VectorField가 방언에 따라 값을 넘기는 방식 테스트."""
+
+    @staticmethod
+    def _instance(dialect: str):
+        return SimpleNamespace(_meta=SimpleNamespace(db=SimpleNamespace(capabilities=SimpleNamespace(dialect=dialect))))
+
+    def test_postgres_passes_list_to_codec(self):
+        assert VectorField().to_db_value((0.1, 0.2), self._instance("postgres")) == [0.1, 0.2]
+
+    def test_sqlite_uses_text(self):
+        assert VectorField().to_db_value([0.1, 0.2], self._instance("sqlite")) == "[0.1, 0.2]"
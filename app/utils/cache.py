@@ -9,6 +9,7 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+from collections.abc import Sequence
 from typing import Any
 
 import redis.asyncio as aioredis
@@ -19,11 +20,16 @@ logger = logging.getLogger(__name__)
 
 _redis: aioredis.Redis | None = None
 _redis_unavailable: bool = False
+_redis_binary: aioredis.Redis | None = None
 
 # TTL 설정 (초)
 TTL_DRUG_SEARCH = 86400  # 약물 검색: 24시간 (마스터 데이터)
 TTL_RECOMMENDATION = 1800  # 추천 결과: 30분
 TTL_DASHBOARD = 30  # 대시보드: 30초 (자주 변경)
+TTL_DISEASE_SEARCH = 3600  # 상병코드 자동완성: 1시간 (seed 시 삭제)
+TTL_GUIDELINE_BUNDLE = 86400  # 질환 가이드라인 묶음: 24시간 (seed 시 버전으로 무효화)
+TTL_GUIDELINE_BUNDLE_MISS = 60  # 매칭 실패 묶음: 1분 (스캔 저장으로 생긴 질환이 바로 보이도록)
+TTL_EMBEDDING = 7 * 86400  # 임베딩 벡터: 7일 (같은 모델·텍스트면 결과가 변하지 않음)
 
 
 async def get_redis() -> aioredis.Redis | None:
@@ -44,6 +50,22 @@ async def get_redis() -> aioredis.Redis | None:
         return None
 
 
+async def get_binary_redis() -> aioredis.Redis | None:
+    """바이트 값을 그대로 주고받는 Redis 클라이언트를 반환한다 (decode_responses=False).
+
+    연결 가능 여부는 get_redis()의 판단을 그대로 따른다.
+
+    Returns:
+        aioredis.Redis | None: Redis 사용 불가 시 None.
+    """
+    global _redis_binary
+    if await get_redis() is None:
+        return None
+    if _redis_binary is None:
+        _redis_binary = aioredis.from_url(config.REDIS_URL)
+    return _redis_binary
+
+
 def _make_key(prefix: str, *parts: Any) -> str:
     raw = ":".join(str(p) for p in parts)
     h = hashlib.md5(raw.encode()).hexdigest()[:12]
@@ -75,6 +97,50 @@ async def cache_set(prefix: str, *parts: Any, value: Any, ttl: int = 3600) -> No
         pass
 
 
+async def cache_get_many(prefix: str, parts_list: Sequence[Sequence[Any]]) -> list[Any | None]:
+    """여러 키를 MGET 1회로 조회한다.
+
+    Args:
+        prefix (str): 캐시 prefix.
+        parts_list (Sequence[Sequence[Any]]): 키별 parts 목록 (cache_get의 *parts와 같다).
+
+    Returns:
+        list[Any | None]: parts_list와 같은 순서의 값 (미적중/Redis 사용 불가 시 None).
+    """
+    if not parts_list:
+        return []
+    r = await get_redis()
+    if not r:
+        return [None] * len(parts_list)
+    try:
+        vals = await r.mget([_make_key(prefix, *parts) for parts in parts_list])
+        return [json.loads(val) if val else None for val in vals]
+    except Exception:
+        return [None] * len(parts_list)
+
+
+async def cache_set_many(prefix: str, items: Sequence[tuple[Sequence[Any], Any]], ttl: int = 3600) -> None:
+    """여러 키를 파이프라인 1회 왕복으로 저장한다.
+
+    Args:
+        prefix (str): 캐시 prefix.
+        items (Sequence[tuple[Sequence[Any], Any]]): (parts, 값) 목록.
+        ttl (int): 만료 시간 (초).
+    """
+    if not items:
+        return
+    r = await get_redis()
+    if not r:
+        return
+    try:
+        async with r.pipeline(transaction=False) as pipe:
+            for parts, value in items:
+                pipe.set(_make_key(prefix, *parts), json.dumps(value, ensure_ascii=False, default=str), ex=ttl)
+            await pipe.execute()
+    except Exception:
+        pass
+
+
 async def cache_delete(prefix: str, *parts: Any) -> None:
     r = await get_redis()
     if not r:
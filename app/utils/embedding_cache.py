@@ -0,0 +1,210 @@
+"""임베딩 벡터 캐시.
+
+같은 약품명·진단명·질문이 반복해서 임베딩되는 것을 막기 위해
+(모델, sha256(정규화 텍스트))를 키로 2단계 캐시를 둔다.
+
+- 1단계: 프로세스 내 LRU (OrderedDict)
+- 2단계: Redis — JSON 대신 float16 little-endian 바이트열로 저장 (1536차원 기준 3KB)
+
+두 계층 모두 float16 바이트열을 저장하고, 미적중으로 새로 계산한 벡터도 set_many()가 돌려주는
+float16 반올림 값을 쓰므로 같은 텍스트는 캐시 상태와 관계없이 같은 벡터를 얻는다.
+Redis 연결 실패 시 LRU만 사용한다 (graceful degradation).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import struct
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Sequence
+
+from app.core import config
+from app.utils.cache import TTL_EMBEDDING, get_binary_redis
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키 계산용으로 텍스트를 정규화한다 (NFKC + 공백 정리).
+
+    Args:
+        text (str): 원본 텍스트.
+
+    Returns:
+        str: 정규화된 텍스트.
+    """
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+def make_embedding_key(model: str, text: str) -> str:
+    """(모델, 정규화 텍스트) 기반의 content-addressed 캐시 키를 만든다.
+
+    Args:
+        model (str): 임베딩 모델명.
+        text (str): 원본 텍스트.
+
+    Returns:
+        str: ``cache:emb:{model}:{sha256}`` 형식의 키.
+    """
+    digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+    return f"cache:emb:{model}:{digest}"
+
+
+def pack_vector(vector: Sequence[float]) -> bytes:
+    """벡터를 float16 little-endian 바이트열로 변환한다."""
+    return struct.pack(f"<{len(vector)}e", *vector)
+
+
+def unpack_vector(blob: bytes) -> list[float]:
+    """pack_vector()로 만든 바이트열을 벡터로 복원한다."""
+    return list(struct.unpack(f"<{len(blob) // 2}e", blob))
+
+
+class EmbeddingCache:
+    """프로세스 내 LRU + Redis 2단계 임베딩 캐시."""
+
+    def __init__(self, *, max_entries: int = 4096, ttl: int = TTL_EMBEDDING) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._lru: OrderedDict[str, bytes] = OrderedDict()
+        self.lru_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    async def get_many(self, model: str, texts: Sequence[str]) -> list[list[float] | None]:
+        """텍스트 목록의 캐시된 벡터를 조회한다.
+
+        LRU에서 찾지 못한 키만 Redis MGET 한 번으로 조회하고, Redis 적중분은 LRU에 채운다.
+
+        Args:
+            model (str): 임베딩 모델명.
+            texts (Sequence[str]): 조회할 텍스트 목록.
+
+        Returns:
+            list[list[float] | None]: 입력 순서와 동일한 벡터 목록 (미적중은 None).
+        """
+        keys = [make_embedding_key(model, text) for text in texts]
+        results: list[list[float] | None] = [None] * len(keys)
+        missing: list[int] = []
+
+        for i, key in enumerate(keys):
+            blob = self._lru_get(key)
+            if blob is None:
+                missing.append(i)
+            else:
+                self.lru_hits += 1
+                results[i] = unpack_vector(blob)
+
+        if missing:
+            blobs = await self._redis_mget([keys[i] for i in missing])
+            for i, blob in zip(missing, blobs, strict=True):
+                if blob is None:
+                    self.misses += 1
+                    continue
+                self.redis_hits += 1
+                self._lru_put(keys[i], blob)
+                results[i] = unpack_vector(blob)
+
+        return results
+
+    async def get(self, model: str, text: str) -> list[float] | None:
+        """텍스트 1건의 캐시된 벡터를 조회한다 (미적중 시 None)."""
+        return (await self.get_many(model, [text]))[0]
+
+    async def set_many(self, model: str, texts: Sequence[str], vectors: Sequence[Sequence[float]]) -> list[list[float]]:
+        """텍스트별 벡터를 LRU와 Redis에 저장하고, 캐시에서 다시 꺼낼 때와 같은 (float16 반올림) 벡터를 반환한다.
+
+        Args:
+            model (str): 임베딩 모델명.
+            texts (Sequence[str]): 원본 텍스트 목록.
+            vectors (Sequence[Sequence[float]]): texts와 같은 순서의 벡터 목록.
+
+        Returns:
+            list[list[float]]: texts와 같은 순서의 저장된 정밀도 벡터 목록.
+        """
+        blobs = [pack_vector(v) for v in vectors]
+        items = {make_embedding_key(model, t): blob for t, blob in zip(texts, blobs, strict=True)}
+        for key, blob in items.items():
+            self._lru_put(key, blob)
+        stored = [unpack_vector(blob) for blob in blobs]
+
+        r = await get_binary_redis()
+        if not r or not items:
+            return stored
+        try:
+            async with r.pipeline(transaction=False) as pipe:
+                for key, blob in items.items():
+                    pipe.set(key, blob, ex=self._ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.debug("embedding cache write failed: %s", e)
+        return stored
+
+    async def set(self, model: str, text: str, vector: Sequence[float]) -> list[float]:
+        """텍스트 1건의 벡터를 저장하고 저장된 정밀도 벡터를 반환한다."""
+        return (await self.set_many(model, [text], [vector]))[0]
+
+    def stats(self) -> dict[str, int | float]:
+        """적중/미적중 카운터와 LRU 크기를 반환한다.
+
+        Returns:
+            dict[str, int | float]: lru_hits, redis_hits, misses, hit_rate, lru_size.
+        """
+        total = self.lru_hits + self.redis_hits + self.misses
+        return {
+            "lru_hits": self.lru_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.lru_hits + self.redis_hits) / total, 4) if total else 0.0,
+            "lru_size": len(self._lru),
+        }
+
+    def clear(self) -> None:
+        """LRU와 카운터를 초기화한다 (Redis는 TTL로 만료)."""
+        self._lru.clear()
+        self.lru_hits = self.redis_hits = self.misses = 0
+
+    def _lru_get(self, key: str) -> bytes | None:
+        blob = self._lru.get(key)
+        if blob is not None:
+            self._lru.move_to_end(key)
+        return blob
+
+    def _lru_put(self, key: str, blob: bytes) -> None:
+        if self._max_entries <= 0:
+            return
+        self._lru[key] = blob
+        self._lru.move_to_end(key)
+        while len(self._lru) > self._max_entries:
+            self._lru.popitem(last=False)
+
+    async def _redis_mget(self, keys: list[str]) -> list[bytes | None]:
+        r = await get_binary_redis()
+        if not r:
+            return [None] * len(keys)
+        try:
+            return list(await r.mget(keys))
+        except Exception as e:
+            logger.debug("embedding cache read failed: %s", e)
+            return [None] * len(keys)
+
+
+_cache: EmbeddingCache | None = None
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """
+    EmbeddingCache 싱글턴 인스턴스 반환.
+
+    Returns:
+        EmbeddingCache: 설정값으로 초기화된 캐시.
+    """
+    global _cache
+    if _cache is None:
+        _cache = EmbeddingCache(max_entries=config.EMBEDDING_CACHE_MAX_ENTRIES)
+    return _cache
@@ -0,0 +1,166 @@
+"""마스터 데이터 변경 알림 (Redis pub/sub).
+
+약품/질병 등 마스터 데이터를 인메모리 인덱스로 들고 있는 워커들이
+seed 스크립트 등 다른 프로세스의 변경을 알 수 있도록 채널 하나로 변경 종류(kind)를 방송한다.
+
+- 발행: publish_master_data_change("drug")
+- 구독: on_master_data_change("drug", handler)로 핸들러를 등록하고 앱 시작 시 start_master_data_listener()
+- 변경분 전달: publish_master_data_change("drug_alias", payload=[...])처럼 JSON 변경분을 함께 보내면
+  on_master_data_payload로 등록한 핸들러가 변경분만 반영한다 (payload 핸들러가 없거나 payload가 없으면 전체 재빌드 핸들러 실행).
+Redis를 쓸 수 없으면 발행/구독 모두 건너뛴다 (인덱스는 시작 시점 상태로 유지).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from app.utils.cache import get_redis
+
+logger = logging.getLogger(__name__)
+
+MASTER_DATA_CHANNEL = "master_data:changed"
+_RECONNECT_DELAY = 5.0
+
+Handler = Callable[[], Awaitable[None]]
+PayloadHandler = Callable[[Any], Awaitable[None]]
+
+_handlers: dict[str, list[Handler]] = defaultdict(list)
+_payload_handlers: dict[str, list[PayloadHandler]] = defaultdict(list)
+
+
+def on_master_data_change(kind: str, handler: Handler) -> None:
+    """
+    kind 변경 알림을 받을 핸들러를 등록한다.
+
+    Args:
+        kind (str): 마스터 데이터 종류 (예: "drug")
+        handler (Handler): 인자 없는 async 콜백
+    """
+    if handler not in _handlers[kind]:
+        _handlers[kind].append(handler)
+
+
+def on_master_data_payload(kind: str, handler: PayloadHandler) -> None:
+    """
+    kind 변경분(payload)을 받을 핸들러를 등록한다. payload가 있는 알림은 전체 재빌드 대신 이 핸들러로 처리한다.
+
+    Args:
+        kind (str): 마스터 데이터 종류 (예: "drug_alias")
+        handler (PayloadHandler): JSON 변경분을 받는 async 콜백
+    """
+    if handler not in _payload_handlers[kind]:
+        _payload_handlers[kind].append(handler)
+
+
+def coalesced(reload: Callable[[], Awaitable[object]]) -> Handler:
+    """
+    재빌드 함수를 알림 핸들러로 감싼다. 실행 중에 알림이 또 오면 끝난 뒤 한 번만 더 실행한다 (알림 폭주 병합).
+
+    Args:
+        reload (Callable[[], Awaitable[object]]): 인메모리 인덱스 재빌드 함수
+
+    Returns:
+        Handler: on_master_data_change에 등록할 핸들러
+    """
+    lock = asyncio.Lock()
+    pending = False
+
+    async def handler() -> None:
+        nonlocal pending
+        if lock.locked():
+            pending = True
+            return
+        async with lock:
+            while True:
+                pending = False
+                await reload()
+                if not pending:
+                    break
+
+    return handler
+
+
+async def publish_master_data_change(kind: str, payload: Any = None) -> None:
+    """
+    kind 변경을 모든 구독 워커에 알린다.
+
+    Args:
+        kind (str): 마스터 데이터 종류 (예: "drug")
+        payload (Any): JSON 직렬화 가능한 변경분 (None이면 전체 재빌드 알림)
+    """
+    r = await get_redis()
+    if not r:
+        return
+    message = kind if payload is None else f"{kind}:{json.dumps(payload, ensure_ascii=False)}"
+    try:
+        await r.publish(MASTER_DATA_CHANNEL, message)
+    except Exception:
+        logger.warning("master data change publish failed: %s", kind, exc_info=True)
+
+
+async def dispatch_master_data_change(kind: str, payload: Any = None) -> None:
+    """
+    등록된 kind 핸들러를 순서대로 실행한다. 핸들러 예외는 로그만 남긴다.
+
+    payload가 있고 payload 핸들러가 등록되어 있으면 그 핸들러만 실행하고, 아니면 전체 재빌드 핸들러를 실행한다.
+    """
+    payload_handlers = _payload_handlers.get(kind, []) if payload is not None else []
+    for payload_handler in payload_handlers:
+        try:
+            await payload_handler(payload)
+        except Exception:
+            logger.exception("master data payload handler failed: %s", kind)
+    if payload_handlers:
+        return
+    for handler in _handlers.get(kind, []):
+        try:
+            await handler()
+        except Exception:
+            logger.exception("master data change handler failed: %s", kind)
+
+
+def _parse_message(data: Any) -> tuple[str, Any]:
+    """알림 메시지("kind" 또는 "kind:<JSON 변경분>")를 (kind, payload)로 나눈다. JSON이 깨졌으면 payload는 None."""
+    kind, _, raw = str(data).partition(":")
+    if not raw:
+        return kind, None
+    try:
+        return kind, json.loads(raw)
+    except ValueError:
+        logger.warning("invalid master data payload ignored: %s", kind)
+        return kind, None
+
+
+async def _listen() -> None:
+    while True:
+        r = await get_redis()
+        if not r:
+            return
+        pubsub = r.pubsub()
+        try:
+            await pubsub.subscribe(MASTER_DATA_CHANNEL)
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    await dispatch_master_data_change(*_parse_message(message["data"]))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("master data listener disconnected, retrying in %.0fs", _RECONNECT_DELAY, exc_info=True)
+        finally:
+            await pubsub.aclose()
+        await asyncio.sleep(_RECONNECT_DELAY)
+
+
+def start_master_data_listener() -> asyncio.Task[None]:
+    """
+    변경 알림 구독 태스크를 시작한다. 앱 종료 시 반환된 태스크를 cancel한다.
+
+    Returns:
+        asyncio.Task[None]: 구독 태스크
+    """
+    return asyncio.create_task(_listen(), name="master-data-listener")
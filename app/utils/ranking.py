@@ -0,0 +1,36 @@
+"""검색 결과 순위 결합 유틸."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TypeVar
+
+RRF_K = 60  # Cormack et al. (2009) 기본값. 클수록 하위 순위의 기여가 상대적으로 커진다.
+
+T = TypeVar("T", int, str)
+
+
+def reciprocal_rank_fusion(*rankings: Sequence[T], k: int = RRF_K) -> list[tuple[T, float]]:  # noqa: UP047
+    """
+    여러 순위 목록을 reciprocal rank fusion으로 결합한다.
+
+    각 목록에서 rank(1부터)번째인 항목은 1 / (k + rank)점을 받고, 점수는 목록별로 합산된다.
+    점수 척도가 다른 신호(trigram 유사도, 벡터 거리 등)를 정규화 없이 순위만으로 합칠 수 있다.
+
+    Args:
+        *rankings (Sequence[T]): 점수 내림차순으로 정렬된 항목 목록들 (같은 목록 내 중복은 첫 순위만 반영)
+        k (int): 순위 평활 상수
+
+    Returns:
+        list[tuple[T, float]]: (항목, RRF 점수) 목록, 점수 내림차순 (동점은 항목 오름차순.
+            하이브리드 검색 SQL의 ORDER BY score DESC, drug_id와 같은 순서)
+    """
+    scores: dict[T, float] = {}
+    for ranking in rankings:
+        seen: set[T] = set()
+        for rank, item in enumerate(ranking, start=1):
+            if item in seen:
+                continue
+            seen.add(item)
+            scores[item] = scores.get(item, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda pair: (-pair[1], pair[0]))
@@ -0,0 +1,279 @@
+"""벡터 검색 recall/latency 벤치마크.
+
+합성 임베딩을 별도 스키마(vector_bench)의 vector_documents 테이블에 적재한 뒤,
+VectorDocumentRepository.search_similar를 그대로 호출하여 인덱스 설정별
+p50/p95 지연시간과 recall@k(브루트포스 정답 대비)를 측정한다.
+
+- seqscan : 인덱스 없음 (정확 검색, 기준 지연시간)
+- ivfflat : lists 고정, ivfflat.probes 변화
+- hnsw    : m/ef_construction 고정, hnsw.ef_search 변화
+
+운영 테이블은 건드리지 않는다. search_path를 "vector_bench, public"으로 두어
+레포지토리 SQL이 벤치마크 테이블을 보도록 한다.
+
+사용 예:
+    uv run python -m scripts.benchmark_vector_search --sizes 10000,100000 --ef-search 40,100,200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import copy
+import json
+import logging
+import math
+import time
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+from tortoise import Tortoise, connections
+
+from app.db.databases import TORTOISE_ORM
+from app.models.fields import EMBEDDING_DIMENSIONS
+from app.repositories.vector_document_repository import VectorDocumentRepository
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = "vector_bench"
+CHUNK_ROWS = 10_000
+N_CLUSTERS = 256
+CLUSTER_NOISE = 0.35
+QUERY_NOISE = 0.15
+
+
+@dataclass
+class BenchResult:
+    corpus_size: int
+    method: str
+    setting: str
+    p50_ms: float
+    p95_ms: float
+    recall_at_k: float
+    queries: int
+    k: int
+
+
+class SyntheticCorpus:
+    """
+    시드 기반으로 청크 단위 재생성이 가능한 군집형 합성 임베딩.
+
+    1M x 1536 float32(약 6GB)를 메모리에 올리지 않도록 적재/정답 계산 시 청크를 다시 만든다.
+    """
+
+    def __init__(self, size: int, dim: int, seed: int) -> None:
+        self.size = size
+        self.dim = dim
+        self.seed = seed
+        rng = np.random.default_rng(seed)
+        self._centroids = _normalize(rng.standard_normal((N_CLUSTERS, dim), dtype=np.float32))
+
+    def chunks(self) -> Iterator[tuple[int, np.ndarray]]:
+        for start in range(0, self.size, CHUNK_ROWS):
+            n = min(CHUNK_ROWS, self.size - start)
+            rng = np.random.default_rng((self.seed, start))
+            labels = rng.integers(0, N_CLUSTERS, n)
+            noise = rng.standard_normal((n, self.dim), dtype=np.float32) * (CLUSTER_NOISE / math.sqrt(self.dim))
+            yield start, _normalize(self._centroids[labels] + noise)
+
+    def queries(self, count: int) -> np.ndarray:
+        # 청크 시드는 CHUNK_ROWS의 배수(start)이므로 1과 겹치지 않는다
+        rng = np.random.default_rng((self.seed, 1))
+        labels = rng.integers(0, N_CLUSTERS, count)
+        noise = rng.standard_normal((count, self.dim), dtype=np.float32) * (QUERY_NOISE / math.sqrt(self.dim))
+        return _normalize(self._centroids[labels] + noise)
+
+    def ground_truth(self, queries: np.ndarray, k: int) -> np.ndarray:
+        """브루트포스 코사인 top-k (행 번호 = id - 1)."""
+        best_scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+        best_ids = np.zeros((len(queries), k), dtype=np.int64)
+        for start, chunk in self.chunks():
+            scores = queries @ chunk.T
+            merged_scores = np.concatenate([best_scores, scores], axis=1)
+            merged_ids = np.concatenate(
+                [best_ids, np.arange(start, start + len(chunk))[None, :].repeat(len(queries), 0)], axis=1
+            )
+            top = np.argpartition(-merged_scores, k - 1, axis=1)[:, :k]
+            best_scores = np.take_along_axis(merged_scores, top, axis=1)
+            best_ids = np.take_along_axis(merged_ids, top, axis=1)
+        return best_ids + 1
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (matrix / norms).astype(np.float32)
+
+
+async def init_db() -> None:
+    """
+    벤치마크 전용 단일 커넥션으로 DB를 초기화한다.
+
+    커넥션 풀 크기를 1로 두어 SET(ivfflat.probes, hnsw.ef_search)이 모든 검색에 적용되도록 한다.
+    """
+    bench_config = copy.deepcopy(TORTOISE_ORM)
+    credentials = bench_config["connections"]["default"]["credentials"]
+    credentials["minsize"] = 1
+    credentials["maxsize"] = 1
+    credentials["server_settings"] = {**credentials.get("server_settings", {}), "search_path": f"{SCHEMA}, public"}
+    await Tortoise.init(config=bench_config)
+
+
+async def prepare_table(corpus: SyntheticCorpus) -> None:
+    """벤치마크 스키마/테이블을 만들고 합성 임베딩을 COPY로 적재한다."""
+    conn = connections.get("default")
+    await conn.execute_script(
+        f"""
+        DROP SCHEMA IF EXISTS {SCHEMA} CASCADE;
+        CREATE SCHEMA {SCHEMA};
+        CREATE TABLE {SCHEMA}.vector_documents (
+            id SERIAL PRIMARY KEY,
+            reference_type VARCHAR(50) NOT NULL,
+            reference_id INT NOT NULL,
+            content TEXT NOT NULL,
+            embedding vector({EMBEDDING_DIMENSIONS}) NOT NULL,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
+        );
+        """
+    )
+    async with conn.acquire_connection() as raw:
+        for start, chunk in corpus.chunks():
+            records = [("bench", start + i + 1, f"doc-{start + i + 1}", row.tolist()) for i, row in enumerate(chunk)]
+            await raw.copy_records_to_table(
+                "vector_documents",
+                schema_name=SCHEMA,
+                records=records,
+                columns=["reference_type", "reference_id", "content", "embedding"],
+            )
+            logger.info("적재 %d/%d", start + len(chunk), corpus.size)
+    await conn.execute_script(f"ANALYZE {SCHEMA}.vector_documents")
+
+
+async def run_queries(
+    repo: VectorDocumentRepository, queries: np.ndarray, truth: np.ndarray, k: int, warmup: int
+) -> tuple[float, float, float]:
+    """레포지토리 검색 경로로 질의를 실행하여 (p50_ms, p95_ms, recall@k)를 반환한다."""
+    query_lists = [q.tolist() for q in queries]
+    for q in query_lists[:warmup]:
+        await repo.search_similar(q, top_k=k)
+
+    latencies: list[float] = []
+    hits = 0
+    for q, expected in zip(query_lists, truth, strict=True):
+        started = time.perf_counter()
+        results = await repo.search_similar(q, top_k=k)
+        latencies.append((time.perf_counter() - started) * 1000)
+        hits += len({r.id for r in results} & set(expected.tolist()))
+
+    p50, p95 = np.percentile(latencies, [50, 95])
+    return float(p50), float(p95), hits / (len(query_lists) * k)
+
+
+async def benchmark_size(args: argparse.Namespace, size: int) -> list[BenchResult]:
+    """코퍼스 크기 1개에 대해 seqscan / ivfflat / hnsw 설정을 차례로 측정한다."""
+    corpus = SyntheticCorpus(size, EMBEDDING_DIMENSIONS, args.seed)
+    await prepare_table(corpus)
+    queries = corpus.queries(args.queries)
+    truth = corpus.ground_truth(queries, args.k)
+
+    conn = connections.get("default")
+    repo = VectorDocumentRepository()
+    results: list[BenchResult] = []
+
+    def record(method: str, setting: str, measured: tuple[float, float, float]) -> None:
+        p50, p95, recall = measured
+        results.append(
+            BenchResult(size, method, setting, round(p50, 2), round(p95, 2), round(recall, 4), len(queries), args.k)
+        )
+        logger.info(
+            "[%d] %-8s %-22s p50=%.2fms p95=%.2fms recall@%d=%.4f", size, method, setting, p50, p95, args.k, recall
+        )
+
+    if "seqscan" in args.methods:
+        record("seqscan", "-", await run_queries(repo, queries, truth, args.k, args.warmup))
+
+    if "ivfflat" in args.methods:
+        lists = args.ivfflat_lists or max(1, int(size / 1000) if size <= 1_000_000 else int(math.sqrt(size)))
+        await conn.execute_script(
+            f"CREATE INDEX bench_ivfflat ON {SCHEMA}.vector_documents "
+            f"USING ivfflat (embedding vector_cosine_ops) WITH (lists = {lists})"
+        )
+        for probes in args.probes:
+            await conn.execute_script(f"SET ivfflat.probes = {int(probes)}")
+            record(
+                "ivfflat",
+                f"lists={lists} probes={probes}",
+                await run_queries(repo, queries, truth, args.k, args.warmup),
+            )
+        await conn.execute_script(f"DROP INDEX {SCHEMA}.bench_ivfflat")
+
+    if "hnsw" in args.methods:
+        await conn.execute_script(
+            f"CREATE INDEX bench_hnsw ON {SCHEMA}.vector_documents "
+            f"USING hnsw (embedding vector_cosine_ops) WITH (m = {args.hnsw_m}, ef_construction = {args.hnsw_ef_construction})"
+        )
+        for ef_search in args.ef_search:
+            await conn.execute_script(f"SET hnsw.ef_search = {int(ef_search)}")
+            record(
+                "hnsw",
+                f"m={args.hnsw_m} ef_search={ef_search}",
+                await run_queries(repo, queries, truth, args.k, args.warmup),
+            )
+        await conn.execute_script(f"DROP INDEX {SCHEMA}.bench_hnsw")
+
+    return results
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(v) for v in value.split(",") if v.strip()]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="pgvector 검색 경로의 recall/latency 벤치마크")
+    parser.add_argument("--sizes", type=_int_list, default=[10_000, 100_000], help="코퍼스 크기 목록 (쉼표 구분)")
+    parser.add_argument("--queries", type=int, default=200, help="측정 질의 수")
+    parser.add_argument("--warmup", type=int, default=20, help="측정 전 워밍업 질의 수")
+    parser.add_argument("--k", type=int, default=10, help="recall@k의 k (= top_k)")
+    parser.add_argument("--methods", default="seqscan,ivfflat,hnsw", help="측정할 방식 (쉼표 구분)")
+    parser.add_argument("--ivfflat-lists", type=int, default=0, help="IVFFlat lists (0이면 크기 기반 자동)")
+    parser.add_argument("--probes", type=_int_list, default=[1, 10, 40])
+    parser.add_argument("--hnsw-m", type=int, default=16)
+    parser.add_argument("--hnsw-ef-construction", type=int, default=64)
+    parser.add_argument("--ef-search", type=_int_list, default=[40, 100, 200])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--keep", action="store_true", help="종료 후 벤치마크 스키마를 남긴다")
+    args = parser.parse_args()
+    args.methods = {m.strip() for m in args.methods.split(",") if m.strip()}
+    return args
+
+
+async def main() -> None:
+    """
+    벡터 검색 벤치마크 실행 진입점.
+    """
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    args = parse_args()
+    await init_db()
+    results: list[BenchResult] = []
+    try:
+        for size in args.sizes:
+            results.extend(await benchmark_size(args, size))
+    finally:
+        if not args.keep:
+            await connections.get("default").execute_script(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+        await Tortoise.close_connections()
+
+    print(f"{'size':>9} {'method':<8} {'setting':<24} {'p50(ms)':>9} {'p95(ms)':>9} {'recall@k':>9}")
+    for r in results:
+        print(
+            f"{r.corpus_size:>9} {r.method:<8} {r.setting:<24} {r.p50_ms:>9.2f} {r.p95_ms:>9.2f} {r.recall_at_k:>9.4f}"
+        )
+    if args.output:
+        args.output.write_text(json.dumps([asdict(r) for r in results], indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
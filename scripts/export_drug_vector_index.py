@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import shutil
+from datetime import UTC, datetime
+from pathlib import Path
+
+import numpy as np
+from numpy.lib.format import open_memmap
+from tortoise import Tortoise, connections
+
+from app.core.config import Config
+from app.db.databases import TORTOISE_ORM
+from app.models.fields import EMBEDDING_DIMENSIONS
+from app.repositories.drug_vector_index import IDS_FILE, META_FILE, VECTORS_FILE, DrugVectorIndex
+from app.utils.master_data import publish_master_data_change
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 5000
+MODEL = "text-embedding-3-small"
+
+
+async def init_db() -> None:
+    """
+    인덱스 export 작업을 위한 DB 연결을 초기화한다 (pgvector 바이너리 코덱 포함).
+    """
+    await Tortoise.init(config=TORTOISE_ORM)
+
+
+async def export_drug_vector_index(output_dir: Path) -> int:
+    """
+    vector_documents(reference_type='drug')를 memory-map 가능한 인덱스 파일로 내보낸다.
+
+    처리 규칙:
+    - id 기준 keyset 페이지네이션으로 읽어 메모리 사용량을 PAGE_SIZE 행으로 제한한다.
+    - 각 벡터는 L2 정규화 후 float32로 저장한다 (검색 시 변환 없이 내적 = 코사인 유사도).
+    - 임시 디렉터리에 쓴 뒤 교체하여, 실행 중인 앱이 반쯤 쓰인 파일을 읽지 않도록 한다.
+
+    Args:
+        output_dir (Path):
+            인덱스 출력 디렉터리
+
+    Returns:
+        int:
+            내보낸 벡터 수
+    """
+    conn = connections.get("default")
+    count_rows = await conn.execute_query_dict(
+        "SELECT COUNT(*) AS cnt FROM vector_documents WHERE reference_type = 'drug'"
+    )
+    total = int(count_rows[0]["cnt"])
+    logger.info("총 %d개 약물 벡터 export 시작", total)
+
+    tmp_dir = output_dir.with_name(output_dir.name + ".tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+
+    vectors = open_memmap(tmp_dir / VECTORS_FILE, mode="w+", dtype=np.float32, shape=(total, EMBEDDING_DIMENSIONS))
+    ids = np.zeros((total, 2), dtype=np.int64)
+    contents: list[str] = []
+
+    last_id = 0
+    row = 0
+    while row < total:
+        page = await conn.execute_query_dict(
+            """
+            SELECT id, reference_id, content, embedding
+            FROM vector_documents
+            WHERE reference_type = 'drug' AND id > $1
+            ORDER BY id
+            LIMIT $2
+            """,
+            [last_id, PAGE_SIZE],
+        )
+        if not page:
+            break
+        page = page[: total - row]
+
+        matrix = np.asarray([r["embedding"] for r in page], dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        vectors[row : row + len(page)] = matrix / norms
+        ids[row : row + len(page)] = [(r["id"], r["reference_id"]) for r in page]
+        contents.extend(r["content"] for r in page)
+
+        row += len(page)
+        last_id = page[-1]["id"]
+        logger.info("%d/%d 벡터 export", row, total)
+
+    vectors.flush()
+    del vectors
+    if row < total:
+        # export 도중 행이 삭제된 경우: 실제 읽은 행 수로 잘라 다시 저장
+        trimmed = np.load(tmp_dir / VECTORS_FILE)[:row]
+        np.save(tmp_dir / VECTORS_FILE, trimmed)
+        ids = ids[:row]
+
+    np.save(tmp_dir / IDS_FILE, ids)
+    meta = {
+        "model": MODEL,
+        "dimensions": EMBEDDING_DIMENSIONS,
+        "count": row,
+        "exported_at": datetime.now(UTC).isoformat(),
+        "contents": contents,
+    }
+    (tmp_dir / META_FILE).write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+
+    # 로드 가능 여부를 확인한 뒤 교체
+    DrugVectorIndex.load(tmp_dir)
+    shutil.rmtree(output_dir, ignore_errors=True)
+    tmp_dir.rename(output_dir)
+    return row
+
+
+async def main() -> None:
+    """
+    약물 벡터 인덱스 export 스크립트 실행 진입점.
+    """
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    parser = argparse.ArgumentParser(description="약물 벡터를 memory-map 인덱스 파일로 내보낸다.")
+    parser.add_argument("--output", default=Config().DRUG_VECTOR_INDEX_DIR or "./artifacts/drug_vector_index")
+    args = parser.parse_args()
+
+    await init_db()
+    try:
+        count = await export_drug_vector_index(Path(args.output))
+        logger.info("export 완료: %s (%d개)", args.output, count)
+        # 실행 중인 API 워커가 새 파일로 인덱스를 다시 로드
+        await publish_master_data_change("drug_vector")
+    finally:
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -51,6 +51,8 @@ async def execute_to_db() -> None:
     import asyncpg  # type: ignore[import-untyped]  # noqa: E402
 
     from app.core import config  # noqa: E402
+    from app.utils.cache import cache_delete_pattern  # noqa: E402
+    from app.utils.master_data import publish_master_data_change  # noqa: E402
 
     conn = await asyncpg.connect(
         host=config.DB_HOST,
@@ -63,6 +65,9 @@ async def execute_to_db() -> None:
     sql = generate_sql()
     await conn.execute(sql)
     await conn.close()
+    # 실행 중인 API 워커의 인메모리 KCD 인덱스 재빌드
+    await publish_master_data_change("disease_code")
+    await cache_delete_pattern("disease_search")
     print(f"[DONE] {MAPPING_JSON} → DB disease_code_mappings 시드 완료")
 
 
@@ -13,7 +13,6 @@ from __future__ import annotations
 import asyncio
 import logging
 import sys
-import time
 from pathlib import Path
 
 import tiktoken
@@ -25,6 +24,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from app.db.databases import TORTOISE_ORM
 from app.models.diseases import DiseaseGuideline
 from app.models.vector_documents import VectorDocument
+from app.repositories.guideline_bundle import invalidate_guideline_bundles
 from app.services.embedding import encode_batch
 
 logger = logging.getLogger(__name__)
@@ -98,14 +98,14 @@ async def seed() -> None:
 
         for attempt in range(5):
             try:
-                embeddings = encode_batch(batch_texts)
+                embeddings = await encode_batch(batch_texts, use_cache=False)
                 break
             except RateLimitError:
                 if attempt == 4:
                     raise
                 wait = 60
                 logger.warning("Rate limit 초과, %d초 대기 후 재시도 (%d/5)...", wait, attempt + 1)
-                time.sleep(wait)
+                await asyncio.sleep(wait)
 
         await VectorDocument.bulk_create(
             [
@@ -121,6 +121,8 @@ async def seed() -> None:
         )
         logger.info("임베딩 진행: %d / %d", processed, total)
 
+    # 실행 중인 API 워커의 가이드라인 묶음 캐시 무효화
+    await invalidate_guideline_bundles()
     await Tortoise.close_connections()
     logger.info("seed 완료")
 
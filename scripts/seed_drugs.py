@@ -2,177 +2,325 @@
 약품 마스터 데이터 seed 스크립트.
 
 raw_drug_license_info.xlsx → drugs 테이블 적재 후
-챗봇용 vector_documents 임베딩 생성 (OpenAI text-embedding-3-small, 1536차원).
+vector_documents 임베딩을 증분 동기화 (OpenAI text-embedding-3-small, 1536차원).
+
+drugs는 (품목명, 업체명, 보험코드) 기준으로 기존 행을 갱신하므로 id가 유지되고,
+임베딩은 추가·변경된 약품만 다시 생성한다 (app.services.vector_sync).
+
+xlsx는 openpyxl read-only 모드로 chunk 단위 스트리밍하며, chunk마다 한 트랜잭션으로 저장한다.
+진행 상황은 체크포인트 파일에 기록되므로 중단 후 다시 실행하면 이어서 진행한다
+(xlsx가 바뀌었거나 --reset이면 처음부터).
 
 실행:
     uv run python scripts/seed_drugs.py
+    uv run python scripts/seed_drugs.py --chunk-size 2000 --concurrency 8
 """
 
 from __future__ import annotations
 
+import argparse
 import asyncio
+import json
 import logging
 import sys
-import time
+from collections import defaultdict
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
-import pandas as pd
-import tiktoken
-from openai import RateLimitError
+from openpyxl import load_workbook
 from tortoise import Tortoise
+from tortoise.transactions import in_transaction
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.db.databases import TORTOISE_ORM
 from app.models.drugs import Drug
-from app.models.vector_documents import VectorDocument
-from app.services.embedding import encode_batch
+from app.repositories.drug_repository import DrugRepository
+from app.services.vector_sync import DEFAULT_CONCURRENCY, VectorSyncService
+from app.utils.master_data import publish_master_data_change
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 
 XLSX_PATH = Path(__file__).parent / "raw_drug_license_info.xlsx"
-MAX_TOKENS_PER_REQUEST = 250_000  # OpenAI 한도 300,000에서 여유분 확보
+CHECKPOINT_PATH = Path(__file__).parent / ".seed_drugs.checkpoint.json"
 REFERENCE_TYPE = "drug"
+CHUNK_SIZE = 1000
+# 기존 행을 찾는 기준 컬럼과, 일치한 행에서 갱신하는 컬럼
+KEY_FIELDS = ("name", "manufacturer", "edi_code")
+UPDATE_FIELDS = [
+    "raw_material",
+    "raw_material_en",
+    "efficacy",
+    "dosage",
+    "caution_1",
+    "caution_2",
+    "caution_3",
+    "caution_4",
+    "storage",
+    "change_log",
+    "main_ingredient",
+]
+
 
-_tokenizer = tiktoken.get_encoding("cl100k_base")  # text-embedding-3-small 인코딩
-MAX_TOKENS_PER_TEXT = 8000  # 8192 한도에서 decode 경계 오차 여유분 확보
-
-
-def _truncate_to_tokens(text: str) -> str:
-    """단일 텍스트가 8192 토큰을 초과하면 잘라낸다."""
-    tokens = _tokenizer.encode(text)
-    if len(tokens) <= MAX_TOKENS_PER_TEXT:
-        return text
-    return _tokenizer.decode(tokens[:MAX_TOKENS_PER_TEXT])
-
-
-def _make_batches(texts: list[str]) -> list[list[str]]:
-    """토큰 수 기준으로 텍스트를 동적 배치로 분할한다."""
-    batches: list[list[str]] = []
-    current: list[str] = []
-    current_tokens = 0
-    for text in texts:
-        token_count = len(_tokenizer.encode(text))
-        if current and current_tokens + token_count > MAX_TOKENS_PER_REQUEST:
-            batches.append(current)
-            current = []
-            current_tokens = 0
-        current.append(text)
-        current_tokens += token_count
-    if current:
-        batches.append(current)
-    return batches
-
-
-def _str_or_none(val) -> str | None:
-    if pd.isna(val):
+def _str_or_none(val: Any) -> str | None:
+    if val is None:
         return None
     s = str(val).strip()
     return s if s else None
 
 
-def _build_embed_text(row: pd.Series) -> str:
-    """챗봇 검색용 임베딩 텍스트 구성."""
-    fields = [
-        ("약품명", str(row["품목명"]).strip()),
-        ("주성분", _str_or_none(row["주성분명"])),
-        ("원료성분", _str_or_none(row["원료성분"])),
-        ("효능효과", _str_or_none(row["효능효과"])),
-        ("용법용량", _str_or_none(row["용법용량"])),
-        ("사용상의주의사항", _str_or_none(row["사용상의주의사항1"])),
-    ]
-    return "\n".join(f"{k}: {v}" for k, v in fields if v)
+def _drug_values(row: dict[str, Any]) -> dict[str, str | None]:
+    """xlsx 1행을 Drug 필드 값으로 변환한다."""
+    return {
+        "name": str(row["품목명"]).strip(),
+        "manufacturer": _str_or_none(row["업체명"]),
+        "raw_material": _str_or_none(row["원료성분"]),
+        "raw_material_en": _str_or_none(row["영문성분명"]),
+        "efficacy": _str_or_none(row["효능효과"]),
+        "dosage": _str_or_none(row["용법용량"]),
+        "caution_1": _str_or_none(row["사용상의주의사항1"]),
+        "caution_2": _str_or_none(row["사용상의주의사항2"]),
+        "caution_3": _str_or_none(row["사용상의주의사항3"]),
+        "caution_4": _str_or_none(row["사용상의주의사항4"]),
+        "storage": _str_or_none(row["저장방법"]),
+        "change_log": _str_or_none(row["변경내용"]),
+        "main_ingredient": _str_or_none(row["주성분명"]),
+        "edi_code": _str_or_none(row["보험코드"]),
+    }
 
 
-async def seed() -> None:
-    await Tortoise.init(config=TORTOISE_ORM)
+def _drug_key(values: dict) -> tuple:
+    return tuple(values[field] for field in KEY_FIELDS)
 
-    logger.info("xlsx 로딩 중...")
-    df = pd.read_excel(XLSX_PATH)
-    total = len(df)
-    logger.info("총 %d건 처리 시작", total)
 
-    existing_drug_count = await Drug.all().count()
-    if existing_drug_count == total:
-        logger.info("drugs 이미 %d건 존재, 적재 스킵", existing_drug_count)
-        drug_objs = await Drug.all().order_by("id")
-    else:
-        await VectorDocument.filter(reference_type=REFERENCE_TYPE).delete()
-        await Drug.all().delete()
-        logger.info("drugs 테이블 적재 중...")
-        await Drug.bulk_create(
-            [
-                Drug(
-                    name=str(row["품목명"]).strip(),
-                    manufacturer=_str_or_none(row["업체명"]),
-                    raw_material=_str_or_none(row["원료성분"]),
-                    raw_material_en=_str_or_none(row["영문성분명"]),
-                    efficacy=_str_or_none(row["효능효과"]),
-                    dosage=_str_or_none(row["용법용량"]),
-                    caution_1=_str_or_none(row["사용상의주의사항1"]),
-                    caution_2=_str_or_none(row["사용상의주의사항2"]),
-                    caution_3=_str_or_none(row["사용상의주의사항3"]),
-                    caution_4=_str_or_none(row["사용상의주의사항4"]),
-                    storage=_str_or_none(row["저장방법"]),
-                    change_log=_str_or_none(row["변경내용"]),
-                    main_ingredient=_str_or_none(row["주성분명"]),
-                    edi_code=_str_or_none(row["보험코드"]),
-                )
-                for _, row in df.iterrows()
-            ]
-        )
-        drug_objs = await Drug.all().order_by("id")
-        logger.info("drugs %d건 적재 완료", len(drug_objs))
-
-    # 2) 임베딩 텍스트 생성 후 토큰 수 기준 동적 배치 분할
-    all_texts = [_truncate_to_tokens(_build_embed_text(row)) for _, row in df.iterrows()]
-    batches = _make_batches(all_texts)
-    logger.info("임베딩 배치 수: %d", len(batches))
-
-    # 이미 임베딩된 drug_id 조회 — 재실행 시 중복 처리 방지
-    done_ids = set(await VectorDocument.filter(reference_type=REFERENCE_TYPE).values_list("reference_id", flat=True))
-    logger.info("이미 완료된 임베딩: %d건 스킵", len(done_ids))
-
-    # 3) 배치별 임베딩 + vector_documents 적재
-    processed = 0
-    for batch_texts in batches:
-        batch_drugs = drug_objs[processed : processed + len(batch_texts)]
-        processed += len(batch_texts)
-
-        # 이미 완료된 배치는 스킵
-        if all(d.id in done_ids for d in batch_drugs):
+def iter_xlsx_chunks(path: Path, chunk_size: int) -> Iterator[list[dict[str, Any]]]:
+    """
+    xlsx 첫 시트를 헤더 기준 dict 행으로 chunk_size개씩 읽는다.
+
+    read-only 모드는 시트를 한 번에 메모리에 올리지 않고 행 단위로 파싱한다.
+    품목명이 빈 행은 건너뛴다.
+
+    Args:
+        path (Path): xlsx 경로
+        chunk_size (int): chunk당 행 수
+
+    Yields:
+        list[dict[str, Any]]: 헤더명 → 셀 값 dict 목록
+    """
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = [str(cell).strip() if cell is not None else "" for cell in next(rows, ())]
+        chunk: list[dict[str, Any]] = []
+        for cells in rows:
+            row = dict(zip(header, cells, strict=False))
+            if _str_or_none(row.get("품목명")) is None:
+                continue
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    finally:
+        workbook.close()
+
+
+class SeedCheckpoint:
+    """
+    seed 진행 상황 체크포인트 (JSON 파일).
+
+    - rows_done: drugs에 반영이 끝난 xlsx 행 수 (chunk 커밋 후 기록)
+    - vector_sync_after_id: 임베딩 저장이 끝난 drug id 워터마크
+    xlsx 경로나 수정 시각이 달라지면 이전 체크포인트는 무시한다.
+    """
+
+    def __init__(self, path: Path, xlsx_path: Path) -> None:
+        self.path = path
+        self._source = {"xlsx": str(xlsx_path.resolve()), "mtime": xlsx_path.stat().st_mtime}
+        self.rows_done = 0
+        self.vector_sync_after_id = 0
+
+    def load(self) -> None:
+        if not self.path.exists():
+            return
+        data = json.loads(self.path.read_text(encoding="utf-8"))
+        if data.get("source") != self._source:
+            logger.info("xlsx가 변경되어 체크포인트를 무시합니다: %s", self.path)
+            return
+        self.rows_done = int(data.get("rows_done", 0))
+        self.vector_sync_after_id = int(data.get("vector_sync_after_id", 0))
+
+    def save(self) -> None:
+        data = {
+            "source": self._source,
+            "rows_done": self.rows_done,
+            "vector_sync_after_id": self.vector_sync_after_id,
+        }
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(self.path)  # 중간에 죽어도 깨진 JSON이 남지 않도록 원자적 교체
+
+    def clear(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+async def _load_existing_keys() -> dict[tuple, list[int]]:
+    """기존 drugs의 (품목명, 업체명, 보험코드) → id 목록 (id 오름차순). 전체 행 대신 키 컬럼만 읽는다."""
+    existing: dict[tuple, list[int]] = defaultdict(list)
+    for drug_id, *key in await Drug.all().order_by("id").values_list("id", *KEY_FIELDS):
+        existing[tuple(key)].append(drug_id)
+    return existing
+
+
+async def upsert_chunk(rows: list[dict[str, Any]], existing: dict[tuple, list[int]]) -> tuple[int, int]:
+    """
+    xlsx 행 chunk를 기존 drugs와 (품목명, 업체명, 보험코드)로 맞춰 생성/갱신한다.
+
+    처방 등에서 FK로 참조되므로 기존 행은 삭제하지 않고 id를 유지한다.
+    일치한 id는 existing에서 소비하므로 같은 키가 여러 행이면 id 순서대로 대응된다.
+
+    Args:
+        rows (list[dict[str, Any]]): iter_xlsx_chunks가 반환한 행 목록
+        existing (dict[tuple, list[int]]): 키 → 아직 대응되지 않은 기존 drug id 목록
+
+    Returns:
+        tuple[int, int]: (생성 수, 갱신 수)
+    """
+    to_create: list[Drug] = []
+    matched: list[tuple[int, dict[str, str | None]]] = []
+    for row in rows:
+        values = _drug_values(row)
+        ids = existing.get(_drug_key(values))
+        if ids:
+            matched.append((ids.pop(0), values))
+        else:
+            to_create.append(Drug(**values))
+
+    drugs = await Drug.in_bulk([drug_id for drug_id, _ in matched], "id") if matched else {}
+    to_update: list[Drug] = []
+    for drug_id, values in matched:
+        drug = drugs[drug_id]
+        if any(getattr(drug, field) != value for field, value in values.items()):
+            drug.update_from_dict(values)
+            to_update.append(drug)
+
+    async with in_transaction():
+        if to_create:
+            await Drug.bulk_create(to_create)
+        if to_update:
+            await Drug.bulk_update(to_update, fields=UPDATE_FIELDS)
+    return len(to_create), len(to_update)
+
+
+async def upsert_drugs(xlsx_path: Path, checkpoint: SeedCheckpoint, *, chunk_size: int) -> tuple[int, int]:
+    """
+    xlsx를 chunk 단위로 스트리밍하며 drugs에 반영하고, chunk마다 체크포인트를 기록한다.
+
+    체크포인트 이전 행은 저장하지 않고 키만 소비해, 재개 후에도 중복 키 행이 같은 id에 대응되도록 한다.
+
+    Args:
+        xlsx_path (Path): 약품 허가정보 xlsx
+        checkpoint (SeedCheckpoint): 진행 상황 체크포인트
+        chunk_size (int): chunk당 행 수
+
+    Returns:
+        tuple[int, int]: 이번 실행의 (생성 수, 갱신 수)
+    """
+    existing = await _load_existing_keys()
+    created = updated = 0
+    rows_seen = 0
+    for chunk in iter_xlsx_chunks(xlsx_path, chunk_size):
+        skip = min(len(chunk), max(0, checkpoint.rows_done - rows_seen))
+        for row in chunk[:skip]:
+            ids = existing.get(_drug_key(_drug_values(row)))
+            if ids:
+                ids.pop(0)
+        rows_seen += len(chunk)
+        if skip == len(chunk):
             continue
 
-        # 429 에러 시 최대 5회 재시도
-        for attempt in range(5):
-            try:
-                embeddings = encode_batch(batch_texts)
-                break
-            except RateLimitError:
-                if attempt == 4:
-                    raise
-                wait = 60
-                logger.warning("Rate limit 초과, %d초 대기 후 재시도 (%d/5)...", wait, attempt + 1)
-                time.sleep(wait)
-
-        await VectorDocument.bulk_create(
-            [
-                VectorDocument(
-                    reference_type=REFERENCE_TYPE,
-                    reference_id=drug.id,
-                    content=text,
-                    embedding=emb,
-                )
-                for drug, text, emb in zip(batch_drugs, batch_texts, embeddings, strict=False)
-                if drug.id not in done_ids
-            ]
+        c, u = await upsert_chunk(chunk[skip:], existing)
+        created += c
+        updated += u
+        checkpoint.rows_done = rows_seen
+        checkpoint.save()
+        logger.info("drugs %d행 반영 (생성 %d / 갱신 %d)", rows_seen, created, updated)
+    return created, updated
+
+
+async def seed(
+    *,
+    xlsx_path: Path = XLSX_PATH,
+    checkpoint_path: Path = CHECKPOINT_PATH,
+    chunk_size: int = CHUNK_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    reset: bool = False,
+) -> None:
+    checkpoint = SeedCheckpoint(checkpoint_path, xlsx_path)
+    if reset:
+        checkpoint.clear()
+    else:
+        checkpoint.load()
+    if checkpoint.rows_done or checkpoint.vector_sync_after_id:
+        logger.info(
+            "체크포인트에서 재개: xlsx %d행, drug id %d 이후 임베딩",
+            checkpoint.rows_done,
+            checkpoint.vector_sync_after_id,
         )
-        logger.info("임베딩 진행: %d / %d", processed, total)
 
-    await Tortoise.close_connections()
+    await Tortoise.init(config=TORTOISE_ORM)
+    try:
+        created, updated = await upsert_drugs(xlsx_path, checkpoint, chunk_size=chunk_size)
+        logger.info("drugs 생성 %d건 / 갱신 %d건", created, updated)
+        edi_upserted, edi_removed = await DrugRepository().sync_edi_codes()
+        logger.info("drug_edi_codes 추가·변경 %d건 / 삭제 %d건", edi_upserted, edi_removed)
+        if created or updated:
+            # 실행 중인 API 워커의 약품명 인덱스 재빌드
+            await publish_master_data_change("drug")
+
+        async def save_vector_checkpoint(after_id: int) -> None:
+            checkpoint.vector_sync_after_id = after_id
+            checkpoint.save()
+
+        stats = await VectorSyncService(concurrency=concurrency).sync(
+            REFERENCE_TYPE,
+            start_after_id=checkpoint.vector_sync_after_id,
+            on_checkpoint=save_vector_checkpoint,
+        )
+        logger.info(
+            "임베딩 생성 %d건 / 갱신 %d건 / 유지 %d건 / 삭제 %d건",
+            stats.created,
+            stats.updated,
+            stats.unchanged,
+            stats.deleted,
+        )
+    finally:
+        await Tortoise.close_connections()
+    checkpoint.clear()
     logger.info("seed 완료")
 
 
+def main() -> None:
+    parser = argparse.ArgumentParser(description="약품 허가정보 xlsx를 drugs / vector_documents에 적재한다.")
+    parser.add_argument("--xlsx", type=Path, default=XLSX_PATH)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="트랜잭션 1회당 xlsx 행 수")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="동시 임베딩 요청 수")
+    parser.add_argument("--checkpoint", type=Path, default=CHECKPOINT_PATH)
+    parser.add_argument("--reset", action="store_true", help="체크포인트를 무시하고 처음부터 실행")
+    args = parser.parse_args()
+    asyncio.run(
+        seed(
+            xlsx_path=args.xlsx,
+            checkpoint_path=args.checkpoint,
+            chunk_size=args.chunk_size,
+            concurrency=args.concurrency,
+            reset=args.reset,
+        )
+    )
+
+
 if __name__ == "__main__":
-    asyncio.run(seed())
+    main()
@@ -4,26 +4,15 @@ import asyncio
 
 from tortoise import Tortoise
 
-from app.core.config import Config
-from app.models.diseases import DiseaseGuideline
-from app.repositories.vector_document_repository import VectorDocumentRepository
-from app.services.embedding import encode
+from app.db.databases import TORTOISE_ORM
+from app.services.vector_sync import VectorSyncService
 
 
 async def init_db() -> None:
     """
-    벡터 문서 seed 작업을 위한 DB 연결을 초기화한다.
+    벡터 문서 seed 작업을 위한 DB 연결을 초기화한다 (pgvector 바이너리 코덱 포함).
     """
-    cfg = Config()
-    await Tortoise.init(
-        db_url=f"asyncpg://{cfg.DB_USER}:{cfg.DB_PASSWORD}@{cfg.DB_HOST}:{cfg.DB_PORT}/{cfg.DB_NAME}",
-        modules={
-            "models": [
-                "app.models.diseases",
-                "app.models.vector_documents",
-            ]
-        },
-    )
+    await Tortoise.init(config=TORTOISE_ORM)
 
 
 async def seed_vector_documents() -> None:
@@ -33,45 +22,16 @@ async def seed_vector_documents() -> None:
     처리 규칙:
     - reference_type은 'disease_guideline'으로 고정한다.
     - reference_id는 DiseaseGuideline.id를 사용한다.
-    - 이미 같은 reference_type/reference_id 문서가 있으면 중복 생성하지 않는다.
+    - content_hash / embedding_model_version이 같은 문서는 다시 임베딩하지 않고,
+      내용이 바뀐 가이드라인만 재임베딩한다 (VectorSyncService).
     """
-    repo = VectorDocumentRepository()
-
-    guidelines = await DiseaseGuideline.all().prefetch_related("disease")
-
-    created_count = 0
-    skipped_count = 0
-
-    for guideline in guidelines:
-        exists = await repo.get_by_reference(
-            reference_type="disease_guideline",
-            reference_id=guideline.id,
-        )
-        if exists:
-            skipped_count += 1
-            continue
-
-        content = guideline.content.strip()
-        if not content:
-            skipped_count += 1
-            continue
-
-        vector = encode(content)
-
-        await repo.create(
-            reference_type="disease_guideline",
-            reference_id=guideline.id,
-            content=content,
-            embedding=vector,
-        )
-
-        created_count += 1
-        disease_name = guideline.disease.name if guideline.disease else "unknown"
-        print(f"저장 완료: [{disease_name}] {guideline.category}")
+    stats = await VectorSyncService().sync("disease_guideline")
 
     print("=== vector_documents seed 완료 ===")
-    print(f"생성 수: {created_count}")
-    print(f"skip 수: {skipped_count}")
+    print(f"생성 수: {stats.created}")
+    print(f"갱신 수: {stats.updated}")
+    print(f"skip 수: {stats.unchanged}")
+    print(f"삭제 수: {stats.deleted}")
 
 
 async def main() -> None:
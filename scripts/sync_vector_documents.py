@@ -0,0 +1,61 @@
+"""
+vector_documents 증분 동기화 스크립트.
+
+원본 테이블과 content_hash / embedding_model_version을 비교해
+추가·변경된 문서만 다시 임베딩하고, 원본에서 사라진 문서는 삭제한다.
+중단되면 그대로 다시 실행하면 된다 (저장된 배치는 건너뜀).
+
+실행:
+    uv run python scripts/sync_vector_documents.py
+    uv run python scripts/sync_vector_documents.py --types drug --dry-run
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+from tortoise import Tortoise
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.db.databases import TORTOISE_ORM
+from app.services.vector_sync import DEFAULT_CONCURRENCY, SOURCES, VectorSyncService
+
+logger = logging.getLogger(__name__)
+
+
+async def main() -> None:
+    """
+    벡터 문서 증분 동기화 스크립트 실행 진입점.
+    """
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    parser = argparse.ArgumentParser(description="vector_documents를 원본 테이블과 증분 동기화한다.")
+    parser.add_argument("--types", nargs="+", choices=sorted(SOURCES), default=sorted(SOURCES))
+    parser.add_argument("--batch-size", type=int, default=256, help="임베딩 요청 1회당 최대 문서 수")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="동시 임베딩 요청 수")
+    parser.add_argument("--dry-run", action="store_true", help="변경 건수만 집계하고 임베딩/저장하지 않는다")
+    args = parser.parse_args()
+
+    await Tortoise.init(config=TORTOISE_ORM)
+    try:
+        service = VectorSyncService(batch_size=args.batch_size, concurrency=args.concurrency)
+        for reference_type in args.types:
+            stats = await service.sync(reference_type, dry_run=args.dry_run)
+            logger.info(
+                "[%s] 생성 %d / 갱신 %d / 유지 %d / 삭제 %d",
+                stats.reference_type,
+                stats.created,
+                stats.updated,
+                stats.unchanged,
+                stats.deleted,
+            )
+    finally:
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())